@@ -50,6 +50,9 @@ from .services import (
     FieldProjectImportService,
     QGISMapThemeService,
 )
+from .core.diagnostics import configure_diagnostics_from_settings
+from .core.performance import CATEGORY_IMPORT, create_performance_recorder
+from .core.profiling import OperationProfiler, profiled_operation
 
 # Layer names used for pending imports (must match import summary / field import services).
 _TEMPORARY_IMPORT_LAYER_NAMES = (
@@ -107,6 +110,8 @@ class ArcheoSyncPlugin(QObject):
         """Initialize all required services."""
         # Initialize settings manager
         self._settings_manager = QGISSettingsManager('ArcheoSync')
+        configure_diagnostics_from_settings(self._settings_manager)
+        self._profiler = OperationProfiler(self._settings_manager)
         
         # Initialize file system service
         self._file_system_service = QGISFileSystemService(self._iface.mainWindow())
@@ -408,6 +413,7 @@ class ArcheoSyncPlugin(QObject):
         if result:
             self._handle_prepare_recording_accepted(dialog)
     
+    @profiled_operation("prepare_recording")
     def _handle_prepare_recording_accepted(self, dialog) -> None:
         """Handle the case when prepare recording dialog is accepted."""
         try:
@@ -602,6 +608,7 @@ class ArcheoSyncPlugin(QObject):
                 self.tr(f"An error occurred during field project preparation:\n{str(e)}")
             )
 
+    @profiled_operation("global_prepare_recording")
     def _handle_global_prepare_recording_accepted(
         self,
         dialog,
@@ -877,6 +884,7 @@ class ArcheoSyncPlugin(QObject):
         if theme:
             self._map_theme_service.apply_theme_to_current_project(theme, self._iface)
     
+    @profiled_operation("import_data")
     def _handle_import_data_accepted(
         self,
         dialog=None,
@@ -918,6 +926,7 @@ class ArcheoSyncPlugin(QObject):
                 'small_finds_duplicates': 0
             }
 
+            self._import_performance = create_performance_recorder(self._settings_manager)
             csv_imported = False
             projects_imported = False
             
@@ -937,6 +946,8 @@ class ArcheoSyncPlugin(QObject):
                     projects_imported = True
                     summary_data.update(project_stats)
             
+            summary_data['performance_metrics'] = self._import_performance.metrics
+
             # Show summary dialog if any data was imported
             if (summary_data['csv_points_count'] > 0 or
                 summary_data['csv_duplicates'] > 0 or
@@ -1026,7 +1037,7 @@ class ArcheoSyncPlugin(QObject):
                     return None
                 choice = dlg.selected_column_key()
                 self._settings_manager.set_value("csv_topo_identifier_column", choice)
-                import_result = self._csv_import_service.import_csv_files(
+                import_result = self._run_csv_import(
                     csv_files, column_mapping, identifier_source_column_key=choice
                 )
             else:
@@ -1037,7 +1048,7 @@ class ArcheoSyncPlugin(QObject):
                 )
                 return None
         else:
-            import_result = self._csv_import_service.import_csv_files(csv_files, column_mapping)
+            import_result = self._run_csv_import(csv_files, column_mapping)
 
         if import_result.is_valid:
             return self._csv_import_service.get_last_import_count()
@@ -1049,12 +1060,34 @@ class ArcheoSyncPlugin(QObject):
             )
             return None
     
+    def _measure_import_step(self, name: str):
+        """Measure one import step into the current import's performance recorder."""
+        recorder = getattr(self, '_import_performance', None)
+        if recorder is None:
+            recorder = self._import_performance = create_performance_recorder(self._settings_manager)
+        return recorder.measure(name, category=CATEGORY_IMPORT)
+
+    def _run_csv_import(self, csv_files: List[str], column_mapping, **kwargs):
+        """Run the CSV import as a measured performance step."""
+        with self._measure_import_step("CSV import") as step:
+            import_result = self._csv_import_service.import_csv_files(csv_files, column_mapping, **kwargs)
+            if import_result.is_valid:
+                step.features_scanned += int(self._csv_import_service.get_last_import_count() or 0)
+        return import_result
+
     def _process_completed_projects(self, project_paths: List[str]) -> Optional[Dict[str, int]]:
         """Process completed field projects for import."""
         from qgis.PyQt.QtWidgets import QMessageBox
         
         # Import field projects using the field project import service
-        import_result = self._field_project_import_service.import_field_projects(project_paths)
+        with self._measure_import_step("Field project import") as step:
+            import_result = self._field_project_import_service.import_field_projects(project_paths)
+            if import_result.is_valid:
+                stats = self._field_project_import_service.get_last_import_stats() or {}
+                step.features_scanned += sum(
+                    int(stats.get(key, 0) or 0)
+                    for key in ('features_count', 'objects_count', 'small_finds_count')
+                )
         
         if import_result.is_valid:
             # Return the import statistics
@@ -1115,6 +1148,7 @@ class ArcheoSyncPlugin(QObject):
                 'duplicate_total_station_identifiers_warnings', []
             )
             summary.height_difference_warnings = summary_data.get('height_difference_warnings', [])
+            summary.performance_metrics = list(summary_data.get('performance_metrics', []))
             
             # Create and show the dock widget
             dock_widget = ImportSummaryDockWidget(
@@ -0,0 +1,91 @@
+"""
+Cooperative cancellation for warning-detection runs.
+
+A :class:`CancellationToken` is passed into each detector ``detect_*`` entry point,
+which activates it for the current thread with :func:`cancellation_scope`. The scan
+loops already call ``maybe_yield_to_ui``; that call checks the active token and
+raises :class:`DetectionCancelled` once the run has been cancelled.
+
+``DetectionCancelled`` derives from ``BaseException`` (like ``asyncio.CancelledError``)
+so the ``except Exception`` handlers detectors use around individual checks do not
+turn a cancelled run into a partial result.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+
+class DetectionCancelled(BaseException):
+    """Raised inside a detection run after its cancellation token was cancelled."""
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag, optionally tied to external cancel checks
+    such as ``QgsTask.isCanceled``.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._checks: List[Callable[[], bool]] = []
+
+    def cancel(self) -> None:
+        """Request cancellation of every run using this token."""
+        self._event.set()
+
+    def watch(self, is_cancelled: Callable[[], bool]) -> None:
+        """Also treat the token as cancelled when ``is_cancelled()`` returns True."""
+        self._checks.append(is_cancelled)
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        for is_cancelled in self._checks:
+            try:
+                if is_cancelled():
+                    self._event.set()
+                    return True
+            except Exception:
+                continue
+        return False
+
+    def raise_if_cancelled(self) -> None:
+        """Raise :class:`DetectionCancelled` when cancellation was requested."""
+        if self.cancelled:
+            raise DetectionCancelled()
+
+
+_active = threading.local()
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken]) -> Iterator[None]:
+    """
+    Make ``token`` the active token of the current thread for the duration of the block.
+
+    ``None`` keeps the currently active token, so nested entry points called without
+    a token still honour the caller's cancellation.
+    """
+    previous = getattr(_active, "token", None)
+    if token is not None:
+        _active.token = token
+    try:
+        if token is not None:
+            token.raise_if_cancelled()
+        yield
+    finally:
+        _active.token = previous
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Return the token active on the current thread, if any."""
+    return getattr(_active, "token", None)
+
+
+def raise_if_cancelled() -> None:
+    """Raise :class:`DetectionCancelled` if the current thread's active token is cancelled."""
+    token = getattr(_active, "token", None)
+    if token is not None:
+        token.raise_if_cancelled()
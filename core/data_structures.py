@@ -1,8 +1,189 @@
 """
 Data structures for the ArcheoSync plugin.
 """
-from dataclasses import dataclass
-from typing import List, Optional, Union
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+@dataclass
+class FeatureRef:
+    """Layer id and feature id of a feature; the feature is loaded only on demand."""
+    __slots__ = ('layer_id', 'feature_id')
+    layer_id: Optional[str]
+    feature_id: int
+
+    @classmethod
+    def of(cls, layer: Any, feature: Any) -> 'FeatureRef':
+        return cls(layer.id() if layer is not None else None, feature.id())
+
+    def load(self) -> Any:
+        """Return the QgsFeature from the project, or None if the layer or feature is gone."""
+        from qgis.core import QgsProject
+
+        layer = QgsProject.instance().mapLayer(self.layer_id) if self.layer_id else None
+        if layer is None:
+            return None
+        feature = layer.getFeature(self.feature_id)
+        return feature if feature.isValid() else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'layer_id': self.layer_id, 'feature_id': self.feature_id}
+
+
+@dataclass
+class FeatureTarget:
+    """Layer id and ids of the features a warning is about, selected with ``selectByIds``."""
+    __slots__ = ('layer_id', 'feature_ids')
+    layer_id: Optional[str]
+    feature_ids: List[int]
+
+    @classmethod
+    def of(cls, layer: Any, feature_ids: Any) -> 'FeatureTarget':
+        return cls(layer.id() if layer is not None else None, list(dict.fromkeys(feature_ids)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'layer_id': self.layer_id, 'feature_ids': list(self.feature_ids)}
+
+
+def group_feature_refs(refs: Any) -> List[FeatureTarget]:
+    """Group feature references by layer, keeping first-seen order of layers and features."""
+    by_layer: Dict[Optional[str], Dict[int, None]] = {}
+    for ref in refs:
+        by_layer.setdefault(ref.layer_id, {})[ref.feature_id] = None
+    return [FeatureTarget(layer_id, list(feature_ids)) for layer_id, feature_ids in by_layer.items()]
+
+
+class _IssueRecord:
+    """
+    Base of the per-feature issue records stored in ``WarningData``.
+
+    Records keep feature references and numbers instead of whole QgsFeature objects,
+    so open warnings do not pin geometries and attributes in memory. Item access with
+    the keys of the former issue dicts still works; feature keys load the feature.
+    """
+    __slots__ = ()
+    # Former dict keys that return a loaded feature, mapped to the FeatureRef slot
+    _FEATURE_KEYS: Dict[str, str] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        slot = self._FEATURE_KEYS.get(key)
+        if slot is not None:
+            return getattr(self, slot).load()
+        if key.startswith('_') or not hasattr(self, key):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def feature_refs(self) -> List[FeatureRef]:
+        """Return the references of the features this issue is about."""
+        return [getattr(self, slot) for slot in self._FEATURE_KEYS.values()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+@dataclass
+class DistanceIssue(_IssueRecord):
+    """A total station point too far from its related object."""
+    __slots__ = ('point_ref', 'object_ref', 'point_identifier', 'object_identifier', 'distance', 'relation_value')
+    _FEATURE_KEYS = {'point_feature': 'point_ref', 'object_feature': 'object_ref'}
+    point_ref: FeatureRef
+    object_ref: FeatureRef
+    point_identifier: str
+    object_identifier: str
+    distance: float
+    relation_value: Any
+
+    @classmethod
+    def from_issue(cls, issue: Dict[str, Any], points_layer: Any, objects_layer: Any) -> 'DistanceIssue':
+        return cls(
+            FeatureRef.of(points_layer, issue['point_feature']),
+            FeatureRef.of(objects_layer, issue['object_feature']),
+            issue['point_identifier'],
+            issue['object_identifier'],
+            issue['distance'],
+            issue['relation_value'],
+        )
+
+
+@dataclass
+class OutOfBoundsIssue(_IssueRecord):
+    """A feature lying outside its recording area."""
+    __slots__ = ('feature_ref', 'feature_identifier', 'recording_area_id', 'recording_area_name', 'distance')
+    _FEATURE_KEYS = {'feature': 'feature_ref'}
+    feature_ref: FeatureRef
+    feature_identifier: str
+    recording_area_id: Any
+    recording_area_name: str
+    distance: float
+
+    @property
+    def feature_id(self) -> int:
+        return self.feature_ref.feature_id
+
+    @classmethod
+    def from_issue(cls, issue: Dict[str, Any], layer: Any) -> 'OutOfBoundsIssue':
+        return cls(
+            FeatureRef(layer.id() if layer is not None else None, issue['feature_id']),
+            issue['feature_identifier'],
+            issue['recording_area_id'],
+            issue['recording_area_name'],
+            issue['distance'],
+        )
+
+
+@dataclass
+class MissingTotalStationIssue(_IssueRecord):
+    """An object without any related total station point."""
+    __slots__ = ('object_ref', 'object_identifier', 'relation_value')
+    _FEATURE_KEYS = {'object_feature': 'object_ref'}
+    object_ref: FeatureRef
+    object_identifier: str
+    relation_value: Any
+
+    @classmethod
+    def from_issue(cls, issue: Dict[str, Any], objects_layer: Any) -> 'MissingTotalStationIssue':
+        return cls(
+            FeatureRef.of(objects_layer, issue['object_feature']),
+            issue['object_identifier'],
+            issue['relation_value'],
+        )
+
+
+@dataclass
+class HeightDifferenceIssue(_IssueRecord):
+    """Two close total station points with a large height difference."""
+    __slots__ = (
+        'feature1_ref', 'feature2_ref', 'feature1_identifier', 'feature2_identifier',
+        'distance', 'height_difference', 'z1', 'z2',
+    )
+    _FEATURE_KEYS = {'feature1': 'feature1_ref', 'feature2': 'feature2_ref'}
+    feature1_ref: FeatureRef
+    feature2_ref: FeatureRef
+    feature1_identifier: str
+    feature2_identifier: str
+    distance: float
+    height_difference: float
+    z1: float
+    z2: float
+
+    @classmethod
+    def from_issue(cls, issue: Dict[str, Any], layer: Any) -> 'HeightDifferenceIssue':
+        return cls(
+            FeatureRef.of(layer, issue['feature1']),
+            FeatureRef.of(layer, issue['feature2']),
+            issue['feature1_identifier'],
+            issue['feature2_identifier'],
+            issue['distance'],
+            issue['height_difference'],
+            issue['z1'],
+            issue['z2'],
+        )
 
 
 @dataclass
@@ -15,17 +196,90 @@ class WarningData:
     # Additional fields for specific warning types
     object_number: Optional[int] = None
     skipped_numbers: Optional[List[int]] = None
+    # Inclusive (first, last) ranges of skipped numbers; ``skipped_numbers`` is capped
+    skipped_number_ranges: Optional[List[Tuple[int, int]]] = None
     # Fields for between-layer warnings
     second_layer_name: Optional[str] = None
     second_filter_expression: Optional[str] = None
     # Fields for out-of-bounds warnings
-    out_of_bounds_features: Optional[List[dict]] = None
+    out_of_bounds_features: Optional[List[OutOfBoundsIssue]] = None
     # Fields for distance warnings
-    distance_issues: Optional[List[dict]] = None
+    distance_issues: Optional[List[DistanceIssue]] = None
     # Fields for missing total station warnings
-    missing_total_station_issues: Optional[List[dict]] = None
+    missing_total_station_issues: Optional[List[MissingTotalStationIssue]] = None
     # Fields for height difference warnings
-    height_difference_issues: Optional[List[dict]] = None
+    height_difference_issues: Optional[List[HeightDifferenceIssue]] = None
+    # Exact features to select, on one or both layers; the filter expressions are
+    # only used when no target can be resolved
+    targets: Optional[List[FeatureTarget]] = None
+
+    def feature_targets(self) -> List[FeatureTarget]:
+        """Return the explicit targets, or the targets derived from the issue records."""
+        if self.targets:
+            return list(self.targets)
+        refs = [
+            ref
+            for issues in (
+                self.out_of_bounds_features,
+                self.distance_issues,
+                self.missing_total_station_issues,
+                self.height_difference_issues,
+            )
+            for issue in issues or []
+            if isinstance(issue, _IssueRecord)
+            for ref in issue.feature_refs()
+        ]
+        return group_feature_refs(refs)
+
+
+@dataclass
+class StepMetrics:
+    """Performance numbers for one import, detector or validation step."""
+    name: str
+    category: str = ""
+    runs: int = 0
+    wall_time_ms: float = 0.0
+    cpu_time_ms: float = 0.0
+    features_scanned: int = 0
+    # Peak traced memory (process-wide); None unless memory tracing was enabled
+    peak_memory_bytes: Optional[int] = None
+    cache_hits: Dict[str, int] = None
+    cache_misses: Dict[str, int] = None
+
+    def __post_init__(self):
+        """Initialize default values for mutable fields."""
+        if self.cache_hits is None:
+            self.cache_hits = {}
+        if self.cache_misses is None:
+            self.cache_misses = {}
+
+    def cache_hit_rate(self, cache_name: Optional[str] = None) -> Optional[float]:
+        """Return the hit rate (0-1) of one cache, or of all caches; None without lookups."""
+        names = [cache_name] if cache_name else set(self.cache_hits) | set(self.cache_misses)
+        hits = sum(self.cache_hits.get(name, 0) for name in names)
+        total = hits + sum(self.cache_misses.get(name, 0) for name in names)
+        return hits / total if total else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        caches = sorted(set(self.cache_hits) | set(self.cache_misses))
+        return {
+            'name': self.name,
+            'category': self.category,
+            'runs': self.runs,
+            'wall_time_ms': round(self.wall_time_ms, 3),
+            'cpu_time_ms': round(self.cpu_time_ms, 3),
+            'features_scanned': self.features_scanned,
+            'peak_memory_bytes': self.peak_memory_bytes,
+            'caches': {
+                name: {
+                    'hits': self.cache_hits.get(name, 0),
+                    'misses': self.cache_misses.get(name, 0),
+                    'hit_rate': self.cache_hit_rate(name),
+                }
+                for name in caches
+            },
+        }
 
 
 @dataclass
@@ -48,6 +302,7 @@ class ImportSummaryData:
     missing_total_station_warnings: List[Union[str, WarningData]] = None
     duplicate_total_station_identifiers_warnings: List[Union[str, WarningData]] = None
     height_difference_warnings: List[Union[str, WarningData]] = None
+    performance_metrics: List[StepMetrics] = None
     
     def __post_init__(self):
         """Initialize default values for mutable fields."""
@@ -64,4 +319,82 @@ class ImportSummaryData:
         if self.duplicate_total_station_identifiers_warnings is None:
             self.duplicate_total_station_identifiers_warnings = []
         if self.height_difference_warnings is None:
-            self.height_difference_warnings = [] 
\ No newline at end of file
+            self.height_difference_warnings = []
+        if self.performance_metrics is None:
+            self.performance_metrics = [] 
+
+def _json_value(value: Any) -> Any:
+    """Convert warning payloads (which may hold QgsFeature objects) to JSON values."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_json_value(item) for item in value]
+    if isinstance(value, (FeatureRef, FeatureTarget, _IssueRecord)):
+        return _json_value(value.to_dict())
+    feature_id = getattr(value, 'id', None)
+    if callable(feature_id) and hasattr(value, 'attributes'):
+        # QgsFeature: keep the feature id rather than geometry and attributes.
+        return feature_id()
+    return str(value)
+
+
+@dataclass
+class BatchValidationReport:
+    """Warnings and timings of one headless detector run."""
+    project_path: str = ""
+    # Warnings per ImportSummaryData attribute name (e.g. ``distance_warnings``)
+    warnings: Dict[str, List[Union[str, WarningData]]] = None
+    # Detector failures per attribute name
+    errors: Dict[str, str] = None
+    metrics: List[StepMetrics] = None
+    total_wall_time_ms: float = 0.0
+
+    def __post_init__(self):
+        """Initialize default values for mutable fields."""
+        if self.warnings is None:
+            self.warnings = {}
+        if self.errors is None:
+            self.errors = {}
+        if self.metrics is None:
+            self.metrics = []
+
+    def warning_count(self) -> int:
+        return sum(len(warnings) for warnings in self.warnings.values())
+
+    def warning_rows(self) -> List[Dict[str, Any]]:
+        """Return one flat row per warning, for CSV reports."""
+        rows = []
+        for category, warnings in self.warnings.items():
+            for warning in warnings:
+                if isinstance(warning, WarningData):
+                    rows.append({
+                        'category': category,
+                        'message': warning.message,
+                        'recording_area': warning.recording_area_name,
+                        'layer': warning.layer_name,
+                        'filter_expression': warning.filter_expression,
+                        'second_layer': warning.second_layer_name or '',
+                        'object_number': '' if warning.object_number is None else warning.object_number,
+                    })
+                else:
+                    rows.append({'category': category, 'message': str(warning)})
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            'project': self.project_path,
+            'warning_count': self.warning_count(),
+            'total_wall_time_ms': round(self.total_wall_time_ms, 3),
+            'errors': dict(self.errors),
+            'steps': [step.to_dict() for step in self.metrics],
+            'warnings': {
+                category: [
+                    _json_value(vars(warning)) if isinstance(warning, WarningData) else {'message': str(warning)}
+                    for warning in warnings
+                ]
+                for category, warnings in self.warnings.items()
+            },
+        }
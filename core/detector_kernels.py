@@ -0,0 +1,177 @@
+"""
+Process-based detector kernels working on exported layer snapshots.
+
+Detectors run on threads in the summary dock and in batch validation, so pure-Python
+pair searches are serialized by the GIL. For large imports a detector can instead
+export the columns it needs to a snapshot file and let :func:`run_kernel` scan it in
+a :class:`ProcessPoolExecutor`:
+
+    path = write_point_snapshot(rows)          # rows of (fid, x, y, z)
+    records = run_kernel(height_difference_kernel, path, len(rows), workers=4,
+                         max_distance=1.0, max_height_difference=0.2)
+
+A point snapshot is a flat file of native doubles (``fid, x, y, z`` per point) that
+workers memory-map read-only, so the data is shared through the page cache instead
+of being pickled to every worker. Kernels return compact tuples; the calling
+detector maps feature ids back to features and builds its ``WarningData``.
+
+This module only uses the standard library: workers are started with the
+``forkserver``/``spawn`` method and never import QGIS or Qt, so they run on a
+headless Linux box and never fork a running QGIS GUI.
+"""
+
+import mmap
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+try:
+    from .diagnostics import get_diagnostics
+except ImportError:
+    from core.diagnostics import get_diagnostics
+
+_diag = get_diagnostics("detector_kernels")
+
+POINT_COLUMNS = 4
+# Below this many rows, worker start-up costs more than the scan itself.
+MIN_PROCESS_ROWS = 5000
+# Chunks per worker, so a dense area does not leave the other workers idle.
+CHUNKS_PER_WORKER = 4
+
+HeightDifferenceRecord = Tuple[int, int, float, float]
+
+
+def write_point_snapshot(rows: Iterable[Sequence[float]], directory: str = None) -> str:
+    """
+    Write ``(fid, x, y, z)`` rows to a new snapshot file and return its path.
+
+    The caller owns the file and removes it with :func:`remove_snapshot`.
+    """
+    values = array('d')
+    for fid, x, y, z in rows:
+        values.extend((float(fid), float(x), float(y), float(z)))
+    handle, path = tempfile.mkstemp(prefix="archeosync_points_", suffix=".bin", dir=directory)
+    with os.fdopen(handle, 'wb') as snapshot_file:
+        values.tofile(snapshot_file)
+    return path
+
+
+def remove_snapshot(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError as e:
+        _diag.warning("Error removing detector snapshot %s: %s", path, e)
+
+
+def read_point_snapshot(path: str) -> memoryview:
+    """Map a point snapshot read-only and return it as a flat view of doubles."""
+    if os.path.getsize(path) == 0:
+        return memoryview(array('d'))
+    with open(path, 'rb') as snapshot_file:
+        mapped = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast('d')
+
+
+# Workers keep the mapped snapshot and its grid between chunks of the same run.
+_snapshot_cache: Dict[Tuple[str, float], Tuple[memoryview, Dict[Tuple[int, int], List[int]]]] = {}
+
+
+def _point_grid(path: str, cell_size: float) -> Tuple[memoryview, Dict[Tuple[int, int], List[int]]]:
+    key = (path, cell_size)
+    cached = _snapshot_cache.get(key)
+    if cached is None:
+        _snapshot_cache.clear()
+        values = read_point_snapshot(path)
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        for row in range(len(values) // POINT_COLUMNS):
+            offset = row * POINT_COLUMNS
+            cell = (int(values[offset + 1] // cell_size), int(values[offset + 2] // cell_size))
+            grid.setdefault(cell, []).append(row)
+        cached = (values, grid)
+        _snapshot_cache[key] = cached
+    return cached
+
+
+def height_difference_kernel(
+    path: str, start: int, stop: int, max_distance: float, max_height_difference: float
+) -> List[HeightDifferenceRecord]:
+    """
+    Find close point pairs with a large height difference.
+
+    Rows ``start`` to ``stop`` are paired with every later row lying within
+    ``max_distance`` (planar distance in layer units), so chunks together report
+    each pair exactly once. Returns ``(fid1, fid2, distance, height_difference)``.
+    """
+    cell_size = max(float(max_distance), 1e-9)
+    values, grid = _point_grid(path, cell_size)
+    records = []
+    for row in range(start, stop):
+        offset = row * POINT_COLUMNS
+        x1 = values[offset + 1]
+        y1 = values[offset + 2]
+        z1 = values[offset + 3]
+        cell_x = int(x1 // cell_size)
+        cell_y = int(y1 // cell_size)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for other in grid.get((cell_x + dx, cell_y + dy), ()):
+                    if other <= row:
+                        continue
+                    other_offset = other * POINT_COLUMNS
+                    distance = ((values[other_offset + 1] - x1) ** 2 + (values[other_offset + 2] - y1) ** 2) ** 0.5
+                    if distance > max_distance:
+                        continue
+                    height_difference = abs(z1 - values[other_offset + 3])
+                    if height_difference > max_height_difference:
+                        records.append((
+                            int(values[offset]), int(values[other_offset]), distance, height_difference
+                        ))
+    return records
+
+
+def _process_context():
+    """Start method that never forks the (possibly threaded, GUI) parent process."""
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    # Inside QGIS sys.executable is the QGIS binary, which cannot run worker scripts.
+    if not os.path.basename(sys.executable).lower().startswith('python'):
+        interpreter = shutil.which(f"python{sys.version_info.major}.{sys.version_info.minor}") or shutil.which('python3')
+        if interpreter:
+            context.set_executable(interpreter)
+    return context
+
+
+def run_kernel(
+    kernel: Callable[..., List[tuple]], path: str, row_count: int, workers: int, **parameters
+) -> List[tuple]:
+    """
+    Run ``kernel(path, start, stop, **parameters)`` over row chunks in worker processes.
+
+    Records are returned in row order. With one worker, or fewer rows than
+    :data:`MIN_PROCESS_ROWS`, the kernel runs in the calling process.
+    """
+    if row_count <= 0:
+        return []
+    if workers <= 1 or row_count < MIN_PROCESS_ROWS:
+        try:
+            return kernel(path, 0, row_count, **parameters)
+        finally:
+            # The snapshot is removed after the run; do not keep it mapped here.
+            _snapshot_cache.clear()
+
+    chunk_count = workers * CHUNKS_PER_WORKER
+    chunk_size = max(1, -(-row_count // chunk_count))
+    bounds = [(start, min(start + chunk_size, row_count)) for start in range(0, row_count, chunk_size)]
+    _diag.debug("Running %s over %d rows in %d chunks on %d processes",
+                kernel.__name__, row_count, len(bounds), workers)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_process_context()) as executor:
+        futures = [executor.submit(kernel, path, start, stop, **parameters) for start, stop in bounds]
+        records = []
+        for future in futures:
+            records.extend(future.result())
+    return records
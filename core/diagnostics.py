@@ -0,0 +1,166 @@
+"""
+Plugin-wide diagnostics with categories and levels.
+
+Services used to ``print("[DEBUG] ...")`` from per-feature and per-relation loops.
+On large imports formatting and writing those lines to the QGIS Python console is
+measurable work. Diagnostics go through the standard :mod:`logging` machinery
+instead: each category is a child logger of ``archeosync``, messages use lazy
+``%``-style arguments, and nothing is formatted when the level is disabled.
+
+Usage:
+    _diag = get_diagnostics("detectors.out_of_bounds")
+    _diag.debug("Processed %d features", count)
+
+    if _diag.isEnabledFor(DEBUG):  # arguments that are costly to compute
+        _diag.debug("Layer feature count: %d", layer.featureCount())
+
+    configure_diagnostics(level="DEBUG", output=OUTPUT_MESSAGE_LOG)
+
+The default level is ``WARNING`` on the console. ``configure_diagnostics_from_settings``
+reads ``diagnostics_level``, ``diagnostics_output`` and ``diagnostics_file`` from the
+plugin settings; the ``ARCHEOSYNC_DIAGNOSTICS`` environment variable overrides the level.
+"""
+
+import logging
+import os
+from typing import Any, Dict, Optional, Union
+
+ROOT_LOGGER_NAME = "archeosync"
+MESSAGE_LOG_TAG = "ArcheoSync"
+ENVIRONMENT_VARIABLE = "ARCHEOSYNC_DIAGNOSTICS"
+
+OUTPUT_CONSOLE = "console"
+OUTPUT_MESSAGE_LOG = "message_log"
+OUTPUT_FILE = "file"
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+DEFAULT_LEVEL = WARNING
+
+_LEVEL_NAMES: Dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "OFF": logging.CRITICAL + 10,
+}
+
+_FORMAT = "[%(levelname)s][%(name)s] %(message)s"
+_handler: Optional[logging.Handler] = None
+
+
+def _root_logger() -> logging.Logger:
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    if _handler is None:
+        configure_diagnostics()
+    return logger
+
+
+def get_diagnostics(category: str) -> logging.Logger:
+    """
+    Return the diagnostics logger for ``category`` (e.g. ``"detectors.distance"``).
+
+    Levels can be set per category with :func:`set_category_level`.
+    """
+    _root_logger()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{category}")
+
+
+def parse_level(level: Union[int, str, None], default: int = DEFAULT_LEVEL) -> int:
+    """Convert a level name (``"debug"``, ``"off"``, ...) or number to a logging level."""
+    if level is None or level == "":
+        return default
+    if isinstance(level, int):
+        return level
+    text = str(level).strip().upper()
+    if text.isdigit():
+        return int(text)
+    return _LEVEL_NAMES.get(text, default)
+
+
+def set_category_level(category: str, level: Union[int, str]) -> None:
+    """Override the level of one category (and its sub-categories)."""
+    logging.getLogger(f"{ROOT_LOGGER_NAME}.{category}").setLevel(parse_level(level))
+
+
+class QgsMessageLogHandler(logging.Handler):
+    """Route diagnostics to the QGIS message log panel."""
+
+    def __init__(self, tag: str = MESSAGE_LOG_TAG):
+        super().__init__()
+        self._tag = tag
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            from qgis.core import Qgis, QgsMessageLog
+
+            QgsMessageLog.logMessage(self.format(record), self._tag, qgis_message_level(Qgis, record.levelno))
+        except Exception:
+            self.handleError(record)
+
+
+def qgis_message_level(qgis: Any, levelno: int) -> Any:
+    """Map a logging level to a ``Qgis`` message level (QGIS 3 and QGIS 4)."""
+    if levelno >= logging.ERROR:
+        name = "Critical"
+    elif levelno >= logging.WARNING:
+        name = "Warning"
+    else:
+        name = "Info"
+    if hasattr(qgis, name):
+        return getattr(qgis, name)
+    return getattr(qgis.MessageLevel, name)
+
+
+def configure_diagnostics(
+    level: Union[int, str, None] = None,
+    output: str = OUTPUT_CONSOLE,
+    file_path: Optional[str] = None,
+) -> logging.Handler:
+    """
+    Configure the level and destination of all plugin diagnostics.
+
+    Args:
+        level: Level name or number; defaults to ``WARNING`` unless the
+            ``ARCHEOSYNC_DIAGNOSTICS`` environment variable is set
+        output: ``"console"``, ``"message_log"`` or ``"file"``
+        file_path: Log file used when ``output`` is ``"file"``
+
+    Returns:
+        The handler now attached to the ``archeosync`` logger
+    """
+    global _handler
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    environment_level = os.environ.get(ENVIRONMENT_VARIABLE)
+    logger.setLevel(parse_level(environment_level or level))
+    logger.propagate = False
+
+    if output == OUTPUT_FILE and file_path:
+        handler: logging.Handler = logging.FileHandler(file_path, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s " + _FORMAT))
+    elif output == OUTPUT_MESSAGE_LOG:
+        handler = QgsMessageLogHandler()
+        handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+    else:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(_FORMAT))
+
+    if _handler is not None:
+        logger.removeHandler(_handler)
+        _handler.close()
+    logger.addHandler(handler)
+    _handler = handler
+    return handler
+
+
+def configure_diagnostics_from_settings(settings_manager: Any) -> None:
+    """Apply the diagnostics level and output stored in the plugin settings."""
+    try:
+        configure_diagnostics(
+            level=settings_manager.get_value("diagnostics_level", "WARNING"),
+            output=settings_manager.get_value("diagnostics_output", OUTPUT_CONSOLE) or OUTPUT_CONSOLE,
+            file_path=settings_manager.get_value("diagnostics_file", "") or None,
+        )
+    except Exception as e:
+        print(f"Error configuring diagnostics: {e}")
@@ -0,0 +1,135 @@
+"""
+Shaped feature requests for read-only layer scans.
+
+Detectors usually need one or two attributes per feature and often no geometry at
+all. Iterating ``layer.getFeatures()`` without a request makes the provider decode
+every column and every geometry blob, which dominates scan time on GeoPackage and
+PostGIS-backed definitive layers. These helpers let each scan declare exactly which
+fields it reads and whether it needs geometry.
+
+Attribute indices stay stable: QGIS keeps the full attribute vector on returned
+features and only leaves unrequested columns empty, so callers can keep using the
+indices they resolved from ``layer.fields()``.
+"""
+
+from typing import Any, Iterable, List, Optional, Union
+
+try:
+    from .performance import count_scanned_features, is_measuring
+except ImportError:
+    from core.performance import count_scanned_features, is_measuring
+
+FieldRef = Union[int, str]
+
+
+def _no_geometry_flag() -> Any:
+    """Return the ``NoGeometry`` request flag compatible with QGIS 3 and QGIS 4."""
+    from qgis.core import QgsFeatureRequest
+
+    if hasattr(QgsFeatureRequest, "NoGeometry"):
+        return QgsFeatureRequest.NoGeometry
+    from qgis.core import Qgis
+
+    return Qgis.FeatureRequestFlag.NoGeometry
+
+
+def resolve_field_indices(layer: Any, fields: Iterable[Optional[FieldRef]]) -> List[int]:
+    """
+    Resolve field names and indices to a de-duplicated list of valid indices.
+
+    Names are matched exactly first, then case-insensitively. Missing fields,
+    ``None`` entries and negative indices are ignored.
+    """
+    indices: List[int] = []
+    layer_fields = None
+    for field in fields:
+        if field is None:
+            continue
+        if isinstance(field, int):
+            index = field
+        else:
+            if layer_fields is None:
+                layer_fields = layer.fields()
+            index = layer_fields.indexOf(field)
+            if isinstance(index, int) and index < 0:
+                wanted = str(field).lower()
+                for candidate_index, candidate in enumerate(layer_fields):
+                    if candidate.name().lower() == wanted:
+                        index = candidate_index
+                        break
+        if isinstance(index, int) and index >= 0 and index not in indices:
+            indices.append(index)
+    return indices
+
+
+def field_in_expression(field_name: str, values: Iterable[Any]) -> str:
+    """
+    Build a ``"field" IN (...)`` expression with properly quoted values.
+
+    Providers that compile expressions (OGR/GeoPackage, PostGIS) turn this into a
+    SQL ``IN`` clause, so only matching rows are read.
+    """
+    from qgis.core import QgsExpression
+
+    quoted_values = ",".join(QgsExpression.quotedValue(value) for value in values)
+    return f"{QgsExpression.quotedColumnRef(field_name)} IN ({quoted_values})"
+
+
+def build_feature_request(
+    layer: Any,
+    fields: Optional[Iterable[Optional[FieldRef]]] = None,
+    *,
+    with_geometry: bool = True,
+    limit: Optional[int] = None,
+    filter_expression: Optional[str] = None,
+) -> Any:
+    """
+    Build a ``QgsFeatureRequest`` fetching only what a scan needs.
+
+    Args:
+        layer: Layer the request will run against (used to resolve field names).
+        fields: Field names or indices to fetch. ``None`` fetches all attributes;
+            an empty iterable fetches none.
+        with_geometry: When False, the provider skips geometry decoding.
+        limit: Optional maximum number of features to return.
+        filter_expression: Optional expression restricting the returned features.
+    """
+    from qgis.core import QgsFeatureRequest
+
+    request = QgsFeatureRequest()
+    if filter_expression:
+        request.setFilterExpression(filter_expression)
+    if fields is not None:
+        request.setSubsetOfAttributes(resolve_field_indices(layer, fields))
+    if not with_geometry:
+        request.setFlags(request.flags() | _no_geometry_flag())
+    if limit is not None:
+        request.setLimit(limit)
+    return request
+
+
+def iter_features(
+    layer: Any,
+    fields: Optional[Iterable[Optional[FieldRef]]] = None,
+    *,
+    with_geometry: bool = True,
+    limit: Optional[int] = None,
+    filter_expression: Optional[str] = None,
+) -> Any:
+    """
+    Iterate ``layer`` with a request built by :func:`build_feature_request`.
+
+    Inside a measured performance step the iterated features are counted.
+    """
+    features = layer.getFeatures(
+        build_feature_request(
+            layer,
+            fields,
+            with_geometry=with_geometry,
+            limit=limit,
+            filter_expression=filter_expression,
+        )
+    )
+    if is_measuring():
+        return count_scanned_features(features)
+    return features
@@ -456,6 +456,42 @@ class ILayerService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_related_objects_info_batch(
+        self,
+        recording_area_features: List[Any],
+        objects_layer_id: str,
+        number_field: Optional[str],
+        level_field: Optional[str],
+        recording_areas_layer_id: Optional[str] = None,
+        unfiltered: bool = False,
+    ) -> Dict[Any, Dict[str, str]]:
+        """
+        Get related objects information for many recording areas in one grouped pass.
+        
+        Args:
+            recording_area_features: The recording area features to get related objects for
+            objects_layer_id: The objects layer ID
+            number_field: The number field name (optional)
+            level_field: The level field name (optional)
+            recording_areas_layer_id: The recording areas layer ID (parent layer, required for relation lookup)
+            unfiltered: When True, ignore QGIS layer display filters while still scoping to each recording area
+            
+        Returns:
+            Dictionary mapping each recording area feature id to its 'last_number' and 'last_level' values
+        """
+        pass
+
+    @abstractmethod
+    def release_unfiltered_layers(self) -> None:
+        """
+        Close the unfiltered layer copies opened for related objects lookups.
+        
+        Called when a preparation run no longer needs them, so their data sources
+        are not held open and later lookups read the current rows.
+        """
+        pass
+
     @abstractmethod
     def calculate_next_level(self, last_level: str, level_field: str, objects_layer_id: str) -> str:
         """
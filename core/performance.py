@@ -0,0 +1,186 @@
+"""
+Per-step performance instrumentation for imports, warning detection and validation.
+
+A :class:`PerformanceRecorder` collects :class:`StepMetrics` (wall time, CPU time of the
+running thread, features scanned, peak traced memory and cache hit rates) into a list,
+typically ``ImportSummaryData.performance_metrics``:
+
+    recorder = PerformanceRecorder(summary_data.performance_metrics)
+    with recorder.measure("Distance detector", category=CATEGORY_DETECTOR):
+        detector.detect_distance_warnings()
+
+Code running inside a measured step reports what it did with
+:func:`record_features_scanned` and :func:`record_cache_access`; both are cheap no-ops
+outside a step. Steps measured again under the same name and category accumulate,
+so validation batches add up to one entry per layer.
+"""
+
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from .data_structures import StepMetrics
+except ImportError:
+    from core.data_structures import StepMetrics
+
+CATEGORY_IMPORT = "import"
+CATEGORY_DETECTOR = "detector"
+CATEGORY_VALIDATION = "validation"
+
+_active = threading.local()
+
+
+def _active_steps() -> List[StepMetrics]:
+    steps = getattr(_active, "steps", None)
+    if steps is None:
+        steps = []
+        _active.steps = steps
+    return steps
+
+
+def is_measuring() -> bool:
+    """Return True while a step is being measured on the current thread."""
+    return bool(getattr(_active, "steps", None))
+
+
+def count_scanned_features(features: Iterable[Any]) -> Iterator[Any]:
+    """Yield ``features`` and report how many were consumed when iteration ends."""
+    count = 0
+    try:
+        for feature in features:
+            count += 1
+            yield feature
+    finally:
+        record_features_scanned(count)
+
+
+def record_features_scanned(count: int) -> None:
+    """Add ``count`` scanned features to every step measured on the current thread."""
+    steps = getattr(_active, "steps", None)
+    if not steps or count <= 0:
+        return
+    for step in steps:
+        step.features_scanned += count
+
+
+def record_cache_access(cache_name: str, hit: bool) -> None:
+    """Count one lookup of ``cache_name`` for every step measured on the current thread."""
+    steps = getattr(_active, "steps", None)
+    if not steps:
+        return
+    for step in steps:
+        counts = step.cache_hits if hit else step.cache_misses
+        counts[cache_name] = counts.get(cache_name, 0) + 1
+
+
+class PerformanceRecorder:
+    """Collect step metrics into a list shared with ``ImportSummaryData``."""
+
+    def __init__(self, metrics: Optional[List[StepMetrics]] = None, trace_memory: bool = False):
+        """
+        Args:
+            metrics: List the recorded steps are appended to (a new list if None)
+            trace_memory: Record peak traced memory with :mod:`tracemalloc`; this slows
+                allocation-heavy code noticeably, so it is off by default
+        """
+        self.metrics: List[StepMetrics] = metrics if metrics is not None else []
+        self.trace_memory = trace_memory
+        self._lock = threading.Lock()
+
+    def _step(self, name: str, category: str) -> StepMetrics:
+        with self._lock:
+            for step in self.metrics:
+                if step.name == name and step.category == category:
+                    return step
+            step = StepMetrics(name=name, category=category)
+            self.metrics.append(step)
+            return step
+
+    def clear(self, category: Optional[str] = None) -> None:
+        """Drop recorded steps, optionally only those of one category."""
+        with self._lock:
+            self.metrics[:] = [
+                step for step in self.metrics if category is not None and step.category != category
+            ]
+
+    @contextmanager
+    def measure(self, name: str, category: str = "") -> Iterator[StepMetrics]:
+        """
+        Measure the enclosed block as step ``name``.
+
+        Yields the accumulated :class:`StepMetrics` so callers can add counts
+        they know directly (e.g. the number of imported CSV rows).
+        """
+        step = self._step(name, category)
+        # Only the outermost traced step resets the (process-wide) tracemalloc peak.
+        owns_trace = False
+        started_tracing = False
+        if self.trace_memory and not getattr(_active, "tracing", False):
+            owns_trace = True
+            _active.tracing = True
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            else:
+                tracemalloc.reset_peak()
+
+        steps = _active_steps()
+        steps.append(step)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield step
+        finally:
+            step.cpu_time_ms += (time.thread_time() - cpu_start) * 1000.0
+            step.wall_time_ms += (time.perf_counter() - wall_start) * 1000.0
+            step.runs += 1
+            steps.remove(step)
+            if owns_trace:
+                peak = tracemalloc.get_traced_memory()[1]
+                step.peak_memory_bytes = max(step.peak_memory_bytes or 0, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+                _active.tracing = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return all steps plus totals as a JSON-serializable dictionary."""
+        with self._lock:
+            steps = [step.to_dict() for step in self.metrics]
+        return {
+            'steps': steps,
+            'total_wall_time_ms': round(sum(step['wall_time_ms'] for step in steps), 3),
+            'total_cpu_time_ms': round(sum(step['cpu_time_ms'] for step in steps), 3),
+        }
+
+    def export_json(self, file_path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Write :meth:`to_dict` (plus optional ``extra`` keys) to ``file_path`` as indented JSON."""
+        data = self.to_dict()
+        if extra:
+            data.update(extra)
+        with open(file_path, 'w', encoding='utf-8') as output:
+            json.dump(data, output, indent=2)
+
+
+def create_performance_recorder(
+    settings_manager: Any = None, metrics: Optional[List[StepMetrics]] = None
+) -> PerformanceRecorder:
+    """
+    Create a recorder honouring the ``performance_trace_memory`` setting.
+
+    QSettings may return booleans as ``"true"``/``"false"`` strings.
+    """
+    trace_memory = False
+    if settings_manager is not None:
+        try:
+            value = settings_manager.get_value('performance_trace_memory', False)
+            if isinstance(value, str):
+                trace_memory = value.strip().lower() in ('1', 'true', 'yes')
+            elif isinstance(value, (bool, int)):
+                trace_memory = bool(value)
+        except Exception as e:
+            print(f"Error reading performance settings: {e}")
+    return PerformanceRecorder(metrics, trace_memory=trace_memory)
@@ -0,0 +1,243 @@
+"""
+On-demand profiling of plugin operations with :mod:`cProfile` and :mod:`tracemalloc`.
+
+Profiling is off by default. It is enabled with the ``profiling_enabled`` plugin
+setting or the ``ARCHEOSYNC_PROFILE`` environment variable (``1``/``true``, or
+``memory`` to also trace allocations). Each profiled operation writes a timestamped
+``.prof`` file, readable with :mod:`pstats` or snakeviz, and optionally a
+``.tracemalloc`` snapshot into ``profiling_output_dir`` (default: a folder in the
+system temp directory). A top-N summary is written to the QGIS message log.
+
+Synchronous entry points use the :func:`profiled_operation` decorator, which looks
+up the object's ``_profiler``. Operations spread over several event-loop ticks or
+QgsTask threads (warning refresh, validation) open a :class:`ProfileSession` and
+profile each tick with :func:`profile_segment`; segments accumulate into one file.
+
+Only one segment is profiled at a time: nested or concurrent segments are skipped
+and their time counts towards the enclosing segment.
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Iterator, Optional
+
+try:
+    from .diagnostics import INFO, MESSAGE_LOG_TAG, get_diagnostics, qgis_message_level
+except ImportError:
+    from core.diagnostics import INFO, MESSAGE_LOG_TAG, get_diagnostics, qgis_message_level
+
+ENVIRONMENT_VARIABLE = "ARCHEOSYNC_PROFILE"
+DEFAULT_TOP_N = 15
+DEFAULT_OUTPUT_DIR = os.path.join(tempfile.gettempdir(), "archeosync_profiles")
+
+_diag = get_diagnostics("profiling")
+# cProfile cannot run two profilers at once (Python 3.12+ refuses outright).
+_segment_lock = threading.Lock()
+
+
+def _is_true(value: Any) -> bool:
+    """Interpret QSettings-style booleans (``"true"``/``"false"`` strings)."""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on', 'memory')
+    if isinstance(value, (bool, int)):
+        return bool(value)
+    return False
+
+
+def _log_summary(text: str) -> None:
+    try:
+        from qgis.core import Qgis, QgsMessageLog
+
+        QgsMessageLog.logMessage(text, MESSAGE_LOG_TAG, qgis_message_level(Qgis, INFO))
+    except Exception:
+        _diag.info("%s", text)
+
+
+class ProfileSession:
+    """One profiled operation, possibly spread over several segments."""
+
+    def __init__(self, name: str, output_dir: str, trace_memory: bool = False, top_n: int = DEFAULT_TOP_N):
+        self.name = name
+        self.output_dir = output_dir
+        self.trace_memory = trace_memory
+        self.top_n = top_n
+        self.profile_path: Optional[str] = None
+        self.snapshot_path: Optional[str] = None
+        self._profile = cProfile.Profile()
+        self._started = time.perf_counter()
+        self._segments = 0
+        self._in_segment = False
+        self._segment_thread: Optional[int] = None
+        self._finish_pending = False
+        self._finished = False
+        self._state_lock = threading.Lock()
+        self._started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def segment(self) -> Iterator[None]:
+        """Profile the enclosed block as part of this session."""
+        if self._finished or not _segment_lock.acquire(blocking=False):
+            yield
+            return
+        try:
+            self._profile.enable()
+            self._in_segment = True
+            self._segment_thread = threading.get_ident()
+        except ValueError as e:
+            # Another profiler (e.g. a debugger) is active.
+            _diag.warning("Could not profile %s: %s", self.name, e)
+        try:
+            yield
+        finally:
+            with self._state_lock:
+                self._end_segment()
+                finish_pending = self._finish_pending
+            _segment_lock.release()
+            if finish_pending:
+                self.finish()
+
+    def _end_segment(self) -> None:
+        if self._in_segment:
+            self._profile.disable()
+            self._segments += 1
+            self._in_segment = False
+
+    def finish(self) -> Optional[str]:
+        """
+        Write the profile (and memory snapshot) and log the top-N summary.
+
+        Returns:
+            Path of the ``.prof`` file, or None when nothing was profiled
+        """
+        with self._state_lock:
+            if self._finished:
+                return self.profile_path
+            if self._in_segment and self._segment_thread != threading.get_ident():
+                # A QgsTask thread is still profiling; it finishes the session when done.
+                self._finish_pending = True
+                return None
+            self._finished = True
+            # Finishing from inside a segment (e.g. the last validation tick) ends it here.
+            self._end_segment()
+        snapshot = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            if self._started_tracing:
+                tracemalloc.stop()
+        if not self._segments:
+            return None
+
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            base_path = os.path.join(
+                self.output_dir, f"{self.name}_{time.strftime('%Y%m%d_%H%M%S')}"
+            )
+            self.profile_path = base_path + ".prof"
+            self._profile.dump_stats(self.profile_path)
+            if snapshot is not None:
+                self.snapshot_path = base_path + ".tracemalloc"
+                snapshot.dump(self.snapshot_path)
+            _log_summary(self.summary(snapshot))
+        except Exception as e:
+            _diag.warning("Error writing profile for %s: %s", self.name, e, exc_info=True)
+        return self.profile_path
+
+    def summary(self, snapshot: Optional[tracemalloc.Snapshot] = None) -> str:
+        """Return the top functions by cumulative time (and top allocations) as text."""
+        output = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=output)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+        lines = [
+            f"Profile '{self.name}': {time.perf_counter() - self._started:.2f} s elapsed, "
+            f"{self._segments} segment(s) -> {self.profile_path}",
+            output.getvalue().strip(),
+        ]
+        if snapshot is not None:
+            lines.append(f"Top {self.top_n} allocations -> {self.snapshot_path}")
+            for statistic in snapshot.statistics('lineno')[:self.top_n]:
+                lines.append(f"  {statistic}")
+        return "\n".join(lines)
+
+
+class OperationProfiler:
+    """Create profile sessions according to the plugin settings."""
+
+    def __init__(self, settings_manager: Any = None):
+        self._settings_manager = settings_manager
+
+    def _setting(self, key: str, default: Any) -> Any:
+        if self._settings_manager is None:
+            return default
+        try:
+            return self._settings_manager.get_value(key, default)
+        except Exception as e:
+            _diag.warning("Error reading profiling settings: %s", e)
+            return default
+
+    @property
+    def enabled(self) -> bool:
+        environment_value = os.environ.get(ENVIRONMENT_VARIABLE)
+        if environment_value:
+            return _is_true(environment_value)
+        return _is_true(self._setting('profiling_enabled', False))
+
+    @property
+    def trace_memory(self) -> bool:
+        environment_value = os.environ.get(ENVIRONMENT_VARIABLE, "")
+        if environment_value.strip().lower() == 'memory':
+            return True
+        return _is_true(self._setting('profiling_trace_memory', False))
+
+    def start_session(self, name: str) -> Optional[ProfileSession]:
+        """Return a new session for ``name``, or None when profiling is disabled."""
+        if not self.enabled:
+            return None
+        output_dir = self._setting('profiling_output_dir', '') or DEFAULT_OUTPUT_DIR
+        try:
+            top_n = int(self._setting('profiling_top_n', DEFAULT_TOP_N))
+        except (TypeError, ValueError):
+            top_n = DEFAULT_TOP_N
+        return ProfileSession(name, output_dir, trace_memory=self.trace_memory, top_n=top_n)
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[Optional[ProfileSession]]:
+        """Profile the enclosed block as one complete session."""
+        session = self.start_session(name)
+        if session is None:
+            yield None
+            return
+        try:
+            with session.segment():
+                yield session
+        finally:
+            session.finish()
+
+
+def profile_segment(session: Optional[ProfileSession]):
+    """Return ``session.segment()``, or a no-op context when ``session`` is None."""
+    return session.segment() if session is not None else nullcontext()
+
+
+def profiled_operation(name: str) -> Callable[[Callable], Callable]:
+    """Profile a method with its object's ``_profiler`` when profiling is enabled."""
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = getattr(self, '_profiler', None)
+            if profiler is None or not profiler.enabled:
+                return method(self, *args, **kwargs)
+            with profiler.profile(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,175 @@
+"""
+Per-run recording-area name lookups for detectors.
+
+Detectors report warnings per recording area and need a human-readable name for
+each one. Resolving a name by scanning the recording-areas layer for every warning
+(and comparing every attribute of every feature) is O(warnings × areas × fields).
+:class:`RecordingAreaNameIndex` reads the recording-areas layer once, evaluates the
+display expression once per area and maps recording-area keys to names, so lookups
+during a detection run are dictionary hits.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .feature_requests import iter_features, resolve_field_indices
+    from .relation_graph import get_relation_graph
+    from .ui_responsiveness import maybe_yield_to_ui
+    from .diagnostics import get_diagnostics
+    from .performance import record_cache_access
+except ImportError:
+    from core.feature_requests import iter_features, resolve_field_indices
+    from core.relation_graph import get_relation_graph
+    from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import get_diagnostics
+    from core.performance import record_cache_access
+
+_diag = get_diagnostics("detectors.recording_area_names")
+
+_NAME_FIELD_NAMES = ('name', 'title', 'label', 'description', 'comment')
+
+
+def find_relation_field_pair(referencing_layer: Any, referenced_layer: Any) -> Optional[Tuple[str, str]]:
+    """
+    Return the first ``(referencing_field, referenced_field)`` pair of the project
+    relation going from ``referencing_layer`` to ``referenced_layer``.
+
+    Returns:
+        The field name pair, or None if no such relation exists
+    """
+    if not referencing_layer or not referenced_layer:
+        return None
+    try:
+        relation = get_relation_graph().relation_from(referencing_layer, referenced_layer)
+        if relation is None:
+            return None
+        field_pairs = relation.fieldPairs()
+        if not field_pairs:
+            return None
+        referencing_field, referenced_field = next(iter(field_pairs.items()))
+        return referencing_field, referenced_field
+    except Exception as e:
+        _diag.warning("Error resolving relation fields: %s", e)
+        return None
+
+
+class RecordingAreaNameIndex:
+    """
+    Map recording-area keys (feature ids and attribute values) to display names.
+
+    The layer is read lazily on the first lookup. Names come from the layer's
+    display expression when ``use_display_expression`` is set, then from the first
+    usable name field (``name``, ``title``, ...), then from the feature id.
+
+    Args:
+        recording_areas_layer: The recording areas layer
+        key_fields: Fields whose values identify an area, in addition to the
+            feature id. ``None`` indexes every attribute, so any attribute value of
+            an area resolves to it; an empty iterable indexes feature ids only.
+        use_display_expression: Whether to try the layer's display expression first
+    """
+
+    def __init__(self,
+                 recording_areas_layer: Any,
+                 key_fields: Optional[Iterable[str]] = None,
+                 use_display_expression: bool = True):
+        self._layer = recording_areas_layer
+        self._key_fields = None if key_fields is None else tuple(key_fields)
+        self._use_display_expression = use_display_expression
+        self._names: Optional[Dict[Any, str]] = None
+
+    def name(self, key: Any) -> str:
+        """Return the display name for ``key``, or ``str(key)`` when no area matches."""
+        if self._names is None:
+            self._names = self._build()
+        try:
+            name = self._names.get(key)
+        except TypeError:
+            name = None
+        record_cache_access("recording_area_names", name is not None)
+        return name if name is not None else str(key)
+
+    def _build(self) -> Dict[Any, str]:
+        names: Dict[Any, str] = {}
+        if not self._layer:
+            return names
+        try:
+            layer_fields = self._layer.fields()
+            name_field_indices = [
+                field_idx
+                for field_idx in (layer_fields.indexOf(field_name) for field_name in _NAME_FIELD_NAMES)
+                if field_idx >= 0
+            ]
+
+            expression, context = self._prepare_display_expression()
+            if self._key_fields is None:
+                key_indices = None
+            else:
+                key_indices = resolve_field_indices(self._layer, self._key_fields)
+
+            if expression is not None or key_indices is None:
+                features = iter_features(
+                    self._layer,
+                    with_geometry=expression is not None and expression.needsGeometry(),
+                )
+            else:
+                features = iter_features(
+                    self._layer, tuple(key_indices) + tuple(name_field_indices), with_geometry=False
+                )
+
+            for feature in features:
+                maybe_yield_to_ui(every=50)
+                display_name = self._display_name(feature, expression, context, name_field_indices)
+                # The first area matching a key wins, as with a sequential scan.
+                names.setdefault(feature.id(), display_name)
+                if key_indices is None:
+                    key_values = feature.attributes()
+                else:
+                    key_values = [feature[field_idx] for field_idx in key_indices]
+                for value in key_values:
+                    if value is None or str(value) == 'NULL':
+                        continue
+                    try:
+                        names.setdefault(value, display_name)
+                    except TypeError:
+                        continue
+        except Exception as e:
+            print(f"Error indexing recording area names: {e}")
+        return names
+
+    def _prepare_display_expression(self) -> Tuple[Optional[Any], Optional[Any]]:
+        """Parse and prepare the layer's display expression once for the whole scan."""
+        if not self._use_display_expression:
+            return None, None
+        try:
+            display_expression = self._layer.displayExpression()
+            if not display_expression:
+                return None, None
+            from qgis.core import QgsExpression, QgsExpressionContext, QgsExpressionContextUtils
+
+            context = QgsExpressionContext()
+            context.appendScope(QgsExpressionContextUtils.layerScope(self._layer))
+            expression = QgsExpression(display_expression)
+            if expression.hasParserError():
+                print(f"Error parsing display expression: {expression.parserErrorString()}")
+                return None, None
+            expression.prepare(context)
+            return expression, context
+        except Exception as e:
+            print(f"Error preparing display expression: {e}")
+            return None, None
+
+    def _display_name(self, feature: Any, expression: Any, context: Any, name_field_indices: List[int]) -> str:
+        if expression is not None:
+            try:
+                context.setFeature(feature)
+                result = expression.evaluate(context)
+                if result and str(result) != 'NULL':
+                    return str(result)
+            except Exception as e:
+                print(f"Error evaluating display expression: {e}")
+        for name_field_idx in name_field_indices:
+            name_value = feature[name_field_idx]
+            if name_value and str(name_value) != 'NULL':
+                return str(name_value)
+        return str(feature.id())
@@ -0,0 +1,295 @@
+"""
+Project-level graph of QGIS relations.
+
+Detectors and the layer service repeatedly look up relations touching a layer,
+relations between two layers and the shortest relation chain between two layers.
+Walking ``relationManager().relations()`` for each of those questions (once per BFS
+node for path searches) is wasteful because the relation set only changes when the
+user edits project relations. :class:`RelationGraph` indexes the relations once,
+with adjacency lists keyed by layer id, caches shortest paths, and drops everything
+when the relation manager emits ``changed``.
+
+Usage:
+    graph = get_relation_graph()
+    path = graph.shortest_path(points_layer, objects_layer)
+"""
+
+import threading
+from collections import deque
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
+
+try:
+    from .diagnostics import get_diagnostics
+    from .performance import record_cache_access
+except ImportError:
+    from core.diagnostics import get_diagnostics
+    from core.performance import record_cache_access
+
+_diag = get_diagnostics("relations")
+
+# (relation manager key, relation, layer at the other end of the relation)
+_Edge = Tuple[Any, Any, Any]
+
+
+def relation_id(relation: Any, dict_key: Any = None) -> str:
+    """
+    Stable string id for a QgsRelation, for comparing relations across calls.
+
+    Uses :meth:`QgsRelation.id` when available, otherwise the relation manager dict key
+    or Python ``id`` as last resort (tests may use plain mocks).
+    """
+    try:
+        rid = relation.id()
+        if rid:
+            return str(rid)
+    except Exception:
+        pass
+    if dict_key is not None:
+        return str(dict_key)
+    return str(id(relation))
+
+
+def other_layer_in_relation(current_layer: Any, relation: Any) -> Optional[Any]:
+    """Return the layer at the other end of ``relation`` from ``current_layer``."""
+    try:
+        ref = relation.referencingLayer()
+        rec = relation.referencedLayer()
+        if not ref or not rec or not current_layer:
+            return None
+        current_id = current_layer.id()
+        if ref.id() == current_id:
+            return rec
+        if rec.id() == current_id:
+            return ref
+    except Exception:
+        return None
+    return None
+
+
+def ordered_layers_along_path(layer_start: Any, relations_path: List[Any]) -> Optional[List[Any]]:
+    """Reconstruct [L0, L1, ..., Ln] where L0 is ``layer_start`` and each relation connects Li to Li+1."""
+    layers = [layer_start]
+    current = layer_start
+    for relation in relations_path:
+        nxt = other_layer_in_relation(current, relation)
+        if not nxt:
+            return None
+        layers.append(nxt)
+        current = nxt
+    return layers
+
+
+def field_names_for_relation_hop(relation: Any, from_layer: Any) -> Optional[Tuple[str, str]]:
+    """
+    For a hop from ``from_layer`` to the other layer in ``relation``, return
+    (field_name_on_from, field_name_on_to) using the relation's first field pair.
+    """
+    field_pairs = relation.fieldPairs()
+    if not field_pairs:
+        return None
+    ref_field, rec_field = next(iter(field_pairs.items()))
+    ref_layer = relation.referencingLayer()
+    rec_layer = relation.referencedLayer()
+    if not ref_layer or not rec_layer:
+        return None
+    if from_layer.id() == ref_layer.id():
+        return ref_field, rec_field
+    if from_layer.id() == rec_layer.id():
+        return rec_field, ref_field
+    return None
+
+
+class RelationGraph:
+    """
+    Relations of one relation manager, indexed by layer id.
+
+    The index is built lazily on first use and rebuilt after :meth:`invalidate`,
+    which is connected to the relation manager's ``changed`` signal.
+    """
+
+    def __init__(self, relation_manager: Any):
+        self._relation_manager = relation_manager
+        self._lock = threading.Lock()
+        self._built = False
+        self._adjacency: Dict[str, List[_Edge]] = {}
+        self._referencing: Dict[str, List[Any]] = {}
+        self._referenced: Dict[str, List[Any]] = {}
+        self._path_cache: Dict[Tuple[Any, ...], Optional[List[Any]]] = {}
+        try:
+            relation_manager.changed.connect(self.invalidate)
+        except Exception as e:
+            _diag.debug("Could not watch relation changes: %s", e)
+
+    @property
+    def relation_manager(self) -> Any:
+        return self._relation_manager
+
+    def invalidate(self, *args: Any) -> None:
+        """Drop the index and cached paths; they are rebuilt on next use."""
+        with self._lock:
+            self._built = False
+            self._adjacency = {}
+            self._referencing = {}
+            self._referenced = {}
+            self._path_cache = {}
+
+    def _ensure_built(self) -> None:
+        with self._lock:
+            if self._built:
+                return
+            adjacency: Dict[str, List[_Edge]] = {}
+            referencing: Dict[str, List[Any]] = {}
+            referenced: Dict[str, List[Any]] = {}
+            for key, relation in self._relation_manager.relations().items():
+                referencing.setdefault(relation.referencingLayerId(), []).append(relation)
+                referenced.setdefault(relation.referencedLayerId(), []).append(relation)
+                ref_layer = relation.referencingLayer()
+                rec_layer = relation.referencedLayer()
+                if not ref_layer or not rec_layer:
+                    continue
+                ref_id = ref_layer.id()
+                rec_id = rec_layer.id()
+                adjacency.setdefault(ref_id, []).append((key, relation, rec_layer))
+                if rec_id != ref_id:
+                    adjacency.setdefault(rec_id, []).append((key, relation, ref_layer))
+            self._adjacency = adjacency
+            self._referencing = referencing
+            self._referenced = referenced
+            self._path_cache = {}
+            self._built = True
+
+    def relations_for_layer_id(self, layer_id: str) -> List[Any]:
+        """Relations where ``layer_id`` is the referencing layer, then where it is referenced."""
+        self._ensure_built()
+        return list(self._referencing.get(layer_id, [])) + list(self._referenced.get(layer_id, []))
+
+    def relations_between(self, layer1: Any, layer2: Any) -> List[Any]:
+        """Relations connecting ``layer1`` and ``layer2`` in either referencing direction."""
+        if not layer1 or not layer2:
+            return []
+        self._ensure_built()
+        target_id = layer2.id()
+        found: List[Any] = []
+        for _key, relation, other_layer in self._adjacency.get(layer1.id(), []):
+            if other_layer.id() == target_id and relation not in found:
+                found.append(relation)
+        return found
+
+    def relation_from(self, referencing_layer: Any, referenced_layer: Any) -> Optional[Any]:
+        """First relation where ``referencing_layer`` references ``referenced_layer``."""
+        if not referencing_layer or not referenced_layer:
+            return None
+        referencing_id = referencing_layer.id()
+        for relation in self.relations_between(referencing_layer, referenced_layer):
+            relation_referencing = relation.referencingLayer()
+            if relation_referencing and relation_referencing.id() == referencing_id:
+                return relation
+        return None
+
+    def relations_touching(self, layer: Any) -> List[Any]:
+        """Relations with ``layer`` on either side, in relation manager order."""
+        if not layer:
+            return []
+        self._ensure_built()
+        found: List[Any] = []
+        for _key, relation, _other_layer in self._adjacency.get(layer.id(), []):
+            if relation not in found:
+                found.append(relation)
+        return found
+
+    def shortest_path(
+        self,
+        layer_start: Any,
+        layer_end: Any,
+        max_hops: int = 8,
+        forbidden_relation_ids: Optional[AbstractSet[str]] = None,
+        forbidden_layer_ids: Optional[AbstractSet[str]] = None,
+    ) -> Optional[List[Any]]:
+        """
+        Shortest chain of relations connecting ``layer_start`` to ``layer_end`` (BFS on
+        the undirected relation graph), or None if none exists within ``max_hops``.
+
+        Args:
+            layer_start: First endpoint
+            layer_end: Second endpoint
+            max_hops: Maximum number of relations in the path
+            forbidden_relation_ids: Relation ids (see :func:`relation_id`) not to traverse
+            forbidden_layer_ids: Layer ids that must not appear on the path
+        """
+        if not layer_start or not layer_end:
+            return None
+        start_id = layer_start.id()
+        end_id = layer_end.id()
+        if start_id == end_id:
+            return None
+        self._ensure_built()
+        cache_key = (
+            start_id,
+            end_id,
+            max_hops,
+            frozenset(forbidden_relation_ids or ()),
+            frozenset(forbidden_layer_ids or ()),
+        )
+        if cache_key in self._path_cache:
+            record_cache_access("relation_paths", True)
+            cached = self._path_cache[cache_key]
+            return list(cached) if cached is not None else None
+        record_cache_access("relation_paths", False)
+
+        path = self._breadth_first_path(
+            start_id, end_id, max_hops, forbidden_relation_ids, forbidden_layer_ids
+        )
+        self._path_cache[cache_key] = path
+        return list(path) if path is not None else None
+
+    def _breadth_first_path(
+        self,
+        start_id: str,
+        end_id: str,
+        max_hops: int,
+        forbidden_relation_ids: Optional[AbstractSet[str]],
+        forbidden_layer_ids: Optional[AbstractSet[str]],
+    ) -> Optional[List[Any]]:
+        queue = deque([(start_id, [])])
+        visited = {start_id}
+        while queue:
+            current_id, path = queue.popleft()
+            if len(path) >= max_hops:
+                continue
+            for key, relation, next_layer in self._adjacency.get(current_id, []):
+                if forbidden_relation_ids and relation_id(relation, key) in forbidden_relation_ids:
+                    continue
+                next_id = next_layer.id()
+                if forbidden_layer_ids and str(next_id) in forbidden_layer_ids:
+                    continue
+                new_path = path + [relation]
+                if next_id == end_id:
+                    return new_path
+                if next_id in visited:
+                    continue
+                visited.add(next_id)
+                queue.append((next_id, new_path))
+        return None
+
+
+_shared_graph: Optional[RelationGraph] = None
+_shared_graph_lock = threading.Lock()
+
+
+def get_relation_graph(relation_manager: Any = None) -> RelationGraph:
+    """
+    Return the shared relation graph for ``relation_manager``.
+
+    Defaults to the current project's relation manager. A new graph is created when
+    the relation manager differs from the one the shared graph was built for (e.g.
+    after switching projects).
+    """
+    global _shared_graph
+    if relation_manager is None:
+        from qgis.core import QgsProject
+
+        relation_manager = QgsProject.instance().relationManager()
+    with _shared_graph_lock:
+        if _shared_graph is None or _shared_graph.relation_manager is not relation_manager:
+            _shared_graph = RelationGraph(relation_manager)
+        return _shared_graph
@@ -2,18 +2,51 @@
 Cooperative UI yielding during long synchronous work on the Qt main thread.
 
 When a warning-detection step must run synchronously (tests or QgsTask unavailable),
-call ``maybe_yield_to_ui`` inside tight loops so Qt can still process events.
+call ``maybe_yield_to_ui`` inside tight loops so Qt can still process events. The same
+call sites are the cancellation points of a detection run (see ``core.cancellation``).
+
+Yielding is time-sliced: events are processed only once the main thread has worked
+for ``yield_interval_ms`` since the previous yield, measured with a monotonic clock.
+In worker threads (e.g. detectors running inside a ``QgsTask``) there is no event loop
+to service, so the call only checks for cancellation.
+
+Work scheduled tick by tick with ``QTimer.singleShot`` (validation loading and copying)
+sizes its batches with :class:`AdaptiveBatchSizer`, so each tick does about one frame
+budget of work whatever the speed of the machine or data provider.
 """
 
-from typing import Any
+import threading
+import time
+from typing import Any, Callable
+
+try:
+    from .cancellation import raise_if_cancelled
+except ImportError:
+    from core.cancellation import raise_if_cancelled
+
+DEFAULT_YIELD_INTERVAL_MS = 50
+# Main-thread work per event-loop tick; leaves room for a repaint at 60 Hz.
+DEFAULT_FRAME_BUDGET_MS = 14.0
+MAX_ADAPTIVE_BATCH_SIZE = 5000
 
+_clock = time.monotonic
+_main_thread_ident = threading.main_thread().ident
+_yield_interval_seconds = DEFAULT_YIELD_INTERVAL_MS / 1000.0
 _yield_counter = 0
+_last_yield_time = _clock()
+
+
+def set_yield_interval_ms(interval_ms: float) -> None:
+    """Set how many milliseconds of main-thread work may pass between two yields."""
+    global _yield_interval_seconds
+    _yield_interval_seconds = max(0.0, float(interval_ms)) / 1000.0
 
 
 def reset_yield_counter() -> None:
-    """Reset the iteration counter (e.g. at the start of each warning-detection step)."""
-    global _yield_counter
+    """Restart the yield interval (e.g. at the start of each warning-detection step)."""
+    global _yield_counter, _last_yield_time
     _yield_counter = 0
+    _last_yield_time = _clock()
 
 
 def flush_ui_updates(widget: Any = None) -> None:
@@ -37,20 +70,69 @@ def flush_ui_updates(widget: Any = None) -> None:
 
 def maybe_yield_to_ui(*, every: int = 1, force: bool = False) -> None:
     """
-    Process pending Qt events periodically during tight loops.
+    Process pending Qt events once the current time slice has elapsed.
+
+    Also raises ``DetectionCancelled`` when the current thread's detection run has
+    been cancelled. Does not process events outside the main thread.
 
     Args:
-        every: Invoke ``processEvents`` every N calls (ignored when ``force`` is True).
-        force: When True, always process events immediately.
+        every: Only look at the clock every N calls, for very tight loops
+            (ignored when ``force`` is True).
+        force: When True, process events immediately.
     """
-    global _yield_counter
-    if force:
-        _process_events()
+    global _yield_counter, _last_yield_time
+    raise_if_cancelled()
+    if threading.get_ident() != _main_thread_ident:
         return
 
-    _yield_counter += 1
-    if _yield_counter % every == 0:
-        _process_events()
+    if not force:
+        _yield_counter += 1
+        if every > 1 and _yield_counter % every:
+            return
+        if _clock() - _last_yield_time < _yield_interval_seconds:
+            return
+
+    _process_events()
+    _last_yield_time = _clock()
+
+
+class AdaptiveBatchSizer:
+    """
+    Batch size for tick-based loops, adjusted so each tick takes about ``budget_ms``.
+
+    Call :meth:`record` after each batch with the number of items processed and the
+    elapsed time; the next :attr:`size` is the budget divided by the measured time
+    per item. The size at most doubles per tick, so one fast batch (e.g. served
+    from a cache) cannot overshoot, and shrinks at once when a batch was too slow.
+    """
+
+    def __init__(
+        self,
+        initial: int = 1,
+        minimum: int = 1,
+        maximum: int = MAX_ADAPTIVE_BATCH_SIZE,
+        budget_ms: float = DEFAULT_FRAME_BUDGET_MS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._minimum = max(1, int(minimum))
+        self._maximum = max(self._minimum, int(maximum))
+        self._budget_seconds = max(0.001, float(budget_ms)) / 1000.0
+        self._size = min(self._maximum, max(self._minimum, int(initial)))
+        self.clock = clock
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def record(self, items: int, elapsed_seconds: float) -> None:
+        """Update the size from one batch of ``items`` that took ``elapsed_seconds``."""
+        if items <= 0:
+            return
+        seconds_per_item = max(float(elapsed_seconds), 1e-9) / items
+        target = self._budget_seconds / seconds_per_item
+        if target > self._size:
+            target = min(target, self._size * 2)
+        self._size = min(self._maximum, max(self._minimum, int(round(target))))
 
 
 def _process_events() -> None:
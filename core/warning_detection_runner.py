@@ -4,6 +4,10 @@ Run warning-detection steps off the Qt main thread via QgsTask.
 Long-running read-only detector scans block the Qt event loop when executed
 synchronously on the main thread. Scheduling each step as a QgsTask keeps the
 map and the rest of QGIS interactive while analysis runs.
+
+Each step gets a ``CancellationToken`` that also follows ``QgsTask.isCanceled``.
+A cancelled step reports neither success nor error, so no partial results reach
+the caller.
 """
 
 from __future__ import annotations
@@ -11,6 +15,11 @@ from __future__ import annotations
 import traceback
 from typing import Any, Callable, Optional
 
+try:
+    from .cancellation import CancellationToken, DetectionCancelled, cancellation_scope
+except ImportError:
+    from core.cancellation import CancellationToken, DetectionCancelled, cancellation_scope
+
 
 def _qgs_task_can_cancel_flag() -> int:
     """Return a QgsTask cancel flag compatible with QGIS 3 and QGIS 4."""
@@ -30,7 +39,11 @@ def _get_qgs_task_manager():
     return task_manager
 
 
-def _build_warning_detection_task(description: str, runner: Callable[[], Any]):
+def _build_warning_detection_task(
+    description: str,
+    runner: Callable[[], Any],
+    cancellation_token: Optional[CancellationToken] = None,
+):
     from qgis.core import QgsTask
 
     class WarningDetectionStepTask(QgsTask):
@@ -39,19 +52,32 @@ def _build_warning_detection_task(description: str, runner: Callable[[], Any]):
             self._runner = runner
             self._result: Any = None
             self._exception: Optional[Exception] = None
+            self._cancelled = False
+            self.cancellation_token = cancellation_token or CancellationToken()
+            self.cancellation_token.watch(self.isCanceled)
             self.on_success: Optional[Callable[[Any], None]] = None
             self.on_error: Optional[Callable[[Exception], None]] = None
 
         def run(self) -> bool:
             try:
-                self._result = self._runner()
+                with cancellation_scope(self.cancellation_token):
+                    self._result = self._runner()
                 return True
+            except DetectionCancelled:
+                self._cancelled = True
+                return False
             except Exception as exc:
                 self._exception = exc
                 traceback.print_exc()
                 return False
 
+        def cancel(self) -> None:
+            self.cancellation_token.cancel()
+            super().cancel()
+
         def finished(self, result: bool) -> None:
+            if self._cancelled or self.cancellation_token.cancelled:
+                return
             if self._exception is not None:
                 if self.on_error is not None:
                     self.on_error(self._exception)
@@ -70,6 +96,7 @@ def dispatch_warning_detection_step(
     runner: Callable[[], Any],
     on_success: Callable[[Any], None],
     on_error: Callable[[Exception], None],
+    cancellation_token: Optional[CancellationToken] = None,
 ) -> Optional[Any]:
     """
     Execute ``runner`` asynchronously when the QGIS task manager is available.
@@ -77,18 +104,30 @@ def dispatch_warning_detection_step(
     Falls back to synchronous execution on the main thread when QgsTask cannot be
     used, for example in unit tests outside QGIS.
 
+    Args:
+        description: Task description shown in the QGIS task manager
+        runner: Detection step to run
+        on_success: Called with the runner's result
+        on_error: Called with the exception raised by the runner
+        cancellation_token: Token active while ``runner`` executes; once cancelled,
+            neither callback is invoked
+
     Returns:
         The QgsTask instance when scheduled asynchronously, otherwise ``None``.
     """
     try:
-        task = _build_warning_detection_task(description, runner)
+        task = _build_warning_detection_task(description, runner, cancellation_token)
         task.on_success = on_success
         task.on_error = on_error
         _get_qgs_task_manager().addTask(task)
         return task
     except Exception:
         try:
-            on_success(runner())
+            with cancellation_scope(cancellation_token):
+                result = runner()
+            on_success(result)
+        except DetectionCancelled:
+            pass
         except Exception as exc:
             on_error(exc)
         return None
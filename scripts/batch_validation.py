@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Headless batch validation of an ArcheoSync project.
+
+Loads a ``.qgs``/``.qgz`` project, applies plugin settings from a JSON file, optionally
+imports CSV files and field projects as pending import layers, runs every warning
+detector and writes a JSON and/or CSV report with timings.
+
+Run it with a PyQGIS interpreter (``QGIS_PREFIX_PATH`` set, or ``source
+scripts/run-env-linux.sh``):
+
+    python3 scripts/batch_validation.py master.qgz --settings archeosync.json \\
+        --import-csv topo/*.csv --json report.json --csv report.csv
+
+The settings file maps plugin setting keys to values, e.g.::
+
+    {"objects_layer": "Objects", "recording_areas_layer": "Recording Areas",
+     "objects_number_field": "number", "distance_max_distance": 0.05}
+
+Layer settings may be given as layer ids or layer names. With ``--use-stored-settings``
+keys missing from the file are read from the ArcheoSync QSettings of the current user.
+
+Exit status: 0 on success, 1 when ``--fail-on-warnings`` is set and warnings were found,
+2 when the project could not be loaded or a detector failed.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Add the plugin root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+
+def _parse_arguments(argv):
+    parser = argparse.ArgumentParser(description="Run ArcheoSync warning detectors without the QGIS UI.")
+    parser.add_argument('project', help="QGIS project (.qgs or .qgz)")
+    parser.add_argument('--settings', help="JSON file with ArcheoSync settings")
+    parser.add_argument('--use-stored-settings', action='store_true',
+                        help="Read settings missing from --settings from the user's QSettings")
+    parser.add_argument('--import-csv', nargs='+', default=[], metavar='CSV',
+                        help="Total station CSV files to import before detection")
+    parser.add_argument('--import-field-project', nargs='+', default=[], metavar='DIR',
+                        help="Completed field project directories to import before detection")
+    parser.add_argument('--processes', type=int,
+                        help="Worker processes for detector kernels that support them (height differences)")
+    parser.add_argument('--json', dest='json_path', help="Write the JSON report here")
+    parser.add_argument('--csv', dest='csv_path', help="Write one CSV row per warning here")
+    parser.add_argument('--fail-on-warnings', action='store_true')
+    return parser.parse_args(argv)
+
+
+def _start_qgis():
+    """Return the running QgsApplication, or start a headless one."""
+    from qgis.core import QgsApplication
+
+    application = QgsApplication.instance()
+    if application is not None:
+        return application, False
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    QgsApplication.setPrefixPath(os.environ.get('QGIS_PREFIX_PATH', '/usr'), True)
+    application = QgsApplication([], False)
+    application.initQgis()
+    return application, True
+
+
+def _load_settings(arguments, project):
+    from services.settings_service import InMemorySettingsManager, QGISSettingsManager
+
+    values = {}
+    if arguments.settings:
+        with open(arguments.settings, encoding='utf-8') as settings_file:
+            values = json.load(settings_file)
+
+    # Layer settings may name layers instead of giving their ids.
+    for key, value in list(values.items()):
+        if key.endswith('_layer') and isinstance(value, str) and project.mapLayer(value) is None:
+            matches = project.mapLayersByName(value)
+            if matches:
+                values[key] = matches[0].id()
+            else:
+                print(f"Warning: no layer '{value}' in project for setting {key}")
+
+    if arguments.processes:
+        values['detector_process_workers'] = arguments.processes
+
+    fallback = QGISSettingsManager('ArcheoSync') if arguments.use_stored_settings else None
+    return InMemorySettingsManager(values, fallback=fallback)
+
+
+def _import_pending_data(arguments, settings_manager, layer_service):
+    """Create the pending import layers the detectors compare with the definitive layers."""
+    if arguments.import_csv:
+        from services.csv_import_service import CSVImportService
+
+        csv_service = CSVImportService(None, settings_manager=settings_manager, layer_service=layer_service)
+        column_mapping, _headers = csv_service.get_column_mapping_and_headers(arguments.import_csv)
+        result = csv_service.import_csv_files(arguments.import_csv, column_mapping)
+        if not result.is_valid:
+            raise RuntimeError(f"CSV import failed: {result.message}")
+        print(f"Imported {csv_service.get_last_import_count()} total station points")
+
+    if arguments.import_field_project:
+        from services.field_project_import_service import FieldProjectImportService
+
+        # The file system service is only needed to archive projects, which is never done here.
+        project_service = FieldProjectImportService(settings_manager, layer_service, None)
+        result = project_service.import_field_projects(arguments.import_field_project)
+        if not result.is_valid:
+            raise RuntimeError(f"Field project import failed: {result.message}")
+        print(result.message)
+
+
+def main(argv=None):
+    arguments = _parse_arguments(sys.argv[1:] if argv is None else argv)
+    application, started = _start_qgis()
+    try:
+        from qgis.core import QgsProject
+        from core.diagnostics import configure_diagnostics_from_settings
+        from services.batch_validation_service import (
+            BatchValidationService,
+            write_csv_report,
+            write_json_report,
+        )
+        from services.layer_service import QGISLayerService
+
+        project = QgsProject.instance()
+        if not project.read(arguments.project):
+            print(f"Error: could not load project {arguments.project}")
+            return 2
+
+        settings_manager = _load_settings(arguments, project)
+        configure_diagnostics_from_settings(settings_manager)
+        layer_service = QGISLayerService()
+        _import_pending_data(arguments, settings_manager, layer_service)
+
+        report = BatchValidationService(settings_manager, layer_service).run(
+            project_path=os.path.abspath(arguments.project),
+        )
+
+        for step in report.metrics:
+            print(f"{step.name:<40} {step.wall_time_ms:>10.1f} ms")
+        for category, warnings in report.warnings.items():
+            print(f"{category}: {len(warnings)}")
+        print(f"Total: {report.warning_count()} warning(s) in {report.total_wall_time_ms:.0f} ms")
+
+        if arguments.json_path:
+            write_json_report(report, arguments.json_path)
+        if arguments.csv_path:
+            write_csv_report(report, arguments.csv_path)
+
+        if report.errors:
+            return 2
+        if arguments.fail_on_warnings and report.warning_count():
+            return 1
+        return 0
+    except Exception as e:
+        print(f"Error during batch validation: {e}")
+        return 2
+    finally:
+        if started:
+            application.exitQgis()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
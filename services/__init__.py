@@ -5,7 +5,7 @@ This package contains concrete implementations of the core interfaces,
 providing QGIS-specific functionality while maintaining clean abstractions.
 """
 
-from .settings_service import QGISSettingsManager
+from .settings_service import InMemorySettingsManager, QGISSettingsManager
 from .file_system_service import QGISFileSystemService
 from .configuration_validator import ArcheoSyncConfigurationValidator
 from .layer_service import QGISLayerService
@@ -17,6 +17,7 @@ from .map_theme_service import QGISMapThemeService
 
 __all__ = [
     'QGISSettingsManager',
+    'InMemorySettingsManager',
     'QGISFileSystemService',
     'ArcheoSyncConfigurationValidator',
     'QGISLayerService',
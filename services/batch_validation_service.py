@@ -0,0 +1,182 @@
+"""
+Headless batch validation for ArcheoSync.
+
+Runs the warning detectors of the import summary without any UI, e.g. for nightly
+quality checks of a large project (see ``scripts/batch_validation.py``):
+
+    service = BatchValidationService(settings_manager, QGISLayerService())
+    report = service.run()
+    write_json_report(report, "report.json")
+    write_csv_report(report, "report.csv")
+
+Detectors run one after another: they read the same project layers, and QGIS
+layers and their providers must not be read from several threads at once.
+Detectors with a process-based kernel (height differences) use the
+``detector_process_workers`` setting for parallelism instead. Each detector is
+recorded as a :class:`StepMetrics` step. Like the summary dock, detectors compare
+the pending import layers (``New Objects``, ``Imported_CSV_Points``, ...) with the
+configured definitive layers. A detector that raises is reported in
+``BatchValidationReport.errors`` and does not stop the others.
+"""
+
+import csv
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+try:
+    from ..core.cancellation import CancellationToken
+    from ..core.data_structures import BatchValidationReport
+    from ..core.diagnostics import get_diagnostics
+    from ..core.performance import CATEGORY_DETECTOR, PerformanceRecorder
+    from .distance_detector_service import DistanceDetectorService
+    from .duplicate_objects_detector_service import DuplicateObjectsDetectorService
+    from .duplicate_total_station_identifiers_detector_service import (
+        DuplicateTotalStationIdentifiersDetectorService,
+    )
+    from .height_difference_detector_service import HeightDifferenceDetectorService
+    from .import_validation_service import IMPORT_LAYER_MAPPINGS
+    from .missing_total_station_detector_service import MissingTotalStationDetectorService
+    from .out_of_bounds_detector_service import OutOfBoundsDetectorService
+    from .skipped_numbers_detector_service import SkippedNumbersDetectorService
+except ImportError:
+    from core.cancellation import CancellationToken
+    from core.data_structures import BatchValidationReport
+    from core.diagnostics import get_diagnostics
+    from core.performance import CATEGORY_DETECTOR, PerformanceRecorder
+    from services.distance_detector_service import DistanceDetectorService
+    from services.duplicate_objects_detector_service import DuplicateObjectsDetectorService
+    from services.duplicate_total_station_identifiers_detector_service import (
+        DuplicateTotalStationIdentifiersDetectorService,
+    )
+    from services.height_difference_detector_service import HeightDifferenceDetectorService
+    from services.import_validation_service import IMPORT_LAYER_MAPPINGS
+    from services.missing_total_station_detector_service import MissingTotalStationDetectorService
+    from services.out_of_bounds_detector_service import OutOfBoundsDetectorService
+    from services.skipped_numbers_detector_service import SkippedNumbersDetectorService
+
+_diag = get_diagnostics("batch_validation")
+
+CSV_REPORT_COLUMNS = (
+    'category',
+    'message',
+    'recording_area',
+    'layer',
+    'second_layer',
+    'object_number',
+    'filter_expression',
+)
+
+
+@dataclass(frozen=True)
+class DetectorStep:
+    """One detector of the suite and the summary attribute its warnings belong to."""
+    result_key: str
+    name: str
+    detector_class: type
+    method_name: str
+
+
+DETECTOR_STEPS: List[DetectorStep] = [
+    DetectorStep("duplicate_objects_warnings", "Duplicate objects",
+                 DuplicateObjectsDetectorService, "detect_duplicate_objects"),
+    DetectorStep("skipped_numbers_warnings", "Skipped numbers",
+                 SkippedNumbersDetectorService, "detect_skipped_numbers"),
+    DetectorStep("out_of_bounds_warnings", "Out-of-bounds features",
+                 OutOfBoundsDetectorService, "detect_out_of_bounds_features"),
+    DetectorStep("distance_warnings", "Distances",
+                 DistanceDetectorService, "detect_distance_warnings"),
+    DetectorStep("missing_total_station_warnings", "Missing total station points",
+                 MissingTotalStationDetectorService, "detect_missing_total_station_warnings"),
+    DetectorStep("duplicate_total_station_identifiers_warnings", "Duplicate total station identifiers",
+                 DuplicateTotalStationIdentifiersDetectorService, "detect_duplicate_identifiers_warnings"),
+    DetectorStep("height_difference_warnings", "Height differences",
+                 HeightDifferenceDetectorService, "detect_height_difference_warnings"),
+]
+
+
+class BatchValidationService:
+    """Run every warning detector against the current project and collect a report."""
+
+    def __init__(self, settings_manager: Any, layer_service: Any):
+        """
+        Initialize the batch validation service.
+
+        Args:
+            settings_manager: Service for managing settings
+            layer_service: Service for layer operations
+        """
+        self._settings_manager = settings_manager
+        self._layer_service = layer_service
+
+    def prepare_layers(self) -> None:
+        """
+        Copy virtual fields from definitive layers onto pending import layers.
+
+        Same preparation as the summary dock's first refresh step; it edits layers,
+        so it runs before any detector starts.
+        """
+        for temp_layer_name, definitive_layer_key in IMPORT_LAYER_MAPPINGS.items():
+            temp_layer = self._layer_service.get_layer_by_name(temp_layer_name)
+            layer_id = self._settings_manager.get_value(definitive_layer_key)
+            definitive_layer = self._layer_service.get_layer_by_id(layer_id) if layer_id else None
+            if temp_layer and definitive_layer:
+                self._layer_service.copy_virtual_fields(definitive_layer, temp_layer)
+
+    def run(
+        self,
+        steps: Optional[List[DetectorStep]] = None,
+        recorder: Optional[PerformanceRecorder] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        project_path: str = "",
+    ) -> BatchValidationReport:
+        """
+        Run detectors sequentially and return their warnings and timings.
+
+        Args:
+            steps: Detectors to run (default: :data:`DETECTOR_STEPS`)
+            recorder: Recorder receiving one step per detector
+            cancellation_token: Token shared by all detectors
+            project_path: Project path stored in the report
+        """
+        steps = list(DETECTOR_STEPS if steps is None else steps)
+        recorder = recorder or PerformanceRecorder()
+        cancellation_token = cancellation_token or CancellationToken()
+        report = BatchValidationReport(project_path=project_path, metrics=recorder.metrics)
+
+        started = time.perf_counter()
+        self.prepare_layers()
+        for step in steps:
+            try:
+                report.warnings[step.result_key] = list(self._run_step(step, recorder, cancellation_token) or [])
+            except Exception as e:
+                _diag.error("Error in %s detection: %s", step.name, e)
+                report.errors[step.result_key] = str(e)
+                report.warnings[step.result_key] = []
+        report.total_wall_time_ms = (time.perf_counter() - started) * 1000.0
+        return report
+
+    def _run_step(
+        self, step: DetectorStep, recorder: PerformanceRecorder, cancellation_token: CancellationToken
+    ) -> List[Any]:
+        detector = step.detector_class(self._settings_manager, self._layer_service)
+        detect: Callable[..., List[Any]] = getattr(detector, step.method_name)
+        with recorder.measure(step.name, category=CATEGORY_DETECTOR):
+            warnings = detect(cancellation_token=cancellation_token)
+        _diag.info("%s: %d warning(s)", step.name, len(warnings or []))
+        return warnings
+
+
+def write_json_report(report: BatchValidationReport, file_path: str) -> None:
+    """Write the full report (warnings with details, timings, errors) as JSON."""
+    with open(file_path, 'w', encoding='utf-8') as output:
+        json.dump(report.to_dict(), output, indent=2)
+
+
+def write_csv_report(report: BatchValidationReport, file_path: str) -> None:
+    """Write one CSV row per warning."""
+    with open(file_path, 'w', newline='', encoding='utf-8') as output:
+        writer = csv.DictWriter(output, fieldnames=CSV_REPORT_COLUMNS, extrasaction='ignore', restval='')
+        writer.writeheader()
+        writer.writerows(report.warning_rows())
@@ -30,18 +30,38 @@ Usage:
     warnings = detector.detect_distance_warnings()
 """
 
-from collections import defaultdict, deque
+from collections import defaultdict
 from typing import List, Optional, Any, Union, Dict, Tuple, AbstractSet
-from qgis.core import QgsProject, QgsGeometry, QgsPointXY, QgsDistanceArea, QgsSpatialIndex
+from qgis.core import QgsGeometry, QgsPointXY, QgsDistanceArea, QgsSpatialIndex
 
 try:
     from ..core.interfaces import ISettingsManager, ILayerService
-    from ..core.data_structures import WarningData
+    from ..core.data_structures import WarningData, DistanceIssue
+    from ..core.feature_requests import iter_features
+    from ..core.relation_graph import (
+        field_names_for_relation_hop,
+        get_relation_graph,
+        ordered_layers_along_path,
+        relation_id,
+    )
+    from ..core.cancellation import CancellationToken, cancellation_scope
     from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.diagnostics import DEBUG, get_diagnostics
 except ImportError:
     from core.interfaces import ISettingsManager, ILayerService
-    from core.data_structures import WarningData
+    from core.data_structures import WarningData, DistanceIssue
+    from core.feature_requests import iter_features
+    from core.relation_graph import (
+        field_names_for_relation_hop,
+        get_relation_graph,
+        ordered_layers_along_path,
+        relation_id,
+    )
+    from core.cancellation import CancellationToken, cancellation_scope
     from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import DEBUG, get_diagnostics
+
+_diag = get_diagnostics("detectors.distance")
 
 
 class DistanceDetectorService:
@@ -69,6 +89,9 @@ class DistanceDetectorService:
         'last_identifier', 'last_identifiant', 'dernier_identifiant',
         'last_ptid', 'last_pt_id',
     })
+    # Fields read by _get_feature_identifier, in lookup order.
+    _POINT_IDENTIFIER_FIELD_NAMES = ('point_id', 'station_id', 'point_number', 'id', 'fid')
+    _OBJECT_IDENTIFIER_FIELD_NAMES = ('object_number', 'number', 'object_id', 'id', 'fid')
     
     def __init__(self, settings_manager, layer_service, import_context=None):
         """
@@ -86,17 +109,28 @@ class DistanceDetectorService:
         # Get configurable thresholds from settings with defaults, always as float
         self._max_distance_meters = float(self._settings_manager.get_value('distance_max_distance', 0.05))
     
-    def detect_distance_warnings(self) -> List[Union[str, WarningData]]:
+    def detect_distance_warnings(
+        self, cancellation_token: Optional[CancellationToken] = None
+    ) -> List[Union[str, WarningData]]:
         """
         Detect distance warnings between total station points and related objects.
+        Args:
+            cancellation_token: Optional token checked in the scan loops; once it is
+                cancelled the run raises ``DetectionCancelled`` instead of returning
+                partial results
         Returns:
             List of warning messages or structured warning data about distance issues
         """
+        with cancellation_scope(cancellation_token):
+            return self._detect_distance_warnings()
+
+    def _detect_distance_warnings(self) -> List[Union[str, WarningData]]:
+        """Run the detection; see :meth:`detect_distance_warnings`."""
         warnings = []
 
         # Check if distance warnings are enabled
         if not self._settings_manager.get_value('enable_distance_warnings', True):
-            print("[DEBUG] Distance detection: feature disabled in settings")
+            _diag.debug("Distance detection: feature disabled in settings")
             return warnings
 
         try:
@@ -105,7 +139,7 @@ class DistanceDetectorService:
             objects_layer_id = self._settings_manager.get_value('objects_layer')
 
             if not total_station_points_layer_id or not objects_layer_id:
-                print("[DEBUG] Distance detection: missing points/objects layer ids in settings")
+                _diag.debug("Distance detection: missing points/objects layer ids in settings")
                 return warnings
 
             # Get all possible layers
@@ -114,24 +148,21 @@ class DistanceDetectorService:
             csv_points_count = self._import_context.get('csv_points_count')
             if csv_points_count is not None and int(csv_points_count) == 0:
                 if temp_total_station_points_layer is not None:
-                    print(
-                        "[DEBUG] Distance detection: ignoring stale Imported_CSV_Points layer "
-                        "(current import has no CSV points)"
-                    )
+                    _diag.debug("Distance detection: ignoring stale Imported_CSV_Points layer (current import has no CSV points)")
                 temp_total_station_points_layer = None
             definitive_total_station_points_layer = self._layer_service.get_layer_by_id(total_station_points_layer_id)
             definitive_objects_layer = self._layer_service.get_layer_by_id(objects_layer_id)
-            print(
-                "[DEBUG] Distance detection: layer presence "
-                f"(temp_points={bool(temp_total_station_points_layer)}, "
-                f"temp_objects={bool(temp_objects_layer)}, "
-                f"def_points={bool(definitive_total_station_points_layer)}, "
-                f"def_objects={bool(definitive_objects_layer)})"
+            _diag.debug(
+                "Distance detection: layer presence (temp_points=%s, temp_objects=%s, def_points=%s, def_objects=%s)",
+                bool(temp_total_station_points_layer),
+                bool(temp_objects_layer),
+                bool(definitive_total_station_points_layer),
+                bool(definitive_objects_layer),
             )
 
             # Object-only import: never run QGIS relation / recording-area pairing without CSV points.
             if temp_objects_layer and not temp_total_station_points_layer:
-                print("[DEBUG] Distance detection: object-only import (no Imported_CSV_Points)")
+                _diag.debug("Distance detection: object-only import (no Imported_CSV_Points)")
                 if self._objects_layer_has_topo_identifier_fields(temp_objects_layer):
                     warnings.extend(
                         self._detect_distance_by_topo_identifiers(
@@ -141,10 +172,7 @@ class DistanceDetectorService:
                         )
                     )
                 else:
-                    print(
-                        "[DEBUG] Distance detection: skipped — no topo link fields on objects "
-                        "and no pending CSV points layer"
-                    )
+                    _diag.debug("Distance detection: skipped — no topo link fields on objects and no pending CSV points layer")
                 return warnings
 
             # List of (points_layer, objects_layer, points_layer_type, objects_layer_type)
@@ -165,14 +193,16 @@ class DistanceDetectorService:
                 if not points_layer or not objects_layer:
                     continue
                 processed_combinations += 1
-                print(
-                    "[DEBUG] Distance detection: evaluating combination "
-                    f"points='{points_layer.name()}' ({points_type}) -> "
-                    f"objects='{objects_layer.name()}' ({objects_type})"
+                _diag.debug(
+                    "Distance detection: evaluating combination points='%s' (%s) -> objects='%s' (%s)",
+                    points_layer.name(),
+                    points_type,
+                    objects_layer.name(),
+                    objects_type,
                 )
 
                 if not definitive_total_station_points_layer or not definitive_objects_layer:
-                    print("[DEBUG] Distance detection: missing definitive points or objects layer from settings")
+                    _diag.debug("Distance detection: missing definitive points or objects layer from settings")
                     continue
 
                 if self._objects_layer_has_topo_identifier_fields(objects_layer):
@@ -181,17 +211,17 @@ class DistanceDetectorService:
                         primary_points_layer=points_layer if self._layer_has_features(points_layer) else None,
                         definitive_points_layer=definitive_total_station_points_layer,
                     )
-                    print(
-                        "[DEBUG] Distance detection: topo identifier check completed "
-                        f"(warnings={len(topo_warnings)})"
+                    _diag.debug(
+                        "Distance detection: topo identifier check completed (warnings=%s)",
+                        len(topo_warnings),
                     )
                     warnings.extend(topo_warnings)
                     continue
 
                 if not self._layer_has_features(points_layer):
-                    print(
-                        "[DEBUG] Distance detection: skipping relation check — "
-                        f"points layer '{points_layer.name()}' has no features"
+                    _diag.debug(
+                        "Distance detection: skipping relation check — points layer '%s' has no features",
+                        points_layer.name(),
                     )
                     continue
 
@@ -215,15 +245,15 @@ class DistanceDetectorService:
                 relations = self._collect_relations_between_layers(
                     definitive_total_station_points_layer, definitive_objects_layer
                 )
-                print(f"[DEBUG] Distance detection: direct relations found = {len(relations)}")
+                _diag.debug("Distance detection: direct relations found = %s", len(relations))
                 forbidden_relation_ids: Optional[AbstractSet[str]] = None
                 if relations:
                     forbidden_relation_ids = frozenset(
-                        self._relation_project_id(r) for r in relations
+                        relation_id(r) for r in relations
                     )
-                    print(
-                        "[DEBUG] Distance detection: direct relation ids ignored for indirect path = "
-                        f"{sorted(forbidden_relation_ids)}"
+                    _diag.debug(
+                        "Distance detection: direct relation ids ignored for indirect path = %s",
+                        sorted(forbidden_relation_ids),
                     )
                 indirect_path = self._find_shortest_relation_path(
                     definitive_total_station_points_layer,
@@ -232,15 +262,12 @@ class DistanceDetectorService:
                     forbidden_layer_ids=forbidden_layer_ids,
                 )
                 if indirect_path:
-                    print(f"[DEBUG] Distance detection: indirect path hops = {len(indirect_path)}")
+                    _diag.debug("Distance detection: indirect path hops = %s", len(indirect_path))
                 else:
-                    print("[DEBUG] Distance detection: no indirect path found")
+                    _diag.debug("Distance detection: no indirect path found")
 
                 if not relations and not indirect_path:
-                    print(
-                        "[DEBUG] Distance detection: no QGIS relation (direct or indirect) "
-                        "between definitive points and objects layers"
-                    )
+                    _diag.debug("Distance detection: no QGIS relation (direct or indirect) between definitive points and objects layers")
                     continue
 
                 ordered_relations = self._ordered_relations_for_distance(
@@ -253,7 +280,7 @@ class DistanceDetectorService:
                     for relation in ordered_relations:
                         field_pairs = relation.fieldPairs()
                         if not field_pairs:
-                            print("[DEBUG] Distance detection: skipping relation without field pairs")
+                            _diag.debug("Distance detection: skipping relation without field pairs")
                             continue
 
                         # Determine which layer is referencing and which is referenced in this relation
@@ -275,11 +302,14 @@ class DistanceDetectorService:
                         if points_field is None or objects_field is None:
                             p_names = [f.name() for f in points_layer.fields()]
                             o_names = [f.name() for f in objects_layer.fields()]
-                            print(
-                                "[DEBUG] Distance detection: relation fields not resolved on current layers "
-                                f"(relation expects points='{def_points_field}', objects='{def_objects_field}'; "
-                                f"resolved points_field={points_field!r}, objects_field={objects_field!r}; "
-                                f"points fields={p_names}; objects fields={o_names}); trying next relation"
+                            _diag.debug(
+                                "Distance detection: relation fields not resolved on current layers (relation expects points='%s', objects='%s'; resolved points_field=%r, objects_field=%r; points fields=%s; objects fields=%s); trying next relation",
+                                def_points_field,
+                                def_objects_field,
+                                points_field,
+                                objects_field,
+                                p_names,
+                                o_names,
                             )
                             continue
 
@@ -287,9 +317,10 @@ class DistanceDetectorService:
                             self._is_recording_area_link_field(points_field, recording_area_link_fields)
                             or self._is_recording_area_link_field(objects_field, recording_area_link_fields)
                         ):
-                            print(
-                                "[DEBUG] Distance detection: skipping relation using recording-area fields "
-                                f"(points='{points_field}', objects='{objects_field}')"
+                            _diag.debug(
+                                "Distance detection: skipping relation using recording-area fields (points='%s', objects='%s')",
+                                points_field,
+                                objects_field,
                             )
                             continue
 
@@ -308,17 +339,20 @@ class DistanceDetectorService:
                                     break
 
                         if points_field_idx < 0 or objects_field_idx < 0:
-                            print(
-                                "[DEBUG] Distance detection: resolved fields but invalid indexes "
-                                f"(points_idx={points_field_idx}, objects_idx={objects_field_idx})"
+                            _diag.debug(
+                                "Distance detection: resolved fields but invalid indexes (points_idx=%s, objects_idx=%s)",
+                                points_field_idx,
+                                objects_field_idx,
                             )
                             continue
 
                         matched_relation = True
-                        print(
-                            "[DEBUG] Distance detection: running direct check with fields "
-                            f"points='{points_field}' (idx={points_field_idx}) and "
-                            f"objects='{objects_field}' (idx={objects_field_idx})"
+                        _diag.debug(
+                            "Distance detection: running direct check with fields points='%s' (idx=%s) and objects='%s' (idx=%s)",
+                            points_field,
+                            points_field_idx,
+                            objects_field,
+                            objects_field_idx,
                         )
                         distance_warnings = self._detect_distance_issues(
                             points_layer, objects_layer,
@@ -326,9 +360,9 @@ class DistanceDetectorService:
                             points_layer_is_referencing
                         )
                         direct_warnings_count = len(distance_warnings)
-                        print(
-                            "[DEBUG] Distance detection: direct check completed "
-                            f"(warnings={direct_warnings_count})"
+                        _diag.debug(
+                            "Distance detection: direct check completed (warnings=%s)",
+                            direct_warnings_count,
                         )
                         warnings.extend(distance_warnings)
                         # Use the first relation whose field mapping exists on both current layers
@@ -339,9 +373,10 @@ class DistanceDetectorService:
                 if (not skip_direct_relation and (not matched_relation or direct_warnings_count == 0) and indirect_path) or (
                     skip_direct_relation and indirect_path
                 ):
-                    print(
-                        "[DEBUG] Distance detection: running indirect fallback "
-                        f"(matched_relation={matched_relation}, direct_warnings={direct_warnings_count})"
+                    _diag.debug(
+                        "Distance detection: running indirect fallback (matched_relation=%s, direct_warnings=%s)",
+                        matched_relation,
+                        direct_warnings_count,
                     )
                     indirect_result = self._detect_distance_issues_via_relation_path(
                         points_layer,
@@ -352,34 +387,29 @@ class DistanceDetectorService:
                     )
                     if indirect_result is not None:
                         matched_relation = True
-                        print(
-                            "[DEBUG] Distance detection: indirect check completed "
-                            f"(warnings={len(indirect_result)})"
+                        _diag.debug(
+                            "Distance detection: indirect check completed (warnings=%s)",
+                            len(indirect_result),
                         )
                         warnings.extend(indirect_result)
                     else:
-                        print("[DEBUG] Distance detection: indirect check could not be applied")
+                        _diag.debug("Distance detection: indirect check could not be applied")
 
                 if not matched_relation:
-                    print(
-                        "[DEBUG] Distance detection: no relation had usable field pairs on "
-                        f"points layer '{points_layer.name()}' and objects layer '{objects_layer.name()}'"
+                    _diag.debug(
+                        "Distance detection: no relation had usable field pairs on points layer '%s' and objects layer '%s'",
+                        points_layer.name(),
+                        objects_layer.name(),
                     )
                     if relations and indirect_path is None:
-                        print(
-                            "[DEBUG] Distance detection: hint — a direct points↔objects relation exists "
-                            "but no alternate multi-hop path was found; remove or fix the direct relation "
-                            "if you rely on an intermediate layer."
-                        )
+                        _diag.debug("Distance detection: hint — a direct points↔objects relation exists but no alternate multi-hop path was found; remove or fix the direct relation if you rely on an intermediate layer.")
             if processed_combinations == 0:
-                print(
-                    "[DEBUG] Distance detection: no valid points/objects layer combination available "
-                    "(temporary and definitive layers missing)."
-                )
+                _diag.debug("Distance detection: no valid points/objects layer combination available (temporary and definitive layers missing).")
             else:
-                print(
-                    "[DEBUG] Distance detection: done "
-                    f"(processed_combinations={processed_combinations}, total_warnings={len(warnings)})"
+                _diag.debug(
+                    "Distance detection: done (processed_combinations=%s, total_warnings=%s)",
+                    processed_combinations,
+                    len(warnings),
                 )
 
         except Exception as e:
@@ -405,7 +435,10 @@ class DistanceDetectorService:
             # Group features by their relation field value (case-insensitive)
             points_by_relation = {}
             objects_by_relation = {}
-            for feature in total_station_points_layer.getFeatures():
+            for feature in iter_features(
+                total_station_points_layer,
+                self._point_scan_fields(points_field_idx),
+            ):
                 maybe_yield_to_ui()
                 relation_value = feature.attribute(points_field_idx)
                 if self._is_valid_relation_value(relation_value):
@@ -413,7 +446,10 @@ class DistanceDetectorService:
                     if relation_value_key not in points_by_relation:
                         points_by_relation[relation_value_key] = []
                     points_by_relation[relation_value_key].append(feature)
-            for feature in objects_layer.getFeatures():
+            for feature in iter_features(
+                objects_layer,
+                self._object_scan_fields(objects_layer, objects_field_idx),
+            ):
                 maybe_yield_to_ui()
                 if not self._object_feature_has_point_association(feature, objects_layer):
                     continue
@@ -428,27 +464,30 @@ class DistanceDetectorService:
             if not common_relation_values and (points_by_relation or objects_by_relation):
                 pk = set(points_by_relation.keys())
                 ok = set(objects_by_relation.keys())
-                print(
-                    "[DEBUG] Distance detection: no overlapping link values between points and objects "
-                    f"(unique keys on points: {len(pk)}, on objects: {len(ok)}; "
-                    f"sample only-on-points: {sorted(pk - ok)[:8]}; "
-                    f"sample only-on-objects: {sorted(ok - pk)[:8]})"
+                _diag.debug(
+                    "Distance detection: no overlapping link values between points and objects (unique keys on points: %s, on objects: %s; sample only-on-points: %s; sample only-on-objects: %s)",
+                    len(pk),
+                    len(ok),
+                    sorted(pk - ok)[:8],
+                    sorted(ok - pk)[:8],
                 )
             distance_issues = []
             for relation_value in common_relation_values:
                 points_features = points_by_relation[relation_value]
                 objects_features = objects_by_relation[relation_value]
                 if len(points_features) > self._MAX_POINTS_PER_RELATION_KEY:
-                    print(
-                        "[DEBUG] Distance detection: skipping non-unique relation key "
-                        f"'{relation_value}' ({len(points_features)} points)"
+                    _diag.debug(
+                        "Distance detection: skipping non-unique relation key '%s' (%s points)",
+                        relation_value,
+                        len(points_features),
                     )
                     continue
                 pairing_count = len(points_features) * len(objects_features)
                 if pairing_count > self._MAX_POINT_OBJECT_PAIRINGS:
-                    print(
-                        "[DEBUG] Distance detection: skipping relation key "
-                        f"'{relation_value}' (too many pairings: {pairing_count})"
+                    _diag.debug(
+                        "Distance detection: skipping relation key '%s' (too many pairings: %s)",
+                        relation_value,
+                        pairing_count,
                     )
                     continue
                 for pf in points_features:
@@ -502,12 +541,15 @@ class DistanceDetectorService:
                         filter_expression=points_filter,
                         second_layer_name=objects_layer.name(),
                         second_filter_expression=objects_filter,
-                        distance_issues=issues
+                        distance_issues=[
+                            DistanceIssue.from_issue(issue, total_station_points_layer, objects_layer)
+                            for issue in issues
+                        ]
                     )
                     warnings.append(warning_data)
             
         except Exception as e:
-            print(f"[DEBUG] Error in _detect_distance_issues: {e}")
+            _diag.warning("Error in _detect_distance_issues: %s", e)
             import traceback
             traceback.print_exc()
         
@@ -524,26 +566,13 @@ class DistanceDetectorService:
         Returns:
             List of QgsRelation instances (possibly empty).
         """
-        found: List[Any] = []
         try:
-            if not layer1 or not layer2:
-                return found
-            project = QgsProject.instance()
-            relation_manager = project.relationManager()
-            for relation_id, relation in relation_manager.relations().items():
-                referencing_layer = relation.referencingLayer()
-                referenced_layer = relation.referencedLayer()
-                if not (referencing_layer and referenced_layer):
-                    continue
-                if ((referencing_layer.id() == layer1.id() and referenced_layer.id() == layer2.id()) or
-                        (referencing_layer.id() == layer2.id() and referenced_layer.id() == layer1.id())):
-                    found.append(relation)
-            return found
+            return get_relation_graph().relations_between(layer1, layer2)
         except Exception as e:
-            print(f"[DEBUG] Error collecting relations between layers: {str(e)}")
+            _diag.warning("Error collecting relations between layers: %s", e)
             import traceback
             traceback.print_exc()
-            return found
+            return []
 
     def _ordered_relations_for_distance(self, relations: List[Any], definitive_points_layer: Any) -> List[Any]:
         """
@@ -566,39 +595,6 @@ class DistanceDetectorService:
                 other.append(relation)
         return preferred + other
 
-    def _relation_project_id(self, relation: Any, dict_key: Any = None) -> str:
-        """
-        Stable string id for a QgsRelation, for comparing relations across calls.
-
-        Uses :meth:`QgsRelation.id` when available, otherwise the relation manager dict key
-        or Python ``id`` as last resort (tests may use plain mocks).
-        """
-        try:
-            rid = relation.id()
-            if rid:
-                return str(rid)
-        except Exception:
-            pass
-        if dict_key is not None:
-            return str(dict_key)
-        return str(id(relation))
-
-    def _other_layer_in_relation(self, current_layer: Any, relation: Any) -> Optional[Any]:
-        """Return the layer at the other end of ``relation`` from ``current_layer``."""
-        try:
-            ref = relation.referencingLayer()
-            rec = relation.referencedLayer()
-            if not ref or not rec or not current_layer:
-                return None
-            cid = current_layer.id()
-            if ref.id() == cid:
-                return rec
-            if rec.id() == cid:
-                return ref
-        except Exception:
-            return None
-        return None
-
     def _find_shortest_relation_path(
         self,
         layer_start: Any,
@@ -626,59 +622,19 @@ class DistanceDetectorService:
             Ordered list of relations, or None if no path exists within ``max_hops``.
         """
         try:
-            if not layer_start or not layer_end or layer_start.id() == layer_end.id():
-                return None
-            queue = deque([(layer_start, [])])
-            visited = {layer_start.id()}
-            project = QgsProject.instance()
-            relation_manager = project.relationManager()
-            while queue:
-                current, path = queue.popleft()
-                if len(path) >= max_hops:
-                    continue
-                for rel_key, relation in relation_manager.relations().items():
-                    if forbidden_relation_ids:
-                        rid = self._relation_project_id(relation, rel_key)
-                        if rid in forbidden_relation_ids:
-                            continue
-                    nxt = self._other_layer_in_relation(current, relation)
-                    if not nxt:
-                        continue
-                    nid = nxt.id()
-                    if forbidden_layer_ids and str(nid) in forbidden_layer_ids:
-                        continue
-                    new_path = path + [relation]
-                    if nid == layer_end.id():
-                        return new_path
-                    if nid in visited:
-                        continue
-                    visited.add(nid)
-                    queue.append((nxt, new_path))
-            return None
+            return get_relation_graph().shortest_path(
+                layer_start,
+                layer_end,
+                max_hops=max_hops,
+                forbidden_relation_ids=forbidden_relation_ids,
+                forbidden_layer_ids=forbidden_layer_ids,
+            )
         except Exception as e:
-            print(f"[DEBUG] Error finding indirect relation path: {e}")
+            _diag.warning("Error finding indirect relation path: %s", e)
             import traceback
             traceback.print_exc()
             return None
 
-    def _ordered_layers_along_path(
-        self,
-        layer_start: Any,
-        relations_path: List[Any],
-    ) -> Optional[List[Any]]:
-        """
-        Reconstruct [L0, L1, ..., Ln] where L0 is ``layer_start`` and each relation connects Li to Li+1.
-        """
-        layers = [layer_start]
-        current = layer_start
-        for relation in relations_path:
-            nxt = self._other_layer_in_relation(current, relation)
-            if not nxt:
-                return None
-            layers.append(nxt)
-            current = nxt
-        return layers
-
     def _resolve_combo_layer_for_path_node(
         self,
         path_node: Any,
@@ -694,25 +650,6 @@ class DistanceDetectorService:
             return objects_combo
         return path_node
 
-    def _field_names_for_relation_hop(self, relation: Any, from_layer: Any) -> Optional[Tuple[str, str]]:
-        """
-        For a hop from ``from_layer`` to the other layer in ``relation``, return
-        (field_name_on_from, field_name_on_to) using the relation's single field pair.
-        """
-        fp = relation.fieldPairs()
-        if not fp:
-            return None
-        ref_field, rec_field = next(iter(fp.items()))
-        ref_lyr = relation.referencingLayer()
-        rec_lyr = relation.referencedLayer()
-        if not ref_lyr or not rec_lyr:
-            return None
-        if from_layer.id() == ref_lyr.id():
-            return ref_field, rec_field
-        if from_layer.id() == rec_lyr.id():
-            return rec_field, ref_field
-        return None
-
     def _field_index_on_layer_for_path(
         self,
         combo_layer: Any,
@@ -761,13 +698,13 @@ class DistanceDetectorService:
         """
         warnings: List[Union[str, WarningData]] = []
         try:
-            ordered_def = self._ordered_layers_along_path(definitive_points, relations_path)
+            ordered_def = ordered_layers_along_path(definitive_points, relations_path)
             if (
                 not ordered_def
                 or ordered_def[-1].id() != definitive_objects.id()
                 or ordered_def[0].id() != definitive_points.id()
             ):
-                print("[DEBUG] Distance detection (indirect): path does not connect points to objects")
+                _diag.debug("Distance detection (indirect): path does not connect points to objects")
                 return None
 
             combo_layers = [
@@ -776,18 +713,19 @@ class DistanceDetectorService:
                 )
                 for d in ordered_def
             ]
-            print(
-                "[DEBUG] Distance detection (indirect): resolved path layers = "
-                f"{[layer.name() if layer else '<none>' for layer in combo_layers]}"
-            )
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug(
+                    "Distance detection (indirect): resolved path layers = %s",
+                    [layer.name() if layer else '<none>' for layer in combo_layers],
+                )
 
             hops: List[Tuple[int, int]] = []
             for i, relation in enumerate(relations_path):
                 from_def = ordered_def[i]
                 to_def = ordered_def[i + 1]
-                names = self._field_names_for_relation_hop(relation, from_def)
+                names = field_names_for_relation_hop(relation, from_def)
                 if not names:
-                    print("[DEBUG] Distance detection (indirect): relation has no field pairs")
+                    _diag.debug("Distance detection (indirect): relation has no field pairs")
                     return None
                 from_name, to_name = names
                 from_idx = self._field_index_on_layer_for_path(
@@ -805,29 +743,47 @@ class DistanceDetectorService:
                     definitive_objects=definitive_objects,
                 )
                 if from_idx < 0 or to_idx < 0:
-                    print(
-                        "[DEBUG] Distance detection (indirect): could not resolve hop fields "
-                        f"(hop {i}: from_idx={from_idx}, to_idx={to_idx})"
+                    _diag.debug(
+                        "Distance detection (indirect): could not resolve hop fields (hop %s: from_idx=%s, to_idx=%s)",
+                        i,
+                        from_idx,
+                        to_idx,
                     )
                     return None
-                print(
-                    "[DEBUG] Distance detection (indirect): hop mapping "
-                    f"{i}: '{combo_layers[i].name()}'.'{from_name}'[{from_idx}] -> "
-                    f"'{combo_layers[i + 1].name()}'.'{to_name}'[{to_idx}]"
+                _diag.debug(
+                    "Distance detection (indirect): hop mapping %s: '%s'.'%s'[%s] -> '%s'.'%s'[%s]",
+                    i,
+                    combo_layers[i].name(),
+                    from_name,
+                    from_idx,
+                    combo_layers[i + 1].name(),
+                    to_name,
+                    to_idx,
                 )
                 hops.append((from_idx, to_idx))
 
             feats = []
-            for layer in combo_layers:
+            last_layer_index = len(combo_layers) - 1
+            for layer_index, layer in enumerate(combo_layers):
+                # Only the end points of the path need geometry and identifiers;
+                # intermediate link layers only contribute their hop fields.
+                if layer_index == 0:
+                    request_fields = self._point_scan_fields(hops[0][0])
+                elif layer_index == last_layer_index:
+                    request_fields = self._object_scan_fields(layer, hops[-1][1])
+                else:
+                    request_fields = (hops[layer_index - 1][1], hops[layer_index][0])
+                with_geometry = layer_index in (0, last_layer_index)
                 feature_list = []
-                for feature in layer.getFeatures():
+                for feature in iter_features(layer, request_fields, with_geometry=with_geometry):
                     maybe_yield_to_ui()
                     feature_list.append(feature)
                 feats.append(feature_list)
-            print(
-                "[DEBUG] Distance detection (indirect): feature counts by layer = "
-                f"{[len(fset) for fset in feats]}"
-            )
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug(
+                    "Distance detection (indirect): feature counts by layer = %s",
+                    [len(fset) for fset in feats],
+                )
             if not feats[0] or not feats[-1]:
                 return []
 
@@ -883,9 +839,9 @@ class DistanceDetectorService:
                             'distance': distance,
                             'relation_value': chain_key,
                         })
-            print(
-                "[DEBUG] Distance detection (indirect): pairing result "
-                f"(distance_issues={len(distance_issues)})"
+            _diag.debug(
+                "Distance detection (indirect): pairing result (distance_issues=%s)",
+                len(distance_issues),
             )
 
             if not distance_issues:
@@ -904,15 +860,16 @@ class DistanceDetectorService:
                 unique_point_ids = {issue['point_feature'].id() for issue in issues}
                 unique_object_ids = {issue['object_feature'].id() for issue in issues}
                 if len(unique_point_ids) > self._MAX_POINTS_PER_RELATION_KEY:
-                    print(
-                        "[DEBUG] Distance detection (indirect): skipping non-unique key "
-                        f"'{relation_value}' ({len(unique_point_ids)} points)"
+                    _diag.debug(
+                        "Distance detection (indirect): skipping non-unique key '%s' (%s points)",
+                        relation_value,
+                        len(unique_point_ids),
                     )
                     continue
                 if len(unique_point_ids) * len(unique_object_ids) > self._MAX_POINT_OBJECT_PAIRINGS:
-                    print(
-                        "[DEBUG] Distance detection (indirect): skipping key "
-                        f"'{relation_value}' (too many pairings)"
+                    _diag.debug(
+                        "Distance detection (indirect): skipping key '%s' (too many pairings)",
+                        relation_value,
                     )
                     continue
                 points_filter_value = issues[0]['point_feature'].attribute(points_field_idx)
@@ -935,12 +892,14 @@ class DistanceDetectorService:
                     filter_expression=points_filter,
                     second_layer_name=objects_combo.name(),
                     second_filter_expression=objects_filter,
-                    distance_issues=issues,
+                    distance_issues=[
+                        DistanceIssue.from_issue(issue, points_combo, objects_combo) for issue in issues
+                    ],
                 )
                 warnings.append(warning_data)
 
         except Exception as e:
-            print(f"[DEBUG] Error in _detect_distance_issues_via_relation_path: {e}")
+            _diag.warning("Error in _detect_distance_issues_via_relation_path: %s", e)
             import traceback
             traceback.print_exc()
             return None
@@ -980,7 +939,7 @@ class DistanceDetectorService:
             # Try to get a meaningful identifier field
             if layer_type == "Total Station Point":
                 # Look for common point identifier fields
-                for field_name in ['point_id', 'station_id', 'point_number', 'id', 'fid']:
+                for field_name in self._POINT_IDENTIFIER_FIELD_NAMES:
                     field_idx = feature.fields().indexOf(field_name)
                     if field_idx >= 0:
                         value = feature.attribute(field_idx)
@@ -988,7 +947,7 @@ class DistanceDetectorService:
                             return f"Point {value}"
             elif layer_type == "Object":
                 # Look for common object identifier fields
-                for field_name in ['object_number', 'number', 'object_id', 'id', 'fid']:
+                for field_name in self._OBJECT_IDENTIFIER_FIELD_NAMES:
                     field_idx = feature.fields().indexOf(field_name)
                     if field_idx >= 0:
                         value = feature.attribute(field_idx)
@@ -1075,7 +1034,7 @@ class DistanceDetectorService:
         if not layer:
             return False
         try:
-            for _feature in layer.getFeatures():
+            for _feature in iter_features(layer, (), with_geometry=False, limit=1):
                 return True
         except Exception:
             return False
@@ -1127,12 +1086,10 @@ class DistanceDetectorService:
             else None
         )
         try:
-            project = QgsProject.instance()
-            relation_manager = project.relationManager()
-            for relation in relation_manager.relations().values():
+            for relation in get_relation_graph().relations_touching(recording_areas_layer):
                 referencing_layer = relation.referencingLayer()
                 referenced_layer = relation.referencedLayer()
-                if not referencing_layer or not referenced_layer or not recording_areas_layer:
+                if not referencing_layer or not referenced_layer:
                     continue
                 if referenced_layer.id() != recording_areas_layer.id():
                     continue
@@ -1144,7 +1101,7 @@ class DistanceDetectorService:
                 if definitive_points_layer and referencing_layer.id() == definitive_points_layer.id():
                     names.update(field_pairs.keys())
         except Exception as e:
-            print(f"[DEBUG] Distance detection: could not collect recording-area fields: {e}")
+            _diag.debug("Distance detection: could not collect recording-area fields: %s", e)
 
         for setting_key in (
             'objects_recording_area_field',
@@ -1187,10 +1144,7 @@ class DistanceDetectorService:
                 continue
             identifier_field = self._find_identifier_field(layer, is_point_layer=True)
             if not identifier_field:
-                print(
-                    "[DEBUG] Distance detection (topo ids): no identifier field on "
-                    f"layer '{layer.name()}'"
-                )
+                _diag.debug("Distance detection (topo ids): no identifier field on layer '%s'", layer.name())
                 continue
             field_idx = layer.fields().indexOf(identifier_field)
             if field_idx < 0:
@@ -1200,7 +1154,7 @@ class DistanceDetectorService:
                         break
             if field_idx < 0:
                 continue
-            for feature in layer.getFeatures():
+            for feature in iter_features(layer, self._point_scan_fields(field_idx)):
                 maybe_yield_to_ui()
                 relation_value = feature.attribute(field_idx)
                 if not self._is_valid_relation_value(relation_value):
@@ -1211,6 +1165,15 @@ class DistanceDetectorService:
                 index[key].append((layer, feature))
         return index
 
+    def _point_scan_fields(self, link_field_idx: int) -> Tuple[Any, ...]:
+        """Attributes fetched when scanning a points layer for distance checks."""
+        return (link_field_idx,) + self._POINT_IDENTIFIER_FIELD_NAMES
+
+    def _object_scan_fields(self, objects_layer: Any, link_field_idx: int = -1) -> Tuple[Any, ...]:
+        """Attributes fetched when scanning an objects layer for distance checks."""
+        first_idx, last_idx = self._find_topo_link_field_indices(objects_layer)
+        return (link_field_idx, first_idx, last_idx) + self._OBJECT_IDENTIFIER_FIELD_NAMES
+
     def _get_object_topo_identifier_keys(self, feature: Any, objects_layer: Any) -> List[str]:
         """Return normalized first/last topo identifiers declared on an object feature."""
         if not feature or not objects_layer:
@@ -1248,14 +1211,16 @@ class DistanceDetectorService:
                 else None,
             )
             if not points_index:
-                print("[DEBUG] Distance detection (topo ids): no indexed topo points")
+                _diag.debug("Distance detection (topo ids): no indexed topo points")
                 return warnings
 
             first_idx, last_idx = self._find_topo_link_field_indices(objects_layer)
             distance_issues: List[Dict[str, Any]] = []
             seen_pairings: AbstractSet[Tuple[int, int]] = set()
 
-            for object_feature in objects_layer.getFeatures():
+            for object_feature in iter_features(
+                objects_layer, self._object_scan_fields(objects_layer)
+            ):
                 maybe_yield_to_ui()
                 if not self._object_feature_has_point_association(object_feature, objects_layer):
                     continue
@@ -1358,10 +1323,12 @@ class DistanceDetectorService:
                     filter_expression=points_filter,
                     second_layer_name=objects_layer.name(),
                     second_filter_expression=objects_filter,
-                    distance_issues=issues,
+                    distance_issues=[
+                        DistanceIssue.from_issue(issue, issue['point_layer'], objects_layer) for issue in issues
+                    ],
                 ))
         except Exception as e:
-            print(f"[DEBUG] Error in _detect_distance_by_topo_identifiers: {e}")
+            _diag.warning("Error in _detect_distance_by_topo_identifiers: %s", e)
             import traceback
             traceback.print_exc()
 
@@ -32,13 +32,23 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from qgis.PyQt.QtCore import QObject
 
 try:
-    from ..core.data_structures import WarningData
+    from ..core.data_structures import FeatureTarget, WarningData
     from ..core.interfaces import ILayerService, ISettingsManager
+    from ..core.feature_requests import iter_features
+    from ..core.relation_graph import get_relation_graph
+    from ..core.cancellation import CancellationToken, cancellation_scope
     from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.diagnostics import get_diagnostics
 except ImportError:
-    from core.data_structures import WarningData
+    from core.data_structures import FeatureTarget, WarningData
     from core.interfaces import ILayerService, ISettingsManager
+    from core.feature_requests import iter_features
+    from core.relation_graph import get_relation_graph
+    from core.cancellation import CancellationToken, cancellation_scope
     from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import get_diagnostics
+
+_diag = get_diagnostics("detectors.duplicate_objects")
 
 
 class _IdentityKeyContext:
@@ -50,6 +60,10 @@ class _IdentityKeyContext:
         self.number_field_idx = number_field_idx
         self.recording_area_field_indices = recording_area_field_indices
 
+    def field_indices(self) -> List[int]:
+        """Return every attribute index read by the identity key extraction."""
+        return [self.number_field_idx, *self.recording_area_field_indices]
+
 
 class DuplicateObjectsDetectorService(QObject):
     """
@@ -79,18 +93,30 @@ class DuplicateObjectsDetectorService(QObject):
             print(f"Error finding layer by name: {exc}")
             return None
 
-    def detect_duplicate_objects(self) -> List[Union[str, WarningData]]:
+    def detect_duplicate_objects(
+        self, cancellation_token: Optional[CancellationToken] = None
+    ) -> List[Union[str, WarningData]]:
         """
         Detect duplicate objects with the same recording area and number.
 
         Checks duplicates within "New Objects" and conflicts with the definitive
         objects layer. The definitive layer is not scanned for internal duplicates.
 
+        Args:
+            cancellation_token: Optional token checked in the scan loops; once it is
+                cancelled the run raises ``DetectionCancelled`` instead of returning
+                partial results
+
         Returns:
             List of warning messages or structured warning data about duplicate objects
         """
+        with cancellation_scope(cancellation_token):
+            return self._detect_duplicate_objects()
+
+    def _detect_duplicate_objects(self) -> List[Union[str, WarningData]]:
+        """Run the detection; see :meth:`detect_duplicate_objects`."""
         if not self._settings_manager.get_value("enable_duplicate_objects_warnings", True):
-            print("[DEBUG] Duplicate objects warnings are disabled, skipping detection")
+            _diag.debug("Duplicate objects warnings are disabled, skipping detection")
             return []
         warnings: List[Union[str, WarningData]] = []
 
@@ -137,6 +163,7 @@ class DuplicateObjectsDetectorService(QObject):
                     resolved_number_field,
                     recording_area_field,
                     "New Objects",
+                    layer=new_objects_layer,
                 )
                 warnings.extend(new_warnings)
 
@@ -233,23 +260,11 @@ class DuplicateObjectsDetectorService(QObject):
     ) -> Optional[str]:
         """Return the objects-layer field that references recording areas via project relations."""
         try:
-            from qgis.core import QgsProject
-
-            relation_manager = QgsProject.instance().relationManager()
-            objects_layer_id = objects_layer.id()
-            recording_areas_layer_id = recording_areas_layer.id()
-            for relation in relation_manager.relations().values():
-                referencing_layer = relation.referencingLayer()
-                referenced_layer = relation.referencedLayer()
-                if referencing_layer is None or referenced_layer is None:
-                    continue
-                if (
-                    referencing_layer.id() == objects_layer_id
-                    and referenced_layer.id() == recording_areas_layer_id
-                ):
-                    field_pairs = relation.fieldPairs()
-                    if field_pairs:
-                        return list(field_pairs.keys())[0]
+            relation = get_relation_graph().relation_from(objects_layer, recording_areas_layer)
+            if relation is not None:
+                field_pairs = relation.fieldPairs()
+                if field_pairs:
+                    return list(field_pairs.keys())[0]
         except Exception as exc:
             print(f"Error resolving recording-area relation field: {exc}")
         return None
@@ -380,7 +395,9 @@ class DuplicateObjectsDetectorService(QObject):
         if context is None:
             return index
 
-        for feature in objects_layer.getFeatures():
+        for feature in iter_features(
+            objects_layer, context.field_indices(), with_geometry=False
+        ):
             maybe_yield_to_ui(every=50)
             identity = self._identity_from_context(feature, context)
             if identity is None:
@@ -413,12 +430,19 @@ class DuplicateObjectsDetectorService(QObject):
         number_field: str,
         recording_area_field: str,
         layer_name: str,
+        layer: Any = None,
     ) -> List[Union[str, WarningData]]:
-        """Create warnings for duplicate identities found within a single layer index."""
+        """
+        Create warnings for duplicate identities found within a single layer index.
+
+        When ``layer`` is given, warnings target the duplicated features by id.
+        """
         warnings: List[Union[str, WarningData]] = []
 
-        print(
-            f"[DEBUG] Found {len(identity_index)} unique recording area/number combinations in {layer_name}"
+        _diag.debug(
+            "Found %s unique recording area/number combinations in %s",
+            len(identity_index),
+            layer_name,
         )
 
         for (recording_area_id, number), features in identity_index.items():
@@ -444,6 +468,11 @@ class DuplicateObjectsDetectorService(QObject):
                         f'AND "{number_field}" = {number}'
                     ),
                     object_number=number,
+                    targets=(
+                        [FeatureTarget.of(layer, [feature.id() for feature in features])]
+                        if layer is not None
+                        else None
+                    ),
                 )
             )
         return warnings
@@ -471,9 +500,10 @@ class DuplicateObjectsDetectorService(QObject):
                 number_field,
                 recording_area_field,
                 layer_name,
+                layer=objects_layer,
             )
         except Exception as exc:
-            print(f"[DEBUG] Error in _detect_duplicates_within_layer: {exc}")
+            _diag.warning("Error in _detect_duplicates_within_layer: %s", exc)
             import traceback
 
             traceback.print_exc()
@@ -513,45 +543,57 @@ class DuplicateObjectsDetectorService(QObject):
             if new_context is None:
                 return warnings
 
-            warned_between_layer_keys = set()
-            for feature in new_objects_layer.getFeatures():
+            # New feature ids per identity already present in the original layer
+            new_feature_ids: Dict[Tuple[Any, Any], List[int]] = {}
+            for feature in iter_features(
+                new_objects_layer, new_context.field_indices(), with_geometry=False
+            ):
                 maybe_yield_to_ui(every=50)
                 identity = self._identity_from_context(feature, new_context)
                 if identity is None:
                     continue
-                if identity in original_index and identity not in warned_between_layer_keys:
-                    warned_between_layer_keys.add(identity)
-                    recording_area_id, number = identity
-                    recording_area_name = self._get_recording_area_name(
-                        recording_areas_layer,
-                        recording_area_id,
-                        recording_area_names,
-                    )
-                    warnings.append(
-                        WarningData(
-                            message=self._create_duplicate_warning(
-                                recording_area_name,
-                                len(original_index[identity]),
-                                number,
-                                f"{original_objects_layer.name()} and New Objects",
-                            ),
-                            recording_area_name=recording_area_name,
-                            layer_name=original_objects_layer.name(),
-                            filter_expression=(
-                                f'"{recording_area_field}" = \'{recording_area_id}\' '
-                                f'AND "{number_field}" = {number}'
-                            ),
-                            object_number=number,
-                            second_layer_name="New Objects",
-                            second_filter_expression=(
-                                f'"{recording_area_field}" = \'{recording_area_id}\' '
-                                f'AND "{number_field}" = {number}'
+                if identity in original_index:
+                    new_feature_ids.setdefault(identity, []).append(feature.id())
+
+            for identity, feature_ids in new_feature_ids.items():
+                recording_area_id, number = identity
+                recording_area_name = self._get_recording_area_name(
+                    recording_areas_layer,
+                    recording_area_id,
+                    recording_area_names,
+                )
+                warnings.append(
+                    WarningData(
+                        message=self._create_duplicate_warning(
+                            recording_area_name,
+                            len(original_index[identity]),
+                            number,
+                            f"{original_objects_layer.name()} and New Objects",
+                        ),
+                        recording_area_name=recording_area_name,
+                        layer_name=original_objects_layer.name(),
+                        filter_expression=(
+                            f'"{recording_area_field}" = \'{recording_area_id}\' '
+                            f'AND "{number_field}" = {number}'
+                        ),
+                        object_number=number,
+                        second_layer_name="New Objects",
+                        second_filter_expression=(
+                            f'"{recording_area_field}" = \'{recording_area_id}\' '
+                            f'AND "{number_field}" = {number}'
+                        ),
+                        targets=[
+                            FeatureTarget.of(
+                                original_objects_layer,
+                                [original.id() for original in original_index[identity]],
                             ),
-                        )
+                            FeatureTarget.of(new_objects_layer, feature_ids),
+                        ],
                     )
+                )
 
         except Exception as exc:
-            print(f"[DEBUG] Error in _detect_duplicates_between_layers: {exc}")
+            _diag.warning("Error in _detect_duplicates_between_layers: %s", exc)
             import traceback
 
             traceback.print_exc()
@@ -572,7 +614,9 @@ class DuplicateObjectsDetectorService(QObject):
         lookup: Dict[Any, str] = {}
         name_field_idx = self._find_first_name_field_index(recording_areas_layer)
 
-        for feature in recording_areas_layer.getFeatures():
+        for feature in iter_features(
+            recording_areas_layer, (name_field_idx,), with_geometry=False
+        ):
             maybe_yield_to_ui(every=50)
             feature_id = feature.id()
             if name_field_idx >= 0:
@@ -35,12 +35,20 @@ from qgis.PyQt.QtCore import QObject, QVariant
 
 try:
     from ..core.interfaces import ISettingsManager, ILayerService
-    from ..core.data_structures import WarningData
+    from ..core.data_structures import FeatureTarget, WarningData
+    from ..core.feature_requests import field_in_expression, iter_features
+    from ..core.cancellation import CancellationToken, cancellation_scope
     from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.diagnostics import DEBUG, get_diagnostics
 except ImportError:
     from core.interfaces import ISettingsManager, ILayerService
-    from core.data_structures import WarningData
+    from core.data_structures import FeatureTarget, WarningData
+    from core.feature_requests import field_in_expression, iter_features
+    from core.cancellation import CancellationToken, cancellation_scope
     from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import DEBUG, get_diagnostics
+
+_diag = get_diagnostics("detectors.duplicate_total_station_identifiers")
 
 
 class DuplicateTotalStationIdentifiersDetectorService(QObject):
@@ -124,16 +132,28 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
             print(f"Error finding layer by name: {e}")
             return None
 
-    def detect_duplicate_identifiers_warnings(self) -> List[Union[str, WarningData]]:
+    def detect_duplicate_identifiers_warnings(
+        self, cancellation_token: Optional[CancellationToken] = None
+    ) -> List[Union[str, WarningData]]:
         """
         Detect duplicate identifiers in total station points.
         
+        Args:
+            cancellation_token: Optional token checked in the scan loops; once it is
+                cancelled the run raises ``DetectionCancelled`` instead of returning
+                partial results
+        
         Returns:
             List of warning messages or structured warning data about duplicate identifiers
         """
+        with cancellation_scope(cancellation_token):
+            return self._detect_duplicate_identifiers_warnings()
+
+    def _detect_duplicate_identifiers_warnings(self) -> List[Union[str, WarningData]]:
+        """Run the detection; see :meth:`detect_duplicate_identifiers_warnings`."""
         # Check if duplicate total station identifiers warnings are enabled
         if not self._settings_manager.get_value('enable_duplicate_total_station_identifiers_warnings', True):
-            print("[DEBUG] Duplicate total station identifiers warnings are disabled, skipping detection")
+            _diag.debug("Duplicate total station identifiers warnings are disabled, skipping detection")
             return []
         print("=" * 50)
         print("DUPLICATE TOTAL STATION IDENTIFIERS DETECTION STARTED")
@@ -161,7 +181,7 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
             )
             
             if not common_identifier_field:
-                print("[DEBUG] Could not find common identifier field between definitive and temporary total station points layers")
+                _diag.debug("Could not find common identifier field between definitive and temporary total station points layers")
                 return warnings
             
             # Check for duplicates within the temporary total station points layer
@@ -179,7 +199,10 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
                 warnings.extend(between_warnings)
             else:
                 # If no temporary layer, only check the definitive layer
-                print(f"[DEBUG] No temporary layer found, only checking definitive layer: {definitive_total_station_points_layer.name()}")
+                _diag.debug(
+                    "No temporary layer found, only checking definitive layer: %s",
+                    definitive_total_station_points_layer.name(),
+                )
             
         except Exception as e:
             print(f"Error in duplicate total station identifiers detection: {e}")
@@ -221,7 +244,7 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
             common_string_fields = set(definitive_string_fields) & set(temp_string_fields)
             
             if not common_string_fields:
-                print("[DEBUG] No common string fields found between layers")
+                _diag.debug("No common string fields found between layers")
                 return None
             
             # Look for fields containing "id" (case-insensitive) in common fields
@@ -267,7 +290,7 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
                 if field.name().lower() in common_string_fields:
                     return field.name()
             
-            print("[DEBUG] No suitable common identifier field found")
+            _diag.debug("No suitable common identifier field found")
             return None
             
         except Exception as e:
@@ -310,8 +333,12 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
                      field_name.endswith("_id") or field_name.endswith("_code"))):
                     return field.name()
             
-            print(f"[DEBUG] Could not guess identifier field for layer: {layer.name()}")
-            print(f"[DEBUG] Available text-like fields: {[f.name() for f in layer.fields() if self._field_is_text_like(f)]}")
+            _diag.debug("Could not guess identifier field for layer: %s", layer.name())
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug(
+                    "Available text-like fields: %s",
+                    [f.name() for f in layer.fields() if self._field_is_text_like(f)],
+                )
             return None
             
         except Exception as e:
@@ -352,31 +379,21 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
                     print(f"Available fields: {[f.name() for f in layer.fields()]}")
                     return warnings
             
-            # Group features by identifier
-            duplicates = {}
-            feature_count = 0
-            for feature in layer.getFeatures():
-                maybe_yield_to_ui()
-                feature_count += 1
-                identifier = feature[identifier_field_idx]
-                
-                if identifier:
-                    if identifier not in duplicates:
-                        duplicates[identifier] = []
-                    duplicates[identifier].append(feature)
+            duplicate_feature_ids = self._find_duplicate_feature_ids(layer, identifier_field_idx)
             
             # Check for duplicates (more than one feature with same identifier)
-            for identifier, features in duplicates.items():
-                if len(features) > 1:
+            for identifier, feature_ids in duplicate_feature_ids.items():
+                if len(feature_ids) > 1:
                     # Create structured warning data
                     warning_data = WarningData(
                         message=self._create_duplicate_warning(
-                            len(features), identifier, layer_name
+                            len(feature_ids), identifier, layer_name
                         ),
                         recording_area_name="",  # Not applicable for total station points
                         layer_name=layer_name,
                         filter_expression=f'"{identifier_field}" = \'{identifier}\'',
-                        object_number=None  # Not applicable for total station points
+                        object_number=None,  # Not applicable for total station points
+                        targets=[FeatureTarget.of(layer, feature_ids)],
                     )
                     warnings.append(warning_data)
             
@@ -387,6 +404,37 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
         
         return warnings
     
+    def _find_duplicate_feature_ids(self, layer: Any, identifier_field_idx: int) -> Dict[Any, List[int]]:
+        """
+        Return feature ids grouped by identifier, for duplicated identifiers only.
+        
+        Only the identifier attribute is fetched, without geometry. Unique identifiers
+        keep a single feature id while scanning; a list of ids is built only once an
+        identifier is seen a second time.
+        
+        Args:
+            layer: The layer to scan
+            identifier_field_idx: Index of the identifier field
+            
+        Returns:
+            Mapping of duplicated identifier to the ids of all features carrying it
+        """
+        first_feature_ids: Dict[Any, int] = {}
+        duplicate_feature_ids: Dict[Any, List[int]] = {}
+        for feature in iter_features(layer, (identifier_field_idx,), with_geometry=False):
+            maybe_yield_to_ui()
+            identifier = feature[identifier_field_idx]
+            if not identifier:
+                continue
+            
+            if identifier in duplicate_feature_ids:
+                duplicate_feature_ids[identifier].append(feature.id())
+            elif identifier in first_feature_ids:
+                duplicate_feature_ids[identifier] = [first_feature_ids[identifier], feature.id()]
+            else:
+                first_feature_ids[identifier] = feature.id()
+        return duplicate_feature_ids
+    
     def _detect_duplicates_between_layers(self, 
                                         definitive_layer: Any, 
                                         temp_layer: Any, 
@@ -417,28 +465,37 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
             if definitive_identifier_field_idx < 0 or temp_identifier_field_idx < 0:
                 return warnings
             
-            # First, collect all identifiers from the temporary layer
-            temp_identifiers = set()
-            for feature in temp_layer.getFeatures():
+            # First, collect all identifiers (and their feature ids) from the temporary layer
+            temp_feature_ids: Dict[Any, List[int]] = {}
+            for feature in iter_features(
+                temp_layer, (temp_identifier_field_idx,), with_geometry=False
+            ):
                 maybe_yield_to_ui()
                 identifier = feature[temp_identifier_field_idx]
                 if identifier:
-                    temp_identifiers.add(identifier)
+                    temp_feature_ids.setdefault(identifier, []).append(feature.id())
+            temp_identifiers = set(temp_feature_ids)
             
             if not temp_identifiers:
-                print("[DEBUG] No identifiers found in temporary layer, skipping between-layers check")
+                _diag.debug("No identifiers found in temporary layer, skipping between-layers check")
                 return warnings
             
-            # Now only check entities in the definitive layer that have matching identifiers
-            definitive_identifiers = set()
-            for feature in definitive_layer.getFeatures():
+            # Look the temporary identifiers up in the definitive layer with one filtered
+            # request, so the provider only returns matching rows instead of a full scan.
+            definitive_feature_ids: Dict[Any, List[int]] = {}
+            for feature in iter_features(
+                definitive_layer,
+                (definitive_identifier_field_idx,),
+                with_geometry=False,
+                filter_expression=field_in_expression(definitive_identifier_field, temp_identifiers),
+            ):
                 maybe_yield_to_ui()
                 identifier = feature[definitive_identifier_field_idx]
                 if identifier and identifier in temp_identifiers:
-                    definitive_identifiers.add(identifier)
+                    definitive_feature_ids.setdefault(identifier, []).append(feature.id())
             
             # Find common identifiers (duplicates between layers)
-            common_identifiers = definitive_identifiers & temp_identifiers
+            common_identifiers = set(definitive_feature_ids) & temp_identifiers
             
             # Create warnings for each common identifier
             for identifier in common_identifiers:
@@ -450,7 +507,11 @@ class DuplicateTotalStationIdentifiersDetectorService(QObject):
                     filter_expression=f'"{definitive_identifier_field}" = \'{identifier}\'',
                     object_number=None,  # Not applicable for total station points
                     second_layer_name="Imported_CSV_Points",
-                    second_filter_expression=f'"{temp_identifier_field}" = \'{identifier}\''
+                    second_filter_expression=f'"{temp_identifier_field}" = \'{identifier}\'',
+                    targets=[
+                        FeatureTarget.of(definitive_layer, definitive_feature_ids[identifier]),
+                        FeatureTarget.of(temp_layer, temp_feature_ids[identifier]),
+                    ],
                 )
                 warnings.append(warning_data)
             
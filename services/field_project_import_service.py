@@ -43,6 +43,13 @@ import unicodedata
 from typing import List, Dict, Optional, Any, Iterable, Tuple
 from dataclasses import dataclass
 
+try:
+    from ..core.diagnostics import get_diagnostics
+except ImportError:
+    from core.diagnostics import get_diagnostics
+
+_diag = get_diagnostics("import.field_projects")
+
 try:
     from qgis.core import QgsVectorLayer, QgsFeature, QgsProject, QgsVectorFileWriter, QgsGeometry, QgsWkbTypes
     from qgis.PyQt.QtCore import QVariant, QObject
@@ -379,12 +386,12 @@ class FieldProjectImportService(QObject):
             )
             if layer_type:
                 layer_files[layer_type].append(file_path)
-                print(f"[DEBUG] Classified {filename} as {layer_type}")
+                _diag.debug("Classified %s as %s", filename, layer_type)
             elif self._is_readonly_context_layer_file(filename):
-                print(f"[DEBUG] Skipping read-only context layer file {filename}")
+                _diag.debug("Skipping read-only context layer file %s", filename)
                 continue
             else:
-                print(f"[DEBUG] Unrecognized GeoPackage in field project: {filename}")
+                _diag.debug("Unrecognized GeoPackage in field project: %s", filename)
         
         return layer_files
 
@@ -1144,12 +1151,17 @@ class FieldProjectImportService(QObject):
             List of features with duplicates removed
         """
         if not existing_layer or not features:
-            print(f"[DEBUG] No existing layer or no features to filter for {layer_type}")
+            _diag.debug("No existing layer or no features to filter for %s", layer_type)
             return features
         
         # Get all existing features for comparison
         existing_features = list(existing_layer.getFeatures())
-        print(f"[DEBUG] Filtering duplicates for {layer_type}: {len(features)} features to check against {len(existing_features)} existing features")
+        _diag.debug(
+            "Filtering duplicates for %s: %s features to check against %s existing features",
+            layer_type,
+            len(features),
+            len(existing_features),
+        )
 
         if layer_type == "Objects":
             return self._filter_object_duplicates(
@@ -1177,7 +1189,7 @@ class FieldProjectImportService(QObject):
                 filtered_features.append(feature)
             else:
                 duplicates_count += 1
-        print(f"[DEBUG] {duplicates_count} duplicates found and ignored for {layer_type}")
+        _diag.debug("%s duplicates found and ignored for %s", duplicates_count, layer_type)
         return filtered_features
 
     def _filter_object_duplicates(
@@ -1235,37 +1247,37 @@ class FieldProjectImportService(QObject):
                 filtered_no_geom.append(feature)
                 continue
             if attr_sig in existing_no_geom_attr_sigs:
-                print(
-                    f"[DEBUG] Excluding no-geometry object duplicate "
-                    f"(attributes={attr_sig}) already in definitive data"
+                _diag.debug(
+                    "Excluding no-geometry object duplicate (attributes=%s) already in definitive data",
+                    attr_sig,
                 )
                 duplicates_count += 1
                 continue
             if attr_sig in existing_geometric_attr_sigs:
-                print(
-                    f"[DEBUG] Excluding no-geometry object duplicate "
-                    f"(attributes={attr_sig}) already represented by definitive geometry"
+                _diag.debug(
+                    "Excluding no-geometry object duplicate (attributes=%s) already represented by definitive geometry",
+                    attr_sig,
                 )
                 duplicates_count += 1
                 continue
             if attr_sig in imported_no_geom_attr_sigs:
-                print(
-                    f"[DEBUG] Excluding no-geometry object duplicate "
-                    f"(attributes={attr_sig}) already in this import batch"
+                _diag.debug(
+                    "Excluding no-geometry object duplicate (attributes=%s) already in this import batch",
+                    attr_sig,
                 )
                 duplicates_count += 1
                 continue
             if attr_sig in kept_geometric_attr_sigs:
-                print(
-                    f"[DEBUG] Excluding no-geometry object duplicate "
-                    f"(attributes={attr_sig}) already represented by imported geometry"
+                _diag.debug(
+                    "Excluding no-geometry object duplicate (attributes=%s) already represented by imported geometry",
+                    attr_sig,
                 )
                 duplicates_count += 1
                 continue
             imported_no_geom_attr_sigs.add(attr_sig)
             filtered_no_geom.append(feature)
 
-        print(f"[DEBUG] {duplicates_count} duplicates found and ignored for Objects")
+        _diag.debug("%s duplicates found and ignored for Objects", duplicates_count)
         return filtered_geometric + filtered_no_geom
 
     def _feature_has_empty_geometry(self, feature: Any) -> bool:
@@ -1309,10 +1321,7 @@ class FieldProjectImportService(QObject):
             objects_layer,
             only_empty_geometry=True,
         )
-        print(
-            f"[DEBUG] Loaded {len(keys)} no-geometry object identity key(s) "
-            f"from definitive Objects layer"
-        )
+        _diag.debug("Loaded %s no-geometry object identity key(s) from definitive Objects layer", len(keys))
         return keys
 
     def _normalize_object_identity_value(self, value: Any) -> Any:
@@ -1763,7 +1772,7 @@ class FieldProjectImportService(QObject):
                 return True
             return False
         except Exception as e:
-            print(f"[DEBUG] Exception in _is_virtual_field for {field_name}: {str(e)}")
+            _diag.warning("Exception in _is_virtual_field for %s: %s", field_name, e)
             return False
 
     def _parse_qml_expression_fields(self, qml_path):
@@ -1905,10 +1914,7 @@ class FieldProjectImportService(QObject):
             source_conn.backup(dest_conn)
             dest_conn.close()
             source_conn.close()
-            print(
-                f"[DEBUG] GeoPackage snapshot created via SQLite backup: "
-                f"{file_path} -> {temp_path}"
-            )
+            _diag.debug("GeoPackage snapshot created via SQLite backup: %s -> %s", file_path, temp_path)
             return temp_path, temp_path
         except Exception as exc:
             print(
@@ -0,0 +1,421 @@
+"""
+Single-transaction commit of validated features into a GeoPackage table.
+
+Validation normally adds copied features to the definitive layer's edit buffer and
+the user saves them through the provider. For GeoPackage layers with 100k+ rows the
+buffer and the provider commit are both heavy, so validation can instead hand the
+prepared features to a :class:`GeoPackageDirectWriter`:
+
+    table = geopackage_table_for_layer(target_layer)   # None when not eligible
+    writer = GeoPackageDirectWriter(table, target_layer.fields().names())
+    writer.add(feature)                                 # once per prepared feature
+    feature_ids = writer.commit()                       # one SQLite transaction
+    reload_layer(target_layer)
+
+Only plain GeoPackage tables without pending edits or subset filters are eligible.
+Rows are inserted with batched ``executemany`` calls inside one ``BEGIN IMMEDIATE``
+transaction; the GeoPackage R-tree triggers call ``ST_*`` functions that plain
+SQLite lacks, so the writer registers them on its connection and also refreshes
+the R-tree entries of the new rows explicitly. On any error the transaction is
+rolled back and nothing is written.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import sqlite3
+import struct
+import threading
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    from ..core.diagnostics import get_diagnostics
+except ImportError:
+    from core.diagnostics import get_diagnostics
+
+_diag = get_diagnostics("geopackage_commit")
+
+# Settings key enabling the direct commit path during validation.
+DIRECT_COMMIT_SETTING = 'validation_direct_commit'
+
+# Rows per executemany call inside the commit transaction.
+DIRECT_COMMIT_INSERT_BATCH = 1000
+
+# Seconds to wait for other connections (e.g. QGIS readers) to release the file.
+_LOCK_TIMEOUT = 30.0
+# On the main thread a busy file fails fast instead, so QGIS does not freeze and
+# validation falls back to the edit buffer.
+_MAIN_THREAD_LOCK_TIMEOUT = 0.5
+
+# Number of envelope doubles for each GeoPackage envelope indicator.
+_ENVELOPE_DOUBLES = {0: 0, 1: 4, 2: 6, 3: 6, 4: 8}
+_EMPTY_GEOMETRY_FLAG = 0x10
+
+
+@dataclass(frozen=True)
+class GeoPackageTable:
+    """Columns of a GeoPackage table that direct commits write to."""
+    path: str
+    table: str
+    fid_column: str
+    geometry_column: Optional[str]
+    srs_id: int
+    # Attribute columns, excluding the fid and geometry columns
+    columns: Tuple[str, ...]
+
+
+def encode_geopackage_geometry(
+    wkb: Optional[bytes], srs_id: int, envelope: Optional[Tuple[float, float, float, float]]
+) -> Optional[bytes]:
+    """
+    Wrap ISO WKB in a GeoPackage geometry blob.
+
+    ``envelope`` is ``(min_x, max_x, min_y, max_y)``; None marks an empty geometry.
+    """
+    if wkb is None:
+        return None
+    flags = 0x01  # little-endian header
+    header = b'GP' + bytes([0])
+    if envelope is None:
+        return header + bytes([flags | _EMPTY_GEOMETRY_FLAG]) + struct.pack('<i', srs_id) + wkb
+    flags |= 1 << 1
+    return header + bytes([flags]) + struct.pack('<i', srs_id) + struct.pack('<4d', *envelope) + wkb
+
+
+def _geometry_envelope(blob: Any) -> Optional[Tuple[float, ...]]:
+    """Return the header envelope of a GeoPackage blob, None when empty or absent."""
+    if not isinstance(blob, (bytes, bytearray, memoryview)) or len(blob) < 8:
+        return None
+    blob = bytes(blob)
+    if blob[:2] != b'GP':
+        return None
+    flags = blob[3]
+    if flags & _EMPTY_GEOMETRY_FLAG:
+        return None
+    count = _ENVELOPE_DOUBLES.get((flags >> 1) & 0x07, 0)
+    if count < 4:
+        return None
+    order = '<' if flags & 0x01 else '>'
+    return struct.unpack(f'{order}4d', blob[8:40])
+
+
+def _st_is_empty(blob: Any) -> Optional[int]:
+    if blob is None:
+        return None
+    blob = bytes(blob)
+    return 1 if len(blob) >= 4 and blob[3] & _EMPTY_GEOMETRY_FLAG else 0
+
+
+def _envelope_function(position: int):
+    def envelope_value(blob: Any) -> Optional[float]:
+        envelope = _geometry_envelope(blob)
+        return envelope[position] if envelope else None
+    return envelope_value
+
+
+def _register_spatial_functions(connection: sqlite3.Connection) -> None:
+    """Provide the ST_* functions used by the GeoPackage R-tree triggers."""
+    connection.create_function("ST_IsEmpty", 1, _st_is_empty, deterministic=True)
+    for position, name in enumerate(("ST_MinX", "ST_MaxX", "ST_MinY", "ST_MaxY")):
+        connection.create_function(name, 1, _envelope_function(position), deterministic=True)
+
+
+def _lock_timeout() -> float:
+    """Return how long a connection opened on the current thread waits for locks."""
+    if threading.current_thread() is threading.main_thread():
+        return _MAIN_THREAD_LOCK_TIMEOUT
+    return _LOCK_TIMEOUT
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def read_geopackage_table(path: str, table: str) -> Optional[GeoPackageTable]:
+    """
+    Describe ``table`` of the GeoPackage at ``path``.
+
+    Returns None when the table is not a registered features or attributes table
+    with a single integer primary key.
+    """
+    try:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=_lock_timeout())
+    except sqlite3.Error as e:
+        _diag.warning("Error opening GeoPackage %s: %s", path, e)
+        return None
+    try:
+        contents = connection.execute(
+            "SELECT table_name, data_type FROM gpkg_contents WHERE lower(table_name) = lower(?)", (table,)
+        ).fetchone()
+        if contents is None or contents[1] not in ('features', 'attributes'):
+            return None
+        table = contents[0]
+        geometry_column = None
+        srs_id = 0
+        geometry = connection.execute(
+            "SELECT column_name, srs_id FROM gpkg_geometry_columns WHERE lower(table_name) = lower(?)", (table,)
+        ).fetchone()
+        if geometry is not None:
+            geometry_column, srs_id = geometry[0], int(geometry[1])
+
+        fid_column = None
+        columns = []
+        primary_keys = 0
+        for _cid, name, column_type, _notnull, _default, primary_key in connection.execute(
+            f"PRAGMA table_info({_quote(table)})"
+        ):
+            if primary_key:
+                primary_keys += 1
+                if str(column_type).upper() == 'INTEGER':
+                    fid_column = name
+            elif name != geometry_column:
+                columns.append(name)
+        if fid_column is None or primary_keys != 1:
+            return None
+        return GeoPackageTable(path, table, fid_column, geometry_column, srs_id, tuple(columns))
+    except sqlite3.Error as e:
+        _diag.warning("Error reading GeoPackage table %s: %s", table, e)
+        return None
+    finally:
+        connection.close()
+
+
+def geopackage_table_for_layer(layer: Any) -> Optional[GeoPackageTable]:
+    """
+    Return the GeoPackage table behind ``layer`` when a direct commit is safe.
+
+    The layer must use the OGR provider on a ``.gpkg`` file, read a whole table
+    (no SQL layer or subset filter) and have no pending edits.
+    """
+    try:
+        if layer.providerType() != 'ogr':
+            return None
+        if layer.isEditable() and layer.isModified():
+            return None
+        if layer.subsetString():
+            return None
+
+        from qgis.core import QgsProviderRegistry
+
+        parts = QgsProviderRegistry.instance().decodeUri('ogr', layer.source())
+        path = parts.get('path') or ''
+        table = parts.get('layerName')
+        if not path.lower().endswith('.gpkg') or not os.path.isfile(path) or not table:
+            return None
+        if parts.get('subset'):
+            return None
+    except Exception as e:
+        _diag.warning("Error checking GeoPackage layer: %s", e)
+        return None
+    return read_geopackage_table(path, table)
+
+
+def _sql_value(value: Any) -> Tuple[bool, Any]:
+    """
+    Convert an attribute value to SQLite; returns (is_set, value).
+
+    NULL, invalid and unset values are not set: their column is left out of the
+    INSERT so its SQL default applies, as when the provider commits the edit buffer.
+    """
+    if value is None:
+        return False, None
+    if type(value).__name__ == 'QgsUnsetAttributeValue':
+        return False, None
+    if hasattr(value, 'isNull') and value.isNull():
+        return False, None
+    if hasattr(value, 'isValid') and not value.isValid():
+        return False, None
+    if hasattr(value, 'toPyDateTime'):
+        value = value.toPyDateTime()
+    elif hasattr(value, 'toPyDate'):
+        value = value.toPyDate()
+    elif hasattr(value, 'toPyTime'):
+        value = value.toPyTime()
+    if isinstance(value, bool):
+        return True, int(value)
+    if isinstance(value, datetime.datetime):
+        return True, value.isoformat(timespec='milliseconds') + ('Z' if value.tzinfo is None else '')
+    if isinstance(value, (datetime.date, datetime.time)):
+        return True, value.isoformat()
+    if isinstance(value, (int, float, str, bytes)):
+        return True, value
+    if isinstance(value, (list, dict)):
+        return True, json.dumps(value)
+    if type(value).__name__ == 'QByteArray':
+        return True, bytes(value)
+    return True, str(value)
+
+
+class GeoPackageDirectWriter:
+    """
+    Collect prepared features for one table and write them in a single transaction.
+
+    Feature attributes are matched to table columns by field name (case-insensitive);
+    virtual, joined and fid fields are left out so SQLite assigns new fids.
+    """
+
+    def __init__(
+        self,
+        table: GeoPackageTable,
+        field_names: Sequence[str],
+        batch_size: int = DIRECT_COMMIT_INSERT_BATCH,
+    ):
+        self._table = table
+        self._batch_size = max(1, int(batch_size))
+        columns_by_name = {column.lower(): column for column in table.columns}
+        # (attribute index, column name) for every layer field backed by the table
+        self._attribute_columns = [
+            (index, columns_by_name[name.lower()])
+            for index, name in enumerate(field_names)
+            if name.lower() in columns_by_name
+        ]
+        self._rows: List[Tuple[Tuple[str, ...], Tuple[Any, ...]]] = []
+
+    @property
+    def table(self) -> GeoPackageTable:
+        return self._table
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._rows)
+
+    def _geometry_blob(self, feature: Any) -> Optional[bytes]:
+        geometry = feature.geometry() if hasattr(feature, 'geometry') else None
+        if geometry is None or geometry.isNull():
+            return None
+        wkb = bytes(geometry.asWkb())
+        if geometry.isEmpty():
+            return encode_geopackage_geometry(wkb, self._table.srs_id, None)
+        box = geometry.boundingBox()
+        envelope = (box.xMinimum(), box.xMaximum(), box.yMinimum(), box.yMaximum())
+        return encode_geopackage_geometry(wkb, self._table.srs_id, envelope)
+
+    def add(self, feature: Any) -> bool:
+        """Convert ``feature`` to a table row and keep it for :meth:`commit`."""
+        attributes = feature.attributes()
+        columns = []
+        values = []
+        if self._table.geometry_column:
+            columns.append(self._table.geometry_column)
+            values.append(self._geometry_blob(feature))
+        for index, column in self._attribute_columns:
+            is_set, value = _sql_value(attributes[index] if index < len(attributes) else None)
+            if is_set:
+                columns.append(column)
+                values.append(value)
+        self._rows.append((tuple(columns), tuple(values)))
+        return True
+
+    def clear(self) -> None:
+        self._rows = []
+
+    def _insert_groups(self):
+        """Yield (columns, rows) for consecutive rows writing the same columns."""
+        columns = None
+        group: List[Tuple[Any, ...]] = []
+        for row_columns, values in self._rows:
+            if row_columns != columns or len(group) >= self._batch_size:
+                if group:
+                    yield columns, group
+                columns, group = row_columns, []
+            group.append(values)
+        if group:
+            yield columns, group
+
+    def _refresh_metadata(self, connection: sqlite3.Connection, first_fid: int) -> None:
+        """Update the R-tree, layer extent and cached feature count for new rows."""
+        table = self._table
+        geometry = table.geometry_column
+        if geometry:
+            rtree = f"rtree_{table.table}_{geometry}"
+            if connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (rtree,)
+            ).fetchone():
+                connection.execute(
+                    f"INSERT OR REPLACE INTO {_quote(rtree)} "
+                    f"SELECT {_quote(table.fid_column)}, ST_MinX({_quote(geometry)}), ST_MaxX({_quote(geometry)}), "
+                    f"ST_MinY({_quote(geometry)}), ST_MaxY({_quote(geometry)}) FROM {_quote(table.table)} "
+                    f"WHERE {_quote(table.fid_column)} > ? AND {_quote(geometry)} IS NOT NULL "
+                    f"AND NOT ST_IsEmpty({_quote(geometry)})",
+                    (first_fid,),
+                )
+            extent = connection.execute(
+                f"SELECT min(ST_MinX(g)), max(ST_MaxX(g)), min(ST_MinY(g)), max(ST_MaxY(g)) "
+                f"FROM (SELECT {_quote(geometry)} AS g FROM {_quote(table.table)} WHERE {_quote(table.fid_column)} > ?)",
+                (first_fid,),
+            ).fetchone()
+            if extent[0] is not None:
+                connection.execute(
+                    "UPDATE gpkg_contents SET min_x = min(coalesce(min_x, ?), ?), max_x = max(coalesce(max_x, ?), ?), "
+                    "min_y = min(coalesce(min_y, ?), ?), max_y = max(coalesce(max_y, ?), ?) WHERE table_name = ?",
+                    (extent[0], extent[0], extent[1], extent[1], extent[2], extent[2], extent[3], extent[3], table.table),
+                )
+        connection.execute(
+            "UPDATE gpkg_contents SET last_change = strftime('%Y-%m-%dT%H:%M:%fZ', 'now') WHERE table_name = ?",
+            (table.table,),
+        )
+        if connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'gpkg_ogr_contents'"
+        ).fetchone():
+            # GDAL recounts when the cached count is NULL.
+            connection.execute(
+                "UPDATE gpkg_ogr_contents SET feature_count = NULL WHERE lower(table_name) = lower(?)",
+                (table.table,),
+            )
+
+    def commit(self) -> List[int]:
+        """
+        Insert every pending row in one transaction and return the new fids.
+
+        Raises ``sqlite3.Error`` after rolling back when the write fails; the
+        pending rows are kept so the caller can decide how to recover. On the
+        main thread another writer holding the file makes this fail after
+        ``_MAIN_THREAD_LOCK_TIMEOUT`` seconds rather than block the UI.
+        """
+        if not self._rows:
+            return []
+        table = self._table
+        fid = _quote(table.fid_column)
+        connection = sqlite3.connect(table.path, timeout=_lock_timeout(), isolation_level=None)
+        try:
+            _register_spatial_functions(connection)
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                first_fid = connection.execute(
+                    f"SELECT coalesce(max({fid}), 0) FROM {_quote(table.table)}"
+                ).fetchone()[0]
+                for columns, rows in self._insert_groups():
+                    column_list = ", ".join(_quote(column) for column in columns)
+                    placeholders = ", ".join("?" for _column in columns)
+                    if columns:
+                        statement = f"INSERT INTO {_quote(table.table)} ({column_list}) VALUES ({placeholders})"
+                        connection.executemany(statement, rows)
+                    else:
+                        for _row in rows:
+                            connection.execute(f"INSERT INTO {_quote(table.table)} DEFAULT VALUES")
+                feature_ids = [row[0] for row in connection.execute(
+                    f"SELECT {fid} FROM {_quote(table.table)} WHERE {fid} > ? ORDER BY {fid}", (first_fid,)
+                )]
+                self._refresh_metadata(connection, first_fid)
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        finally:
+            connection.close()
+        _diag.debug("Committed %d row(s) to %s in one transaction", len(feature_ids), table.table)
+        self._rows = []
+        return feature_ids
+
+
+def reload_layer(layer: Any) -> None:
+    """Make ``layer`` re-read its data source after a direct commit."""
+    try:
+        layer.dataProvider().reloadData()
+        layer.updateExtents()
+        layer.triggerRepaint()
+    except Exception as e:
+        _diag.warning("Error reloading layer after direct commit: %s", e)
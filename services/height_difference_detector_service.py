@@ -36,12 +36,36 @@ from qgis.core import QgsProject, QgsGeometry, QgsPointXY, QgsDistanceArea, QgsS
 try:
     from ..core.interfaces import ISettingsManager, ILayerService
     from core.interfaces import ITranslationService
-    from ..core.data_structures import WarningData
+    from ..core.data_structures import WarningData, HeightDifferenceIssue
+    from ..core.feature_requests import iter_features
+    from ..core.relation_graph import get_relation_graph
+    from ..core.cancellation import CancellationToken, cancellation_scope
     from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.diagnostics import get_diagnostics
+    from ..core.detector_kernels import (
+        MIN_PROCESS_ROWS,
+        height_difference_kernel,
+        remove_snapshot,
+        run_kernel,
+        write_point_snapshot,
+    )
 except ImportError:
     from core.interfaces import ISettingsManager, ILayerService
-    from core.data_structures import WarningData
+    from core.data_structures import WarningData, HeightDifferenceIssue
+    from core.feature_requests import iter_features
+    from core.relation_graph import get_relation_graph
+    from core.cancellation import CancellationToken, cancellation_scope
     from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import get_diagnostics
+    from core.detector_kernels import (
+        MIN_PROCESS_ROWS,
+        height_difference_kernel,
+        remove_snapshot,
+        run_kernel,
+        write_point_snapshot,
+    )
+
+_diag = get_diagnostics("detectors.height_difference")
 
 
 class HeightDifferenceDetectorService:
@@ -52,6 +76,9 @@ class HeightDifferenceDetectorService:
     but have significant height differences, which could indicate measurement errors
     or data quality issues.
     """
+
+    # Fields read by _get_feature_identifier, in lookup order.
+    _IDENTIFIER_FIELD_NAMES = ("id", "identifier", "name", "number", "point_id", "station_id")
     
     def __init__(self, settings_manager: ISettingsManager, 
                  layer_service: ILayerService):
@@ -69,13 +96,25 @@ class HeightDifferenceDetectorService:
         self._max_distance_meters = float(self._settings_manager.get_value('height_max_distance', 1.0))
         self._max_height_difference_meters = float(self._settings_manager.get_value('height_max_difference', 0.2))
     
-    def detect_height_difference_warnings(self) -> List[Union[str, WarningData]]:
+    def detect_height_difference_warnings(
+        self, cancellation_token: Optional[CancellationToken] = None
+    ) -> List[Union[str, WarningData]]:
         """
         Detect height difference warnings between close total station points.
         
+        Args:
+            cancellation_token: Optional token checked in the scan loops; once it is
+                cancelled the run raises ``DetectionCancelled`` instead of returning
+                partial results
+        
         Returns:
             List of warning messages or structured warning data about height difference issues
         """
+        with cancellation_scope(cancellation_token):
+            return self._detect_height_difference_warnings()
+
+    def _detect_height_difference_warnings(self) -> List[Union[str, WarningData]]:
+        """Run the detection; see :meth:`detect_height_difference_warnings`."""
         warnings = []
         
         # Check if height difference warnings are enabled
@@ -165,10 +204,13 @@ class HeightDifferenceDetectorService:
             else:
                 distance_calculator.setEllipsoid('WGS84')
 
+            identifier_field = self._find_relation_identifier_field(total_station_points_layer)
+
             # Collect features with valid geometry and Z
             features = []
             feature_geoms = []
-            for feature in total_station_points_layer.getFeatures():
+            requested_fields = (z_field_idx, identifier_field) + self._IDENTIFIER_FIELD_NAMES
+            for feature in iter_features(total_station_points_layer, requested_fields):
                 maybe_yield_to_ui()
                 if not feature.geometry() or feature.geometry().isEmpty():
                     continue
@@ -185,64 +227,13 @@ class HeightDifferenceDetectorService:
             if len(features) < 2:
                 return warnings
 
-            # Build spatial index
-            spatial_index = QgsSpatialIndex()
-            for f in features:
-                spatial_index.insertFeature(f['feature'])
-
-            checked_pairs = set()
-            height_difference_issues = []
-            for i, f1 in enumerate(features):
-                maybe_yield_to_ui()
-                geom1 = f1['geometry']
-                z1 = f1['z']
-                id1 = f1['feature'].id()
-                # Use bounding box grow for candidate search
-                bbox = geom1.boundingBox()
-                bbox.grow(self._max_distance_meters)
-                candidate_ids = spatial_index.intersects(bbox)
-                for cid in candidate_ids:
-                    if cid == id1:
-                        continue
-                    # Ensure each pair is only checked once
-                    pair = tuple(sorted((id1, cid)))
-                    if pair in checked_pairs:
-                        continue
-                    checked_pairs.add(pair)
-                    # Get candidate feature
-                    f2 = next((f for f in features if f['feature'].id() == cid), None)
-                    if not f2:
-                        continue
-                    geom2 = f2['geometry']
-                    z2 = f2['z']
-                    # Calculate distance
-                    point1 = geom1.asPoint()
-                    point2 = geom2.asPoint()
-                    point1_2d = QgsPointXY(point1.x(), point1.y())
-                    point2_2d = QgsPointXY(point2.x(), point2.y())
-                    try:
-                        distance = distance_calculator.measureLine(point1_2d, point2_2d)
-                    except Exception:
-                        dx = point2.x() - point1.x()
-                        dy = point2.y() - point1.y()
-                        distance = (dx * dx + dy * dy) ** 0.5
-                    if distance is None or distance != distance:
-                        continue
-                    if distance <= float(self._max_distance_meters):
-                        height_difference = abs(z1 - z2)
-                        if height_difference > self._max_height_difference_meters:
-                            feature1_identifier = self._get_feature_identifier(f1['feature'], "Total Station Point")
-                            feature2_identifier = self._get_feature_identifier(f2['feature'], "Total Station Point")
-                            height_difference_issues.append({
-                                'feature1': f1['feature'],
-                                'feature2': f2['feature'],
-                                'feature1_identifier': feature1_identifier,
-                                'feature2_identifier': feature2_identifier,
-                                'distance': distance,
-                                'height_difference': height_difference,
-                                'z1': z1,
-                                'z2': z2
-                            })
+            height_difference_issues = None
+            process_workers = self._process_worker_count()
+            if process_workers > 1 and layer_crs.isValid() and len(features) >= MIN_PROCESS_ROWS:
+                # Without an ellipsoid, measureLine is planar, which the kernel reproduces.
+                height_difference_issues = self._find_issues_in_processes(features, process_workers)
+            if height_difference_issues is None:
+                height_difference_issues = self._find_issues_with_spatial_index(features, distance_calculator)
             # Create warnings for height difference issues
             if height_difference_issues:
                 # Group by distance range for better organization
@@ -255,7 +246,6 @@ class HeightDifferenceDetectorService:
                 
                 for distance_range, issues in by_distance_range.items():
                     # Create filter expressions for the layer using dynamic identifier field
-                    identifier_field = self._find_relation_identifier_field(total_station_points_layer)
                     feature_identifiers = []
                     feature_ids = []
                     
@@ -317,7 +307,9 @@ class HeightDifferenceDetectorService:
                         recording_area_name=f"Height Difference {distance_range}",
                         layer_name=total_station_points_layer.name(),
                         filter_expression=filter_expression,
-                        height_difference_issues=issues
+                        height_difference_issues=[
+                            HeightDifferenceIssue.from_issue(issue, total_station_points_layer) for issue in issues
+                        ]
                     )
                     
                     warnings.append(warning_data)
@@ -328,6 +320,128 @@ class HeightDifferenceDetectorService:
         
         return warnings
     
+    def _find_issues_with_spatial_index(self, features: List[Dict[str, Any]],
+                                        distance_calculator: Any) -> List[Dict[str, Any]]:
+        """Pair close points using QgsSpatialIndex, each pair checked once."""
+        # Build spatial index
+        spatial_index = QgsSpatialIndex()
+        for f in features:
+            spatial_index.insertFeature(f['feature'])
+
+        checked_pairs = set()
+        height_difference_issues = []
+        for i, f1 in enumerate(features):
+            maybe_yield_to_ui()
+            geom1 = f1['geometry']
+            z1 = f1['z']
+            id1 = f1['feature'].id()
+            # Use bounding box grow for candidate search
+            bbox = geom1.boundingBox()
+            bbox.grow(self._max_distance_meters)
+            candidate_ids = spatial_index.intersects(bbox)
+            for cid in candidate_ids:
+                if cid == id1:
+                    continue
+                # Ensure each pair is only checked once
+                pair = tuple(sorted((id1, cid)))
+                if pair in checked_pairs:
+                    continue
+                checked_pairs.add(pair)
+                # Get candidate feature
+                f2 = next((f for f in features if f['feature'].id() == cid), None)
+                if not f2:
+                    continue
+                geom2 = f2['geometry']
+                z2 = f2['z']
+                # Calculate distance
+                point1 = geom1.asPoint()
+                point2 = geom2.asPoint()
+                point1_2d = QgsPointXY(point1.x(), point1.y())
+                point2_2d = QgsPointXY(point2.x(), point2.y())
+                try:
+                    distance = distance_calculator.measureLine(point1_2d, point2_2d)
+                except Exception:
+                    dx = point2.x() - point1.x()
+                    dy = point2.y() - point1.y()
+                    distance = (dx * dx + dy * dy) ** 0.5
+                if distance is None or distance != distance:
+                    continue
+                if distance <= float(self._max_distance_meters):
+                    height_difference = abs(z1 - z2)
+                    if height_difference > self._max_height_difference_meters:
+                        feature1_identifier = self._get_feature_identifier(f1['feature'], "Total Station Point")
+                        feature2_identifier = self._get_feature_identifier(f2['feature'], "Total Station Point")
+                        height_difference_issues.append({
+                            'feature1': f1['feature'],
+                            'feature2': f2['feature'],
+                            'feature1_identifier': feature1_identifier,
+                            'feature2_identifier': feature2_identifier,
+                            'distance': distance,
+                            'height_difference': height_difference,
+                            'z1': z1,
+                            'z2': z2
+                        })
+        return height_difference_issues
+
+    def _process_worker_count(self) -> int:
+        try:
+            return int(self._settings_manager.get_value('detector_process_workers', 0) or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _find_issues_in_processes(self, features: List[Dict[str, Any]],
+                                  workers: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Pair close points with :func:`height_difference_kernel` in worker processes.
+
+        Points are exported to a memory-mapped snapshot of ``(fid, x, y, z)`` rows and
+        the compact records returned by the workers are mapped back to features.
+        Returns None when a geometry is not a single point or the worker processes
+        fail (broken pool, missing interpreter, import error), so the caller falls
+        back to the spatial index scan.
+        """
+        rows = []
+        features_by_id = {}
+        for f in features:
+            try:
+                point = f['geometry'].asPoint()
+            except Exception:
+                return None
+            features_by_id[f['feature'].id()] = f
+            rows.append((f['feature'].id(), point.x(), point.y(), f['z']))
+
+        try:
+            snapshot_path = write_point_snapshot(rows)
+            try:
+                records = run_kernel(
+                    height_difference_kernel, snapshot_path, len(rows), workers,
+                    max_distance=float(self._max_distance_meters),
+                    max_height_difference=float(self._max_height_difference_meters),
+                )
+            finally:
+                remove_snapshot(snapshot_path)
+        except Exception as e:
+            _diag.warning("Height difference: worker processes failed, using the spatial index scan: %s", e)
+            return None
+        maybe_yield_to_ui(force=True)
+        _diag.debug("Height difference: %d issue(s) from %d process worker(s)", len(records), workers)
+
+        height_difference_issues = []
+        for fid1, fid2, distance, height_difference in records:
+            f1 = features_by_id[fid1]
+            f2 = features_by_id[fid2]
+            height_difference_issues.append({
+                'feature1': f1['feature'],
+                'feature2': f2['feature'],
+                'feature1_identifier': self._get_feature_identifier(f1['feature'], "Total Station Point"),
+                'feature2_identifier': self._get_feature_identifier(f2['feature'], "Total Station Point"),
+                'distance': distance,
+                'height_difference': height_difference,
+                'z1': f1['z'],
+                'z2': f2['z']
+            })
+        return height_difference_issues
+
     def _find_identifier_field(self, layer: Any) -> Optional[str]:
         """
         Find the identifier field for the layer using the same logic as the duplicate detector, but only if it exists in the layer.
@@ -441,8 +555,7 @@ class HeightDifferenceDetectorService:
                     return f"{feature_type} {id_value}"
             
             # Try common identifier fields
-            identifier_fields = ["identifier", "name", "number", "point_id", "station_id"]
-            for field_name in identifier_fields:
+            for field_name in self._IDENTIFIER_FIELD_NAMES[1:]:
                 field_idx = feature.fields().indexOf(field_name)
                 if field_idx >= 0:
                     field_value = feature.attribute(field_idx)
@@ -507,37 +620,37 @@ class HeightDifferenceDetectorService:
             definitive_points_layer_id = self._settings_manager.get_value('total_station_points_layer')
             definitive_objects_layer_id = self._settings_manager.get_value('objects_layer')
             if not definitive_points_layer_id or not definitive_objects_layer_id:
-                print("[DEBUG][HeightDiff] No definitive layer IDs in settings, using 'fid'")
+                _diag.debug("[HeightDiff] No definitive layer IDs in settings, using 'fid'")
                 return 'fid'
             definitive_points_layer = self._layer_service.get_layer_by_id(definitive_points_layer_id)
             definitive_objects_layer = self._layer_service.get_layer_by_id(definitive_objects_layer_id)
             if not definitive_points_layer or not definitive_objects_layer:
-                print("[DEBUG][HeightDiff] Could not get definitive layers, using 'fid'")
+                _diag.debug("[HeightDiff] Could not get definitive layers, using 'fid'")
                 return 'fid'
             # Find the relation between the definitive layers
             relation = self._get_relation_between_layers(definitive_points_layer, definitive_objects_layer)
             if not relation:
-                print("[DEBUG][HeightDiff] No relation found between definitive layers, using 'fid'")
+                _diag.debug("[HeightDiff] No relation found between definitive layers, using 'fid'")
                 return 'fid'
             field_pairs = relation.fieldPairs()
             if not field_pairs:
-                print("[DEBUG][HeightDiff] No field pairs in relation, using 'fid'")
+                _diag.debug("[HeightDiff] No field pairs in relation, using 'fid'")
                 return 'fid'
             # Determine referencing field (in points layer)
             if relation.referencingLayer() == definitive_points_layer:
                 referencing_field = list(field_pairs.keys())[0]
             else:
                 referencing_field = list(field_pairs.values())[0]
-            print(f"[DEBUG][HeightDiff] Referencing field in definitive points layer: {referencing_field}")
+            _diag.debug("[HeightDiff] Referencing field in definitive points layer: %s", referencing_field)
             # Find matching field in temp_points_layer (case-insensitive)
             for field in temp_points_layer.fields():
                 if field.name().lower() == referencing_field.lower():
-                    print(f"[DEBUG][HeightDiff] Found matching field in temp layer: {field.name()}")
+                    _diag.debug("[HeightDiff] Found matching field in temp layer: %s", field.name())
                     return field.name()
-            print("[DEBUG][HeightDiff] No matching field in temp layer, using 'fid'")
+            _diag.debug("[HeightDiff] No matching field in temp layer, using 'fid'")
             return 'fid'
         except Exception as e:
-            print(f"[DEBUG][HeightDiff] Exception in _find_relation_identifier_field: {e}")
+            _diag.debug("[HeightDiff] Exception in _find_relation_identifier_field: %s", e)
             import traceback; traceback.print_exc()
             return 'fid'
 
@@ -546,18 +659,9 @@ class HeightDifferenceDetectorService:
         Get the relation object between two layers, or None if not found.
         """
         try:
-            from qgis.core import QgsProject
-            project = QgsProject.instance()
-            relation_manager = project.relationManager()
-            for relation in relation_manager.relations().values():
-                referencing_layer = relation.referencingLayer()
-                referenced_layer = relation.referencedLayer()
-                if ((referencing_layer and referenced_layer) and
-                    ((referencing_layer.id() == layer1.id() and referenced_layer.id() == layer2.id()) or
-                     (referencing_layer.id() == layer2.id() and referenced_layer.id() == layer1.id()))):
-                    return relation
-            return None
+            relations = get_relation_graph().relations_between(layer1, layer2)
+            return relations[0] if relations else None
         except Exception as e:
-            print(f"[DEBUG][HeightDiff] Exception in _get_relation_between_layers: {e}")
+            _diag.debug("[HeightDiff] Exception in _get_relation_between_layers: %s", e)
             import traceback; traceback.print_exc()
             return None 
\ No newline at end of file
@@ -8,19 +8,31 @@ self-referencing defaults cannot overwrite source values.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 try:
-    from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.diagnostics import get_diagnostics
+    from ..core.ui_responsiveness import AdaptiveBatchSizer, maybe_yield_to_ui
+    from .geopackage_direct_commit import GeoPackageDirectWriter, geopackage_table_for_layer, reload_layer
+    from .sequence_defaults import SequenceDefaultEvaluator
 except ImportError:
-    from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import get_diagnostics
+    from core.ui_responsiveness import AdaptiveBatchSizer, maybe_yield_to_ui
+    from services.geopackage_direct_commit import GeoPackageDirectWriter, geopackage_table_for_layer, reload_layer
+    from services.sequence_defaults import SequenceDefaultEvaluator
 
+_diag = get_diagnostics("import_validation")
 
-# One feature per Qt timer tick so the progress bar can repaint between copies.
+# Features copied in the first Qt timer tick; later ticks are sized to the frame budget.
 DEFAULT_COPY_BATCH_SIZE = 1
 
-# Yield to Qt while loading source features from disk.
+# First bulk batch when target defaults do not depend on previously inserted rows.
+BULK_COPY_BATCH_SIZE = 100
+
+# Features loaded in the first tick; later ticks are sized to the frame budget.
 FEATURE_LOAD_YIELD_EVERY = 25
 
 IMPORT_LAYER_MAPPINGS: Dict[str, str] = {
@@ -34,6 +46,16 @@ TEMPORARY_IMPORT_LAYER_NAMES = tuple(IMPORT_LAYER_MAPPINGS.keys())
 
 _FID_FIELD_NAMES = frozenset({"fid", "id", "gid", "objectid", "featureid"})
 
+# Expression functions whose result depends on other features, so a default value
+# using them must see the features inserted before it (e.g. ``maximum("n") + 1``).
+_ORDER_DEPENDENT_FUNCTIONS = frozenset({
+    "aggregate", "relation_aggregate", "array_agg", "collect", "concatenate",
+    "concatenate_unique", "count", "count_distinct", "count_missing", "iqr",
+    "majority", "max_length", "maximum", "mean", "median", "min_length", "minimum",
+    "minority", "q1", "q3", "range", "stdev", "sum", "get_feature", "get_feature_by_id",
+})
+_FUNCTION_CALL_PATTERN = re.compile(r"\b([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+
 
 def _feature_id(feature: Any) -> Optional[int]:
     """
@@ -63,6 +85,14 @@ def _feature_id(feature: Any) -> Optional[int]:
     return None
 
 
+def _describe_source_feature(feature: Any, index: int) -> str:
+    """Name a source feature in error messages by its id, else by its position."""
+    feature_id = _feature_id(feature)
+    if feature_id is not None:
+        return f"feature id {feature_id}"
+    return f"feature {index + 1}"
+
+
 @dataclass
 class LayerFieldMapping:
     """Precomputed field mapping for a source/target layer pair."""
@@ -78,6 +108,8 @@ class CopyBatchResult:
     copied_count: int
     error_count: int
     added_feature_ids: List[int] = field(default_factory=list)
+    # Set when the source iterator of a streamed copy is used up
+    exhausted: bool = False
 
 
 @dataclass
@@ -89,15 +121,28 @@ class LayerCopyJob:
     source_layer: Any
     target_layer: Any
     field_mapping: LayerFieldMapping
+    # featureCount() estimate until the source has been read to the end
     feature_count: int
+    # Only filled by load_job_source_features; validation streams the source layer
     source_features: Optional[List[Any]] = None
     feature_index: int = 0
     copied_count: int = 0
     added_feature_ids: List[int] = field(default_factory=list)
+    # Copy in large batches; False when target defaults need sequential inserts
+    bulk_copy: bool = False
+    # Evaluator for maximum(...) + 1 defaults that makes bulk copies possible
+    sequence_defaults: Any = field(default=None, repr=False, compare=False)
     load_complete: bool = False
     load_iterator: Any = field(default=None, repr=False, compare=False)
+    load_sizer: AdaptiveBatchSizer = field(
+        default_factory=lambda: AdaptiveBatchSizer(initial=FEATURE_LOAD_YIELD_EVERY),
+        repr=False,
+        compare=False,
+    )
     expression_context: Any = field(default=None, repr=False, compare=False)
     target_signals_blocked: bool = False
+    # GeoPackageDirectWriter collecting the features when committing directly
+    direct_writer: Any = field(default=None, repr=False, compare=False)
 
 
 class ImportFeatureCopier:
@@ -109,10 +154,24 @@ class ImportFeatureCopier:
     ``addFeature`` one at a time so sequential aggregate defaults (e.g.
     ``maximum("sequence") + 1``) see entities already in the edit buffer.
     Work is still chunked so the Qt event loop can stay responsive.
+
+    When no target default depends on other features (see
+    :func:`defaults_require_sequential_copy`), ``bulk=True`` creates a whole batch
+    with ``QgsVectorLayerUtils.createFeatures`` and inserts it with one
+    ``addFeatures`` call.
+
+    ``batch_size`` and ``bulk_batch_size`` are the first batch sizes; each batch is
+    timed and the next one sized by an :class:`AdaptiveBatchSizer` so a batch fills
+    about one frame budget of main-thread work.
     """
 
-    def __init__(self, batch_size: int = DEFAULT_COPY_BATCH_SIZE) -> None:
-        self._batch_size = max(1, batch_size)
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_COPY_BATCH_SIZE,
+        bulk_batch_size: int = BULK_COPY_BATCH_SIZE,
+    ) -> None:
+        self._sizer = AdaptiveBatchSizer(initial=batch_size)
+        self._bulk_sizer = AdaptiveBatchSizer(initial=bulk_batch_size)
 
     @staticmethod
     def is_missing_attribute_value(value: Any) -> bool:
@@ -159,35 +218,22 @@ class ImportFeatureCopier:
         target_layer: Any,
         field_mapping: LayerFieldMapping,
         expression_context: Any = None,
+        sequence_defaults: Any = None,
     ) -> Optional[Any]:
         """
         Build a target-layer feature with default expressions applied.
 
         Imported attributes are re-applied after ``QgsVectorLayerUtils.createFeature``
-        so self-referencing defaults cannot replace valid source values.
+        so self-referencing defaults cannot replace valid source values. A
+        :class:`SequenceDefaultEvaluator` fills sequence fields before that.
         """
         try:
-            from qgis.core import QgsGeometry, QgsVectorLayerUtils
+            from qgis.core import QgsVectorLayerUtils
 
-            geometry = (
-                source_feature.geometry()
-                if source_feature.geometry() and not source_feature.geometry().isEmpty()
-                else QgsGeometry()
-            )
-
-            attribute_map: Dict[int, Any] = {}
-            for target_idx, source_idx in field_mapping.attribute_field_pairs:
-                source_value = source_feature[source_idx]
-                if self.is_missing_attribute_value(source_value):
-                    continue
-                attribute_map[target_idx] = source_value
-
-            context = expression_context
-            if context is None and hasattr(target_layer, "createExpressionContext"):
-                try:
-                    context = target_layer.createExpressionContext()
-                except Exception:
-                    context = None
+            geometry, attribute_map = self._source_geometry_and_attributes(source_feature, field_mapping)
+            context = self._expression_context(target_layer, expression_context)
+            if sequence_defaults is not None:
+                sequence_defaults.fill(attribute_map, context)
 
             new_feature = QgsVectorLayerUtils.createFeature(
                 target_layer,
@@ -204,6 +250,83 @@ class ImportFeatureCopier:
             print(f"Error creating feature with target structure: {exc}")
             return None
 
+    def create_features_with_target_structure(
+        self,
+        source_features: Sequence[Any],
+        target_layer: Any,
+        field_mapping: LayerFieldMapping,
+        expression_context: Any = None,
+        sequence_defaults: Any = None,
+    ) -> List[Optional[Any]]:
+        """
+        Build target-layer features for a whole batch in one ``createFeatures`` call.
+
+        Returns one entry per source feature (None when it could not be read).
+        Only valid when defaults do not depend on previously inserted features, or
+        when those defaults are sequences filled by ``sequence_defaults``.
+        """
+        from qgis.core import QgsVectorLayerUtils
+
+        context = self._expression_context(target_layer, expression_context)
+        features_data = []
+        attribute_maps: List[Optional[Dict[int, Any]]] = []
+        for source_feature in source_features:
+            try:
+                geometry, attribute_map = self._source_geometry_and_attributes(source_feature, field_mapping)
+            except Exception as exc:
+                print(f"Error reading source feature: {exc}")
+                attribute_maps.append(None)
+                continue
+            if sequence_defaults is not None:
+                sequence_defaults.fill(attribute_map, context)
+            features_data.append(QgsVectorLayerUtils.QgsFeatureData(geometry, attribute_map))
+            attribute_maps.append(attribute_map)
+
+        try:
+            created = iter(QgsVectorLayerUtils.createFeatures(target_layer, features_data, context))
+        except Exception:
+            if sequence_defaults is not None:
+                # Values were handed out for features that were never created.
+                sequence_defaults.invalidate()
+            raise
+        new_features: List[Optional[Any]] = []
+        for attribute_map in attribute_maps:
+            if attribute_map is None:
+                new_features.append(None)
+                continue
+            new_feature = next(created)
+            for field_index, source_value in attribute_map.items():
+                new_feature.setAttribute(field_index, source_value)
+            new_features.append(new_feature)
+        return new_features
+
+    def _source_geometry_and_attributes(
+        self, source_feature: Any, field_mapping: LayerFieldMapping
+    ) -> Tuple[Any, Dict[int, Any]]:
+        from qgis.core import QgsGeometry
+
+        geometry = (
+            source_feature.geometry()
+            if source_feature.geometry() and not source_feature.geometry().isEmpty()
+            else QgsGeometry()
+        )
+        attribute_map: Dict[int, Any] = {}
+        for target_idx, source_idx in field_mapping.attribute_field_pairs:
+            source_value = source_feature[source_idx]
+            if self.is_missing_attribute_value(source_value):
+                continue
+            attribute_map[target_idx] = source_value
+        return geometry, attribute_map
+
+    @staticmethod
+    def _expression_context(target_layer: Any, expression_context: Any) -> Any:
+        if expression_context is not None or not hasattr(target_layer, "createExpressionContext"):
+            return expression_context
+        try:
+            return target_layer.createExpressionContext()
+        except Exception:
+            return None
+
     def copy_features_batch(
         self,
         source_features: Sequence[Any],
@@ -211,34 +334,121 @@ class ImportFeatureCopier:
         start_index: int,
         field_mapping: LayerFieldMapping,
         expression_context: Any = None,
+        bulk: bool = False,
+        sequence_defaults: Any = None,
+        sink: Optional[Callable[[Any], bool]] = None,
     ) -> CopyBatchResult:
         """
-        Copy up to ``batch_size`` features starting at ``start_index``.
+        Copy one adaptively sized batch of features starting at ``start_index``.
 
         The target layer is put into edit mode when needed. Each batch yields to the
-        Qt event loop so the QGIS UI stays responsive during validation.
+        Qt event loop so the QGIS UI stays responsive during validation. With
+        ``bulk=True`` the batch is created with a single ``createFeatures`` call;
+        ``sequence_defaults`` (see :class:`SequenceDefaultEvaluator`) allows this for
+        layers with ``maximum(...) + 1`` defaults. With ``sink`` the created features
+        are handed to it (e.g. ``GeoPackageDirectWriter.add``) instead of the edit buffer.
         """
-        if not target_layer.isEditable():
+        sizer = self._bulk_sizer if bulk else self._sizer
+        started = sizer.clock()
+        end_index = min(start_index + sizer.size, len(source_features))
+        return self._copy_batch(
+            source_features[start_index:end_index], target_layer, start_index, field_mapping,
+            sizer, started, expression_context, bulk, sequence_defaults, sink,
+        )
+
+    def copy_features_from_iterator(
+        self,
+        feature_iterator: Iterator[Any],
+        target_layer: Any,
+        start_index: int,
+        field_mapping: LayerFieldMapping,
+        expression_context: Any = None,
+        bulk: bool = False,
+        sequence_defaults: Any = None,
+        sink: Optional[Callable[[Any], bool]] = None,
+    ) -> CopyBatchResult:
+        """
+        Like :meth:`copy_features_batch`, but pull the batch from ``feature_iterator``.
+
+        Only one batch of source features is held at a time. ``start_index`` is the
+        number of features already consumed; ``exhausted`` is set on the result once
+        the iterator is used up.
+        """
+        sizer = self._bulk_sizer if bulk else self._sizer
+        started = sizer.clock()
+        requested = sizer.size
+        batch = list(islice(feature_iterator, requested))
+        result = self._copy_batch(
+            batch, target_layer, start_index, field_mapping,
+            sizer, started, expression_context, bulk, sequence_defaults, sink,
+        )
+        result.exhausted = len(batch) < requested
+        return result
+
+    def _copy_batch(
+        self,
+        batch: Sequence[Any],
+        target_layer: Any,
+        start_index: int,
+        field_mapping: LayerFieldMapping,
+        sizer: AdaptiveBatchSizer,
+        started: float,
+        expression_context: Any,
+        bulk: bool,
+        sequence_defaults: Any,
+        sink: Optional[Callable[[Any], bool]],
+    ) -> CopyBatchResult:
+        if sink is None and not target_layer.isEditable():
             target_layer.startEditing()
 
-        end_index = min(start_index + self._batch_size, len(source_features))
         error_count = 0
         copied_count = 0
         added_feature_ids: List[int] = []
 
-        for index in range(start_index, end_index):
-            source_feature = source_features[index]
+        new_features: Optional[List[Optional[Any]]] = None
+        if bulk and batch:
             try:
-                new_feature = self.create_feature_with_target_structure(
-                    source_feature,
+                new_features = self.create_features_with_target_structure(
+                    batch,
                     target_layer,
                     field_mapping,
                     expression_context=expression_context,
+                    sequence_defaults=sequence_defaults,
                 )
+            except Exception as exc:
+                # Fall back to one createFeature call per feature for this batch.
+                print(f"Error creating feature batch, copying one by one: {exc}")
+
+        # Bulk batches going to the edit buffer are inserted with one addFeatures call.
+        insert_in_bulk = new_features is not None and sink is None
+        bulk_features: List[Any] = []
+        for offset, source_feature in enumerate(batch):
+            try:
+                if new_features is not None:
+                    new_feature = new_features[offset]
+                else:
+                    new_feature = self.create_feature_with_target_structure(
+                        source_feature,
+                        target_layer,
+                        field_mapping,
+                        expression_context=expression_context,
+                        sequence_defaults=sequence_defaults,
+                    )
                 if new_feature is None:
                     error_count += 1
                     continue
 
+                if sink is not None:
+                    if sink(new_feature):
+                        copied_count += 1
+                    else:
+                        error_count += 1
+                    continue
+
+                if insert_in_bulk:
+                    bulk_features.append(new_feature)
+                    continue
+
                 # Create and insert immediately so aggregate default expressions
                 # (e.g. maximum("sequence") + 1) see entities already in the buffer.
                 success = target_layer.addFeature(new_feature)
@@ -246,8 +456,8 @@ class ImportFeatureCopier:
                     error_count += 1
                     if hasattr(target_layer, "lastError"):
                         print(
-                            f"Failed to add feature {index + 1} to {target_layer.name()}: "
-                            f"{target_layer.lastError()}"
+                            f"Failed to add {_describe_source_feature(source_feature, start_index + offset)} "
+                            f"to {target_layer.name()}: {target_layer.lastError()}"
                         )
                     continue
 
@@ -257,17 +467,69 @@ class ImportFeatureCopier:
                     added_feature_ids.append(feature_id)
             except Exception as exc:
                 error_count += 1
-                print(f"Error processing feature {index + 1}: {exc}")
+                print(f"Error processing {_describe_source_feature(source_feature, start_index + offset)}: {exc}")
 
-            maybe_yield_to_ui(force=True)
+        if bulk_features:
+            added, ids = self._add_features_in_bulk(target_layer, bulk_features, start_index)
+            copied_count += added
+            error_count += len(bulk_features) - added
+            added_feature_ids.extend(ids)
+
+        sizer.record(len(batch), sizer.clock() - started)
+        maybe_yield_to_ui(force=True)
 
         return CopyBatchResult(
-            next_index=end_index,
+            next_index=start_index + len(batch),
             copied_count=copied_count,
             error_count=error_count,
             added_feature_ids=added_feature_ids,
         )
 
+    @staticmethod
+    def _add_features_in_bulk(target_layer: Any, features: List[Any], start_index: int) -> Tuple[int, List[int]]:
+        """
+        Insert a created batch with one ``addFeatures`` call.
+
+        Returns the number of added features and their ids. ``addFeatures`` does not
+        hand the edit-buffer ids back to Python, so they are collected from the edit
+        buffer's ``featureAdded`` signal, which also tells how many were added when
+        the call fails part way.
+        """
+        signal_ids: List[int] = []
+        edit_buffer = target_layer.editBuffer() if hasattr(target_layer, "editBuffer") else None
+        feature_added = getattr(edit_buffer, "featureAdded", None)
+        if feature_added is not None:
+            feature_added.connect(signal_ids.append)
+        try:
+            result = target_layer.addFeatures(features)
+        except Exception as exc:
+            result = False
+            print(f"Error adding feature batch at source index {start_index} to {target_layer.name()}: {exc}")
+        finally:
+            if feature_added is not None:
+                try:
+                    feature_added.disconnect(signal_ids.append)
+                except (TypeError, RuntimeError):
+                    pass
+
+        # Providers return (success, features); vector layers return success only.
+        if isinstance(result, tuple):
+            success, features = result[0], list(result[1])
+        else:
+            success = bool(result)
+        ids = [fid for fid in signal_ids if isinstance(fid, int) and fid != -1]
+        if success:
+            if not ids:
+                ids = [fid for fid in (_feature_id(feature) for feature in features) if fid is not None]
+            return len(features), ids
+
+        if hasattr(target_layer, "lastError"):
+            print(
+                f"Failed to add {len(features) - len(signal_ids)} of {len(features)} features "
+                f"at source index {start_index} to {target_layer.name()}: {target_layer.lastError()}"
+            )
+        return len(signal_ids), ids
+
     @staticmethod
     def select_copied_features(target_layer: Any, feature_ids: Sequence[int]) -> None:
         """Select newly copied features (including uncommitted edit-buffer FIDs)."""
@@ -304,13 +566,43 @@ class ImportFeatureCopier:
         return None
 
 
+def defaults_require_sequential_copy(target_layer: Any) -> bool:
+    """
+    Return True when a default value expression of ``target_layer`` depends on other features.
+
+    Such defaults (aggregates like ``maximum("sequence") + 1``, ``get_feature``)
+    must be evaluated after the previous feature was inserted, so the layer is
+    copied one feature at a time. Unreadable layers are treated as sequential.
+    """
+    try:
+        fields = target_layer.fields()
+        for field_index in range(fields.count()):
+            if default_is_order_dependent(target_layer.defaultValueDefinition(field_index).expression()):
+                return True
+    except Exception as exc:
+        print(f"Error reading default values: {exc}")
+        return True
+    return False
+
+
+def default_is_order_dependent(expression: str) -> bool:
+    """Return True when a default value expression calls an aggregate or feature lookup."""
+    if not expression:
+        return False
+    function_names = {name.lower() for name in _FUNCTION_CALL_PATTERN.findall(expression)}
+    return bool(function_names & _ORDER_DEPENDENT_FUNCTIONS)
+
+
 def load_job_source_features_chunk(
     job: LayerCopyJob,
-    chunk_size: int = FEATURE_LOAD_YIELD_EVERY,
+    chunk_size: Optional[int] = None,
 ) -> bool:
     """
     Load up to ``chunk_size`` temporary-layer features, then return control to Qt.
 
+    Without ``chunk_size`` the chunk is sized by ``job.load_sizer`` to fill the
+    frame budget.
+
     Returns:
         True when every feature for the job has been read from the source layer.
     """
@@ -323,8 +615,11 @@ def load_job_source_features_chunk(
     if job.load_iterator is None:
         job.load_iterator = iter(job.source_layer.getFeatures())
 
+    sizer = job.load_sizer
+    limit = sizer.size if chunk_size is None else chunk_size
+    started = sizer.clock()
     loaded_this_chunk = 0
-    while loaded_this_chunk < chunk_size:
+    while loaded_this_chunk < limit:
         try:
             job.source_features.append(next(job.load_iterator))
             loaded_this_chunk += 1
@@ -335,22 +630,54 @@ def load_job_source_features_chunk(
             maybe_yield_to_ui(force=True)
             return True
 
+    if chunk_size is None:
+        sizer.record(loaded_this_chunk, sizer.clock() - started)
     maybe_yield_to_ui(force=True)
     return False
 
 
 def load_job_source_features(job: LayerCopyJob) -> List[Any]:
     """
-    Load every temporary-layer feature (synchronous path for unit tests).
+    Load every temporary-layer feature into ``job.source_features``.
 
-    Production validation uses :func:`load_job_source_features_chunk` so the UI
-    can repaint between chunks.
+    Validation streams features with :func:`copy_next_job_batch` instead, so
+    only one batch is held in memory next to the temporary layer.
     """
     while not load_job_source_features_chunk(job, chunk_size=FEATURE_LOAD_YIELD_EVERY):
         pass
     return job.source_features or []
 
 
+def copy_next_job_batch(job: LayerCopyJob, copier: ImportFeatureCopier) -> CopyBatchResult:
+    """
+    Copy the next batch of ``job``, streamed from its temporary layer.
+
+    ``job.feature_count`` starts as the layer's ``featureCount()`` estimate and is
+    corrected to the number of features read once the iterator is used up, at
+    which point ``job.load_complete`` is set.
+    """
+    if job.load_iterator is None:
+        job.load_iterator = iter(job.source_layer.getFeatures())
+    result = copier.copy_features_from_iterator(
+        job.load_iterator,
+        job.target_layer,
+        job.feature_index,
+        job.field_mapping,
+        expression_context=job.expression_context,
+        bulk=job.bulk_copy,
+        sequence_defaults=job.sequence_defaults,
+        sink=job.direct_writer.add if job.direct_writer is not None else None,
+    )
+    job.feature_index = result.next_index
+    job.copied_count += result.copied_count
+    job.added_feature_ids.extend(result.added_feature_ids)
+    if result.exhausted:
+        job.load_iterator = None
+        job.load_complete = True
+        job.feature_count = job.feature_index
+    return result
+
+
 def block_job_target_signals(job: LayerCopyJob) -> None:
     """Suppress per-feature layer signals that trigger map redraws during validation."""
     if job.target_signals_blocked:
@@ -389,6 +716,7 @@ def build_layer_copy_jobs(
     project_layers: Dict[str, Any],
     get_setting: Callable[[str, Any], Any],
     layer_mappings: Optional[Dict[str, str]] = None,
+    direct_commit: bool = False,
 ) -> List[LayerCopyJob]:
     """
     Resolve temporary import layers and their configured definitive targets.
@@ -397,6 +725,8 @@ def build_layer_copy_jobs(
         project_layers: ``QgsProject.instance().mapLayers()`` value.
         get_setting: Callable returning a definitive layer id for a settings key.
         layer_mappings: Optional override of ``IMPORT_LAYER_MAPPINGS``.
+        direct_commit: Write bulk-copyable jobs straight to their GeoPackage
+            table (see :func:`commit_job_direct_writes`) when the target allows it.
 
     Returns:
         Copy jobs for every temporary layer that exists and has a configured target.
@@ -429,6 +759,17 @@ def build_layer_copy_jobs(
             continue
 
         field_mapping = copier.build_field_mapping(source_layer.fields(), target_layer)
+        sequence_defaults = None
+        bulk_copy = not defaults_require_sequential_copy(target_layer)
+        if not bulk_copy:
+            sequence_defaults = SequenceDefaultEvaluator.for_layer(target_layer)
+            bulk_copy = sequence_defaults is not None
+
+        direct_writer = None
+        if direct_commit and bulk_copy:
+            table = geopackage_table_for_layer(target_layer)
+            if table is not None:
+                direct_writer = GeoPackageDirectWriter(table, target_layer.fields().names())
 
         jobs.append(
             LayerCopyJob(
@@ -438,12 +779,46 @@ def build_layer_copy_jobs(
                 target_layer=target_layer,
                 field_mapping=field_mapping,
                 feature_count=feature_count,
+                bulk_copy=bulk_copy,
+                sequence_defaults=sequence_defaults,
+                direct_writer=direct_writer,
             )
         )
 
     return jobs
 
 
+def commit_job_direct_writes(job: LayerCopyJob) -> bool:
+    """
+    Write the features collected by ``job.direct_writer`` in one transaction.
+
+    On success the target layer is reloaded and ``job.added_feature_ids`` holds the
+    committed fids. On failure nothing is written and the job is reset so it is
+    copied again through the edit buffer; returns False in that case.
+    """
+    writer = job.direct_writer
+    if writer is None:
+        return True
+    try:
+        job.added_feature_ids = writer.commit()
+    except Exception as e:
+        _diag.warning(
+            "Error committing %s directly, using the edit buffer: %s", job.temp_layer_name, e, exc_info=True
+        )
+        writer.clear()
+        job.direct_writer = None
+        job.feature_index = 0
+        job.copied_count = 0
+        job.added_feature_ids = []
+        job.load_iterator = None
+        job.load_complete = False
+        if job.sequence_defaults is not None:
+            job.sequence_defaults.invalidate()
+        return False
+    reload_layer(job.target_layer)
+    return True
+
+
 def remove_pending_import_layers(
     project: Any,
     layer_service: Optional[Any] = None,
@@ -22,8 +22,10 @@ Usage:
     empty_layer = layer_service.create_empty_layer_copy(source_layer_id, "Empty Layer")
 """
 
+from contextlib import ExitStack, contextmanager
 from typing import List, Optional, Dict, Any, Tuple
 import os
+import sqlite3
 import tempfile
 import unicodedata
 import uuid
@@ -51,14 +53,44 @@ from qgis.PyQt.QtCore import QVariant
 
 try:
     from ..core.interfaces import ILayerService
+    from ..core.relation_graph import get_relation_graph
     from .import_validation_service import IMPORT_LAYER_MAPPINGS
+    from ..core.diagnostics import DEBUG, get_diagnostics
+    from ..core.performance import record_cache_access
+    from ..core.feature_requests import field_in_expression, iter_features
 except ImportError:
     from core.interfaces import ILayerService
+    from core.relation_graph import get_relation_graph
     from services.import_validation_service import IMPORT_LAYER_MAPPINGS
+    from core.diagnostics import DEBUG, get_diagnostics
+    from core.performance import record_cache_access
+    from core.feature_requests import field_in_expression, iter_features
+
+_diag = get_diagnostics("layers")
 
 IMPORT_RELATION_ID_PREFIX = "archeosync_import_"
 
 
+def _relation_key(value: Any) -> Optional[str]:
+    """Normalize a relation key value so parent and child values compare equal."""
+    if value is None:
+        return None
+    try:
+        if hasattr(value, "isNull") and value.isNull():
+            return None
+    except Exception:
+        pass
+    if str(value) == 'NULL':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _quote_sql_identifier(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
 class QGISLayerService(ILayerService):
     """
     QGIS-specific implementation of layer operations.
@@ -71,15 +103,23 @@ class QGISLayerService(ILayerService):
         """Initialize the layer service."""
         self._recording_area_relation_cache: Dict[Tuple[str, str], Any] = {}
         self._layer_fields_cache: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+        # Unfiltered copies of filtered child layers, keyed by layer id: (source, layer or None)
+        self._unfiltered_layer_cache: Dict[str, Tuple[str, Optional[QgsVectorLayer]]] = {}
 
     def clear_caches(self) -> None:
         """Clear in-memory layer metadata caches after import layers are removed."""
         self._layer_fields_cache.clear()
         self._recording_area_relation_cache.clear()
+        self.release_unfiltered_layers()
+
+    def release_unfiltered_layers(self) -> None:
+        """Drop the cached unfiltered layer copies (see :meth:`_get_unfiltered_layer`)."""
+        self._unfiltered_layer_cache.clear()
 
     def invalidate_layer_cache(self, layer_id: str) -> None:
         """Drop cached metadata for one layer id (e.g. before removing it)."""
         self._layer_fields_cache.pop(layer_id, None)
+        self._unfiltered_layer_cache.pop(layer_id, None)
         stale_relation_keys = [
             key for key in self._recording_area_relation_cache if key[0] == layer_id
         ]
@@ -447,7 +487,9 @@ class QGISLayerService(ILayerService):
             List of field information dictionaries or None if layer not found
         """
         if layer_id in self._layer_fields_cache:
+            record_cache_access("layer_fields", True)
             return self._layer_fields_cache[layer_id]
+        record_cache_access("layer_fields", False)
 
         layer = self.get_layer_by_id(layer_id)
         if layer is None:
@@ -483,7 +525,9 @@ class QGISLayerService(ILayerService):
         """Return the QgsRelation linking a child layer to recording areas, with caching."""
         cache_key = (child_layer_id, recording_areas_layer_id)
         if cache_key in self._recording_area_relation_cache:
+            record_cache_access("recording_area_relations", True)
             return self._recording_area_relation_cache[cache_key]
+        record_cache_access("recording_area_relations", False)
 
         relation = None
         project = QgsProject.instance()
@@ -505,21 +549,95 @@ class QGISLayerService(ILayerService):
         recording_area_feature,
         objects_layer: QgsVectorLayer,
     ) -> List[Any]:
-        """Return related features while temporarily ignoring QGIS layer display filters."""
-        original_subset = (objects_layer.subsetString() or "").strip()
+        """Return related features while ignoring QGIS layer display filters."""
+        with self._reading_without_layer_filters(objects_layer) as source_layer:
+            if source_layer is objects_layer:
+                return list(relation.getRelatedFeatures(recording_area_feature))
+            return list(source_layer.getFeatures(relation.getRelatedFeaturesRequest(recording_area_feature)))
+
+    @contextmanager
+    def _reading_without_layer_filters(self, layer: QgsVectorLayer):
+        """
+        Yield a layer that reads the data of ``layer`` without its display filters.
+
+        Prefers the cached unfiltered copy from :meth:`_get_unfiltered_layer`, which
+        leaves the user's layer untouched. When no copy can be used (memory layers,
+        pending edits, copies that fail to open), the filters of ``layer`` itself
+        are cleared for the duration of the read and restored afterwards.
+        """
+        unfiltered_layer = self._get_unfiltered_layer(layer)
+        if unfiltered_layer is not None:
+            yield unfiltered_layer
+            return
+
+        original_subset = (layer.subsetString() or "").strip()
         original_filter_expression = ""
-        if hasattr(objects_layer, "filterExpression"):
-            original_filter_expression = (objects_layer.filterExpression() or "").strip()
+        if hasattr(layer, "filterExpression"):
+            original_filter_expression = (layer.filterExpression() or "").strip()
 
         try:
-            objects_layer.setSubsetString("")
-            if hasattr(objects_layer, "setFilterExpression"):
-                objects_layer.setFilterExpression("")
-            return list(relation.getRelatedFeatures(recording_area_feature))
+            layer.setSubsetString("")
+            if hasattr(layer, "setFilterExpression"):
+                layer.setFilterExpression("")
+            yield layer
         finally:
-            objects_layer.setSubsetString(original_subset)
-            if hasattr(objects_layer, "setFilterExpression"):
-                objects_layer.setFilterExpression(original_filter_expression)
+            layer.setSubsetString(original_subset)
+            if hasattr(layer, "setFilterExpression"):
+                layer.setFilterExpression(original_filter_expression)
+
+    def _get_unfiltered_layer(self, layer: QgsVectorLayer) -> Optional[QgsVectorLayer]:
+        """
+        Return a layer reading the same data as ``layer`` without its display filters.
+
+        Unfiltered layers are returned as-is. Filtered layers are opened a second time
+        from their provider source with the subset removed; the copy is cached per
+        layer id and source, so a preparation run opens it once and the user's layer
+        (filters, signals, canvas) is never touched. The run drops the copies with
+        :meth:`release_unfiltered_layers` when it is done with them. Returns None when no copy can
+        stand in for the layer: memory layers (features only exist in the provider),
+        layers with pending edits (the copy would not see them) and copies that
+        fail to open.
+        """
+        subset = (layer.subsetString() or "").strip()
+        filter_expression = ""
+        if hasattr(layer, "filterExpression"):
+            filter_expression = (layer.filterExpression() or "").strip()
+        if not subset and not filter_expression:
+            return layer
+        if layer.isEditable() and layer.isModified():
+            return None
+        provider = layer.providerType()
+        if provider == "memory":
+            return None
+
+        try:
+            from qgis.core import QgsProviderRegistry
+
+            registry = QgsProviderRegistry.instance()
+            parts = registry.decodeUri(provider, layer.source())
+            if parts:
+                parts.pop("subset", None)
+                parts.pop("sql", None)
+                source = registry.encodeUri(provider, parts)
+            else:
+                source = layer.source()
+        except Exception as e:
+            _diag.warning("Error building unfiltered layer source: %s", e)
+            return None
+
+        layer_id = layer.id()
+        cached = self._unfiltered_layer_cache.get(layer_id)
+        if cached is not None and cached[0] == source:
+            record_cache_access("unfiltered_layers", True)
+            return cached[1]
+        record_cache_access("unfiltered_layers", False)
+
+        unfiltered_layer = QgsVectorLayer(source, layer.name(), provider)
+        if not unfiltered_layer.isValid():
+            _diag.warning("Error opening unfiltered copy of layer %s", layer.name())
+            unfiltered_layer = None
+        self._unfiltered_layer_cache[layer_id] = (source, unfiltered_layer)
+        return unfiltered_layer
 
     def get_selected_features_count(self, layer_id: str) -> int:
         """
@@ -608,23 +726,10 @@ class QGISLayerService(ILayerService):
         if layer is None:
             return []
         
-        project = QgsProject.instance()
-        relation_manager = project.relationManager()
-        
-        # Get all relations where this layer is either the referencing or referenced layer
-        relations = []
-        
-        # Get relations where this layer is the referencing layer (child)
-        for relation in relation_manager.relations().values():
-            if relation.referencingLayerId() == layer_id:
-                relations.append(relation)
-        
-        # Get relations where this layer is the referenced layer (parent)
-        for relation in relation_manager.relations().values():
-            if relation.referencedLayerId() == layer_id:
-                relations.append(relation)
-        
-        return relations
+        # Relations where this layer is the referencing layer (child), then those
+        # where it is the referenced layer (parent), from the shared relation graph.
+        relation_manager = QgsProject.instance().relationManager()
+        return get_relation_graph(relation_manager).relations_for_layer_id(layer_id)
 
     def get_related_objects_info(
         self,
@@ -696,28 +801,41 @@ class QGISLayerService(ILayerService):
         if level_field:
             level_field_idx = objects_layer.fields().indexOf(level_field)
         
-        # Find highest number and last level
-        highest_number = None
+        number_values = []
         level_values = []
-        
         for obj_feature in related_objects:
-            # Get number value
             if number_field_idx >= 0:
-                number_value = obj_feature.attribute(number_field_idx)
-                if number_value is not None and str(number_value) != 'NULL':
-                    try:
-                        number_int = int(number_value)
-                        if highest_number is None or number_int > highest_number:
-                            highest_number = number_int
-                    except (ValueError, TypeError):
-                        pass
-            
-            # Get level value
+                number_values.append(obj_feature.attribute(number_field_idx))
             if level_field_idx >= 0:
-                level_value = obj_feature.attribute(level_field_idx)
-                if level_value is not None and str(level_value) != 'NULL':
-                    level_values.append(str(level_value))
-        
+                level_values.append(obj_feature.attribute(level_field_idx))
+
+        return self._summarize_related_values(number_values, level_values, objects_layer_id, level_field)
+
+    def _summarize_related_values(
+        self,
+        number_values: List[Any],
+        level_values: List[Any],
+        objects_layer_id: str,
+        level_field: Optional[str],
+    ) -> Dict[str, str]:
+        """Return the highest number and last level among related attribute values."""
+        # Find highest number
+        highest_number = None
+        for number_value in number_values:
+            if number_value is not None and str(number_value) != 'NULL':
+                try:
+                    number_int = int(number_value)
+                    if highest_number is None or number_int > highest_number:
+                        highest_number = number_int
+                except (ValueError, TypeError):
+                    pass
+
+        level_values = [
+            str(level_value)
+            for level_value in level_values
+            if level_value is not None and str(level_value) != 'NULL'
+        ]
+
         # Determine last level
         last_level = ''
         if level_values:
@@ -745,6 +863,228 @@ class QGISLayerService(ILayerService):
             'last_level': last_level
         }
 
+    def get_related_objects_info_batch(
+        self,
+        recording_area_features: List[Any],
+        objects_layer_id: str,
+        number_field: Optional[str],
+        level_field: Optional[str],
+        recording_areas_layer_id: Optional[str] = None,
+        unfiltered: bool = False,
+    ) -> Dict[Any, Dict[str, str]]:
+        """
+        Get related objects information for many recording areas in one grouped pass.
+
+        Equivalent to calling :meth:`get_related_objects_info` for every feature,
+        but the child layer is aggregated once per relation key: GeoPackage and
+        PostGIS layers without pending edits run a ``GROUP BY`` in the provider,
+        other layers are scanned once without geometry.
+
+        Args:
+            recording_area_features: The recording area features to get related objects for
+            objects_layer_id: The objects layer ID
+            number_field: The number field name (optional)
+            level_field: The level field name (optional)
+            recording_areas_layer_id: The recording areas layer ID (parent layer, required for relation lookup)
+            unfiltered: When True, ignore QGIS layer display filters while still scoping to each recording area
+
+        Returns:
+            Dictionary mapping each recording area feature id to its 'last_number' and 'last_level' values
+        """
+        features = list(recording_area_features)
+        results = {feature.id(): {'last_number': '', 'last_level': ''} for feature in features}
+        if not features or not objects_layer_id or not recording_areas_layer_id:
+            return results
+
+        objects_layer = self.get_layer_by_id(objects_layer_id)
+        if not objects_layer:
+            return results
+        relation = self._find_relation_to_recording_area(objects_layer_id, recording_areas_layer_id)
+        if relation is None:
+            return results
+
+        field_pairs = self._normalize_relation_field_pairs(relation.fieldPairs())
+        if len(field_pairs) != 1:
+            # Composite relation keys: fall back to per-area relation lookups
+            for feature in features:
+                results[feature.id()] = self.get_related_objects_info(
+                    feature,
+                    objects_layer_id,
+                    number_field,
+                    level_field,
+                    recording_areas_layer_id,
+                    unfiltered=unfiltered,
+                )
+            return results
+        referencing_field, referenced_field = field_pairs[0]
+
+        fields = objects_layer.fields()
+        key_idx = fields.indexOf(referencing_field)
+        number_idx = fields.indexOf(number_field) if number_field else -1
+        level_idx = fields.indexOf(level_field) if level_field else -1
+        if key_idx < 0:
+            return results
+
+        area_values = {feature.id(): feature.attribute(referenced_field) for feature in features}
+        area_keys = {feature_id: _relation_key(value) for feature_id, value in area_values.items()}
+        grouped = self._query_grouped_related_values(
+            objects_layer,
+            objects_layer_id,
+            referencing_field,
+            number_field if number_idx >= 0 else None,
+            level_field if level_idx >= 0 else None,
+            unfiltered,
+        )
+        if grouped is None:
+            grouped = self._scan_grouped_related_values(
+                objects_layer,
+                referencing_field,
+                key_idx,
+                number_idx,
+                level_idx,
+                [value for feature_id, value in area_values.items() if area_keys[feature_id] is not None],
+                unfiltered,
+            )
+
+        for feature_id, key in area_keys.items():
+            values = grouped.get(key) if key is not None else None
+            if values:
+                results[feature_id] = self._summarize_related_values(
+                    values[0], values[1], objects_layer_id, level_field
+                )
+        return results
+
+    def _query_grouped_related_values(
+        self,
+        objects_layer: QgsVectorLayer,
+        objects_layer_id: str,
+        key_field: str,
+        number_field: Optional[str],
+        level_field: Optional[str],
+        unfiltered: bool,
+    ) -> Optional[Dict[str, Tuple[List[Any], List[Any]]]]:
+        """
+        Aggregate the highest number and level per relation key with a provider ``GROUP BY``.
+
+        Returns None when the layer cannot be aggregated in its data source
+        (other providers, pending edits, or field types whose SQL ordering differs
+        from :meth:`_summarize_related_values`).
+        """
+        try:
+            provider = objects_layer.providerType()
+            if provider not in ('ogr', 'postgres'):
+                return None
+            if objects_layer.isEditable() and objects_layer.isModified():
+                return None
+
+            field_info = {f['name']: f for f in (self.get_layer_fields(objects_layer_id) or [])}
+            number_info = field_info.get(number_field) if number_field else None
+            level_info = field_info.get(level_field) if level_field else None
+            if number_field and not (number_info and number_info['is_integer']):
+                return None
+            if level_field and not (level_info and (level_info['is_integer'] or level_info['type_id'] == 10)):
+                return None
+
+            number_sql = f"MAX({_quote_sql_identifier(number_field)})" if number_field else "NULL"
+            level_sql = "NULL"
+            if level_field:
+                level_column = _quote_sql_identifier(level_field)
+                if level_info['is_integer']:
+                    level_sql = f"MAX({level_column})"
+                else:
+                    # Code point order, as Python sorts level strings
+                    collate = ' COLLATE "C"' if provider == 'postgres' else ''
+                    level_sql = f"MAX(CASE WHEN {level_column} <> 'NULL' THEN {level_column}{collate} END)"
+            subset = '' if unfiltered else (objects_layer.subsetString() or '').strip()
+            where_sql = f" WHERE ({subset})" if subset else ""
+            key_column = _quote_sql_identifier(key_field)
+
+            from qgis.core import QgsProviderRegistry
+
+            if provider == 'ogr':
+                parts = QgsProviderRegistry.instance().decodeUri('ogr', objects_layer.source())
+                path = parts.get('path') or ''
+                table = parts.get('layerName')
+                if not path.lower().endswith('.gpkg') or not os.path.isfile(path) or not table:
+                    return None
+                sql = (
+                    f"SELECT {key_column}, {number_sql}, {level_sql} FROM {_quote_sql_identifier(table)}"
+                    f"{where_sql} GROUP BY {key_column}"
+                )
+                connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=5.0)
+                try:
+                    rows = connection.execute(sql).fetchall()
+                finally:
+                    connection.close()
+            else:
+                from qgis.core import QgsDataSourceUri
+
+                uri = QgsDataSourceUri(objects_layer.source())
+                table = uri.table()
+                if not table or table.startswith('('):
+                    return None
+                table_sql = _quote_sql_identifier(table)
+                if uri.schema():
+                    table_sql = f"{_quote_sql_identifier(uri.schema())}.{table_sql}"
+                sql = (
+                    f"SELECT {key_column}, {number_sql}, {level_sql} FROM {table_sql}"
+                    f"{where_sql} GROUP BY {key_column}"
+                )
+                connection = QgsProviderRegistry.instance().providerMetadata('postgres').createConnection(
+                    objects_layer.source(), {}
+                )
+                rows = connection.executeSql(sql)
+        except Exception as e:
+            _diag.warning(
+                "Error grouping related objects of %s, falling back to a feature scan: %s",
+                objects_layer_id, e, exc_info=True,
+            )
+            return None
+
+        _diag.debug("Grouped related objects of %s in %s: %d key(s)", objects_layer_id, provider, len(rows))
+        grouped: Dict[str, Tuple[List[Any], List[Any]]] = {}
+        for key_value, highest_number, last_level in rows:
+            key = _relation_key(key_value)
+            if key is not None:
+                grouped[key] = ([highest_number], [last_level])
+        return grouped
+
+    def _scan_grouped_related_values(
+        self,
+        objects_layer: QgsVectorLayer,
+        key_field: str,
+        key_idx: int,
+        number_idx: int,
+        level_idx: int,
+        key_values: List[Any],
+        unfiltered: bool,
+    ) -> Dict[str, Tuple[List[Any], List[Any]]]:
+        """Collect number and level values per relation key in one scan of the child layer."""
+        grouped: Dict[str, Tuple[List[Any], List[Any]]] = {}
+        keys = {_relation_key(value) for value in key_values}
+        if not key_values:
+            return grouped
+        filter_expression = field_in_expression(key_field, key_values)
+        with ExitStack() as stack:
+            source_layer = objects_layer
+            if unfiltered:
+                source_layer = stack.enter_context(self._reading_without_layer_filters(objects_layer))
+            for obj_feature in iter_features(
+                source_layer,
+                [key_idx, number_idx, level_idx],
+                with_geometry=False,
+                filter_expression=filter_expression,
+            ):
+                key = _relation_key(obj_feature.attribute(key_idx))
+                if key not in keys:
+                    continue
+                number_values, level_values = grouped.setdefault(key, ([], []))
+                if number_idx >= 0:
+                    number_values.append(obj_feature.attribute(number_idx))
+                if level_idx >= 0:
+                    level_values.append(obj_feature.attribute(level_idx))
+        return grouped
+
     def calculate_next_level(self, last_level: str, level_field: str, objects_layer_id: str) -> str:
         """
         Calculate the next level value based on the last level and field type.
@@ -2256,7 +2596,7 @@ class QGISLayerService(ILayerService):
         try:
             # Method 1: Always use QGIS's built-in style copying (most reliable)
             # This ensures we get the current style, not just what's in the styleURI
-            print(f"[DEBUG] Using QGIS built-in style copying for {source_layer.name()}")
+            _diag.debug("Using QGIS built-in style copying for %s", source_layer.name())
             import tempfile
             
             # Create temporary file for style export
@@ -2268,12 +2608,12 @@ class QGISLayerService(ILayerService):
                 # This always exports the current style, regardless of styleURI
                 export_result = source_layer.saveNamedStyle(temp_qml_path)
                 if export_result[0]:
-                    print(f"[DEBUG] Successfully exported current style to temporary file: {temp_qml_path}")
+                    _diag.debug("Successfully exported current style to temporary file: %s", temp_qml_path)
                     
                     # Read the exported QML content
                     with open(temp_qml_path, 'r', encoding='utf-8') as f:
                         exported_qml_content = f.read()
-                    print(f"[DEBUG] Exported QML content length: {len(exported_qml_content)} characters")
+                    _diag.debug("Exported QML content length: %s characters", len(exported_qml_content))
                     
                     # Load from the temporary export file (memory layers have no writable .qml path)
                     load_result = target_layer.loadNamedStyle(temp_qml_path)
@@ -2531,7 +2871,7 @@ class QGISLayerService(ILayerService):
         import os
         import tempfile
         
-        print(f"[DEBUG] Copying virtual fields from {source_layer.name()} to {target_layer.name()}")
+        _diag.debug("Copying virtual fields from %s to %s", source_layer.name(), target_layer.name())
         
         # Use the proven approach: export source layer style and parse it
         try:
@@ -2543,23 +2883,26 @@ class QGISLayerService(ILayerService):
                 # Export source layer style to temporary QML file
                 export_result = source_layer.saveNamedStyle(temp_qml_path)
                 if export_result[0]:
-                    print(f"[DEBUG] Successfully exported style to temporary file: {temp_qml_path}")
+                    _diag.debug("Successfully exported style to temporary file: %s", temp_qml_path)
                     
                     # Parse QML file to find expression fields
                     virtual_fields = self._parse_qml_expression_fields(temp_qml_path)
-                    print(f"[DEBUG] Found {len(virtual_fields)} virtual fields in exported style")
+                    _diag.debug("Found %s virtual fields in exported style", len(virtual_fields))
                     
                     if virtual_fields:
                         # Add virtual fields to the target layer
                         provider = target_layer.dataProvider()
                         for field_name, expression in virtual_fields.items():
-                            print(f"[DEBUG] Adding virtual field: {field_name} = {expression}")
+                            _diag.debug("Adding virtual field: %s = %s", field_name, expression)
                             
                             # Check if the field already exists as a regular field
                             existing_field_idx = target_layer.fields().indexOf(field_name)
                             if existing_field_idx >= 0:
                                 # Remove the regular field and add it as virtual
-                                print(f"[DEBUG] Removing existing field '{field_name}' to replace with virtual field")
+                                _diag.debug(
+                                    "Removing existing field '%s' to replace with virtual field",
+                                    field_name,
+                                )
                                 provider.deleteAttributes([existing_field_idx])
                                 target_layer.updateFields()
                             
@@ -2568,14 +2911,14 @@ class QGISLayerService(ILayerService):
                             virtual_field.setAlias(field_name)
                             # Set the expression for the virtual field
                             target_layer.addExpressionField(expression, virtual_field)
-                            print(f"[DEBUG] Successfully added virtual field: {field_name}")
+                            _diag.debug("Successfully added virtual field: %s", field_name)
                         
                         target_layer.triggerRepaint()
-                        print(f"[DEBUG] Finished copying {len(virtual_fields)} virtual fields")
+                        _diag.debug("Finished copying %s virtual fields", len(virtual_fields))
                     else:
-                        print(f"[DEBUG] No virtual fields found in exported style")
+                        _diag.debug("No virtual fields found in exported style")
                 else:
-                    print(f"[DEBUG] Failed to export style from source layer: {export_result[1]}")
+                    _diag.warning("Failed to export style from source layer: %s", export_result[1])
                     
             finally:
                 # Clean up temporary file
@@ -2585,9 +2928,10 @@ class QGISLayerService(ILayerService):
                     pass
                     
         except Exception as e:
-            print(f"[DEBUG] Exception during virtual field copying: {e}")
+            _diag.warning("Exception during virtual field copying: %s", e)
             import traceback
-            print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug("Traceback: %s", traceback.format_exc())
 
     def resolve_extent_geometry_from_layer(self, layer_id: str) -> Optional[QgsGeometry]:
         """
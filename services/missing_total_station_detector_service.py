@@ -34,12 +34,24 @@ from qgis.core import QgsProject, QgsGeometry, QgsPointXY, QgsDistanceArea
 
 try:
     from ..core.interfaces import ISettingsManager, ILayerService
-    from ..core.data_structures import WarningData
+    from ..core.data_structures import WarningData, MissingTotalStationIssue
+    from ..core.feature_requests import iter_features
+    from ..core.recording_area_names import RecordingAreaNameIndex, find_relation_field_pair
+    from ..core.relation_graph import get_relation_graph
+    from ..core.cancellation import CancellationToken, cancellation_scope
     from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.diagnostics import DEBUG, get_diagnostics
 except ImportError:
     from core.interfaces import ISettingsManager, ILayerService
-    from core.data_structures import WarningData
+    from core.data_structures import WarningData, MissingTotalStationIssue
+    from core.feature_requests import iter_features
+    from core.recording_area_names import RecordingAreaNameIndex, find_relation_field_pair
+    from core.relation_graph import get_relation_graph
+    from core.cancellation import CancellationToken, cancellation_scope
     from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import DEBUG, get_diagnostics
+
+_diag = get_diagnostics("detectors.missing_total_station")
 
 
 class MissingTotalStationDetectorService:
@@ -62,95 +74,126 @@ class MissingTotalStationDetectorService:
         self._settings_manager = settings_manager
         self._layer_service = layer_service
     
-    def detect_missing_total_station_warnings(self) -> List[Union[str, WarningData]]:
+    def detect_missing_total_station_warnings(
+        self, cancellation_token: Optional[CancellationToken] = None
+    ) -> List[Union[str, WarningData]]:
         """
         Detect warnings for objects without matching total station points.
         
+        Args:
+            cancellation_token: Optional token checked in the scan loops; once it is
+                cancelled the run raises ``DetectionCancelled`` instead of returning
+                partial results
+        
         Returns:
             List of warning messages or structured warning data about missing total station points
         """
+        with cancellation_scope(cancellation_token):
+            return self._detect_missing_total_station_warnings()
+
+    def _detect_missing_total_station_warnings(self) -> List[Union[str, WarningData]]:
+        """Run the detection; see :meth:`detect_missing_total_station_warnings`."""
         # Check if missing total station warnings are enabled
         if not self._settings_manager.get_value('enable_missing_total_station_warnings', True):
-            print("[DEBUG] Missing total station warnings are disabled, skipping detection")
+            _diag.debug("Missing total station warnings are disabled, skipping detection")
             return []
         warnings = []
         
-        print(f"[DEBUG] Starting missing total station detection")
+        _diag.debug("Starting missing total station detection")
         
         try:
             # Get configuration from settings
             total_station_points_layer_id = self._settings_manager.get_value('total_station_points_layer')
             objects_layer_id = self._settings_manager.get_value('objects_layer')
             
-            print(f"[DEBUG] Layer IDs from settings:")
-            print(f"[DEBUG]   total_station_points_layer_id: {total_station_points_layer_id}")
-            print(f"[DEBUG]   objects_layer_id: {objects_layer_id}")
+            _diag.debug("Layer IDs from settings:")
+            _diag.debug("  total_station_points_layer_id: %s", total_station_points_layer_id)
+            _diag.debug("  objects_layer_id: %s", objects_layer_id)
             
             # Check if both layers are configured
             if not total_station_points_layer_id or not objects_layer_id:
-                print(f"[DEBUG] Missing layer configuration, returning empty warnings")
-                print(f"[DEBUG]   total_station_points_layer_id is None: {total_station_points_layer_id is None}")
-                print(f"[DEBUG]   objects_layer_id is None: {objects_layer_id is None}")
+                _diag.debug("Missing layer configuration, returning empty warnings")
+                _diag.debug(
+                    "  total_station_points_layer_id is None: %s",
+                    total_station_points_layer_id is None,
+                )
+                _diag.debug("  objects_layer_id is None: %s", objects_layer_id is None)
                 return warnings
             
             # Get layers - look for temporary layers first (like distance detector)
-            print(f"[DEBUG] Looking for layers...")
+            _diag.debug("Looking for layers...")
             
             # Try to find temporary total station points layer first
             temp_total_station_points_layer = self._layer_service.get_layer_by_name("Imported_CSV_Points")
             if temp_total_station_points_layer:
-                print(f"[DEBUG] Found temporary 'Imported_CSV_Points' layer: {temp_total_station_points_layer.name()}")
+                _diag.debug(
+                    "Found temporary 'Imported_CSV_Points' layer: %s",
+                    temp_total_station_points_layer.name(),
+                )
                 total_station_points_layer = temp_total_station_points_layer
             else:
-                print(f"[DEBUG] No temporary 'Imported_CSV_Points' layer found, using configured layer: {total_station_points_layer_id}")
+                _diag.debug(
+                    "No temporary 'Imported_CSV_Points' layer found, using configured layer: %s",
+                    total_station_points_layer_id,
+                )
                 total_station_points_layer = self._layer_service.get_layer_by_id(total_station_points_layer_id)
             
             # Try to find temporary objects layer first
             temp_objects_layer = self._layer_service.get_layer_by_name("New Objects")
             if temp_objects_layer:
-                print(f"[DEBUG] Found temporary 'New Objects' layer: {temp_objects_layer.name()}")
+                _diag.debug("Found temporary 'New Objects' layer: %s", temp_objects_layer.name())
                 objects_layer = temp_objects_layer
             else:
-                print(f"[DEBUG] No temporary 'New Objects' layer found, using configured layer: {objects_layer_id}")
+                _diag.debug(
+                    "No temporary 'New Objects' layer found, using configured layer: %s",
+                    objects_layer_id,
+                )
                 objects_layer = self._layer_service.get_layer_by_id(objects_layer_id)
             
             if not total_station_points_layer or not objects_layer:
-                print(f"[DEBUG] Could not get one or both layers")
-                print(f"[DEBUG]   total_station_points_layer is None: {total_station_points_layer is None}")
-                print(f"[DEBUG]   objects_layer is None: {objects_layer is None}")
+                _diag.debug("Could not get one or both layers")
+                _diag.debug("  total_station_points_layer is None: %s", total_station_points_layer is None)
+                _diag.debug("  objects_layer is None: %s", objects_layer is None)
                 return warnings
             
-            print(f"[DEBUG] Successfully got layers:")
-            print(f"[DEBUG]   Total station points layer: {total_station_points_layer.name()} (ID: {total_station_points_layer.id()})")
-            print(f"[DEBUG]   Objects layer: {objects_layer.name()} (ID: {objects_layer.id()})")
+            _diag.debug("Successfully got layers:")
+            _diag.debug(
+                "  Total station points layer: %s (ID: %s)",
+                total_station_points_layer.name(),
+                total_station_points_layer.id(),
+            )
+            _diag.debug("  Objects layer: %s (ID: %s)", objects_layer.name(), objects_layer.id())
             
             # Check if layers are related - handle temporary layers
-            print(f"[DEBUG] Checking for relations between layers...")
+            _diag.debug("Checking for relations between layers...")
             
             # For temporary layers, we need to get relation info from definitive layers
             if (total_station_points_layer.name() == "Imported_CSV_Points" or 
                 objects_layer.name() == "New Objects"):
-                print(f"[DEBUG] Working with temporary layers, getting relation from definitive layers")
+                _diag.debug("Working with temporary layers, getting relation from definitive layers")
                 
                 # Get definitive layers to find the relation
                 definitive_total_station_points_layer = self._layer_service.get_layer_by_id(total_station_points_layer_id)
                 definitive_objects_layer = self._layer_service.get_layer_by_id(objects_layer_id)
                 
                 if definitive_total_station_points_layer and definitive_objects_layer:
-                    print(f"[DEBUG] Got definitive layers:")
-                    print(f"[DEBUG]   Definitive total station points: {definitive_total_station_points_layer.name()}")
-                    print(f"[DEBUG]   Definitive objects: {definitive_objects_layer.name()}")
+                    _diag.debug("Got definitive layers:")
+                    _diag.debug(
+                        "  Definitive total station points: %s",
+                        definitive_total_station_points_layer.name(),
+                    )
+                    _diag.debug("  Definitive objects: %s", definitive_objects_layer.name())
                     
                     # Get relation from definitive layers
                     relation = self._get_relation_between_layers(definitive_total_station_points_layer, definitive_objects_layer)
                     
                     if relation:
-                        print(f"[DEBUG] Found relation from definitive layers: {relation.name()}")
+                        _diag.debug("Found relation from definitive layers: %s", relation.name())
                         
                         # Get field mappings from the relation
                         field_pairs = relation.fieldPairs()
                         if field_pairs:
-                            print(f"[DEBUG] Field pairs from definitive relation: {field_pairs}")
+                            _diag.debug("Field pairs from definitive relation: %s", field_pairs)
                             
                             # Determine which layer is referencing and which is referenced
                             if relation.referencingLayer() == definitive_total_station_points_layer:
@@ -164,10 +207,10 @@ class MissingTotalStationDetectorService:
                                 points_field = list(field_pairs.values())[0]  # Field in total station points layer
                                 points_layer_is_referencing = False
                             
-                            print(f"[DEBUG] Field mapping from definitive layers:")
-                            print(f"[DEBUG]   Points field: {points_field}")
-                            print(f"[DEBUG]   Objects field: {objects_field}")
-                            print(f"[DEBUG]   Points layer is referencing: {points_layer_is_referencing}")
+                            _diag.debug("Field mapping from definitive layers:")
+                            _diag.debug("  Points field: %s", points_field)
+                            _diag.debug("  Objects field: %s", objects_field)
+                            _diag.debug("  Points layer is referencing: %s", points_layer_is_referencing)
                             
                             # Get field indices in temporary layers - handle case sensitivity
                             points_field_idx = total_station_points_layer.fields().indexOf(points_field)
@@ -176,7 +219,11 @@ class MissingTotalStationDetectorService:
                                 for i, field in enumerate(total_station_points_layer.fields()):
                                     if field.name().lower() == points_field.lower():
                                         points_field_idx = i
-                                        print(f"[DEBUG] Found points field '{field.name()}' (case-insensitive match for '{points_field}')")
+                                        _diag.debug(
+                                            "Found points field '%s' (case-insensitive match for '%s')",
+                                            field.name(),
+                                            points_field,
+                                        )
                                         break
                             
                             objects_field_idx = objects_layer.fields().indexOf(objects_field)
@@ -185,43 +232,58 @@ class MissingTotalStationDetectorService:
                                 for i, field in enumerate(objects_layer.fields()):
                                     if field.name().lower() == objects_field.lower():
                                         objects_field_idx = i
-                                        print(f"[DEBUG] Found objects field '{field.name()}' (case-insensitive match for '{objects_field}')")
+                                        _diag.debug(
+                                            "Found objects field '%s' (case-insensitive match for '%s')",
+                                            field.name(),
+                                            objects_field,
+                                        )
                                         break
                             
                             if points_field_idx < 0 or objects_field_idx < 0:
-                                print(f"[DEBUG] Required fields not found in temporary layers")
-                                print(f"[DEBUG] Available fields in points layer: {[f.name() for f in total_station_points_layer.fields()]}")
-                                print(f"[DEBUG] Available fields in objects layer: {[f.name() for f in objects_layer.fields()]}")
+                                _diag.debug("Required fields not found in temporary layers")
+                                if _diag.isEnabledFor(DEBUG):
+                                    _diag.debug(
+                                        "Available fields in points layer: %s",
+                                        [f.name() for f in total_station_points_layer.fields()],
+                                    )
+                                    _diag.debug(
+                                        "Available fields in objects layer: %s",
+                                        [f.name() for f in objects_layer.fields()],
+                                    )
                                 return warnings
                             
-                            print(f"[DEBUG] Field indices in temporary layers - points: {points_field_idx}, objects: {objects_field_idx}")
+                            _diag.debug(
+                                "Field indices in temporary layers - points: %s, objects: %s",
+                                points_field_idx,
+                                objects_field_idx,
+                            )
                         else:
-                            print(f"[DEBUG] No field pairs found in definitive relation")
+                            _diag.debug("No field pairs found in definitive relation")
                             return warnings
                     else:
-                        print(f"[DEBUG] No relation found between definitive layers")
+                        _diag.debug("No relation found between definitive layers")
                         return warnings
                 else:
-                    print(f"[DEBUG] Could not get definitive layers for relation lookup")
+                    _diag.debug("Could not get definitive layers for relation lookup")
                     return warnings
             else:
                 # Working with definitive layers directly
                 relation = self._get_relation_between_layers(total_station_points_layer, objects_layer)
                 if not relation:
-                    print(f"[DEBUG] No relation found between total station points and objects layers")
-                    print(f"[DEBUG] Missing total station detection will not proceed without a relation")
+                    _diag.debug("No relation found between total station points and objects layers")
+                    _diag.debug("Missing total station detection will not proceed without a relation")
                     return warnings
                 
-                print(f"[DEBUG] Found relation: {relation.name()}")
-                print(f"[DEBUG] Relation ID: {relation.id()}")
+                _diag.debug("Found relation: %s", relation.name())
+                _diag.debug("Relation ID: %s", relation.id())
                 
                 # Get field mappings from the relation
                 field_pairs = relation.fieldPairs()
                 if not field_pairs:
-                    print(f"[DEBUG] No field pairs found in relation")
+                    _diag.debug("No field pairs found in relation")
                     return warnings
                 
-                print(f"[DEBUG] Field pairs: {field_pairs}")
+                _diag.debug("Field pairs: %s", field_pairs)
                 
                 # Determine which layer is referencing and which is referenced
                 if relation.referencingLayer() == total_station_points_layer:
@@ -235,10 +297,10 @@ class MissingTotalStationDetectorService:
                     points_field = list(field_pairs.values())[0]  # Field in total station points layer
                     points_layer_is_referencing = False
                 
-                print(f"[DEBUG] Field mapping:")
-                print(f"[DEBUG]   Points field: {points_field}")
-                print(f"[DEBUG]   Objects field: {objects_field}")
-                print(f"[DEBUG]   Points layer is referencing: {points_layer_is_referencing}")
+                _diag.debug("Field mapping:")
+                _diag.debug("  Points field: %s", points_field)
+                _diag.debug("  Objects field: %s", objects_field)
+                _diag.debug("  Points layer is referencing: %s", points_layer_is_referencing)
                 
                 # Get field indices - handle case sensitivity
                 points_field_idx = total_station_points_layer.fields().indexOf(points_field)
@@ -247,7 +309,11 @@ class MissingTotalStationDetectorService:
                     for i, field in enumerate(total_station_points_layer.fields()):
                         if field.name().lower() == points_field.lower():
                             points_field_idx = i
-                            print(f"[DEBUG] Found points field '{field.name()}' (case-insensitive match for '{points_field}')")
+                            _diag.debug(
+                                "Found points field '%s' (case-insensitive match for '%s')",
+                                field.name(),
+                                points_field,
+                            )
                             break
                 
                 objects_field_idx = objects_layer.fields().indexOf(objects_field)
@@ -256,16 +322,27 @@ class MissingTotalStationDetectorService:
                     for i, field in enumerate(objects_layer.fields()):
                         if field.name().lower() == objects_field.lower():
                             objects_field_idx = i
-                            print(f"[DEBUG] Found objects field '{field.name()}' (case-insensitive match for '{objects_field}')")
+                            _diag.debug(
+                                "Found objects field '%s' (case-insensitive match for '%s')",
+                                field.name(),
+                                objects_field,
+                            )
                             break
                 
                 if points_field_idx < 0 or objects_field_idx < 0:
-                    print(f"[DEBUG] Required fields not found in layers")
-                    print(f"[DEBUG] Available fields in points layer: {[f.name() for f in total_station_points_layer.fields()]}")
-                    print(f"[DEBUG] Available fields in objects layer: {[f.name() for f in objects_layer.fields()]}")
+                    _diag.debug("Required fields not found in layers")
+                    if _diag.isEnabledFor(DEBUG):
+                        _diag.debug(
+                            "Available fields in points layer: %s",
+                            [f.name() for f in total_station_points_layer.fields()],
+                        )
+                        _diag.debug(
+                            "Available fields in objects layer: %s",
+                            [f.name() for f in objects_layer.fields()],
+                        )
                     return warnings
                 
-                print(f"[DEBUG] Field indices - points: {points_field_idx}, objects: {objects_field_idx}")
+                _diag.debug("Field indices - points: %s, objects: %s", points_field_idx, objects_field_idx)
             
             # Detect missing total station issues
             missing_warnings = self._detect_missing_total_station_issues(
@@ -281,52 +358,26 @@ class MissingTotalStationDetectorService:
             import traceback
             traceback.print_exc()
         
-        print(f"[DEBUG] Missing total station detection completed, found {len(warnings)} warnings")
+        _diag.debug("Missing total station detection completed, found %s warnings", len(warnings))
         return warnings
     
-    def _get_recording_area_name(self, recording_areas_layer: Any, recording_area_id: Any) -> str:
+    def _get_recording_area_name(self,
+                                 recording_areas_layer: Any,
+                                 recording_area_id: Any,
+                                 recording_area_names: Optional[RecordingAreaNameIndex] = None) -> str:
         """
         Get the name of a recording area by its ID, using the display expression if available.
         Args:
             recording_areas_layer: The recording areas layer
-            recording_area_id: The ID of the recording area
+            recording_area_id: The ID (or referenced field value) of the recording area
+            recording_area_names: Optional per-run name index for the recording areas layer
         Returns:
             The name of the recording area, or the ID as string if name not found
         """
         try:
-            # Find the feature with the given ID or field value
-            target_feature = None
-            for feature in recording_areas_layer.getFeatures():
-                maybe_yield_to_ui()
-                if feature.id() == recording_area_id or any(feature[field_idx] == recording_area_id for field_idx in range(feature.fields().count())):
-                    target_feature = feature
-                    break
-            if target_feature:
-                # Try display expression first
-                display_expression = recording_areas_layer.displayExpression()
-                if display_expression:
-                    try:
-                        from qgis.core import QgsExpression, QgsExpressionContext, QgsExpressionContextUtils
-                        context = QgsExpressionContext()
-                        context.appendScope(QgsExpressionContextUtils.layerScope(recording_areas_layer))
-                        context.setFeature(target_feature)
-                        expression = QgsExpression(display_expression)
-                        result = expression.evaluate(context)
-                        if result and str(result) != 'NULL':
-                            return str(result)
-                    except Exception as e:
-                        print(f"Error evaluating display expression: {e}")
-                # Fallback: Try to get a name field if available
-                name_fields = ['name', 'title', 'label', 'description', 'comment']
-                for field_name in name_fields:
-                    field_idx = recording_areas_layer.fields().indexOf(field_name)
-                    if field_idx >= 0:
-                        name_value = target_feature[field_idx]
-                        if name_value and str(name_value) != 'NULL':
-                            return str(name_value)
-                # Final fallback to ID
-                return str(target_feature.id())
-            return str(recording_area_id)
+            if recording_area_names is None:
+                recording_area_names = RecordingAreaNameIndex(recording_areas_layer)
+            return recording_area_names.name(recording_area_id)
         except Exception as e:
             print(f"Error getting recording area name: {e}")
             return str(recording_area_id)
@@ -362,7 +413,7 @@ class MissingTotalStationDetectorService:
             def add_points_from_layer(layer, field_idx):
                 if not layer or field_idx is None:
                     return
-                for feature in layer.getFeatures():
+                for feature in iter_features(layer, (field_idx,), with_geometry=False):
                     maybe_yield_to_ui()
                     relation_value = feature.attribute(field_idx)
                     if relation_value is not None and relation_value != '':
@@ -388,7 +439,9 @@ class MissingTotalStationDetectorService:
             objects_by_relation = {}
             objects_count = 0
             objects_with_relation = 0
-            for feature in objects_layer.getFeatures():
+            # Objects keep all attributes (identifier and recording-area lookups use
+            # field names) but never need their geometry here.
+            for feature in iter_features(objects_layer, with_geometry=False):
                 maybe_yield_to_ui()
                 objects_count += 1
                 relation_value = feature.attribute(objects_field_idx)
@@ -398,8 +451,8 @@ class MissingTotalStationDetectorService:
                     if norm_value not in objects_by_relation:
                         objects_by_relation[norm_value] = []
                     objects_by_relation[norm_value].append(feature)
-            print(f"[DEBUG] Points relation values (union): {list(points_by_relation.keys())}")
-            print(f"[DEBUG] Objects relation values: {list(objects_by_relation.keys())}")
+            _diag.debug("Points relation values (union): %s", list(points_by_relation.keys()))
+            _diag.debug("Objects relation values: %s", list(objects_by_relation.keys()))
             # Find objects that don't have matching total station points
             missing_total_station_issues = []
             for norm_value, objects_features in objects_by_relation.items():
@@ -411,48 +464,57 @@ class MissingTotalStationDetectorService:
                             'object_identifier': object_identifier,
                             'relation_value': object_feature.attribute(objects_field_idx)
                         })
-            print(f"[DEBUG] Found {len(missing_total_station_issues)} missing total station issues")
+            _diag.debug("Found %s missing total station issues", len(missing_total_station_issues))
             # Create warnings for missing total station issues
             if missing_total_station_issues:
+                # Resolve the objects -> recording areas relation and the area names
+                # once per run instead of once per issue.
+                recording_area_field = None
+                recording_area_names = None
+                if recording_areas_layer:
+                    objects_layer_id = self._settings_manager.get_value('objects_layer')
+                    definitive_objects_layer = self._layer_service.get_layer_by_id(objects_layer_id) if objects_layer_id else None
+                    field_pair = find_relation_field_pair(definitive_objects_layer, recording_areas_layer)
+                    key_fields = None
+                    if field_pair:
+                        recording_area_field, referenced_field = field_pair
+                        key_fields = (referenced_field,)
+                        _diag.debug(
+                            "Using relation field '%s' for recording area lookup",
+                            recording_area_field,
+                        )
+                    recording_area_names = RecordingAreaNameIndex(recording_areas_layer, key_fields=key_fields)
+                fallback_field_indices = [
+                    idx for idx in (
+                        objects_layer.fields().indexOf(fallback_field)
+                        for fallback_field in ['recording_area', 'recording_area_id', 'area_id', 'area']
+                    ) if idx >= 0
+                ]
                 by_recording_area = {}
                 for issue in missing_total_station_issues:
                     object_feature = issue['object_feature']
                     # Get the recording area value from the object feature
                     recording_area_value = None
-                    if recording_areas_layer:
-                        # Try to get the relation field from the definitive object layer and recording area layer
-                        objects_layer_id = self._settings_manager.get_value('objects_layer')
-                        definitive_objects_layer = self._layer_service.get_layer_by_id(objects_layer_id) if objects_layer_id else None
-                        if definitive_objects_layer and recording_areas_layer:
-                            # Find the relation
-                            from qgis.core import QgsProject
-                            project = QgsProject.instance()
-                            relation_manager = project.relationManager()
-                            for relation in relation_manager.relations().values():
-                                if (relation.referencingLayer() == definitive_objects_layer and 
-                                    relation.referencedLayer() == recording_areas_layer):
-                                    field_pairs = relation.fieldPairs()
-                                    if field_pairs:
-                                        recording_area_field = list(field_pairs.keys())[0]
-                                        recording_area_value = object_feature.attribute(recording_area_field)
-                                        print(f"[DEBUG] Using relation field '{recording_area_field}' with value '{recording_area_value}' for object {object_feature.id()}")
-                                        break
+                    if recording_area_field:
+                        recording_area_value = object_feature.attribute(recording_area_field)
                     # Fallback: try common field names if not found
                     if recording_area_value is None:
-                        for fallback_field in ['recording_area', 'recording_area_id', 'area_id', 'area']:
-                            idx = object_feature.fields().indexOf(fallback_field)
-                            if idx >= 0:
-                                recording_area_value = object_feature.attribute(idx)
-                                if recording_area_value:
-                                    print(f"[DEBUG] Using fallback field '{fallback_field}' with value '{recording_area_value}' for object {object_feature.id()}")
-                                    break
+                        for idx in fallback_field_indices:
+                            recording_area_value = object_feature.attribute(idx)
+                            if recording_area_value:
+                                break
                     # Get the human-readable name
                     if recording_area_value is not None and recording_areas_layer:
-                        recording_area_name = self._get_recording_area_name(recording_areas_layer, recording_area_value)
-                        print(f"[DEBUG] Found recording area name '{recording_area_name}' for value '{recording_area_value}' (object {object_feature.id()})")
+                        recording_area_name = self._get_recording_area_name(
+                            recording_areas_layer, recording_area_value, recording_area_names
+                        )
                     else:
                         recording_area_name = str(recording_area_value) if recording_area_value is not None else "Unknown"
-                        print(f"[DEBUG] Could not find recording area name for value '{recording_area_value}' (object {object_feature.id()})")
+                        _diag.debug(
+                            "Could not find recording area name for value '%s' (object %s)",
+                            recording_area_value,
+                            object_feature.id(),
+                        )
                     if recording_area_name not in by_recording_area:
                         by_recording_area[recording_area_name] = []
                     by_recording_area[recording_area_name].append(issue)
@@ -469,9 +531,15 @@ class MissingTotalStationDetectorService:
                         filter_expression=objects_filter,
                         second_layer_name=total_station_points_layer.name(),
                         second_filter_expression=points_filter,
-                        missing_total_station_issues=issues
+                        missing_total_station_issues=[
+                            MissingTotalStationIssue.from_issue(issue, objects_layer) for issue in issues
+                        ]
+                    )
+                    _diag.debug(
+                        "Created warning for recording_area_name='%s' with %s issues.",
+                        recording_area_name,
+                        len(issues),
                     )
-                    print(f"[DEBUG] Created warning for recording_area_name='{recording_area_name}' with {len(issues)} issues.")
                     warnings.append(warning_data)
         except Exception as e:
             print(f"Error detecting missing total station issues: {str(e)}")
@@ -491,43 +559,21 @@ class MissingTotalStationDetectorService:
             The relation if found, None otherwise
         """
         try:
-            from qgis.core import QgsProject
-            
-            project = QgsProject.instance()
-            relation_manager = project.relationManager()
-            
-            print(f"[DEBUG] Looking for relation between layers:")
-            print(f"[DEBUG]   Layer 1: {layer1.name()} (ID: {layer1.id()})")
-            print(f"[DEBUG]   Layer 2: {layer2.name()} (ID: {layer2.id()})")
-            
-            # Find relations between the two layers
-            for relation_id, relation in relation_manager.relations().items():
-                print(f"[DEBUG] Checking relation: {relation.name()} (ID: {relation_id})")
-                
-                referencing_layer = relation.referencingLayer()
-                referenced_layer = relation.referencedLayer()
-                
-                print(f"[DEBUG]   Referencing layer: {referencing_layer.name() if referencing_layer else 'None'} (ID: {referencing_layer.id() if referencing_layer else 'None'})")
-                print(f"[DEBUG]   Referenced layer: {referenced_layer.name() if referenced_layer else 'None'} (ID: {referenced_layer.id() if referenced_layer else 'None'})")
-                
-                # Check if either layer matches either side of the relation
-                if ((referencing_layer and referenced_layer) and
-                    ((referencing_layer.id() == layer1.id() and referenced_layer.id() == layer2.id()) or
-                     (referencing_layer.id() == layer2.id() and referenced_layer.id() == layer1.id()))):
-                    print(f"[DEBUG] Found matching relation: {relation.name()}")
-                    return relation
+            _diag.debug("Looking for relation between layers:")
+            _diag.debug("  Layer 1: %s (ID: %s)", layer1.name(), layer1.id())
+            _diag.debug("  Layer 2: %s (ID: %s)", layer2.name(), layer2.id())
             
-            print(f"[DEBUG] No matching relation found")
-            print(f"[DEBUG] Available relations:")
-            for relation_id, relation in relation_manager.relations().items():
-                ref_layer = relation.referencingLayer()
-                refd_layer = relation.referencedLayer()
-                print(f"[DEBUG]   {relation.name()}: {ref_layer.name() if ref_layer else 'None'} -> {refd_layer.name() if refd_layer else 'None'}")
+            # Relations between the two layers, in either direction
+            relations = get_relation_graph().relations_between(layer1, layer2)
+            if relations:
+                _diag.debug("Found matching relation: %s", relations[0].name())
+                return relations[0]
             
+            _diag.debug("No matching relation found")
             return None
             
         except Exception as e:
-            print(f"[DEBUG] Error getting relation between layers: {str(e)}")
+            _diag.warning("Error getting relation between layers: %s", e)
             import traceback
             traceback.print_exc()
             return None
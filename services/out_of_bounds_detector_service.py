@@ -31,19 +31,37 @@ Usage:
     warnings = service.detect_out_of_bounds_features()
 """
 
-from collections import defaultdict, deque
+from collections import defaultdict
 from typing import List, Dict, Any, Optional, Union, Tuple, AbstractSet
 
 try:
-    from ..core.data_structures import WarningData
+    from ..core.data_structures import WarningData, OutOfBoundsIssue
+    from ..core.feature_requests import iter_features
+    from ..core.relation_graph import (
+        field_names_for_relation_hop,
+        get_relation_graph,
+        ordered_layers_along_path,
+    )
+    from ..core.cancellation import CancellationToken, cancellation_scope
     from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.diagnostics import DEBUG, get_diagnostics
 except ImportError:
-    from core.data_structures import WarningData
+    from core.data_structures import WarningData, OutOfBoundsIssue
+    from core.feature_requests import iter_features
+    from core.relation_graph import (
+        field_names_for_relation_hop,
+        get_relation_graph,
+        ordered_layers_along_path,
+    )
+    from core.cancellation import CancellationToken, cancellation_scope
     from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import DEBUG, get_diagnostics
 
-from qgis.core import QgsProject, QgsGeometry, QgsPointXY
+from qgis.core import QgsGeometry, QgsPointXY
 from qgis.PyQt.QtCore import QObject
 
+_diag = get_diagnostics("detectors.out_of_bounds")
+
 # Temporary import layers created during field-data import (see import_validation_service).
 _TEMP_IMPORT_LAYER_NAMES = {
     "objects_layer": "New Objects",
@@ -66,6 +84,47 @@ _STANDARD_RELATION_FIELD_NAMES = frozenset({
     'object_number', 'number', 'numero', 'ptid', 'pt_id', 'num', 'no',
 })
 
+# Identifier fields read from total-station points, in lookup order.
+_POINT_IDENTIFIER_FIELD_NAMES = ('identifier', 'PtID', 'ptid', 'point_id', 'station_id')
+
+# Number of features buffered per recording-area grouping pass while streaming a layer.
+_FEATURE_SCAN_CHUNK_SIZE = 2000
+
+
+class _PreparedRecordingArea:
+    """
+    Recording-area geometry with a prepared GEOS engine.
+
+    Preparing the polygon once lets ``contains`` and ``distance`` run in roughly
+    logarithmic time for every feature checked against the same recording area.
+    """
+
+    __slots__ = ('geometry', '_engine')
+
+    def __init__(self, geometry: Any):
+        self.geometry = geometry
+        self._engine = None
+        try:
+            engine = QgsGeometry.createGeometryEngine(geometry.constGet())
+            engine.prepareGeometry()
+            self._engine = engine
+        except Exception as e:
+            _diag.debug("Could not prepare recording area geometry, using raw geometry: %s", e)
+
+    def distance_outside(self, geometry: Any) -> Optional[float]:
+        """
+        Return ``None`` when ``geometry`` lies inside the recording area, otherwise
+        its distance to the recording area.
+        """
+        if self._engine is not None:
+            abstract_geometry = geometry.constGet()
+            if self._engine.contains(abstract_geometry):
+                return None
+            return self._engine.distance(abstract_geometry)
+        if self.geometry.contains(geometry):
+            return None
+        return self.geometry.distance(geometry)
+
 
 class OutOfBoundsDetectorService(QObject):
     """
@@ -91,72 +150,90 @@ class OutOfBoundsDetectorService(QObject):
         # Get configurable thresholds from settings with defaults
         self._max_distance_meters = float(self._settings_manager.get_value('bounds_max_distance', 0.2))
     
-    def detect_out_of_bounds_features(self) -> List[Union[str, WarningData]]:
+    def detect_out_of_bounds_features(
+        self, cancellation_token: Optional[CancellationToken] = None
+    ) -> List[Union[str, WarningData]]:
         """
         Detect features located outside their recording areas.
 
         Only pending temporary import layers are scanned (``New Objects``,
         ``New Features``, ``New Small Finds``, ``Imported_CSV_Points``).
         
+        Args:
+            cancellation_token: Optional token checked in the scan loops; once it is
+                cancelled the run raises ``DetectionCancelled`` instead of returning
+                partial results
+        
         Returns:
             List of warning messages or structured warning data about out-of-bounds features
         """
+        with cancellation_scope(cancellation_token):
+            return self._detect_out_of_bounds_features()
+
+    def _detect_out_of_bounds_features(self) -> List[Union[str, WarningData]]:
+        """Run the detection; see :meth:`detect_out_of_bounds_features`."""
         warnings = []
         
         # Check if out of bounds warnings are enabled
         if not self._settings_manager.get_value('enable_bounds_warnings', True):
-            print(f"[DEBUG] Out of bounds warnings are disabled, skipping detection")
+            _diag.debug("Out of bounds warnings are disabled, skipping detection")
             return warnings
         
-        print(f"[DEBUG] Starting out-of-bounds detection with max_distance_meters: {self._max_distance_meters}")
+        _diag.debug(
+            "Starting out-of-bounds detection with max_distance_meters: %s",
+            self._max_distance_meters,
+        )
         
         try:
             # Get configuration from settings
             recording_areas_layer_id = self._settings_manager.get_value('recording_areas_layer')
             
-            print(f"[DEBUG] Layer IDs from settings:")
-            print(f"[DEBUG]   recording_areas_layer_id: {recording_areas_layer_id}")
+            _diag.debug("Layer IDs from settings:")
+            _diag.debug("  recording_areas_layer_id: %s", recording_areas_layer_id)
             for setting_key, temp_name in _TEMP_IMPORT_LAYER_NAMES.items():
-                print(
-                    f"[DEBUG]   {setting_key}: "
-                    f"{self._settings_manager.get_value(setting_key)} "
-                    f"(temp: {temp_name})"
-                )
+                if _diag.isEnabledFor(DEBUG):
+                    _diag.debug(
+                        "  %s: %s (temp: %s)",
+                        setting_key,
+                        self._settings_manager.get_value(setting_key),
+                        temp_name,
+                    )
             
             if not recording_areas_layer_id:
-                print(f"[DEBUG] No recording areas layer configured, returning empty warnings")
+                _diag.debug("No recording areas layer configured, returning empty warnings")
                 return warnings
             
             # Get recording areas layer
             recording_areas_layer = self._layer_service.get_layer_by_id(recording_areas_layer_id)
             if not recording_areas_layer:
-                print(f"[DEBUG] Could not get recording areas layer with ID: {recording_areas_layer_id}")
+                _diag.debug("Could not get recording areas layer with ID: %s", recording_areas_layer_id)
                 return warnings
             
-            print(f"[DEBUG] Successfully got recording areas layer: {recording_areas_layer.name()}")
-            print(f"[DEBUG] Recording areas layer feature count: {recording_areas_layer.featureCount()}")
+            _diag.debug("Successfully got recording areas layer: %s", recording_areas_layer.name())
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug("Recording areas layer feature count: %s", recording_areas_layer.featureCount())
 
             if not self._has_temporary_import_layers():
-                print("[DEBUG] No temporary import layers present, skipping out-of-bounds detection")
+                _diag.debug("No temporary import layers present, skipping out-of-bounds detection")
                 return warnings
 
             layers_to_check = self._resolve_layers_to_check()
             for layer_id, layer_type in layers_to_check:
-                print(f"[DEBUG] Checking {layer_type} layer ({layer_id})...")
+                _diag.debug("Checking %s layer (%s)...", layer_type, layer_id)
                 layer_warnings = self._detect_out_of_bounds_in_layer(
                     layer_id, recording_areas_layer, layer_type
                 )
-                print(f"[DEBUG] {layer_type} layer returned {len(layer_warnings)} warnings")
+                _diag.debug("%s layer returned %s warnings", layer_type, len(layer_warnings))
                 warnings.extend(layer_warnings)
 
             topo_warnings = self._detect_topo_points_out_of_bounds(recording_areas_layer)
-            print(f"[DEBUG] Total station points layer returned {len(topo_warnings)} warnings")
+            _diag.debug("Total station points layer returned %s warnings", len(topo_warnings))
             warnings.extend(topo_warnings)
             
-            print(f"[DEBUG] Total out-of-bounds warnings found: {len(warnings)}")
+            _diag.debug("Total out-of-bounds warnings found: %s", len(warnings))
             
         except Exception as e:
-            print(f"[DEBUG] Error in out-of-bounds detection: {e}")
+            _diag.warning("Error in out-of-bounds detection: %s", e)
             import traceback
             traceback.print_exc()
         
@@ -197,37 +274,35 @@ class OutOfBoundsDetectorService(QObject):
         warnings: List[Union[str, WarningData]] = []
         temp_topo = self._layer_service.get_layer_by_name(_TEMP_TOPO_LAYER_NAME)
         if not temp_topo:
-            print("[DEBUG] No temporary topo import layer, skipping topo out-of-bounds check")
+            _diag.debug("No temporary topo import layer, skipping topo out-of-bounds check")
             return warnings
 
         definitive_topo_id = self._settings_manager.get_value('total_station_points_layer')
         if not definitive_topo_id:
-            print("[DEBUG] No total station points layer configured")
+            _diag.debug("No total station points layer configured")
             return warnings
 
         definitive_topo = self._layer_service.get_layer_by_id(definitive_topo_id)
         if not definitive_topo:
-            print(f"[DEBUG] Could not get definitive topo layer with ID: {definitive_topo_id}")
+            _diag.debug("Could not get definitive topo layer with ID: %s", definitive_topo_id)
             return warnings
 
         check_layer = temp_topo
-        print(
-            f"[DEBUG] Checking temporary topo points layer '{check_layer.name()}'"
-        )
+        _diag.debug("Checking temporary topo points layer '%s'", check_layer.name())
 
         direct_relation = self._get_relation_for_layer(definitive_topo, recording_areas_layer)
         if direct_relation:
-            print("[DEBUG] Topo out-of-bounds: using direct relation to recording areas")
+            _diag.debug("Topo out-of-bounds: using direct relation to recording areas")
             return self._detect_out_of_bounds_in_layer(
                 check_layer.id(), recording_areas_layer, "Total Station Points"
             )
 
         indirect_path = self._find_shortest_relation_path(definitive_topo, recording_areas_layer)
         if not indirect_path:
-            print("[DEBUG] No direct or indirect relation between topo points and recording areas")
+            _diag.debug("No direct or indirect relation between topo points and recording areas")
             return warnings
 
-        print(f"[DEBUG] Topo out-of-bounds: indirect path hops = {len(indirect_path)}")
+        _diag.debug("Topo out-of-bounds: indirect path hops = %s", len(indirect_path))
         return self._detect_out_of_bounds_via_relation_path(
             check_layer, definitive_topo, recording_areas_layer, indirect_path
         )
@@ -249,28 +324,33 @@ class OutOfBoundsDetectorService(QObject):
         """
         warnings = []
         
-        print(f"[DEBUG] _detect_out_of_bounds_in_layer called for layer_id: {layer_id}, layer_type: {layer_type}")
+        _diag.debug(
+            "_detect_out_of_bounds_in_layer called for layer_id: %s, layer_type: %s",
+            layer_id,
+            layer_type,
+        )
         
         try:
             # Get the layer
             layer = self._layer_service.get_layer_by_id(layer_id)
             if not layer:
-                print(f"[DEBUG] Could not get layer with ID: {layer_id}")
+                _diag.debug("Could not get layer with ID: %s", layer_id)
                 return warnings
             
-            print(f"[DEBUG] Successfully got layer: {layer.name()}")
-            print(f"[DEBUG] Layer feature count: {layer.featureCount()}")
-            print(f"[DEBUG] Layer fields: {[field.name() for field in layer.fields()]}")
+            _diag.debug("Successfully got layer: %s", layer.name())
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug("Layer feature count: %s", layer.featureCount())
+                _diag.debug("Layer fields: %s", [field.name() for field in layer.fields()])
             
             # Get the recording area field name from relations
             recording_area_field = self._get_recording_area_field(layer, recording_areas_layer)
-            print(f"[DEBUG] Recording area field found: {recording_area_field}")
+            _diag.debug("Recording area field found: %s", recording_area_field)
             
             if not recording_area_field:
-                print(f"[DEBUG] No recording area field found, trying fallback for temporary layers...")
+                _diag.debug("No recording area field found, trying fallback for temporary layers...")
                 # For temporary layers, try to get the field name from the corresponding definitive layer
                 if layer.name().startswith("New "):
-                    print(f"[DEBUG] Layer is temporary: {layer.name()}")
+                    _diag.debug("Layer is temporary: %s", layer.name())
                     # Map temporary layer names to definitive layer types
                     layer_type_mapping = {
                         "New Objects": "objects_layer",
@@ -279,26 +359,26 @@ class OutOfBoundsDetectorService(QObject):
                     }
 
                     definitive_layer_key = layer_type_mapping.get(layer.name())
-                    print(f"[DEBUG] Definitive layer key: {definitive_layer_key}")
+                    _diag.debug("Definitive layer key: %s", definitive_layer_key)
                     if definitive_layer_key:
                         definitive_layer_id = self._settings_manager.get_value(definitive_layer_key)
-                        print(f"[DEBUG] Definitive layer ID: {definitive_layer_id}")
+                        _diag.debug("Definitive layer ID: %s", definitive_layer_id)
                         if definitive_layer_id:
                             definitive_layer = self._layer_service.get_layer_by_id(definitive_layer_id)
                             if definitive_layer:
-                                print(f"[DEBUG] Got definitive layer: {definitive_layer.name()}")
+                                _diag.debug("Got definitive layer: %s", definitive_layer.name())
                                 # Get the field name from the definitive layer's relation
                                 definitive_field = self._get_recording_area_field(definitive_layer, recording_areas_layer)
-                                print(f"[DEBUG] Definitive field: {definitive_field}")
+                                _diag.debug("Definitive field: %s", definitive_field)
                                 if definitive_field:
                                     # Check if the temporary layer has the same field
                                     field_idx = layer.fields().indexOf(definitive_field)
-                                    print(f"[DEBUG] Field index in temporary layer: {field_idx}")
+                                    _diag.debug("Field index in temporary layer: %s", field_idx)
                                     if field_idx >= 0:
                                         recording_area_field = definitive_field
-                                        print(f"[DEBUG] Using definitive field: {recording_area_field}")
+                                        _diag.debug("Using definitive field: %s", recording_area_field)
                 elif layer.name() == _TEMP_TOPO_LAYER_NAME:
-                    print(f"[DEBUG] Layer is temporary topo import: {layer.name()}")
+                    _diag.debug("Layer is temporary topo import: %s", layer.name())
                     definitive_layer_id = self._settings_manager.get_value('total_station_points_layer')
                     if definitive_layer_id:
                         definitive_layer = self._layer_service.get_layer_by_id(definitive_layer_id)
@@ -312,23 +392,23 @@ class OutOfBoundsDetectorService(QObject):
                                 )
                                 if resolved_field:
                                     recording_area_field = resolved_field
-                                    print(
-                                        f"[DEBUG] Using topo field from definitive layer: "
-                                        f"{recording_area_field}"
+                                    _diag.debug(
+                                        "Using topo field from definitive layer: %s",
+                                        recording_area_field,
                                     )
                     
                     if not recording_area_field:
-                        print(f"[DEBUG] Still no recording area field found for temporary layer")
+                        _diag.debug("Still no recording area field found for temporary layer")
                         return warnings
                 else:
-                    print(f"[DEBUG] Layer is not temporary and no recording area field found")
+                    _diag.debug("Layer is not temporary and no recording area field found")
                     return warnings
             
             # Get field indices
             recording_area_field_idx = layer.fields().indexOf(recording_area_field)
-            print(f"[DEBUG] Recording area field index: {recording_area_field_idx}")
+            _diag.debug("Recording area field index: %s", recording_area_field_idx)
             if recording_area_field_idx < 0:
-                print(f"[DEBUG] Recording area field not found in layer")
+                _diag.debug("Recording area field not found in layer")
                 return warnings
             
             # Get the field mapping information for finding recording area features
@@ -354,7 +434,11 @@ class OutOfBoundsDetectorService(QObject):
                                 if field_pairs:
                                     # Get the referenced field name (the field in the recording areas layer)
                                     referenced_field_name = list(field_pairs.values())[0]
-                                    print(f"[DEBUG] Using field mapping from definitive layer: {recording_area_field} -> {referenced_field_name}")
+                                    _diag.debug(
+                                        "Using field mapping from definitive layer: %s -> %s",
+                                        recording_area_field,
+                                        referenced_field_name,
+                                    )
             elif layer.name() == _TEMP_TOPO_LAYER_NAME:
                 definitive_layer_id = self._settings_manager.get_value('total_station_points_layer')
                 if definitive_layer_id:
@@ -365,9 +449,10 @@ class OutOfBoundsDetectorService(QObject):
                             field_pairs = relation.fieldPairs()
                             if field_pairs:
                                 referenced_field_name = list(field_pairs.values())[0]
-                                print(
-                                    f"[DEBUG] Using topo field mapping from definitive layer: "
-                                    f"{recording_area_field} -> {referenced_field_name}"
+                                _diag.debug(
+                                    "Using topo field mapping from definitive layer: %s -> %s",
+                                    recording_area_field,
+                                    referenced_field_name,
                                 )
             else:
                 # For definitive layers, get the relation directly
@@ -377,118 +462,98 @@ class OutOfBoundsDetectorService(QObject):
                     if field_pairs:
                         # Get the referenced field name (the field in the recording areas layer)
                         referenced_field_name = list(field_pairs.values())[0]
-                        print(f"[DEBUG] Using field mapping from layer relation: {recording_area_field} -> {referenced_field_name}")
+                        _diag.debug(
+                            "Using field mapping from layer relation: %s -> %s",
+                            recording_area_field,
+                            referenced_field_name,
+                        )
             
             if not referenced_field_name:
-                print(f"[DEBUG] Could not determine field mapping for recording area lookup")
+                _diag.debug("Could not determine field mapping for recording area lookup")
                 return warnings
             
             # Get the referenced field index in the recording areas layer
             referenced_field_idx = recording_areas_layer.fields().indexOf(referenced_field_name)
             if referenced_field_idx < 0:
-                print(f"[DEBUG] Referenced field '{referenced_field_name}' not found in recording areas layer")
+                _diag.debug("Referenced field '%s' not found in recording areas layer", referenced_field_name)
                 return warnings
             
-            print(f"[DEBUG] Recording area lookup field: {referenced_field_name} (index: {referenced_field_idx})")
-
-            # Collect only features that have geometry and a recording area reference.
-            features_to_check = []
-            feature_count = 0
-            max_features = 10000  # Safety limit
+            _diag.debug(
+                "Recording area lookup field: %s (index: %s)",
+                referenced_field_name,
+                referenced_field_idx,
+            )
 
-            print(f"[DEBUG] Collecting features with geometry...")
-            for feature in layer.getFeatures():
+            # Stream features in chunks grouped by recording area value. Only
+            # out-of-bounds features are retained once their chunk is checked.
+            features_scanned = 0
+            features_with_recording_area = 0
+            features_outside = 0
+            out_of_bounds_features: List[Dict[str, Any]] = []
+            recording_areas_by_value: Optional[Dict[Any, Any]] = None
+            prepared_areas: Dict[Any, Optional[_PreparedRecordingArea]] = {}
+            area_names: Dict[Any, str] = {}
+            chunk: Dict[Any, List[Any]] = defaultdict(list)
+            chunk_size = 0
+
+            _diag.debug("Streaming features in chunks of %s...", _FEATURE_SCAN_CHUNK_SIZE)
+            scan_fields = (recording_area_field_idx,) + self._identifier_scan_fields(layer_type)
+            for feature in iter_features(layer, scan_fields):
                 maybe_yield_to_ui(every=50)
-                feature_count += 1
-                if feature_count > max_features:
-                    print(f"[DEBUG] Warning: Too many features ({feature_count}), limiting to {max_features}")
-                    break
+                features_scanned += 1
 
-                if not feature.geometry() or feature.geometry().isEmpty():
+                feature_geometry = feature.geometry()
+                if not feature_geometry or feature_geometry.isEmpty():
                     continue
 
                 recording_area_value = feature.attribute(recording_area_field_idx)
                 if not recording_area_value:
                     continue
 
-                features_to_check.append((feature, recording_area_value))
+                chunk[recording_area_value].append(feature)
+                chunk_size += 1
+                features_with_recording_area += 1
+                if chunk_size < _FEATURE_SCAN_CHUNK_SIZE:
+                    continue
 
-            print(f"[DEBUG] Features with geometry and recording area: {len(features_to_check)}")
-            if not features_to_check:
-                print(f"[DEBUG] No features to check, skipping recording-area lookup")
-                return warnings
+                if recording_areas_by_value is None:
+                    recording_areas_by_value = self._index_recording_areas_by_value(
+                        recording_areas_layer, referenced_field_idx
+                    )
+                features_outside += self._collect_out_of_bounds_in_chunk(
+                    chunk, recording_areas_by_value, prepared_areas, area_names,
+                    recording_areas_layer, layer_type, out_of_bounds_features,
+                )
+                chunk = defaultdict(list)
+                chunk_size = 0
 
-            needed_recording_area_values = {value for _, value in features_to_check}
-            recording_areas_by_value = {}
-            for ra_feature in recording_areas_layer.getFeatures():
-                maybe_yield_to_ui(every=50)
-                ra_value = ra_feature.attribute(referenced_field_idx)
-                if ra_value in needed_recording_area_values:
-                    recording_areas_by_value[ra_value] = ra_feature
-            
-            # Check each feature with geometry
-            out_of_bounds_features = []
-            processed_features = 0
-            features_with_recording_area = 0
-            features_outside = 0
-            
-            print(f"[DEBUG] Starting feature processing...")
-            
-            for feature, recording_area_value in features_to_check:
-                maybe_yield_to_ui(every=50)
-                features_with_recording_area += 1
-                
-                # Find the recording area feature that matches this value
-                recording_area_feature = recording_areas_by_value.get(recording_area_value)
-                recording_area_geometry = (
-                    recording_area_feature.geometry()
-                    if recording_area_feature is not None
-                    else None
+            if chunk:
+                if recording_areas_by_value is None:
+                    recording_areas_by_value = self._index_recording_areas_by_value(
+                        recording_areas_layer, referenced_field_idx
+                    )
+                features_outside += self._collect_out_of_bounds_in_chunk(
+                    chunk, recording_areas_by_value, prepared_areas, area_names,
+                    recording_areas_layer, layer_type, out_of_bounds_features,
                 )
-                
-                if not recording_area_geometry or recording_area_geometry.isEmpty():
-                    continue
-                
-                feature_geometry = feature.geometry()
-                
-                # Check if feature is outside the recording area
-                if not recording_area_geometry.contains(feature_geometry):
-                    features_outside += 1
-                    # Calculate the distance to the recording area boundary
-                    distance = recording_area_geometry.distance(feature_geometry)
-                    maybe_yield_to_ui(every=50)
-                    
-                    if distance > self._max_distance_meters:
-                        # Get recording area name
-                        recording_area_name = self._get_recording_area_name(recording_areas_layer, recording_area_feature)
-                        
-                        # Get feature identifier (number field if available)
-                        feature_identifier = self._get_feature_identifier(feature, layer_type)
-                        
-                        print(f"[DEBUG] Found out-of-bounds feature: {feature_identifier} in {recording_area_name}, distance: {distance:.3f}m")
-                        
-                        out_of_bounds_features.append({
-                            'feature': feature,
-                            'feature_id': feature.id(),  # Store the FID directly
-                            'recording_area_name': recording_area_name,
-                            'recording_area_id': recording_area_value,
-                            'distance': distance,
-                            'feature_identifier': feature_identifier
-                        })
-                
-                processed_features += 1
-                if processed_features % 100 == 0:
-                    print(f"[DEBUG] Processed {processed_features} features...")
-            
-            print(f"[DEBUG] Feature processing complete:")
-            print(f"[DEBUG]   Total features scanned: {feature_count}")
-            print(f"[DEBUG]   Features with geometry and recording area: {features_with_recording_area}")
-            print(f"[DEBUG]   Features outside recording areas: {features_outside}")
-            print(f"[DEBUG]   Out-of-bounds features (beyond {self._max_distance_meters}m): {len(out_of_bounds_features)}")
+
+            if not features_with_recording_area:
+                _diag.debug("No features to check, skipping recording-area lookup")
+                return warnings
+
+            _diag.debug("Feature processing complete:")
+            _diag.debug("  Total features scanned: %s", features_scanned)
+            _diag.debug("  Features with geometry and recording area: %s", features_with_recording_area)
+            _diag.debug("  Features outside recording areas: %s", features_outside)
+            _diag.debug(
+                "  Out-of-bounds features (beyond %sm): %s",
+                self._max_distance_meters,
+                len(out_of_bounds_features),
+            )
             
             # Create warnings for out-of-bounds features
             if out_of_bounds_features:
-                print(f"[DEBUG] Creating warnings for {len(out_of_bounds_features)} out-of-bounds features")
+                _diag.debug("Creating warnings for %s out-of-bounds features", len(out_of_bounds_features))
                 # Group by recording area for better organization
                 by_recording_area = {}
                 for item in out_of_bounds_features:
@@ -508,9 +573,14 @@ class OutOfBoundsDetectorService(QObject):
                     )
                     
                     # Debug: Verify filter expression
-                    print(f"[DEBUG] Creating filter expression: {filter_expression}")
+                    _diag.debug("Creating filter expression: %s", filter_expression)
                     
-                    print(f"[DEBUG] Creating warning for {recording_area_name}: {len(items)} features, max distance: {max_distance:.3f}m")
+                    _diag.debug(
+                        "Creating warning for %s: %s features, max distance: %.3fm",
+                        recording_area_name,
+                        len(items),
+                        max_distance,
+                    )
                     
                     # Create structured warning data
                     warning_data = WarningData(
@@ -520,21 +590,108 @@ class OutOfBoundsDetectorService(QObject):
                         recording_area_name=recording_area_name,
                         layer_name=layer.name(),  # Use actual layer name instead of layer type
                         filter_expression=filter_expression,
-                        out_of_bounds_features=items
+                        out_of_bounds_features=[OutOfBoundsIssue.from_issue(item, layer) for item in items]
                     )
                     warnings.append(warning_data)
-                    print(f"[DEBUG] Created warning: {warning_data.message}")
+                    _diag.debug("Created warning: %s", warning_data.message)
             else:
-                print(f"[DEBUG] No out-of-bounds features found")
+                _diag.debug("No out-of-bounds features found")
             
         except Exception as e:
-            print(f"[DEBUG] Error in _detect_out_of_bounds_in_layer: {e}")
+            _diag.warning("Error in _detect_out_of_bounds_in_layer: %s", e)
             import traceback
             traceback.print_exc()
         
-        print(f"[DEBUG] _detect_out_of_bounds_in_layer returning {len(warnings)} warnings")
+        _diag.debug("_detect_out_of_bounds_in_layer returning %s warnings", len(warnings))
         return warnings
 
+    def _index_recording_areas_by_value(
+        self,
+        recording_areas_layer: Any,
+        referenced_field_idx: int,
+    ) -> Dict[Any, Any]:
+        """Map recording-area key values to their features in one pass over the layer."""
+        recording_areas_by_value: Dict[Any, Any] = {}
+        for ra_feature in recording_areas_layer.getFeatures():
+            maybe_yield_to_ui(every=50)
+            recording_areas_by_value[ra_feature.attribute(referenced_field_idx)] = ra_feature
+        return recording_areas_by_value
+
+    def _prepared_recording_area(
+        self,
+        prepared_areas: Dict[Any, Optional["_PreparedRecordingArea"]],
+        key: Any,
+        recording_area_feature: Any,
+    ) -> Optional["_PreparedRecordingArea"]:
+        """Return the cached prepared geometry for a recording area, preparing it on first use."""
+        if key in prepared_areas:
+            return prepared_areas[key]
+        prepared = None
+        if recording_area_feature is not None:
+            geometry = recording_area_feature.geometry()
+            if geometry and not geometry.isEmpty():
+                prepared = _PreparedRecordingArea(geometry)
+        prepared_areas[key] = prepared
+        return prepared
+
+    def _collect_out_of_bounds_in_chunk(
+        self,
+        chunk: Dict[Any, List[Any]],
+        recording_areas_by_value: Dict[Any, Any],
+        prepared_areas: Dict[Any, Optional["_PreparedRecordingArea"]],
+        area_names: Dict[Any, str],
+        recording_areas_layer: Any,
+        layer_type: str,
+        out_of_bounds_features: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Check one chunk of features grouped by recording area value.
+
+        Appends out-of-bounds items to ``out_of_bounds_features`` and returns the
+        number of features found outside their recording area (at any distance).
+        """
+        features_outside = 0
+        for recording_area_value, features in chunk.items():
+            recording_area_feature = recording_areas_by_value.get(recording_area_value)
+            prepared = self._prepared_recording_area(
+                prepared_areas, recording_area_value, recording_area_feature
+            )
+            if prepared is None:
+                continue
+
+            for feature in features:
+                maybe_yield_to_ui(every=50)
+                distance = prepared.distance_outside(feature.geometry())
+                if distance is None:
+                    continue
+                features_outside += 1
+                if distance <= self._max_distance_meters:
+                    continue
+
+                if recording_area_value not in area_names:
+                    area_names[recording_area_value] = self._get_recording_area_name(
+                        recording_areas_layer, recording_area_feature
+                    )
+                recording_area_name = area_names[recording_area_value]
+                feature_identifier = self._get_feature_identifier(feature, layer_type)
+
+                _diag.debug(
+                    "Found out-of-bounds feature: %s in %s, distance: %.3fm",
+                    feature_identifier,
+                    recording_area_name,
+                    distance,
+                )
+
+                out_of_bounds_features.append({
+                    'feature': feature,
+                    'feature_id': feature.id(),  # Store the FID directly
+                    'recording_area_name': recording_area_name,
+                    'recording_area_id': recording_area_value,
+                    'distance': distance,
+                    'feature_identifier': feature_identifier
+                })
+        return features_outside
+
     def _detect_out_of_bounds_via_relation_path(
         self,
         check_layer: Any,
@@ -550,13 +707,13 @@ class OutOfBoundsDetectorService(QObject):
         """
         warnings: List[Union[str, WarningData]] = []
         try:
-            ordered_def = self._ordered_layers_along_path(definitive_start_layer, relations_path)
+            ordered_def = ordered_layers_along_path(definitive_start_layer, relations_path)
             if (
                 not ordered_def
                 or ordered_def[-1].id() != recording_areas_layer.id()
                 or ordered_def[0].id() != definitive_start_layer.id()
             ):
-                print("[DEBUG] Topo out-of-bounds (indirect): path does not connect layers")
+                _diag.debug("Topo out-of-bounds (indirect): path does not connect layers")
                 return warnings
 
             combo_layers: List[Any] = []
@@ -566,17 +723,18 @@ class OutOfBoundsDetectorService(QObject):
                 else:
                     combo_layers.append(def_layer)
 
-            print(
-                "[DEBUG] Topo out-of-bounds (indirect): resolved path layers = "
-                f"{[layer.name() if layer else '<none>' for layer in combo_layers]}"
-            )
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug(
+                    "Topo out-of-bounds (indirect): resolved path layers = %s",
+                    [layer.name() if layer else '<none>' for layer in combo_layers],
+                )
 
             hops: List[Tuple[int, int]] = []
             for hop_index, relation in enumerate(relations_path):
                 from_def = ordered_def[hop_index]
-                names = self._field_names_for_relation_hop(relation, from_def)
+                names = field_names_for_relation_hop(relation, from_def)
                 if not names:
-                    print("[DEBUG] Topo out-of-bounds (indirect): relation has no field pairs")
+                    _diag.debug("Topo out-of-bounds (indirect): relation has no field pairs")
                     return warnings
                 from_name, to_name = names
                 from_idx = self._field_index_on_path_layer(
@@ -587,17 +745,35 @@ class OutOfBoundsDetectorService(QObject):
                     definitive_start_layer,
                 )
                 if from_idx < 0 or to_idx < 0:
-                    print(
-                        "[DEBUG] Topo out-of-bounds (indirect): could not resolve hop fields "
-                        f"(hop {hop_index}: from_idx={from_idx}, to_idx={to_idx})"
+                    _diag.debug(
+                        "Topo out-of-bounds (indirect): could not resolve hop fields (hop %s: from_idx=%s, to_idx=%s)",
+                        hop_index,
+                        from_idx,
+                        to_idx,
                     )
                     return warnings
                 hops.append((from_idx, to_idx))
 
             features_by_layer: List[List[Any]] = []
-            for layer in combo_layers:
+            last_layer_index = len(combo_layers) - 1
+            for layer_index, layer in enumerate(combo_layers):
+                # Points need geometry and identifiers, recording areas keep every
+                # attribute for their display name; link layers only need hop fields.
+                if layer_index == 0:
+                    layer_features_iter = iter_features(
+                        layer,
+                        (hops[0][0],) + self._identifier_scan_fields("Total Station Points"),
+                    )
+                elif layer_index == last_layer_index:
+                    layer_features_iter = layer.getFeatures()
+                else:
+                    layer_features_iter = iter_features(
+                        layer,
+                        (hops[layer_index - 1][1], hops[layer_index][0]),
+                        with_geometry=False,
+                    )
                 layer_features = []
-                for feature in layer.getFeatures():
+                for feature in layer_features_iter:
                     maybe_yield_to_ui()
                     layer_features.append(feature)
                 features_by_layer.append(layer_features)
@@ -618,6 +794,7 @@ class OutOfBoundsDetectorService(QObject):
                 indices.append(dict(bucket))
 
             out_of_bounds_features: List[Dict[str, Any]] = []
+            prepared_areas: Dict[Any, Optional[_PreparedRecordingArea]] = {}
             for point_feature in features_by_layer[0]:
                 maybe_yield_to_ui()
                 if not point_feature.geometry() or point_feature.geometry().isEmpty():
@@ -644,13 +821,13 @@ class OutOfBoundsDetectorService(QObject):
                 point_geometry = point_feature.geometry()
                 for recording_area_feature in current_matches:
                     maybe_yield_to_ui()
-                    recording_area_geometry = recording_area_feature.geometry()
-                    if not recording_area_geometry or recording_area_geometry.isEmpty():
-                        continue
-                    if recording_area_geometry.contains(point_geometry):
+                    prepared = self._prepared_recording_area(
+                        prepared_areas, recording_area_feature.id(), recording_area_feature
+                    )
+                    if prepared is None:
                         continue
-                    distance = recording_area_geometry.distance(point_geometry)
-                    if distance <= self._max_distance_meters:
+                    distance = prepared.distance_outside(point_geometry)
+                    if distance is None or distance <= self._max_distance_meters:
                         continue
 
                     recording_area_name = self._get_recording_area_name(
@@ -692,17 +869,25 @@ class OutOfBoundsDetectorService(QObject):
                     recording_area_name=recording_area_name,
                     layer_name=check_layer.name(),
                     filter_expression=filter_expression,
-                    out_of_bounds_features=items,
+                    out_of_bounds_features=[OutOfBoundsIssue.from_issue(item, check_layer) for item in items],
                 )
                 warnings.append(warning_data)
 
         except Exception as e:
-            print(f"[DEBUG] Error in _detect_out_of_bounds_via_relation_path: {e}")
+            _diag.warning("Error in _detect_out_of_bounds_via_relation_path: %s", e)
             import traceback
             traceback.print_exc()
 
         return warnings
 
+    def _identifier_scan_fields(self, layer_type: str) -> Tuple[Any, ...]:
+        """Field names read by feature identifiers and filter expressions for a layer type."""
+        if layer_type == "Total Station Points":
+            return _POINT_IDENTIFIER_FIELD_NAMES + ('Label',)
+        if layer_type == "Objects":
+            return (self._settings_manager.get_value('objects_number_field'), 'Label')
+        return ('Label',)
+
     def _build_out_of_bounds_filter_expression(
         self,
         layer: Any,
@@ -711,7 +896,7 @@ class OutOfBoundsDetectorService(QObject):
     ) -> str:
         """Build a QGIS expression to select out-of-bounds features in the attribute table."""
         if layer_type == "Total Station Points":
-            for field_name in ('identifier', 'PtID', 'ptid', 'point_id', 'Label'):
+            for field_name in _POINT_IDENTIFIER_FIELD_NAMES[:4] + ('Label',):
                 field_idx = layer.fields().indexOf(field_name)
                 if field_idx < 0:
                     continue
@@ -736,22 +921,6 @@ class OutOfBoundsDetectorService(QObject):
         feature_ids = [str(item['feature_id']) for item in items]
         return f"$id IN ({','.join(feature_ids)})"
 
-    def _other_layer_in_relation(self, current_layer: Any, relation: Any) -> Optional[Any]:
-        """Return the layer at the other end of ``relation`` from ``current_layer``."""
-        try:
-            ref = relation.referencingLayer()
-            rec = relation.referencedLayer()
-            if not ref or not rec or not current_layer:
-                return None
-            current_id = current_layer.id()
-            if ref.id() == current_id:
-                return rec
-            if rec.id() == current_id:
-                return ref
-        except Exception:
-            return None
-        return None
-
     def _find_shortest_relation_path(
         self,
         layer_start: Any,
@@ -761,80 +930,16 @@ class OutOfBoundsDetectorService(QObject):
     ) -> Optional[List[Any]]:
         """Shortest chain of QgsRelation instances connecting two layers (BFS)."""
         try:
-            if not layer_start or not layer_end or layer_start.id() == layer_end.id():
-                return None
-            queue = deque([(layer_start, [])])
-            visited = {layer_start.id()}
-            project = QgsProject.instance()
-            relation_manager = project.relationManager()
-            while queue:
-                current, path = queue.popleft()
-                if len(path) >= max_hops:
-                    continue
-                for rel_key, relation in relation_manager.relations().items():
-                    if forbidden_relation_ids:
-                        relation_id = self._relation_project_id(relation, rel_key)
-                        if relation_id in forbidden_relation_ids:
-                            continue
-                    nxt = self._other_layer_in_relation(current, relation)
-                    if not nxt:
-                        continue
-                    new_path = path + [relation]
-                    if nxt.id() == layer_end.id():
-                        return new_path
-                    if nxt.id() in visited:
-                        continue
-                    visited.add(nxt.id())
-                    queue.append((nxt, new_path))
-            return None
+            return get_relation_graph().shortest_path(
+                layer_start,
+                layer_end,
+                max_hops=max_hops,
+                forbidden_relation_ids=forbidden_relation_ids,
+            )
         except Exception as e:
-            print(f"[DEBUG] Error finding indirect relation path: {e}")
+            _diag.warning("Error finding indirect relation path: %s", e)
             return None
 
-    def _relation_project_id(self, relation: Any, dict_key: Any = None) -> str:
-        """Stable string id for a QgsRelation."""
-        try:
-            relation_id = relation.id()
-            if relation_id:
-                return str(relation_id)
-        except Exception:
-            pass
-        if dict_key is not None:
-            return str(dict_key)
-        return str(id(relation))
-
-    def _ordered_layers_along_path(
-        self,
-        layer_start: Any,
-        relations_path: List[Any],
-    ) -> Optional[List[Any]]:
-        """Reconstruct [L0, L1, ..., Ln] where each relation connects consecutive layers."""
-        layers = [layer_start]
-        current = layer_start
-        for relation in relations_path:
-            nxt = self._other_layer_in_relation(current, relation)
-            if not nxt:
-                return None
-            layers.append(nxt)
-            current = nxt
-        return layers
-
-    def _field_names_for_relation_hop(self, relation: Any, from_layer: Any) -> Optional[Tuple[str, str]]:
-        """Return (field_on_from_layer, field_on_to_layer) for one relation hop."""
-        field_pairs = relation.fieldPairs()
-        if not field_pairs:
-            return None
-        ref_field, rec_field = next(iter(field_pairs.items()))
-        ref_layer = relation.referencingLayer()
-        rec_layer = relation.referencedLayer()
-        if not ref_layer or not rec_layer:
-            return None
-        if from_layer.id() == ref_layer.id():
-            return ref_field, rec_field
-        if from_layer.id() == rec_layer.id():
-            return rec_field, ref_field
-        return None
-
     def _field_index_on_path_layer(
         self,
         combo_layer: Any,
@@ -930,31 +1035,19 @@ class OutOfBoundsDetectorService(QObject):
             The relation object if found, None otherwise
         """
         try:
-            print(f"[DEBUG] _get_relation_for_layer called for layer: {layer.name()}")
+            _diag.debug("_get_relation_for_layer called for layer: %s", layer.name())
             
-            # Get the relation manager
-            project = QgsProject.instance()
-            relation_manager = project.relationManager()
-            
-            print(f"[DEBUG] Found {len(relation_manager.relations())} total relations in project")
-            
-            # Find relations where the layer is the referencing layer
+            # Relation where the layer is the referencing layer
             # and the recording areas layer is the referenced layer
-            for relation in relation_manager.relations().values():
-                print(f"[DEBUG] Checking relation: {relation.name()}")
-                print(f"[DEBUG]   Referencing layer: {relation.referencingLayer().name() if relation.referencingLayer() else 'None'}")
-                print(f"[DEBUG]   Referenced layer: {relation.referencedLayer().name() if relation.referencedLayer() else 'None'}")
-                
-                if (relation.referencingLayer() == layer and 
-                    relation.referencedLayer() == recording_areas_layer):
-                    print(f"[DEBUG] Found matching relation: {relation.name()}")
-                    return relation
-            
-            print(f"[DEBUG] No matching relation found")
-            return None
+            relation = get_relation_graph().relation_from(layer, recording_areas_layer)
+            if relation:
+                _diag.debug("Found matching relation: %s", relation.name())
+            else:
+                _diag.debug("No matching relation found")
+            return relation
             
         except Exception as e:
-            print(f"[DEBUG] Error getting relation for layer: {str(e)}")
+            _diag.warning("Error getting relation for layer: %s", e)
             return None
     
     def _get_recording_area_field(self, layer: Any, recording_areas_layer: Any) -> Optional[str]:
@@ -969,26 +1062,26 @@ class OutOfBoundsDetectorService(QObject):
             The field name that references the recording areas layer, or None if not found
         """
         try:
-            print(f"[DEBUG] _get_recording_area_field called for layer: {layer.name()}")
+            _diag.debug("_get_recording_area_field called for layer: %s", layer.name())
             
             relation = self._get_relation_for_layer(layer, recording_areas_layer)
             if relation:
                 field_pairs = relation.fieldPairs()
-                print(f"[DEBUG] Field pairs in relation: {field_pairs}")
+                _diag.debug("Field pairs in relation: %s", field_pairs)
                 if field_pairs:
                     # Return the first referencing field (should be the recording area field)
                     recording_area_field = list(field_pairs.keys())[0]
-                    print(f"[DEBUG] Found recording area field: {recording_area_field}")
+                    _diag.debug("Found recording area field: %s", recording_area_field)
                     return recording_area_field
                 else:
-                    print(f"[DEBUG] No field pairs found in relation")
+                    _diag.debug("No field pairs found in relation")
             else:
-                print(f"[DEBUG] No relation found")
+                _diag.debug("No relation found")
             
             return None
             
         except Exception as e:
-            print(f"[DEBUG] Error getting recording area field: {str(e)}")
+            _diag.warning("Error getting recording area field: %s", e)
             return None
     
     def _get_recording_area_name(self, recording_areas_layer: Any, recording_area_feature: Any) -> str:
@@ -1062,7 +1155,7 @@ class OutOfBoundsDetectorService(QObject):
                         if number:
                             return f"Object {number}"
             elif layer_type == "Total Station Points":
-                for field_name in ('identifier', 'PtID', 'ptid', 'point_id', 'station_id'):
+                for field_name in _POINT_IDENTIFIER_FIELD_NAMES:
                     field_idx = feature.fields().indexOf(field_name)
                     if field_idx >= 0:
                         value = feature.attribute(field_idx)
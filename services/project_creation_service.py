@@ -66,12 +66,16 @@ try:
         PROJECT_KIND_GLOBAL,
         write_project_metadata,
     )
+    from ..core.diagnostics import DEBUG, get_diagnostics
 except ImportError:
     from core.interfaces import ISettingsManager, ILayerService, IFileSystemService, IRasterProcessingService
     from services.field_project_metadata import (
         PROJECT_KIND_GLOBAL,
         write_project_metadata,
     )
+    from core.diagnostics import DEBUG, get_diagnostics
+
+_diag = get_diagnostics("project_creation")
 
 
 class QGISProjectCreationService(QObject):
@@ -265,10 +269,10 @@ class QGISProjectCreationService(QObject):
                         layer_info = self._layer_service.get_layer_info(layer_id)
                         if layer_info:
                             layer_name = layer_info['name']
-                            print(f"[DEBUG] Processing extra layer: {layer_name} (ID: {layer_id})")
+                            _diag.debug("Processing extra layer: %s (ID: %s)", layer_name, layer_id)
                             # Check if layer has relationship with recording areas
                             if self._has_relationship_with_recording_areas(layer_id, recording_areas_layer_id):
-                                print(f"[DEBUG] Layer {layer_name} has relationship - will filter")
+                                _diag.debug("Layer %s has relationship - will filter", layer_name)
                                 # Filter to only related features
                                 filter_expression = self._get_relationship_filter_expression(layer_id, recording_areas_layer_id, feature_data['id'])
                                 if filter_expression:
@@ -280,7 +284,10 @@ class QGISProjectCreationService(QObject):
                                         project=project
                                     )
                                 else:
-                                    print(f"[DEBUG] No filter expression found for {layer_name} - copying all features")
+                                    _diag.debug(
+                                        "No filter expression found for %s - copying all features",
+                                        layer_name,
+                                    )
                                     # Fallback to copying all features if no specific filter expression found
                                     success = self._create_layer_copy(
                                         source_layer_id=layer_id,
@@ -289,7 +296,7 @@ class QGISProjectCreationService(QObject):
                                         project=project
                                     )
                             else:
-                                print(f"[DEBUG] Layer {layer_name} has no relationship - copying all features")
+                                _diag.debug("Layer %s has no relationship - copying all features", layer_name)
                                 # Copy all features
                                 success = self._create_layer_copy(
                                     source_layer_id=layer_id,
@@ -683,7 +690,7 @@ class QGISProjectCreationService(QObject):
             if target_layer is not None and hasattr(target_layer, "id"):
                 source_to_target_layer_ids[source_layer_id] = target_layer.id()
         except Exception as e:
-            print(f"[DEBUG] Failed to register layer ID mapping for {created_layer_name}: {str(e)}")
+            _diag.warning("Failed to register layer ID mapping for %s: %s", created_layer_name, e)
 
     def _copy_project_relations_to_field_project(
         self,
@@ -731,9 +738,9 @@ class QGISProjectCreationService(QObject):
                             source_to_target_layer_ids[src_id] = matches[0].id()
                             fixed += 1
                 if fixed:
-                    print(f"[DEBUG] Fixed {fixed} layer-id mapping(s) by name")
+                    _diag.debug("Fixed %s layer-id mapping(s) by name", fixed)
             except Exception as e:
-                print(f"[DEBUG] Failed to fix layer-id mappings: {str(e)}")
+                _diag.warning("Failed to fix layer-id mappings: %s", e)
 
             def _resolve_target_layer_id(src_layer_id: str) -> Optional[str]:
                 """
@@ -774,12 +781,12 @@ class QGISProjectCreationService(QObject):
                         src_rel_name_dbg = rel.name() if hasattr(rel, "name") else ""
                         src_ref_layer_dbg = source_project.mapLayer(src_referenced_id)
                         src_ing_layer_dbg = source_project.mapLayer(src_referencing_id)
-                        print(
-                            "[DEBUG] Relation candidate:"
-                            f" id='{src_rel_id_dbg}'"
-                            f" name='{src_rel_name_dbg}'"
-                            f" referencing='{src_ing_layer_dbg.name() if src_ing_layer_dbg else src_referencing_id}'"
-                            f" referenced='{src_ref_layer_dbg.name() if src_ref_layer_dbg else src_referenced_id}'"
+                        _diag.debug(
+                            "Relation candidate: id='%s' name='%s' referencing='%s' referenced='%s'",
+                            src_rel_id_dbg,
+                            src_rel_name_dbg,
+                            src_ing_layer_dbg.name() if src_ing_layer_dbg else src_referencing_id,
+                            src_ref_layer_dbg.name() if src_ref_layer_dbg else src_referenced_id,
                         )
                     except Exception:
                         pass
@@ -847,11 +854,14 @@ class QGISProjectCreationService(QObject):
                             pass
 
                     if new_rel.referencingLayerId() != tgt_referencing_id or new_rel.referencedLayerId() != tgt_referenced_id:
-                        print(
-                            "[DEBUG] Could not bind relation to target layers:"
-                            f" got referencing='{new_rel.referencingLayerId()}', referenced='{new_rel.referencedLayerId()}'"
-                            f" expected referencing='{tgt_referencing_id}', referenced='{tgt_referenced_id}'"
-                        )
+                        if _diag.isEnabledFor(DEBUG):
+                            _diag.debug(
+                                "Could not bind relation to target layers: got referencing='%s', referenced='%s' expected referencing='%s', referenced='%s'",
+                                new_rel.referencingLayerId(),
+                                new_rel.referencedLayerId(),
+                                tgt_referencing_id,
+                                tgt_referenced_id,
+                            )
                         continue
 
                     # Extra defensive check: if either mapped ID is still missing in target project,
@@ -860,10 +870,18 @@ class QGISProjectCreationService(QObject):
                         mapped_ref_ing = tgt_referencing_id
                         mapped_ref_ed = tgt_referenced_id
                         if target_project.mapLayer(mapped_ref_ing) is None:
-                            print(f"[DEBUG] Skipping relation '{rel_name}': mapped referencing layer missing in target (id='{mapped_ref_ing}')")
+                            _diag.debug(
+                                "Skipping relation '%s': mapped referencing layer missing in target (id='%s')",
+                                rel_name,
+                                mapped_ref_ing,
+                            )
                             continue
                         if target_project.mapLayer(mapped_ref_ed) is None:
-                            print(f"[DEBUG] Skipping relation '{rel_name}': mapped referenced layer missing in target (id='{mapped_ref_ed}')")
+                            _diag.debug(
+                                "Skipping relation '%s': mapped referenced layer missing in target (id='%s')",
+                                rel_name,
+                                mapped_ref_ed,
+                            )
                             continue
                     except Exception:
                         pass
@@ -897,20 +915,26 @@ class QGISProjectCreationService(QObject):
 
                     if not field_pairs_list:
                         try:
-                            print(
-                                f"[DEBUG] Relation '{rel_name}' has empty/unsupported fieldPairs:"
-                                f" type={type(field_pairs_obj)}"
-                                f" repr={field_pairs_obj!r}"
+                            _diag.debug(
+                                "Relation '%s' has empty/unsupported fieldPairs: type=%s repr=%r",
+                                rel_name,
+                                type(field_pairs_obj),
+                                field_pairs_obj,
                             )
                         except Exception:
-                            print(f"[DEBUG] Relation '{rel_name}' has empty/unsupported fieldPairs")
+                            _diag.debug("Relation '%s' has empty/unsupported fieldPairs", rel_name)
 
                     for referencing_field, referenced_field in field_pairs_list:
                         new_rel.addFieldPair(str(referencing_field), str(referenced_field))
 
                     try:
                         if field_pairs_list:
-                            print(f"[DEBUG] Relation '{rel_name}' field pairs copied: {[(str(a), str(b)) for a, b in field_pairs_list]}")
+                            if _diag.isEnabledFor(DEBUG):
+                                _diag.debug(
+                                    "Relation '%s' field pairs copied: %s",
+                                    rel_name,
+                                    [(str(a), str(b)) for a, b in field_pairs_list],
+                                )
                     except Exception:
                         pass
 
@@ -919,7 +943,7 @@ class QGISProjectCreationService(QObject):
                     # otherwise-correct relations. We stage relations and set them in batch.
                     prepared_relations[new_rel.id()] = new_rel
                 except Exception as e:
-                    print(f"[DEBUG] Failed to copy a relation: {str(e)}")
+                    _diag.warning("Failed to copy a relation: %s", e)
 
             if prepared_relations:
                 try:
@@ -935,7 +959,7 @@ class QGISProjectCreationService(QObject):
                             _QgsProjectClass.setInstance(target_project)
                             switched_instance = True
                         except Exception as e:
-                            print(f"[DEBUG] Could not switch QgsProject.instance(): {str(e)}")
+                            _diag.debug("Could not switch QgsProject.instance(): %s", e)
 
                     try:
                         # Prefer explicit addRelation so we know whether each relation is accepted.
@@ -953,26 +977,30 @@ class QGISProjectCreationService(QObject):
                                             break
                                         except Exception:
                                             pass
-                                print(f"[DEBUG] addRelation rejected '{rel_label}': {extra_reason if extra_reason else 'unknown reason'}")
+                                _diag.debug(
+                                    "addRelation rejected '%s': %s",
+                                    rel_label,
+                                    extra_reason if extra_reason else 'unknown reason',
+                                )
                     finally:
                         if switched_instance:
                             try:
                                 _QgsProjectClass.setInstance(original_project_instance)
                             except Exception as e:
-                                print(f"[DEBUG] Failed to restore QgsProject.instance(): {str(e)}")
+                                _diag.warning("Failed to restore QgsProject.instance(): %s", e)
                 except Exception as e:
-                    print(f"[DEBUG] Failed while adding staged relations: {str(e)}")
+                    _diag.warning("Failed while adding staged relations: %s", e)
 
             if copied:
-                print(f"[DEBUG] Copied {copied} relation(s) into field project")
+                _diag.debug("Copied %s relation(s) into field project", copied)
             try:
                 current_relations = target_relation_manager.relations()
                 current_count = len(current_relations) if hasattr(current_relations, "__len__") else "unknown"
-                print(f"[DEBUG] Field-project relation manager currently has: {current_count} relation(s)")
+                _diag.debug("Field-project relation manager currently has: %s relation(s)", current_count)
             except Exception:
                 pass
         except Exception as e:
-            print(f"[DEBUG] Failed to copy project relations: {str(e)}")
+            _diag.warning("Failed to copy project relations: %s", e)
 
     def _extract_relation_field_pairs(self, relation: Any) -> List[tuple]:
         """
@@ -1062,7 +1090,7 @@ class QGISProjectCreationService(QObject):
                 )
 
             if not relations_payload:
-                print("[DEBUG] No relations available for XML injection")
+                _diag.debug("No relations available for XML injection")
                 return
 
             tree = ET.parse(qgs_path)
@@ -1098,9 +1126,9 @@ class QGISProjectCreationService(QObject):
                     )
 
             tree.write(qgs_path, encoding="utf-8", xml_declaration=False)
-            print(f"[DEBUG] Injected {len(relations_payload)} relation(s) directly into .qgs XML")
+            _diag.debug("Injected %s relation(s) directly into .qgs XML", len(relations_payload))
         except Exception as e:
-            print(f"[DEBUG] Failed to inject relations into .qgs XML: {str(e)}")
+            _diag.warning("Failed to inject relations into .qgs XML: %s", e)
 
     def _inject_map_view_into_qgs_xml(
         self,
@@ -1202,12 +1230,16 @@ class QGISProjectCreationService(QObject):
             render_tile_el.text = '0'
 
             tree.write(qgs_path, encoding='utf-8', xml_declaration=False)
-            print(
-                f"[DEBUG] Injected map view into .qgs XML "
-                f"(extent={xmin},{ymin},{xmax},{ymax}, rotation={rotation})"
+            _diag.debug(
+                "Injected map view into .qgs XML (extent=%s,%s,%s,%s, rotation=%s)",
+                xmin,
+                ymin,
+                xmax,
+                ymax,
+                rotation,
             )
         except Exception as e:
-            print(f"[DEBUG] Failed to inject map view into .qgs XML: {str(e)}")
+            _diag.warning("Failed to inject map view into .qgs XML: %s", e)
 
     def _map_units_label_for_crs(self, crs: Any) -> str:
         """Return the QGIS map-units label stored in .qgs mapcanvas nodes."""
@@ -1293,7 +1325,7 @@ class QGISProjectCreationService(QObject):
                 "memory",
             )
             if not memory_layer.isValid():
-                print(f"[DEBUG] Could not create memory layer for {source_layer.name()}")
+                _diag.debug("Could not create memory layer for %s", source_layer.name())
                 return None
 
             fields_to_drop = self._collect_non_exportable_field_names(source_layer)
@@ -1370,9 +1402,10 @@ class QGISProjectCreationService(QObject):
                 return False
 
             filtered_count = memory_layer.featureCount()
-            print(
-                f"[DEBUG] Exporting layer '{layer_name}' via feature request "
-                f"({filtered_count} feature(s))"
+            _diag.debug(
+                "Exporting layer '%s' via feature request (%s feature(s))",
+                layer_name,
+                filtered_count,
             )
             if filtered_count == 0:
                 return False
@@ -1434,10 +1467,8 @@ class QGISProjectCreationService(QObject):
                 filtered_count = 0
                 for feature in source_layer.getFeatures():
                     filtered_count += 1
-                print(
-                    f"[DEBUG] Filtering layer '{layer_name}' with expression: {combined_filter}"
-                )
-                print(f"[DEBUG] Number of features after filtering: {filtered_count}")
+                _diag.debug("Filtering layer '%s' with expression: %s", layer_name, combined_filter)
+                _diag.debug("Number of features after filtering: %s", filtered_count)
 
                 # Copy layer
                 success = self._copy_layer_to_geopackage(source_layer, output_path, layer_name)
@@ -1466,7 +1497,7 @@ class QGISProjectCreationService(QObject):
         try:
             source_layer = self._layer_service.get_layer_by_id(source_layer_id)
             if not source_layer:
-                print(f"[DEBUG] Could not get source layer for ID: {source_layer_id}")
+                _diag.debug("Could not get source layer for ID: %s", source_layer_id)
                 return False
             # Create empty layer with same structure
             success = self._copy_layer_structure_to_geopackage(source_layer, output_path, layer_name)
@@ -1482,7 +1513,7 @@ class QGISProjectCreationService(QObject):
             
             return False
         except Exception as e:
-            print(f"[DEBUG] Exception in _create_empty_layer_copy: {str(e)}")
+            _diag.warning("Exception in _create_empty_layer_copy: %s", e)
             import traceback
             traceback.print_exc()
             return False
@@ -1577,7 +1608,7 @@ class QGISProjectCreationService(QObject):
     ):
         """Copy a layer to a Geopackage file with preserved forms, styles, and field configurations."""
         try:
-            print(f"[DEBUG] _copy_layer_to_geopackage called for layer: {layer_name}")
+            _diag.debug("_copy_layer_to_geopackage called for layer: %s", layer_name)
             from qgis.core import QgsVectorFileWriter
             options = QgsVectorFileWriter.SaveVectorOptions()
             options.driverName = "GPKG"
@@ -1599,10 +1630,12 @@ class QGISProjectCreationService(QObject):
             fields_to_drop = self._collect_non_exportable_field_names(source_layer)
             layer_to_write = source_layer
             if fields_to_drop:
-                print(
-                    f"[DEBUG] Omitting non-exportable field(s) for {layer_name}: "
-                    f"{', '.join(sorted(fields_to_drop))}"
-                )
+                if _diag.isEnabledFor(DEBUG):
+                    _diag.debug(
+                        "Omitting non-exportable field(s) for %s: %s",
+                        layer_name,
+                        ', '.join(sorted(fields_to_drop)),
+                    )
                 safe_layer = self._create_export_layer_without_fields(source_layer, fields_to_drop)
                 if safe_layer is not None:
                     layer_to_write = safe_layer
@@ -1615,13 +1648,13 @@ class QGISProjectCreationService(QObject):
                 if unsupported_field in fields_to_drop:
                     break
                 fields_to_drop.add(unsupported_field)
-                print(
-                    f"[DEBUG] Detected unsupported attribute type for field "
-                    f"'{unsupported_field}', retrying without it"
+                _diag.debug(
+                    "Detected unsupported attribute type for field '%s', retrying without it",
+                    unsupported_field,
                 )
                 safe_layer = self._create_export_layer_without_fields(source_layer, fields_to_drop)
                 if safe_layer is None:
-                    print(f"[DEBUG] Could not create safe export layer for {layer_name}")
+                    _diag.debug("Could not create safe export layer for %s", layer_name)
                     return False
                 layer_to_write = safe_layer
                 error = _write_layer(layer_to_write)
@@ -1687,18 +1720,18 @@ class QGISProjectCreationService(QObject):
             export_layer.commitChanges()
             return export_layer
         except Exception as e:
-            print(f"[DEBUG] Failed to create export-safe layer: {str(e)}")
+            _diag.warning("Failed to create export-safe layer: %s", e)
             return None
 
     def _copy_layer_structure_to_geopackage(self, source_layer, output_path, layer_name):
         """Copy only the structure of a layer to a Geopackage file (no features) with preserved forms and styles."""
         try:
-            print(f"[DEBUG] Creating structure for layer: {layer_name}")
+            _diag.debug("Creating structure for layer: %s", layer_name)
             
             from qgis.core import QgsVectorFileWriter
             
             uri = self._memory_layer_uri_for_vector_layer(source_layer)
-            print(f"[DEBUG] Memory layer URI for structure export: {uri}")
+            _diag.debug("Memory layer URI for structure export: %s", uri)
             
             temp_layer = QgsVectorLayer(uri, "temp", "memory")
             
@@ -1706,7 +1739,7 @@ class QGISProjectCreationService(QObject):
                 print(f"Error: Could not create temporary layer for {layer_name}")
                 return False
             
-            print(f"[DEBUG] Successfully created temporary memory layer")
+            _diag.debug("Successfully created temporary memory layer")
             
             # Copy all fields (including virtual fields) with proper field configurations
             temp_layer.startEditing()
@@ -1766,7 +1799,7 @@ class QGISProjectCreationService(QObject):
                         print(f"Error writing layer structure to Geopackage: {error[1]}")
                         return False
                     
-                    print(f"[DEBUG] Successfully created Geopackage structure for {layer_name}")
+                    _diag.debug("Successfully created Geopackage structure for %s", layer_name)
                     
                     # Verify the Geopackage was created and the layer exists
                     if not os.path.exists(output_path):
@@ -1791,7 +1824,7 @@ class QGISProjectCreationService(QObject):
                     return True
                 except TypeError as e:
                     # Fallback to classic API
-                    print(f"[DEBUG] V2 API failed, falling back to classic API for {layer_name}: {str(e)}")
+                    _diag.debug("V2 API failed, falling back to classic API for %s: %s", layer_name, e)
                     pass
 
             # Classic API (older QGIS)
@@ -1804,7 +1837,7 @@ class QGISProjectCreationService(QObject):
                 print(f"Error writing layer structure to Geopackage (classic): {error}")
                 return False
             
-            print(f"[DEBUG] Successfully created Geopackage structure for {layer_name} (classic API)")
+            _diag.debug("Successfully created Geopackage structure for %s (classic API)", layer_name)
             
             # Verify the Geopackage was created and the layer exists
             if not os.path.exists(output_path):
@@ -1821,7 +1854,7 @@ class QGISProjectCreationService(QObject):
                     return False
             
             # After successful structure copy, copy forms, styles, and field configurations
-            print(f"[DEBUG] About to copy properties to Geopackage for {layer_name}")
+            _diag.debug("About to copy properties to Geopackage for %s", layer_name)
             properties_success = self._copy_layer_properties_to_geopackage(source_layer, output_path, layer_name)
             if not properties_success:
                 print(f"Warning: Failed to copy properties to Geopackage for {layer_name}, but structure was created")
@@ -1831,7 +1864,7 @@ class QGISProjectCreationService(QObject):
             
             return True
         except Exception as e:
-            print(f"[DEBUG] Exception in _copy_layer_structure_to_geopackage: {str(e)}")
+            _diag.warning("Exception in _copy_layer_structure_to_geopackage: %s", e)
             import traceback
             traceback.print_exc()
             return False
@@ -1872,10 +1905,13 @@ class QGISProjectCreationService(QObject):
                     # Try loading with the full path including layer name
                     target_layer = QgsVectorLayer(f"{output_path}|layername={layer_name}", layer_name, "ogr")
                     if not target_layer.isValid():
-                        print(f"[DEBUG] Warning: Could not load target layer for property copying: {output_path}")
+                        _diag.debug(
+                            "Warning: Could not load target layer for property copying: %s",
+                            output_path,
+                        )
                         return False
                 except Exception as e:
-                    print(f"[DEBUG] Warning: Could not load target layer for property copying: {str(e)}")
+                    _diag.debug("Warning: Could not load target layer for property copying: %s", e)
                     return False
             
             # Copy layer properties using the layer service methods
@@ -1886,7 +1922,7 @@ class QGISProjectCreationService(QObject):
             
             # If QML style copying failed, use renderer fallback
             if not qml_success:
-                print(f"[DEBUG] QML style copying failed for {layer_name}, using renderer clone as fallback")
+                _diag.debug("QML style copying failed for %s, using renderer clone as fallback", layer_name)
                 self._layer_service._copy_renderer_fallback(source_layer, target_layer)
             
             # Force the layer to save its style to the Geopackage
@@ -1900,14 +1936,22 @@ class QGISProjectCreationService(QObject):
                 if isinstance(temp_qml, tuple) and len(temp_qml) == 2 and temp_qml[0] and isinstance(temp_qml[1], str):
                     load_result = target_layer.loadNamedStyle(temp_qml[1])
                     if isinstance(load_result, tuple) and load_result[0]:
-                        print(f"[DEBUG] Used QML save/load method for {layer_name}")
+                        _diag.debug("Used QML save/load method for %s", layer_name)
                         style_saved = True
                     else:
-                        print(f"[DEBUG] QML load failed: {load_result[1] if isinstance(load_result, tuple) and len(load_result) > 1 else load_result}")
+                        if _diag.isEnabledFor(DEBUG):
+                            _diag.debug(
+                                "QML load failed: %s",
+                                load_result[1] if isinstance(load_result, tuple) and len(load_result) > 1 else load_result,
+                            )
                 else:
-                    print(f"[DEBUG] QML save failed: {temp_qml[1] if isinstance(temp_qml, tuple) and len(temp_qml) > 1 else temp_qml}")
+                    if _diag.isEnabledFor(DEBUG):
+                        _diag.debug(
+                            "QML save failed: %s",
+                            temp_qml[1] if isinstance(temp_qml, tuple) and len(temp_qml) > 1 else temp_qml,
+                        )
             except Exception as e:
-                print(f"[DEBUG] QML save/load method failed: {str(e)}")
+                _diag.debug("QML save/load method failed: %s", e)
             
             # Method 2: Save QML file in the same directory as the Geopackage
             # This is the most reliable method and ensures the style is preserved
@@ -1917,21 +1961,32 @@ class QGISProjectCreationService(QObject):
                     qml_path = os.path.splitext(output_path)[0] + ".qml"
                     save_result = target_layer.saveNamedStyle(qml_path)
                     if isinstance(save_result, tuple) and save_result[0]:
-                        print(f"[DEBUG] Saved QML style file: {qml_path}")
+                        _diag.debug("Saved QML style file: %s", qml_path)
                         # Try to load the QML style back to ensure it's properly associated
                         load_result = target_layer.loadNamedStyle(qml_path)
                         if isinstance(load_result, tuple) and load_result[0]:
-                            print(f"[DEBUG] Successfully loaded QML style from {qml_path}")
+                            _diag.debug("Successfully loaded QML style from %s", qml_path)
                             style_saved = True
                         else:
-                            print(f"[DEBUG] Failed to load QML style from {qml_path}: {load_result[1] if isinstance(load_result, tuple) and len(load_result) > 1 else load_result}")
+                            _diag.warning(
+                                "Failed to load QML style from %s: %s",
+                                qml_path,
+                                load_result[1] if isinstance(load_result, tuple) and len(load_result) > 1 else load_result,
+                            )
                     else:
-                        print(f"[DEBUG] Failed to save QML style file: {qml_path}: {save_result[1] if isinstance(save_result, tuple) and len(save_result) > 1 else save_result}")
+                        _diag.warning(
+                            "Failed to save QML style file: %s: %s",
+                            qml_path,
+                            save_result[1] if isinstance(save_result, tuple) and len(save_result) > 1 else save_result,
+                        )
                 except Exception as e:
-                    print(f"[DEBUG] Error saving QML style file: {str(e)}")
+                    _diag.warning("Error saving QML style file: %s", e)
             
             if not style_saved:
-                print(f"[DEBUG] Warning: Could not save style to Geopackage for {layer_name}, but layer structure and properties were copied successfully")
+                _diag.debug(
+                    "Warning: Could not save style to Geopackage for %s, but layer structure and properties were copied successfully",
+                    layer_name,
+                )
             
             # Force the layer to update and save changes
             target_layer.triggerRepaint()
@@ -1959,10 +2014,19 @@ class QGISProjectCreationService(QObject):
             for relation in relation_manager.relations().values():
                 if (relation.referencingLayerId() == layer_id and 
                     relation.referencedLayerId() == recording_areas_layer_id):
-                    print(f"[DEBUG] Found relationship: {relation.referencingLayerId()} -> {relation.referencedLayerId()}")
+                    if _diag.isEnabledFor(DEBUG):
+                        _diag.debug(
+                            "Found relationship: %s -> %s",
+                            relation.referencingLayerId(),
+                            relation.referencedLayerId(),
+                        )
                     return True
             
-            print(f"[DEBUG] No relationship found for layer {layer_id} with recording areas layer {recording_areas_layer_id}")
+            _diag.debug(
+                "No relationship found for layer %s with recording areas layer %s",
+                layer_id,
+                recording_areas_layer_id,
+            )
             return False
         except Exception as e:
             print(f"Error checking layer relationship: {str(e)}")
@@ -1981,7 +2045,7 @@ class QGISProjectCreationService(QObject):
             # Get the recording area layer and the selected feature
             recording_layer = self._layer_service.get_layer_by_id(recording_areas_layer_id)
             if not recording_layer:
-                print(f"[DEBUG] Recording area layer not found: {recording_areas_layer_id}")
+                _diag.debug("Recording area layer not found: %s", recording_areas_layer_id)
                 return None
             
             # Find the selected feature
@@ -1992,7 +2056,7 @@ class QGISProjectCreationService(QObject):
                     break
             
             if not selected_feature:
-                print(f"[DEBUG] Selected feature not found: {selected_feature_id}")
+                _diag.debug("Selected feature not found: %s", selected_feature_id)
                 return None
             
             # Find the relation where the extra layer references the recording areas layer
@@ -2012,14 +2076,21 @@ class QGISProjectCreationService(QObject):
                         field_idx = recording_layer.fields().indexOf(referenced_field)
                         if field_idx >= 0:
                             referenced_value = selected_feature.attribute(field_idx)
-                            print(f"[DEBUG] Using field '{referenced_field}' with value '{referenced_value}' for filtering")
+                            _diag.debug(
+                                "Using field '%s' with value '%s' for filtering",
+                                referenced_field,
+                                referenced_value,
+                            )
                             filter_expr = f'"{referencing_field}" = \'{referenced_value}\''
-                            print(f"[DEBUG] Generated filter expression: {filter_expr}")
+                            _diag.debug("Generated filter expression: %s", filter_expr)
                             return filter_expr
                         else:
-                            print(f"[DEBUG] Referenced field '{referenced_field}' not found in recording area layer")
+                            _diag.debug(
+                                "Referenced field '%s' not found in recording area layer",
+                                referenced_field,
+                            )
             
-            print(f"[DEBUG] No filter expression generated for layer {layer_id}")
+            _diag.debug("No filter expression generated for layer %s", layer_id)
             return None
         except Exception as e:
             print(f"Error getting relationship filter expression: {str(e)}")
@@ -2203,10 +2274,7 @@ class QGISProjectCreationService(QObject):
         if source_layer and isinstance(source_layer, QgsVectorLayer) and recording_area_ids:
             sql_filter = self._build_sql_primary_key_in_filter(source_layer, recording_area_ids)
             if sql_filter:
-                print(
-                    f"[DEBUG] Exporting recording areas for {layer_name} "
-                    f"with SQL filter: {sql_filter}"
-                )
+                _diag.debug("Exporting recording areas for %s with SQL filter: %s", layer_name, sql_filter)
                 if self._create_filtered_layer(
                     recording_areas_layer_id,
                     output_path,
@@ -2215,10 +2283,7 @@ class QGISProjectCreationService(QObject):
                     project,
                 ):
                     return True
-                print(
-                    f"[DEBUG] SQL primary-key export failed for {layer_name}, "
-                    "trying spatial clip"
-                )
+                _diag.debug("SQL primary-key export failed for %s, trying spatial clip", layer_name)
 
         if self._create_extent_intersect_layer_copy(
             source_layer_id=recording_areas_layer_id,
@@ -2270,9 +2335,9 @@ class QGISProjectCreationService(QObject):
             ):
                 return True
             if spatial_filter:
-                print(
-                    f"[DEBUG] Spatial feature-request export failed for {layer_name}, "
-                    "trying memory-layer path"
+                _diag.debug(
+                    "Spatial feature-request export failed for %s, trying memory-layer path",
+                    layer_name,
                 )
 
             filtered_layer = self._build_memory_layer_with_intersecting_features(
@@ -2281,7 +2346,7 @@ class QGISProjectCreationService(QObject):
                 extent_crs_authid,
             )
             if filtered_layer is None:
-                print(f"[DEBUG] Memory export failed for {layer_name}, trying structure + features fallback")
+                _diag.debug("Memory export failed for %s, trying structure + features fallback", layer_name)
                 return self._create_extent_intersect_layer_copy_fallback(
                     source_layer=source_layer,
                     output_path=output_path,
@@ -2410,7 +2475,7 @@ class QGISProjectCreationService(QObject):
             target_layer.commitChanges()
             self._copy_layer_properties_to_geopackage(source_layer, output_path, layer_name)
             project.addMapLayer(target_layer)
-            print(f"[DEBUG] Fallback export added {added} feature(s) to {layer_name}")
+            _diag.debug("Fallback export added %s feature(s) to %s", added, layer_name)
             return True
         except Exception as e:
             print(f"Error in extent intersect fallback export: {str(e)}")
@@ -2509,16 +2574,16 @@ class QGISProjectCreationService(QObject):
                         # Save the style without enhancement
                         style_result = layer.saveNamedStyle(qml_path)
                         if style_result[0]:
-                            print(f"[DEBUG] Saved raster QML style file: {qml_path}")
+                            _diag.debug("Saved raster QML style file: %s", qml_path)
                         else:
-                            print(f"[DEBUG] Failed to save raster QML style file: {qml_path}")
+                            _diag.warning("Failed to save raster QML style file: %s", qml_path)
                     
                     # Load the style back to ensure it's associated
                     load_result = layer.loadNamedStyle(qml_path)
                     if load_result[0]:
-                        print(f"[DEBUG] Loaded raster QML style file: {qml_path}")
+                        _diag.debug("Loaded raster QML style file: %s", qml_path)
                     else:
-                        print(f"[DEBUG] Failed to load raster QML style file: {qml_path}")
+                        _diag.warning("Failed to load raster QML style file: %s", qml_path)
                     
                     project.addMapLayer(layer)
                     return True
@@ -2540,7 +2605,7 @@ class QGISProjectCreationService(QObject):
             # First save the basic style
             style_result = layer.saveNamedStyle(qml_path)
             if not style_result[0]:
-                print(f"[DEBUG] Failed to save basic raster style: {qml_path}")
+                _diag.warning("Failed to save basic raster style: %s", qml_path)
                 return False
 
             # Parse the QML file as XML
@@ -2550,7 +2615,7 @@ class QGISProjectCreationService(QObject):
             # Find the <pipe> element
             pipe = root.find('pipe')
             if pipe is None:
-                print(f"[DEBUG] No <pipe> element found in QML: {qml_path}")
+                _diag.debug("No <pipe> element found in QML: %s", qml_path)
                 return False
 
             # Remove any existing <brightnesscontrast> and <huesaturation> elements
@@ -2589,7 +2654,12 @@ class QGISProjectCreationService(QObject):
             # Write the updated QML content back
             tree.write(qml_path, encoding='utf-8', xml_declaration=False)
 
-            print(f"[DEBUG] Saved raster QML style file with enhancement (XML) - Brightness: {brightness}, Contrast: {contrast}, Saturation: {saturation}")
+            _diag.debug(
+                "Saved raster QML style file with enhancement (XML) - Brightness: %s, Contrast: %s, Saturation: %s",
+                brightness,
+                contrast,
+                saturation,
+            )
             return True
         except Exception as e:
             print(f"Error saving raster style with enhancement (XML): {str(e)}")
@@ -2607,45 +2677,51 @@ class QGISProjectCreationService(QObject):
         """
         try:
             if not raster_layer or not raster_layer.isValid():
-                print("[DEBUG] Raster layer is invalid or None.")
+                _diag.debug("Raster layer is invalid or None.")
                 return False
             
             # Get the renderer
             renderer = raster_layer.renderer()
             if not renderer:
-                print("[DEBUG] No renderer found for raster layer.")
+                _diag.debug("No renderer found for raster layer.")
                 return False
             
-            print(f"[DEBUG] Renderer type: {type(renderer)}")
-            print(f"[DEBUG] Renderer has setBrightness: {hasattr(renderer, 'setBrightness')}")
-            print(f"[DEBUG] Renderer has setContrast: {hasattr(renderer, 'setContrast')}")
-            print(f"[DEBUG] Renderer has setSaturation: {hasattr(renderer, 'setSaturation')}")
+            _diag.debug("Renderer type: %s", type(renderer))
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug("Renderer has setBrightness: %s", hasattr(renderer, 'setBrightness'))
+                _diag.debug("Renderer has setContrast: %s", hasattr(renderer, 'setContrast'))
+                _diag.debug("Renderer has setSaturation: %s", hasattr(renderer, 'setSaturation'))
             
             # Get enhancement settings from settings manager
             brightness = self._settings_manager.get_value('raster_brightness', 0)
             contrast = self._settings_manager.get_value('raster_contrast', 0)
             saturation = self._settings_manager.get_value('raster_saturation', 0)
             
-            print(f"[DEBUG] Applying raster enhancement - Brightness: {brightness}, Contrast: {contrast}, Saturation: {saturation}")
+            _diag.debug(
+                "Applying raster enhancement - Brightness: %s, Contrast: %s, Saturation: %s",
+                brightness,
+                contrast,
+                saturation,
+            )
             
             # Apply brightness and contrast
             if hasattr(renderer, 'setBrightness'):
                 renderer.setBrightness(brightness)
-                print(f"[DEBUG] Set brightness to: {brightness}")
+                _diag.debug("Set brightness to: %s", brightness)
             else:
-                print("[DEBUG] Renderer does not support setBrightness.")
+                _diag.debug("Renderer does not support setBrightness.")
             if hasattr(renderer, 'setContrast'):
                 renderer.setContrast(contrast)
-                print(f"[DEBUG] Set contrast to: {contrast}")
+                _diag.debug("Set contrast to: %s", contrast)
             else:
-                print("[DEBUG] Renderer does not support setContrast.")
+                _diag.debug("Renderer does not support setContrast.")
             
             # Apply saturation (hue/saturation)
             if hasattr(renderer, 'setSaturation'):
                 renderer.setSaturation(saturation)
-                print(f"[DEBUG] Set saturation to: {saturation}")
+                _diag.debug("Set saturation to: %s", saturation)
             else:
-                print("[DEBUG] Renderer does not support setSaturation.")
+                _diag.debug("Renderer does not support setSaturation.")
             
             # Trigger repaint to apply changes
             raster_layer.triggerRepaint()
@@ -2668,27 +2744,30 @@ class QGISProjectCreationService(QObject):
             True if the field appears to be virtual/computed
         """
         try:
-            print(f"[DEBUG] _is_virtual_field called for field: {field.name()}")
+            _diag.debug("_is_virtual_field called for field: %s", field.name())
             # Method 1: Check if it's a virtual field (computed field)
             if hasattr(field, 'isVirtual') and field.isVirtual():
-                print(f"[DEBUG] Field {field.name()} detected as virtual via isVirtual()")
+                _diag.debug("Field %s detected as virtual via isVirtual()", field.name())
                 return True
             
             # Method 2: Check if it's a computed field (QVariant.Invalid type)
             if hasattr(field, 'type') and field.type() == 100:  # QVariant.Invalid
-                print(f"[DEBUG] Field {field.name()} detected as virtual via type() == 100")
+                _diag.debug("Field %s detected as virtual via type() == 100", field.name())
                 return True
             
             # Method 3: Check if the field has an expression (computed field)
             if hasattr(field, 'expression') and field.expression():
-                print(f"[DEBUG] Field {field.name()} detected as virtual via expression()")
+                _diag.debug("Field %s detected as virtual via expression()", field.name())
                 return True
             
             # Method 4: Check if the field has a default value expression
             if hasattr(field, 'defaultValueDefinition') and field.defaultValueDefinition():
                 default_def = field.defaultValueDefinition()
                 if hasattr(default_def, 'expression') and default_def.expression():
-                    print(f"[DEBUG] Field {field.name()} detected as virtual via defaultValueDefinition().expression()")
+                    _diag.debug(
+                        "Field %s detected as virtual via defaultValueDefinition().expression()",
+                        field.name(),
+                    )
                     return True
             
             # Method 5: Check QML style file for expression fields (most reliable)
@@ -2697,28 +2776,28 @@ class QGISProjectCreationService(QObject):
                 if qml_path and qml_path.endswith('.qml'):
                     virtual_fields = self._parse_qml_expression_fields(qml_path)
                     if field.name() in virtual_fields:
-                        print(f"[DEBUG] Field {field.name()} detected as virtual via QML expression fields")
+                        _diag.debug("Field %s detected as virtual via QML expression fields", field.name())
                         return True
             
             # Method 6: Check if the field has a comment indicating it's computed
             if hasattr(field, 'comment') and field.comment():
                 comment = field.comment().lower()
                 if any(keyword in comment for keyword in ['computed', 'virtual', 'expression', 'calculated']):
-                    print(f"[DEBUG] Field {field.name()} detected as virtual via comment: {comment}")
+                    _diag.debug("Field %s detected as virtual via comment: %s", field.name(), comment)
                     return True
             
             # Method 7: Check if the field has an alias that suggests it's computed
             if hasattr(field, 'alias') and field.alias():
                 alias = field.alias().lower()
                 if any(keyword in alias for keyword in ['computed', 'virtual', 'expression', 'calculated']):
-                    print(f"[DEBUG] Field {field.name()} detected as virtual via alias: {alias}")
+                    _diag.debug("Field %s detected as virtual via alias: %s", field.name(), alias)
                     return True
             
-            print(f"[DEBUG] Field {field.name()} not detected as virtual")
+            _diag.debug("Field %s not detected as virtual", field.name())
             return False
         except Exception as e:
             # If we can't determine, assume it's not virtual
-            print(f"[DEBUG] Exception in _is_virtual_field for {field.name()}: {str(e)}")
+            _diag.warning("Exception in _is_virtual_field for %s: %s", field.name(), e)
             return False
     
     def _parse_qml_expression_fields(self, qml_path):
@@ -0,0 +1,240 @@
+"""
+Incremental evaluation of sequence-style default values during validation.
+
+Definitive layers often number new entities with aggregate defaults such as::
+
+    maximum("numero") + 1
+    coalesce(maximum("numero", group_by:="recording_area"), 0) + 1
+    maximum("numero", filter:="recording_area" = @recording_area) + 1
+
+Evaluating them through ``QgsVectorLayerUtils.createFeature`` re-runs the aggregate
+over the layer and its edit buffer for every copied feature, which forces one
+feature per insert. :class:`SequenceDefaultEvaluator` recognises these patterns,
+seeds the maxima with one scan of the target layer and then keeps them up to date
+in Python as features are added, so sequence layers can be copied in bulk batches.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from ..core.diagnostics import get_diagnostics
+    from ..core.feature_requests import iter_features, resolve_field_indices
+except ImportError:
+    from core.diagnostics import get_diagnostics
+    from core.feature_requests import iter_features, resolve_field_indices
+
+_diag = get_diagnostics("sequence_defaults")
+
+_PLUS_ONE_PATTERN = re.compile(r"^\s*(?P<inner>.+?)\s*\+\s*1\s*$", re.DOTALL)
+_COALESCE_PATTERN = re.compile(
+    r"^\s*coalesce\s*\(\s*(?P<inner>.+?)\s*,\s*(?P<start>-?\d+)\s*\)\s*$", re.IGNORECASE | re.DOTALL
+)
+_MAXIMUM_PATTERN = re.compile(
+    r'^\s*maximum\s*\(\s*"(?P<field>[^"]+)"\s*'
+    r'(?:,\s*(?:group_by\s*:=\s*)?"(?P<group>[^"]+)"\s*'
+    r'|,\s*filter\s*:=\s*"(?P<filter_field>[^"]+)"\s*=\s*@(?P<variable>\w+)\s*)?'
+    r'\)\s*$',
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class SequenceDefault:
+    """A recognised ``maximum(...) + 1`` default on one target field."""
+    target_index: int
+    value_index: int
+    # Field grouping (group_by) or restricting (filter = @variable) the maximum
+    group_index: Optional[int] = None
+    # Variable whose value the group field must equal (filter form)
+    variable: Optional[str] = None
+    # Value used instead of an empty maximum (coalesce form)
+    start: Optional[int] = None
+
+
+def parse_sequence_default(expression: str, layer: Any, target_index: int) -> Optional[SequenceDefault]:
+    """Return the sequence default described by ``expression``, or None if it is not one."""
+    match = _PLUS_ONE_PATTERN.match(expression or "")
+    if not match:
+        return None
+    inner = match.group('inner')
+    start = None
+    coalesce = _COALESCE_PATTERN.match(inner)
+    if coalesce:
+        inner = coalesce.group('inner')
+        start = int(coalesce.group('start'))
+    maximum = _MAXIMUM_PATTERN.match(inner)
+    if not maximum:
+        return None
+
+    value_indices = resolve_field_indices(layer, [maximum.group('field')])
+    if not value_indices:
+        return None
+    group_name = maximum.group('group') or maximum.group('filter_field')
+    group_index = None
+    if group_name:
+        group_indices = resolve_field_indices(layer, [group_name])
+        if not group_indices:
+            return None
+        group_index = group_indices[0]
+    return SequenceDefault(
+        target_index=target_index,
+        value_index=value_indices[0],
+        group_index=group_index,
+        variable=maximum.group('variable'),
+        start=start,
+    )
+
+
+def _numeric(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        if hasattr(value, "isNull") and value.isNull():
+            return None
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if number != number:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def _group_key(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        if hasattr(value, "isNull") and value.isNull():
+            return None
+    except Exception:
+        pass
+    return str(value)
+
+
+class SequenceDefaultEvaluator:
+    """
+    Fill sequence defaults of new features from maxima tracked in Python.
+
+    Build it with :meth:`for_layer`; :meth:`fill` is called with the attribute map
+    of each new feature in insertion order, before ``createFeatures`` runs, so QGIS
+    keeps the provided values instead of evaluating the aggregate.
+    """
+
+    def __init__(self, layer: Any, defaults: List[SequenceDefault]):
+        self._layer = layer
+        self._defaults = defaults
+        self._variables: Dict[str, Optional[str]] = {}
+        # Maximum per (value field, group field, variable) and group value
+        self._maxima: Dict[Tuple[int, Optional[int], Optional[str]], Dict[Optional[str], Any]] = {}
+        self._seeded = False
+
+    @classmethod
+    def for_layer(cls, layer: Any) -> Optional['SequenceDefaultEvaluator']:
+        """
+        Return an evaluator when every order-dependent default of ``layer`` is a
+        recognised sequence, None otherwise (the layer must then be copied one
+        feature at a time).
+        """
+        try:
+            from .import_validation_service import default_is_order_dependent
+        except ImportError:
+            from services.import_validation_service import default_is_order_dependent
+
+        defaults = []
+        try:
+            fields = layer.fields()
+            for field_index in range(fields.count()):
+                expression = layer.defaultValueDefinition(field_index).expression()
+                if not default_is_order_dependent(expression):
+                    continue
+                sequence = parse_sequence_default(expression, layer, field_index)
+                if sequence is None:
+                    _diag.debug("Default of field %s is not a recognised sequence: %s", field_index, expression)
+                    return None
+                defaults.append(sequence)
+        except Exception as e:
+            print(f"Error reading sequence defaults: {e}")
+            return None
+        return cls(layer, defaults) if defaults else None
+
+    @property
+    def defaults(self) -> List[SequenceDefault]:
+        return list(self._defaults)
+
+    def _tracker_key(self, sequence: SequenceDefault) -> Tuple[int, Optional[int], Optional[str]]:
+        return (sequence.value_index, sequence.group_index, sequence.variable)
+
+    def _group_of(self, sequence: SequenceDefault, attributes: Any) -> Tuple[bool, Optional[str]]:
+        """Return (counts, group key) of a feature for one sequence."""
+        if sequence.group_index is None:
+            return True, None
+        value = _group_key(attributes(sequence.group_index))
+        if sequence.variable is None:
+            return True, value
+        wanted = self._variables.get(sequence.variable)
+        return value is not None and value == wanted, wanted
+
+    def _observe(self, attributes: Any) -> None:
+        for sequence in self._defaults:
+            counts, group = self._group_of(sequence, attributes)
+            if not counts:
+                continue
+            value = _numeric(attributes(sequence.value_index))
+            if value is None:
+                continue
+            maxima = self._maxima.setdefault(self._tracker_key(sequence), {})
+            current = maxima.get(group)
+            if current is None or value > current:
+                maxima[group] = value
+
+    def seed(self, expression_context: Any = None) -> None:
+        """Read the current maxima from the layer, including its edit buffer."""
+        context = expression_context
+        if context is None and hasattr(self._layer, "createExpressionContext"):
+            context = self._layer.createExpressionContext()
+        for sequence in self._defaults:
+            if sequence.variable and sequence.variable not in self._variables:
+                value = context.variable(sequence.variable) if context is not None else None
+                self._variables[sequence.variable] = _group_key(value)
+
+        fields = set()
+        for sequence in self._defaults:
+            fields.add(sequence.value_index)
+            if sequence.group_index is not None:
+                fields.add(sequence.group_index)
+        scanned = 0
+        self._maxima.clear()
+        for feature in iter_features(self._layer, sorted(fields), with_geometry=False):
+            self._observe(feature.attribute)
+            scanned += 1
+        self._seeded = True
+        _diag.debug("Seeded %d sequence default(s) from %d feature(s)", len(self._defaults), scanned)
+
+    def invalidate(self) -> None:
+        """Forget the tracked maxima; the next :meth:`fill` seeds them again."""
+        self._maxima.clear()
+        self._seeded = False
+
+    def fill(self, attribute_map: Dict[int, Any], expression_context: Any = None) -> None:
+        """
+        Set missing sequence fields of one new feature and record its values.
+
+        Imported values are kept and raise the maximum like any inserted feature.
+        """
+        if not self._seeded:
+            self.seed(expression_context)
+        for sequence in self._defaults:
+            if _numeric(attribute_map.get(sequence.target_index)) is not None:
+                continue
+            # With a filter the maximum is read for @variable's group whatever the
+            # new feature's own group; it is only raised by features of that group.
+            _counts, group = self._group_of(sequence, attribute_map.get)
+            current = self._maxima.get(self._tracker_key(sequence), {}).get(group)
+            if current is None:
+                current = sequence.start
+            if current is not None:
+                attribute_map[sequence.target_index] = current + 1
+        self._observe(attribute_map.get)
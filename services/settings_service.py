@@ -98,4 +98,43 @@ class QGISSettingsManager(ISettingsManager):
     @property
     def plugin_group(self) -> str:
         """Get the plugin group name."""
-        return self._plugin_group 
\ No newline at end of file
+        return self._plugin_group 
+
+class InMemorySettingsManager(ISettingsManager):
+    """
+    Dictionary-backed settings for headless runs (batch validation, benchmarks).
+
+    Values not set explicitly are read from an optional ``fallback`` manager, so a
+    settings file can override only some of the stored QSettings values.
+    """
+
+    def __init__(self, values: Optional[dict] = None, fallback: Optional[ISettingsManager] = None):
+        """
+        Initialize the settings manager.
+
+        Args:
+            values: Initial setting values
+            fallback: Manager consulted for keys missing from ``values``
+        """
+        self._values = dict(values or {})
+        self._fallback = fallback
+
+    def set_value(self, key: str, value: Any) -> None:
+        """Store a value in memory only."""
+        self._values[key] = value
+
+    def get_value(self, key: str, default: Any = None) -> Any:
+        """Return the in-memory value, else the fallback value, else ``default``."""
+        if key in self._values:
+            return self._values[key]
+        if self._fallback is not None:
+            return self._fallback.get_value(key, default)
+        return default
+
+    def remove_value(self, key: str) -> None:
+        """Remove an in-memory value; the fallback is never modified."""
+        self._values.pop(key, None)
+
+    def clear_all(self) -> None:
+        """Clear all in-memory values."""
+        self._values.clear()
@@ -32,18 +32,36 @@ Usage:
     warnings = service.detect_skipped_numbers()
 """
 
-from typing import List, Dict, Any, Optional, Union
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 try:
     from ..core.data_structures import WarningData
+    from ..core.feature_requests import iter_features
+    from ..core.recording_area_names import RecordingAreaNameIndex
+    from ..core.relation_graph import get_relation_graph
+    from ..core.cancellation import CancellationToken, cancellation_scope
     from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.diagnostics import get_diagnostics
 except ImportError:
     from core.data_structures import WarningData
+    from core.feature_requests import iter_features
+    from core.recording_area_names import RecordingAreaNameIndex
+    from core.relation_graph import get_relation_graph
+    from core.cancellation import CancellationToken, cancellation_scope
     from core.ui_responsiveness import maybe_yield_to_ui
+    from core.diagnostics import get_diagnostics
 
 from qgis.core import QgsProject
 from qgis.PyQt.QtCore import QObject
 
+_diag = get_diagnostics("detectors.skipped_numbers")
+
+# Skipped numbers copied into WarningData.skipped_numbers; full ranges are kept separately.
+_MAX_LISTED_SKIPPED_NUMBERS = 100
+# Gap ranges spelled out in a warning message before the rest are summarised.
+_MAX_LISTED_GAP_RANGES = 20
+
 
 class SkippedNumbersDetectorService(QObject):
     """
@@ -66,16 +84,28 @@ class SkippedNumbersDetectorService(QObject):
         self._settings_manager = settings_manager
         self._layer_service = layer_service
     
-    def detect_skipped_numbers(self) -> List[Union[str, WarningData]]:
+    def detect_skipped_numbers(
+        self, cancellation_token: Optional[CancellationToken] = None
+    ) -> List[Union[str, WarningData]]:
         """
         Detect skipped numbers in recording areas.
         
+        Args:
+            cancellation_token: Optional token checked in the scan loops; once it is
+                cancelled the run raises ``DetectionCancelled`` instead of returning
+                partial results
+        
         Returns:
             List of warning messages or structured warning data about skipped numbers
         """
+        with cancellation_scope(cancellation_token):
+            return self._detect_skipped_numbers()
+
+    def _detect_skipped_numbers(self) -> List[Union[str, WarningData]]:
+        """Run the detection; see :meth:`detect_skipped_numbers`."""
         # Check if skipped numbers warnings are enabled
         if not self._settings_manager.get_value('enable_skipped_numbers_warnings', True):
-            print("[DEBUG] Skipped numbers warnings are disabled, skipping detection")
+            _diag.debug("Skipped numbers warnings are disabled, skipping detection")
             return []
         warnings = []
         
@@ -149,7 +179,11 @@ class SkippedNumbersDetectorService(QObject):
             
             # Group objects by recording area
             recording_area_objects = {}
-            for feature in objects_layer.getFeatures():
+            for feature in iter_features(
+                objects_layer,
+                (number_field_idx, recording_area_field_idx),
+                with_geometry=False,
+            ):
                 maybe_yield_to_ui()
                 recording_area_id = feature.attribute(recording_area_field_idx)
                 number = feature.attribute(number_field_idx)
@@ -166,6 +200,7 @@ class SkippedNumbersDetectorService(QObject):
                         pass
             
             # Check for skipped numbers in each recording area
+            recording_area_names = self._create_recording_area_name_index(recording_areas_layer)
             for recording_area_id, numbers in recording_area_objects.items():
                 if len(numbers) < 2:
                     # Need at least 2 numbers to detect gaps
@@ -173,150 +208,163 @@ class SkippedNumbersDetectorService(QObject):
                 
                 # Sort numbers and find gaps
                 numbers.sort()
-                gaps = self._find_gaps_in_sequence(numbers)
+                gap_ranges = self._find_gap_ranges(numbers)
                 
-                if gaps:
+                if gap_ranges:
                     # Get recording area name
-                    recording_area_name = self._get_recording_area_name(recording_areas_layer, recording_area_id)
+                    recording_area_name = self._get_recording_area_name(
+                        recording_areas_layer, recording_area_id, recording_area_names
+                    )
                     
-                    # Get context numbers (gaps + before/after)
-                    context_numbers = self._get_context_numbers_for_gaps(numbers, gaps)
+                    # Get context numbers (existing numbers right before/after each gap)
+                    context_numbers = self._get_context_numbers_for_gaps(numbers, gap_ranges)
                     
                     # Create structured warning data
                     warning_data = WarningData(
                         message=self._create_skipped_numbers_warning(
-                            recording_area_name, gaps, layer_name
+                            recording_area_name, gap_ranges, layer_name
                         ),
                         recording_area_name=recording_area_name,
                         layer_name=layer_name,
                         filter_expression=f'"{recording_area_field}" = \'{recording_area_id}\' AND "{number_field}" IN ({",".join(map(str, context_numbers))})',
-                        skipped_numbers=gaps
+                        skipped_numbers=self._expand_gap_ranges(gap_ranges),
+                        skipped_number_ranges=gap_ranges
                     )
                     warnings.append(warning_data)
             
         except Exception as e:
-            print(f"[DEBUG] Error in _detect_skipped_numbers_within_layer: {e}")
+            _diag.warning("Error in _detect_skipped_numbers_within_layer: %s", e)
             import traceback
             traceback.print_exc()
         
         return warnings
     
-    def _find_gaps_in_sequence(self, numbers: List[int]) -> List[int]:
+    def _find_gap_ranges(self, sorted_numbers: List[int]) -> List[Tuple[int, int]]:
         """
-        Find gaps in a sequence of numbers.
+        Find gaps in a sorted sequence of numbers as inclusive ranges.
+        
+        Runs in O(len(sorted_numbers)) regardless of how wide the gaps are, so a
+        single mistyped number (e.g. 100000 in a 1-300 zone) costs one range.
         
         Args:
-            numbers: List of sorted integers
+            sorted_numbers: Sorted integers (duplicates allowed)
             
         Returns:
-            List of missing numbers (gaps)
-        """
-        gaps = []
-        
-        if len(numbers) < 2:
-            return gaps
-        
-        # Find gaps in the sequence
-        for i in range(len(numbers) - 1):
-            current = numbers[i]
-            next_num = numbers[i + 1]
-            
-            # Check for gaps between current and next number
-            for missing in range(current + 1, next_num):
-                gaps.append(missing)
-        
-        return gaps
-
-    def _consecutive_run_length_ending_at(self, sorted_numbers: List[int], value: int) -> int:
-        """
-        Return how many consecutive integers ending at ``value`` exist in ``sorted_numbers``.
-
-        Example: for [1, 2, 3, 10] and value 3, returns 3 (the run 1-2-3).
+            List of (first_missing, last_missing) tuples in ascending order
         """
-        number_set = set(sorted_numbers)
-        if value not in number_set:
-            return 0
+        gap_ranges: List[Tuple[int, int]] = []
+        for current, next_num in zip(sorted_numbers, sorted_numbers[1:]):
+            if next_num - current > 1:
+                gap_ranges.append((current + 1, next_num - 1))
+        return gap_ranges
 
-        length = 1
-        current = value - 1
-        while current in number_set:
-            length += 1
-            current -= 1
-        return length
+    def _expand_gap_ranges(self,
+                           gap_ranges: List[Tuple[int, int]],
+                           limit: int = _MAX_LISTED_SKIPPED_NUMBERS) -> List[int]:
+        """Return at most ``limit`` skipped numbers from ``gap_ranges``, in ascending order."""
+        numbers: List[int] = []
+        for first, last in gap_ranges:
+            remaining = limit - len(numbers)
+            if remaining <= 0:
+                break
+            numbers.extend(range(first, min(last, first + remaining - 1) + 1))
+        return numbers
 
     def _find_novel_gaps_between_layers(
         self,
         original_numbers: List[int],
         new_numbers: List[int],
-        all_numbers: List[int],
-    ) -> List[int]:
+        sorted_all_numbers: List[int],
+    ) -> List[Tuple[int, int]]:
         """
-        Return numbering gaps that should be reported at import time.
+        Return numbering gap ranges that should be reported at import time.
 
         Pre-existing holes in the definitive layer alone are ignored, except when a
         temporary object continues immediately after a consecutive definitive block and
         leaves a gap before the next imported number (e.g. definitive 1-2-3 and 10,
         imported 5 -> warn for 4 but not for 6-9 before definitive 10).
+
+        Every combined gap lies between two consecutive numbers of the merged
+        sequence, so one pass over ``sorted_all_numbers`` classifies each gap range:
+        the parts outside the definitive span are always novel, and the part inside
+        it is novel only under the consecutive-block rule above.
         """
-        sorted_all = sorted(all_numbers)
         original_set = set(original_numbers)
         new_set = set(new_numbers)
-        combined_gaps = self._find_gaps_in_sequence(sorted_all)
+        has_definitive_span = len(original_set) >= 2
+        if has_definitive_span:
+            definitive_min = min(original_set)
+            definitive_max = max(original_set)
 
-        gaps_in_definitive_only: List[int] = []
-        if len(original_numbers) >= 2:
-            gaps_in_definitive_only = self._find_gaps_in_sequence(sorted(original_numbers))
-        definitive_gap_set = set(gaps_in_definitive_only)
+        novel_gaps: List[Tuple[int, int]] = []
+        for lower_neighbor, upper_neighbor in zip(sorted_all_numbers, sorted_all_numbers[1:]):
+            if upper_neighbor - lower_neighbor <= 1:
+                continue
+            first, last = lower_neighbor + 1, upper_neighbor - 1
+            if not has_definitive_span:
+                novel_gaps.append((first, last))
+                continue
 
-        novel_gaps: List[int] = []
-        for gap in combined_gaps:
-            if gap not in definitive_gap_set:
-                novel_gaps.append(gap)
+            # Numbers strictly between the definitive min and max are definitive-only gaps.
+            inside_first = max(first, definitive_min + 1)
+            inside_last = min(last, definitive_max - 1)
+            if inside_first > inside_last:
+                novel_gaps.append((first, last))
                 continue
 
-            lower_neighbor = max(number for number in sorted_all if number < gap)
-            upper_neighbor = min(number for number in sorted_all if number > gap)
+            if first < inside_first:
+                novel_gaps.append((first, inside_first - 1))
             if (
                 lower_neighbor in original_set
                 and upper_neighbor in new_set
-                and self._consecutive_run_length_ending_at(sorted(original_numbers), lower_neighbor) >= 2
+                and lower_neighbor - 1 in original_set
             ):
-                novel_gaps.append(gap)
+                novel_gaps.append((inside_first, inside_last))
+            if inside_last < last:
+                novel_gaps.append((inside_last + 1, last))
+
+        return self._merge_adjacent_ranges(novel_gaps)
 
-        return novel_gaps
+    def _merge_adjacent_ranges(self, ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Merge ascending ranges that touch each other into single ranges."""
+        merged: List[Tuple[int, int]] = []
+        for first, last in ranges:
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+            else:
+                merged.append((first, last))
+        return merged
 
-    def _get_context_numbers_for_gaps(self, numbers: List[int], gaps: List[int]) -> List[int]:
+    def _get_context_numbers_for_gaps(self,
+                                      sorted_numbers: List[int],
+                                      gap_ranges: List[Tuple[int, int]]) -> List[int]:
         """
-        Get the numbers before and after gaps to provide context.
+        Get the existing numbers right before and after each gap.
+        
+        Neighbours are found by bisection, so the cost grows with the number of
+        gaps and objects, not with the width of the gaps. The skipped numbers
+        themselves are not included since no feature carries them.
         
         Args:
-            numbers: List of sorted integers
-            gaps: List of missing numbers (gaps)
+            sorted_numbers: Sorted integers present in the layer(s)
+            gap_ranges: Inclusive (first, last) ranges of missing numbers
             
         Returns:
-            List of numbers including gaps and their context (before/after)
+            Sorted list of neighbouring numbers
         """
-        if not gaps or not numbers:
-            return gaps
+        if not gap_ranges or not sorted_numbers:
+            return []
         
-        context_numbers = set(gaps)  # Start with the gaps
+        context_numbers = set()
+        for first, last in gap_ranges:
+            before_idx = bisect_left(sorted_numbers, first) - 1
+            if before_idx >= 0:
+                context_numbers.add(sorted_numbers[before_idx])
+            after_idx = bisect_right(sorted_numbers, last)
+            if after_idx < len(sorted_numbers):
+                context_numbers.add(sorted_numbers[after_idx])
         
-        # Find numbers before and after each gap
-        for gap in gaps:
-            # Find the number before the gap
-            for num in numbers:
-                if num < gap:
-                    context_numbers.add(num)
-                else:
-                    break
-            
-            # Find the number after the gap
-            for num in numbers:
-                if num > gap:
-                    context_numbers.add(num)
-                    break
-        
-        return sorted(list(context_numbers))
+        return sorted(context_numbers)
     
     def _detect_skipped_numbers_between_layers(self, 
                                              original_objects_layer: Any, 
@@ -366,7 +414,11 @@ class SkippedNumbersDetectorService(QObject):
             new_recording_area_objects = {}
             
             # Process original objects
-            for feature in original_objects_layer.getFeatures():
+            for feature in iter_features(
+                original_objects_layer,
+                (original_number_field_idx, original_recording_area_field_idx),
+                with_geometry=False,
+            ):
                 maybe_yield_to_ui()
                 recording_area_id = feature.attribute(original_recording_area_field_idx)
                 number = feature.attribute(original_number_field_idx)
@@ -382,7 +434,11 @@ class SkippedNumbersDetectorService(QObject):
                         pass
             
             # Process new objects
-            for feature in new_objects_layer.getFeatures():
+            for feature in iter_features(
+                new_objects_layer,
+                (new_number_field_idx, new_recording_area_field_idx),
+                with_geometry=False,
+            ):
                 maybe_yield_to_ui()
                 recording_area_id = feature.attribute(new_recording_area_field_idx)
                 number = feature.attribute(new_number_field_idx)
@@ -399,6 +455,7 @@ class SkippedNumbersDetectorService(QObject):
             
             # Check for gaps in each recording area
             all_recording_areas = set(original_recording_area_objects.keys()) | set(new_recording_area_objects.keys())
+            recording_area_names = self._create_recording_area_name_index(recording_areas_layer)
             
             for recording_area_id in all_recording_areas:
                 original_numbers = original_recording_area_objects.get(recording_area_id, [])
@@ -420,10 +477,13 @@ class SkippedNumbersDetectorService(QObject):
 
                 if novel_gaps:
                     # Get recording area name
-                    recording_area_name = self._get_recording_area_name(recording_areas_layer, recording_area_id)
+                    recording_area_name = self._get_recording_area_name(
+                        recording_areas_layer, recording_area_id, recording_area_names
+                    )
                     
-                    # Get context numbers (gaps + before/after)
+                    # Get context numbers (existing numbers right before/after each gap)
                     context_numbers = self._get_context_numbers_for_gaps(all_numbers, novel_gaps)
+                    context_filter = f'"{recording_area_field}" = \'{recording_area_id}\' AND "{number_field}" IN ({",".join(map(str, context_numbers))})'
                     
                     # Create structured warning data for between-layer skipped numbers
                     warning_data = WarningData(
@@ -432,15 +492,16 @@ class SkippedNumbersDetectorService(QObject):
                         ),
                         recording_area_name=recording_area_name,
                         layer_name=original_objects_layer.name(),
-                        filter_expression=f'"{recording_area_field}" = \'{recording_area_id}\' AND "{number_field}" IN ({",".join(map(str, context_numbers))})',
-                        skipped_numbers=novel_gaps,
+                        filter_expression=context_filter,
+                        skipped_numbers=self._expand_gap_ranges(novel_gaps),
+                        skipped_number_ranges=novel_gaps,
                         second_layer_name="New Objects",
-                        second_filter_expression=f'"{recording_area_field}" = \'{recording_area_id}\' AND "{number_field}" IN ({",".join(map(str, context_numbers))})'
+                        second_filter_expression=context_filter
                     )
                     warnings.append(warning_data)
             
         except Exception as e:
-            print(f"[DEBUG] Error in _detect_skipped_numbers_between_layers: {e}")
+            _diag.warning("Error in _detect_skipped_numbers_between_layers: %s", e)
             import traceback
             traceback.print_exc()
         
@@ -458,61 +519,49 @@ class SkippedNumbersDetectorService(QObject):
             The field name that references the recording areas layer, or None if not found
         """
         try:
-            # Get the relation manager
-            project = QgsProject.instance()
-            relation_manager = project.relationManager()
-            
-            # Find relations where the objects layer is the referencing layer
+            # Relation where the objects layer is the referencing layer
             # and the recording areas layer is the referenced layer
-            for relation in relation_manager.relations().values():
-                if (relation.referencingLayer() == objects_layer and 
-                    relation.referencedLayer() == recording_areas_layer):
-                    
-                    # Get the field pairs
-                    field_pairs = relation.fieldPairs()
-                    
-                    # Return the first referencing field (should be the recording area field)
-                    if field_pairs:
-                        recording_area_field = list(field_pairs.keys())[0]
-                        return recording_area_field
+            relation = get_relation_graph().relation_from(objects_layer, recording_areas_layer)
+            if relation:
+                field_pairs = relation.fieldPairs()
+                
+                # Return the first referencing field (should be the recording area field)
+                if field_pairs:
+                    return list(field_pairs.keys())[0]
             
             return None
             
         except Exception as e:
             return None
     
-    def _get_recording_area_name(self, recording_areas_layer: Any, recording_area_id: Any) -> str:
+    def _get_recording_area_name(self,
+                                 recording_areas_layer: Any,
+                                 recording_area_id: Any,
+                                 recording_area_names: Optional[RecordingAreaNameIndex] = None) -> str:
         """
         Get the name of a recording area by its ID.
         
         Args:
             recording_areas_layer: The recording areas layer
             recording_area_id: The ID of the recording area
+            recording_area_names: Optional per-run name index for the recording areas layer
             
         Returns:
             The name of the recording area, or the ID as string if name not found
         """
         try:
-            # Try to find a name field
-            name_fields = ['name', 'title', 'label', 'description', 'comment']
-            for field_name in name_fields:
-                field_idx = recording_areas_layer.fields().indexOf(field_name)
-                if field_idx >= 0:
-                    # Find the feature with this ID
-                    for feature in recording_areas_layer.getFeatures():
-                        maybe_yield_to_ui()
-                        if feature.id() == recording_area_id:
-                            name_value = feature[field_idx]
-                            if name_value and str(name_value) != 'NULL':
-                                return str(name_value)
-            
-            # Fallback to ID if no name found
-            return str(recording_area_id)
+            if recording_area_names is None:
+                recording_area_names = self._create_recording_area_name_index(recording_areas_layer)
+            return recording_area_names.name(recording_area_id)
             
         except Exception as e:
             print(f"Error getting recording area name: {e}")
             return str(recording_area_id)
     
+    def _create_recording_area_name_index(self, recording_areas_layer: Any) -> RecordingAreaNameIndex:
+        """Index recording area names by feature id, using the first non-empty name field."""
+        return RecordingAreaNameIndex(recording_areas_layer, key_fields=(), use_display_expression=False)
+    
     def _find_layer_by_name(self, layer_name: str) -> Optional[Any]:
         """
         Find a layer by name in the current QGIS project.
@@ -533,20 +582,43 @@ class SkippedNumbersDetectorService(QObject):
             print(f"Error finding layer by name: {e}")
             return None
     
-    def _create_skipped_numbers_warning(self, recording_area_name: str, gaps: List[int], layer_name: str) -> str:
+    def _format_gap_ranges(self, gap_ranges: List[Tuple[int, int]]) -> str:
+        """
+        Format gap ranges for display, e.g. ``[2, 4, 6-9]``.
+
+        At most ``_MAX_LISTED_GAP_RANGES`` ranges are listed; the rest are summarised.
+        """
+        parts = []
+        for first, last in gap_ranges[:_MAX_LISTED_GAP_RANGES]:
+            if first == last:
+                parts.append(str(first))
+            elif last == first + 1:
+                parts.extend((str(first), str(last)))
+            else:
+                parts.append(f"{first}-{last}")
+        hidden_count = len(gap_ranges) - _MAX_LISTED_GAP_RANGES
+        if hidden_count > 0:
+            parts.append(f"... (+{hidden_count} more ranges)")
+        return f"[{', '.join(parts)}]"
+
+    def _create_skipped_numbers_warning(self,
+                                        recording_area_name: str,
+                                        gap_ranges: List[Tuple[int, int]],
+                                        layer_name: str) -> str:
         """
         Create a warning message for skipped numbers.
         
         Args:
             recording_area_name: The name of the recording area
-            gaps: List of skipped numbers
+            gap_ranges: Inclusive (first, last) ranges of skipped numbers
             layer_name: The name of the layer where gaps were found
             
         Returns:
             The warning message
         """
+        gaps_text = self._format_gap_ranges(gap_ranges)
         try:
-            message = self.tr(f"Recording Area '{recording_area_name}' has skipped numbers: {gaps} in {layer_name}")
+            message = self.tr(f"Recording Area '{recording_area_name}' has skipped numbers: {gaps_text} in {layer_name}")
         except Exception:
-            message = f"Recording Area '{recording_area_name}' has skipped numbers: {gaps} in {layer_name}"
-        return message 
\ No newline at end of file
+            message = f"Recording Area '{recording_area_name}' has skipped numbers: {gaps_text} in {layer_name}"
+        return message
@@ -0,0 +1,9 @@
+"""
+Benchmark suite for ArcheoSync on synthetic excavation data.
+
+- ``synthetic_data``: deterministic dataset generation (pure Python)
+- ``qgis_project``: writes a dataset as GeoPackages, a topo CSV and field projects
+- ``stages``: the timed pipeline stages
+- ``baselines``: baseline storage and regression comparison
+- ``run_benchmarks``: command-line entry point (``make benchmark``)
+"""
@@ -0,0 +1,109 @@
+"""
+Store benchmark results and compare them against stored baselines.
+
+Baseline files map ``size -> step name -> median wall time in milliseconds``. A step
+regresses when it is slower than its baseline by more than the relative
+``tolerance`` *and* by more than ``min_delta_ms``; the absolute floor keeps
+millisecond-sized steps from flagging on timer noise. Steps without a baseline
+cannot be checked and are reported as missing rather than passing.
+"""
+
+import json
+import os
+import statistics
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+try:
+    from core.data_structures import StepMetrics
+except ImportError:
+    from ...core.data_structures import StepMetrics
+
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA_MS = 20.0
+
+
+@dataclass
+class StepComparison:
+    """Result of comparing one step against its baseline."""
+    size_name: str
+    step_name: str
+    wall_time_ms: float
+    baseline_ms: Optional[float]
+    regressed: bool
+
+    @property
+    def missing(self) -> bool:
+        """True when no baseline exists for this size and step."""
+        return self.baseline_ms is None
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change against the baseline (0.1 means 10% slower)."""
+        if not self.baseline_ms:
+            return None
+        return (self.wall_time_ms - self.baseline_ms) / self.baseline_ms
+
+
+def median_wall_times(runs: List[List[StepMetrics]]) -> Dict[str, float]:
+    """Return the median wall time per step name over repeated runs."""
+    samples: Dict[str, List[float]] = {}
+    for metrics in runs:
+        for step in metrics:
+            samples.setdefault(step.name, []).append(step.wall_time_ms)
+    return {name: round(statistics.median(values), 3) for name, values in samples.items()}
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    """Load a baseline file; a missing file is an empty baseline."""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as baseline_file:
+        return json.load(baseline_file).get('sizes', {})
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, float]], environment: Dict[str, str]) -> None:
+    """Write ``results`` as the new baseline, keeping sizes that were not re-run."""
+    sizes = load_baseline(path)
+    sizes.update(results)
+    with open(path, 'w', encoding='utf-8') as baseline_file:
+        json.dump({'environment': environment, 'sizes': sizes}, baseline_file, indent=2, sort_keys=True)
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> List[StepComparison]:
+    """Compare median wall times per size and step; steps without baseline are marked missing."""
+    comparisons = []
+    for size_name, steps in results.items():
+        size_baseline = baseline.get(size_name, {})
+        for step_name, wall_time_ms in steps.items():
+            baseline_ms = size_baseline.get(step_name)
+            regressed = (
+                baseline_ms is not None
+                and wall_time_ms > baseline_ms * (1.0 + tolerance)
+                and wall_time_ms - baseline_ms > min_delta_ms
+            )
+            comparisons.append(StepComparison(size_name, step_name, wall_time_ms, baseline_ms, regressed))
+    return comparisons
+
+
+def format_comparisons(comparisons: List[StepComparison]) -> str:
+    """Render comparisons as a plain-text table."""
+    lines = [f"{'Size':<8} {'Step':<40} {'Median (ms)':>12} {'Baseline':>10} {'Change':>8}"]
+    for comparison in comparisons:
+        baseline = f"{comparison.baseline_ms:.1f}" if comparison.baseline_ms is not None else "-"
+        change = f"{comparison.change:+.0%}" if comparison.change is not None else "-"
+        marker = ""
+        if comparison.regressed:
+            marker = "  REGRESSION"
+        elif comparison.missing:
+            marker = "  NO BASELINE"
+        lines.append(
+            f"{comparison.size_name:<8} {comparison.step_name:<40} "
+            f"{comparison.wall_time_ms:>12.1f} {baseline:>10} {change:>8}{marker}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,237 @@
+"""
+Materialize a :class:`SyntheticDataset` as a QGIS project for benchmarking.
+
+Definitive layers are written to GeoPackages and loaded into ``QgsProject.instance()``
+with the relations the detectors follow. The pending import is written as a topo CSV
+and one directory of GeoPackages per field project, so the benchmark exercises the
+real CSV and field project import services. Plugin settings come from an
+:class:`InMemorySettingsManager` instead of ``QSettings``.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsProject,
+    QgsRelation,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+)
+
+try:
+    from services.settings_service import InMemorySettingsManager
+except ImportError:
+    from ...services.settings_service import InMemorySettingsManager
+
+from .synthetic_data import CRS_AUTHID, ExcavationEntity, SyntheticDataset, TopoPoint, write_topo_csv
+
+RECORDING_AREAS_LAYER_NAME = "Recording Areas"
+OBJECTS_LAYER_NAME = "Objects"
+FEATURES_LAYER_NAME = "Features"
+SMALL_FINDS_LAYER_NAME = "Small Finds"
+TOTAL_STATION_POINTS_LAYER_NAME = "Total Station Points"
+
+_ENTITY_FIELDS = "field=number:integer&field=recording_area:integer&field=level:string(20)"
+
+
+@dataclass
+class BenchmarkProject:
+    """Paths, layers and settings of one materialized dataset."""
+    dataset: SyntheticDataset
+    work_dir: str
+    settings_manager: InMemorySettingsManager
+    layer_ids: Dict[str, str]
+    csv_path: str
+    field_project_paths: List[str] = field(default_factory=list)
+
+
+def _memory_layer(geometry: str, fields: str, name: str) -> QgsVectorLayer:
+    layer = QgsVectorLayer(f"{geometry}?crs={CRS_AUTHID}&{fields}", name, "memory")
+    if not layer.isValid():
+        raise RuntimeError(f"Could not create memory layer {name}")
+    return layer
+
+
+def _add_features(layer: QgsVectorLayer, rows: List[tuple]) -> None:
+    """Add ``(wkt, attributes)`` rows through the data provider in one call."""
+    features = []
+    for wkt, attributes in rows:
+        feature = QgsFeature(layer.fields())
+        feature.setGeometry(QgsGeometry.fromWkt(wkt))
+        feature.setAttributes(list(attributes))
+        features.append(feature)
+    layer.dataProvider().addFeatures(features)
+    layer.updateExtents()
+
+
+def _write_geopackage(layer: QgsVectorLayer, output_path: str, layer_name: str) -> None:
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    options.layerName = layer_name
+    if hasattr(QgsVectorFileWriter, "writeAsVectorFormatV3"):
+        result = QgsVectorFileWriter.writeAsVectorFormatV3(
+            layer, output_path, QgsProject.instance().transformContext(), options
+        )
+    else:
+        result = QgsVectorFileWriter.writeAsVectorFormatV2(layer, output_path, options)
+    if result[0] != QgsVectorFileWriter.NoError:
+        raise RuntimeError(f"Could not write {output_path}: {result[1]}")
+
+
+def _entity_rows(entities: List[ExcavationEntity], geometry: Callable[[ExcavationEntity], str]) -> List[tuple]:
+    return [
+        (geometry(entity), (entity.number, entity.recording_area_fid, entity.level))
+        for entity in entities
+    ]
+
+
+def _object_rows(entities: List[ExcavationEntity]) -> List[tuple]:
+    return [
+        (entity.polygon_wkt, (entity.number, entity.recording_area_fid, entity.level, entity.object_id))
+        for entity in entities
+    ]
+
+
+def _point_rows(points: List[TopoPoint]) -> List[tuple]:
+    return [
+        (f"PointZ({point.x:.3f} {point.y:.3f} {point.z:.3f})", (point.identifier, point.object_id, point.z))
+        for point in points
+    ]
+
+
+def _layer_sources(dataset: SyntheticDataset, definitive: bool) -> Dict[str, tuple]:
+    """Return ``{layer name: (geometry, fields, rows)}`` for definitive or imported records."""
+    objects = dataset.definitive_objects if definitive else dataset.import_objects
+    features = dataset.definitive_features if definitive else dataset.import_features
+    small_finds = dataset.definitive_small_finds if definitive else dataset.import_small_finds
+    return {
+        OBJECTS_LAYER_NAME: (
+            "Polygon", _ENTITY_FIELDS + "&field=object_id:string(20)", _object_rows(objects),
+        ),
+        FEATURES_LAYER_NAME: (
+            "Polygon", _ENTITY_FIELDS, _entity_rows(features, lambda entity: entity.polygon_wkt),
+        ),
+        SMALL_FINDS_LAYER_NAME: (
+            "Point", _ENTITY_FIELDS, _entity_rows(small_finds, lambda entity: entity.point_wkt),
+        ),
+    }
+
+
+def _load_definitive_layer(
+    project: QgsProject, work_dir: str, name: str, geometry: str, fields: str, rows: List[tuple]
+) -> QgsVectorLayer:
+    source = _memory_layer(geometry, fields, name)
+    _add_features(source, rows)
+    path = os.path.join(work_dir, "definitive", f"{name}.gpkg")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _write_geopackage(source, path, name)
+    layer = QgsVectorLayer(f"{path}|layername={name}", name, "ogr")
+    if not layer.isValid():
+        raise RuntimeError(f"Could not load {path}")
+    project.addMapLayer(layer)
+    return layer
+
+
+def _add_relation(
+    project: QgsProject, relation_id: str, referencing: QgsVectorLayer, referencing_field: str,
+    referenced: QgsVectorLayer, referenced_field: str,
+) -> None:
+    relation = QgsRelation()
+    relation.setId(relation_id)
+    relation.setName(relation_id)
+    relation.setReferencingLayer(referencing.id())
+    relation.setReferencedLayer(referenced.id())
+    relation.addFieldPair(referencing_field, referenced_field)
+    if not relation.isValid():
+        raise RuntimeError(f"Invalid benchmark relation {relation_id}")
+    project.relationManager().addRelation(relation)
+
+
+def build_benchmark_project(dataset: SyntheticDataset, work_dir: str) -> BenchmarkProject:
+    """
+    Replace the current project content with ``dataset`` and return its description.
+
+    Args:
+        dataset: Generated dataset
+        work_dir: Empty directory receiving GeoPackages, the CSV and field projects
+    """
+    project = QgsProject.instance()
+    project.clear()
+
+    recording_areas = _load_definitive_layer(
+        project, work_dir, RECORDING_AREAS_LAYER_NAME, "Polygon", "field=name:string(50)",
+        [(area.wkt, (area.name,)) for area in dataset.recording_areas],
+    )
+    layers = {'recording_areas_layer': recording_areas}
+    for setting_key, (name, (geometry, fields, rows)) in zip(
+        ('objects_layer', 'features_layer', 'small_finds_layer'),
+        _layer_sources(dataset, definitive=True).items(),
+    ):
+        layers[setting_key] = _load_definitive_layer(project, work_dir, name, geometry, fields, rows)
+    layers['total_station_points_layer'] = _load_definitive_layer(
+        project, work_dir, TOTAL_STATION_POINTS_LAYER_NAME, "PointZ",
+        "field=identifier:string(20)&field=object_id:string(20)&field=Z:double",
+        _point_rows(dataset.definitive_points),
+    )
+
+    for setting_key in ('objects_layer', 'features_layer', 'small_finds_layer'):
+        _add_relation(
+            project, f"bench_{setting_key}_recording_area",
+            layers[setting_key], 'recording_area', recording_areas, 'fid',
+        )
+    _add_relation(
+        project, "bench_points_objects",
+        layers['total_station_points_layer'], 'object_id', layers['objects_layer'], 'object_id',
+    )
+
+    settings_manager = InMemorySettingsManager({
+        setting_key: layer.id() for setting_key, layer in layers.items()
+    })
+    settings_manager.set_value('objects_number_field', 'number')
+    settings_manager.set_value('objects_recording_area_field', 'recording_area')
+    settings_manager.set_value('objects_level_field', 'level')
+
+    csv_path = os.path.join(work_dir, "topo_import.csv")
+    write_topo_csv(dataset.import_points, csv_path)
+
+    return BenchmarkProject(
+        dataset=dataset,
+        work_dir=work_dir,
+        settings_manager=settings_manager,
+        layer_ids={setting_key: layer.id() for setting_key, layer in layers.items()},
+        csv_path=csv_path,
+        field_project_paths=_write_field_projects(dataset, work_dir),
+    )
+
+
+def _write_field_projects(dataset: SyntheticDataset, work_dir: str) -> List[str]:
+    """Write one directory of GeoPackages, named after the definitive layers, per field project."""
+    project_count = 1 + max(
+        (entity.field_project for entity in dataset.import_objects + dataset.import_features
+         + dataset.import_small_finds),
+        default=0,
+    )
+    paths = []
+    for project_index in range(project_count):
+        project_dir = os.path.join(work_dir, "field_projects", f"Sondage_{project_index + 1:02d}")
+        os.makedirs(project_dir, exist_ok=True)
+        project_dataset = _field_project_subset(dataset, project_index)
+        for name, (geometry, fields, rows) in _layer_sources(project_dataset, definitive=False).items():
+            layer = _memory_layer(geometry, fields, name)
+            _add_features(layer, rows)
+            _write_geopackage(layer, os.path.join(project_dir, f"{name}.gpkg"), name)
+        paths.append(project_dir)
+    return paths
+
+
+def _field_project_subset(dataset: SyntheticDataset, project_index: int) -> SyntheticDataset:
+    def keep(entities: List[ExcavationEntity]) -> List[ExcavationEntity]:
+        return [entity for entity in entities if entity.field_project == project_index]
+
+    return SyntheticDataset(
+        dataset.size_name, dataset.seed, dataset.recording_areas, [], [], [], [],
+        keep(dataset.import_objects), keep(dataset.import_features), keep(dataset.import_small_finds), [],
+    )
@@ -0,0 +1,147 @@
+"""
+Run the ArcheoSync benchmark suite headless.
+
+Usage (from the plugin root, with the QGIS Python environment sourced)::
+
+    python -m test.benchmarks.run_benchmarks --sizes small medium --repeat 3
+    python -m test.benchmarks.run_benchmarks --sizes small --update-baseline
+
+For every size, a synthetic dataset is materialized once in a temporary directory,
+then the pipeline (CSV import, field project import, each detector, validation) is
+run ``--repeat`` times. Median wall times per step are compared against the baseline
+file; the exit status is 1 when any step regressed and 2 when the baseline file, or
+the baseline of a benchmarked step, is missing (record one with ``--update-baseline``
+on the reference machine). Baselines depend on the machine, so none ships with the
+plugin.
+"""
+
+import argparse
+import os
+import platform
+import sys
+import tempfile
+from typing import Dict, List
+
+# Qt must not try to open a display on CI machines.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from core.data_structures import StepMetrics
+    from core.performance import PerformanceRecorder
+except ImportError:
+    from ...core.data_structures import StepMetrics
+    from ...core.performance import PerformanceRecorder
+
+from .baselines import (
+    DEFAULT_MIN_DELTA_MS,
+    DEFAULT_TOLERANCE,
+    compare_to_baseline,
+    format_comparisons,
+    load_baseline,
+    median_wall_times,
+    save_baseline,
+)
+from .synthetic_data import SIZES, generate_dataset
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def _parse_arguments(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark ArcheoSync on synthetic excavation data.")
+    parser.add_argument('--sizes', nargs='+', choices=sorted(SIZES), default=['small', 'medium'])
+    parser.add_argument('--repeat', type=int, default=3, help="Pipeline runs per size (median is kept)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Store this run as the new baseline instead of comparing")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown before a step counts as a regression")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Slowdowns smaller than this never count as regressions")
+    parser.add_argument('--output', help="Write every run's step metrics to this JSON file")
+    return parser.parse_args(argv)
+
+
+def _environment() -> Dict[str, str]:
+    from qgis.core import Qgis
+
+    return {
+        'python': platform.python_version(),
+        'qgis': Qgis.QGIS_VERSION,
+        'platform': platform.platform(),
+    }
+
+
+def run_size(size_name: str, repeat: int, seed: int) -> List[List[StepMetrics]]:
+    """Materialize one dataset and run the pipeline ``repeat`` times."""
+    from .qgis_project import build_benchmark_project
+    from .stages import run_pipeline
+
+    dataset = generate_dataset(size_name, seed=seed)
+    runs = []
+    with tempfile.TemporaryDirectory(prefix=f"archeosync_bench_{size_name}_") as work_dir:
+        project = build_benchmark_project(dataset, work_dir)
+        for _ in range(max(1, repeat)):
+            recorder = PerformanceRecorder()
+            run_pipeline(project, recorder)
+            runs.append(recorder.metrics)
+    return runs
+
+
+def main(argv: List[str] = None) -> int:
+    arguments = _parse_arguments(sys.argv[1:] if argv is None else argv)
+
+    try:
+        from ..utilities import get_qgis_app
+    except ImportError:
+        from test.utilities import get_qgis_app
+    if get_qgis_app()[0] is None:
+        print("QGIS is not available; source the QGIS environment before running benchmarks.")
+        return 2
+    if not arguments.update_baseline and not os.path.exists(arguments.baseline):
+        print(
+            f"No baseline at {arguments.baseline}; record one with --update-baseline "
+            "before comparing benchmark runs."
+        )
+        return 2
+
+    results: Dict[str, Dict[str, float]] = {}
+    all_runs: Dict[str, List[List[dict]]] = {}
+    for size_name in arguments.sizes:
+        print(f"Running {size_name} ({arguments.repeat} runs)...")
+        runs = run_size(size_name, arguments.repeat, arguments.seed)
+        results[size_name] = median_wall_times(runs)
+        all_runs[size_name] = [[step.to_dict() for step in metrics] for metrics in runs]
+
+    if arguments.output:
+        import json
+
+        with open(arguments.output, 'w', encoding='utf-8') as output:
+            json.dump({'environment': _environment(), 'medians': results, 'runs': all_runs}, output, indent=2)
+
+    if arguments.update_baseline:
+        save_baseline(arguments.baseline, results, _environment())
+        print(f"Baseline written to {arguments.baseline}")
+        return 0
+
+    comparisons = compare_to_baseline(
+        results,
+        load_baseline(arguments.baseline),
+        tolerance=arguments.tolerance,
+        min_delta_ms=arguments.min_delta_ms,
+    )
+    print(format_comparisons(comparisons))
+    if any(comparison.regressed for comparison in comparisons):
+        return 1
+    missing = [comparison for comparison in comparisons if comparison.missing]
+    if missing:
+        print(
+            f"{len(missing)} step(s) have no baseline in {arguments.baseline}; "
+            "update it with --update-baseline."
+        )
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Pipeline stages timed by the benchmark suite.
+
+Each stage calls the same services the plugin uses and is measured with
+:class:`PerformanceRecorder`, so benchmark results carry the same wall/CPU time,
+feature and cache counts as the import summary's performance panel.
+"""
+
+from typing import Callable, List, Tuple
+
+from qgis.core import QgsProject
+
+try:
+    from core.performance import (
+        CATEGORY_IMPORT,
+        CATEGORY_VALIDATION,
+        PerformanceRecorder,
+    )
+    from services.batch_validation_service import BatchValidationService
+    from services.csv_import_service import CSVImportService
+    from services.field_project_import_service import FieldProjectImportService
+    from services.import_validation_service import (
+        ImportFeatureCopier,
+        build_layer_copy_jobs,
+        copy_next_job_batch,
+        ensure_job_expression_context,
+        remove_pending_import_layers,
+    )
+    from services.layer_service import QGISLayerService
+except ImportError:
+    from ...core.performance import (
+        CATEGORY_IMPORT,
+        CATEGORY_VALIDATION,
+        PerformanceRecorder,
+    )
+    from ...services.batch_validation_service import BatchValidationService
+    from ...services.csv_import_service import CSVImportService
+    from ...services.field_project_import_service import FieldProjectImportService
+    from ...services.import_validation_service import (
+        ImportFeatureCopier,
+        build_layer_copy_jobs,
+        copy_next_job_batch,
+        ensure_job_expression_context,
+        remove_pending_import_layers,
+    )
+    from ...services.layer_service import QGISLayerService
+
+from .qgis_project import BenchmarkProject
+
+
+def _check(result, stage: str) -> None:
+    if not result.is_valid:
+        raise RuntimeError(f"{stage} failed: {result.message}")
+
+
+def run_csv_import(project: BenchmarkProject, recorder: PerformanceRecorder, layer_service) -> None:
+    service = CSVImportService(None, settings_manager=project.settings_manager, layer_service=layer_service)
+    with recorder.measure("CSV import", category=CATEGORY_IMPORT) as step:
+        column_mapping, _headers = service.get_column_mapping_and_headers([project.csv_path])
+        _check(service.import_csv_files([project.csv_path], column_mapping), "CSV import")
+        step.features_scanned += service.get_last_import_count()
+
+
+def run_field_project_import(project: BenchmarkProject, recorder: PerformanceRecorder, layer_service) -> None:
+    # The file system service is only used to archive projects, which benchmarks never do.
+    service = FieldProjectImportService(project.settings_manager, layer_service, None)
+    with recorder.measure("Field project import", category=CATEGORY_IMPORT):
+        _check(service.import_field_projects(project.field_project_paths), "Field project import")
+
+
+def run_detectors(project: BenchmarkProject, recorder: PerformanceRecorder, layer_service) -> int:
+    """Run the detector suite sequentially, one step per detector, and return the warning count."""
+    service = BatchValidationService(project.settings_manager, layer_service)
+    return service.run(workers=1, recorder=recorder).warning_count()
+
+
+def run_validation(project: BenchmarkProject, recorder: PerformanceRecorder) -> None:
+    """
+    Copy the pending import into the definitive layers, then roll the edits back.
+
+    Rolling back keeps the definitive GeoPackages identical between repeats.
+    """
+    jobs = build_layer_copy_jobs(QgsProject.instance().mapLayers(), project.settings_manager.get_value)
+    copier = ImportFeatureCopier()
+    try:
+        for job in jobs:
+            with recorder.measure(f"Validation: {job.temp_layer_name}", category=CATEGORY_VALIDATION) as step:
+                ensure_job_expression_context(job)
+                while not job.load_complete:
+                    copy_next_job_batch(job, copier)
+                step.features_scanned += job.feature_index
+    finally:
+        for job in jobs:
+            if job.target_layer.isEditable():
+                job.target_layer.rollBack()
+
+
+# Stage runners in pipeline order; each receives (project, recorder, layer_service).
+PIPELINE: List[Tuple[str, Callable]] = [
+    ("csv_import", run_csv_import),
+    ("field_project_import", run_field_project_import),
+    ("detectors", run_detectors),
+    ("validation", lambda project, recorder, layer_service: run_validation(project, recorder)),
+]
+
+
+def run_pipeline(project: BenchmarkProject, recorder: PerformanceRecorder) -> None:
+    """Run every stage once against ``project`` and remove the pending import afterwards."""
+    layer_service = QGISLayerService()
+    try:
+        for _stage, runner in PIPELINE:
+            runner(project, recorder, layer_service)
+    finally:
+        remove_pending_import_layers(
+            QgsProject.instance(),
+            layer_service=layer_service,
+            get_setting=project.settings_manager.get_value,
+        )
@@ -0,0 +1,322 @@
+"""
+Deterministic synthetic excavation datasets for the benchmark suite.
+
+Generation is pure Python so datasets can be inspected and tested without QGIS;
+``qgis_project`` turns them into GeoPackage layers, a topo CSV and field projects.
+
+A dataset is a grid of square recording areas. Objects are clustered around a few
+excavation sectors per area, total station points are clustered around their object,
+and a configurable share of everything belongs to the pending import rather than the
+definitive layers. The import carries the anomalies the detectors look for: skipped
+and duplicate object numbers, objects without topo points, far-away or out-of-bounds
+points, height spikes and duplicate point identifiers.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+# Projected metric coordinates (RGF93 / Lambert-93), like a French excavation.
+CRS_AUTHID = "EPSG:2154"
+ORIGIN = (651000.0, 6861000.0)
+RECORDING_AREA_SIZE = 20.0
+BASE_ELEVATION = 48.0
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    """Counts describing one benchmark size."""
+    recording_areas: int
+    objects_per_area: int
+    points_per_object: int
+    features_per_area: int
+    small_finds_per_area: int
+    field_projects: int
+
+
+SIZES: Dict[str, DatasetSize] = {
+    'small': DatasetSize(4, 25, 3, 10, 10, 2),
+    'medium': DatasetSize(16, 100, 4, 40, 40, 4),
+    'large': DatasetSize(64, 250, 5, 100, 100, 8),
+}
+
+
+@dataclass
+class RecordingArea:
+    fid: int
+    name: str
+    xmin: float
+    ymin: float
+    size: float
+
+    @property
+    def wkt(self) -> str:
+        x0, y0 = self.xmin, self.ymin
+        x1, y1 = x0 + self.size, y0 + self.size
+        return f"Polygon(({x0} {y0}, {x1} {y0}, {x1} {y1}, {x0} {y1}, {x0} {y0}))"
+
+
+@dataclass
+class ExcavationEntity:
+    """An object, feature or small find; polygons are regular octagons."""
+    number: int
+    recording_area_fid: int
+    x: float
+    y: float
+    radius: float
+    level: str
+    # Stable key linking topo points to objects; unlike ``number`` it is never altered
+    object_id: str = ""
+    field_project: int = -1
+
+    @property
+    def polygon_wkt(self) -> str:
+        ring = [
+            (
+                self.x + self.radius * math.cos(step * math.pi / 4),
+                self.y + self.radius * math.sin(step * math.pi / 4),
+            )
+            for step in range(8)
+        ]
+        ring.append(ring[0])
+        return "Polygon((" + ", ".join(f"{x:.3f} {y:.3f}" for x, y in ring) + "))"
+
+    @property
+    def point_wkt(self) -> str:
+        return f"Point({self.x:.3f} {self.y:.3f})"
+
+
+@dataclass
+class TopoPoint:
+    identifier: str
+    x: float
+    y: float
+    z: float
+    object_id: str
+    recording_area_fid: int
+
+
+@dataclass
+class SyntheticDataset:
+    """Definitive records already in the project plus the pending import."""
+    size_name: str
+    seed: int
+    recording_areas: List[RecordingArea]
+    definitive_objects: List[ExcavationEntity]
+    definitive_features: List[ExcavationEntity]
+    definitive_small_finds: List[ExcavationEntity]
+    definitive_points: List[TopoPoint]
+    import_objects: List[ExcavationEntity]
+    import_features: List[ExcavationEntity]
+    import_small_finds: List[ExcavationEntity]
+    import_points: List[TopoPoint]
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            'recording_areas': len(self.recording_areas),
+            'definitive_objects': len(self.definitive_objects),
+            'definitive_features': len(self.definitive_features),
+            'definitive_small_finds': len(self.definitive_small_finds),
+            'definitive_points': len(self.definitive_points),
+            'import_objects': len(self.import_objects),
+            'import_features': len(self.import_features),
+            'import_small_finds': len(self.import_small_finds),
+            'import_points': len(self.import_points),
+        }
+
+
+def _sector_centers(rng: random.Random, area: RecordingArea, count: int) -> List[Tuple[float, float]]:
+    margin = area.size * 0.15
+    return [
+        (
+            rng.uniform(area.xmin + margin, area.xmin + area.size - margin),
+            rng.uniform(area.ymin + margin, area.ymin + area.size - margin),
+        )
+        for _ in range(count)
+    ]
+
+
+def _clustered_position(
+    rng: random.Random, area: RecordingArea, sectors: List[Tuple[float, float]]
+) -> Tuple[float, float]:
+    """Pick a position near one sector, clamped inside the recording area."""
+    cx, cy = rng.choice(sectors)
+    spread = area.size * 0.08
+    x = min(max(rng.gauss(cx, spread), area.xmin + 0.5), area.xmin + area.size - 0.5)
+    y = min(max(rng.gauss(cy, spread), area.ymin + 0.5), area.ymin + area.size - 0.5)
+    return x, y
+
+
+def _entities_for_area(
+    rng: random.Random,
+    area: RecordingArea,
+    sectors: List[Tuple[float, float]],
+    count: int,
+    radius: float,
+) -> List[ExcavationEntity]:
+    entities = []
+    for number in range(1, count + 1):
+        x, y = _clustered_position(rng, area, sectors)
+        level = f"US{1 + (number * 7) // max(count, 1)}"
+        entities.append(ExcavationEntity(
+            number, area.fid, x, y, radius * rng.uniform(0.6, 1.4), level, object_id=f"{area.fid}-{number}"
+        ))
+    return entities
+
+
+def _points_for_object(
+    rng: random.Random,
+    entity: ExcavationEntity,
+    count: int,
+    prefix: str,
+    next_id: List[int],
+) -> List[TopoPoint]:
+    points = []
+    surface = BASE_ELEVATION - 0.05 * int(entity.level[2:] or 1)
+    for _ in range(count):
+        next_id[0] += 1
+        points.append(TopoPoint(
+            identifier=f"{prefix}{next_id[0]:06d}",
+            x=rng.gauss(entity.x, entity.radius * 0.25),
+            y=rng.gauss(entity.y, entity.radius * 0.25),
+            z=rng.gauss(surface, 0.02),
+            object_id=entity.object_id,
+            recording_area_fid=entity.recording_area_fid,
+        ))
+    return points
+
+
+def _split_import(
+    entities: List[ExcavationEntity], import_fraction: float
+) -> Tuple[List[ExcavationEntity], List[ExcavationEntity]]:
+    """Keep the lowest numbers definitive; the highest numbers are the pending import."""
+    cut = len(entities) - max(1, int(round(len(entities) * import_fraction)))
+    return entities[:cut], entities[cut:]
+
+
+def generate_dataset(
+    size_name: str = 'small',
+    seed: int = 1,
+    import_fraction: float = 0.2,
+    anomaly_rate: float = 0.02,
+) -> SyntheticDataset:
+    """
+    Generate a reproducible dataset of the given size.
+
+    Args:
+        size_name: Key of :data:`SIZES`
+        seed: Random seed; the same seed always yields the same dataset
+        import_fraction: Share of each area's entities that belong to the pending import
+        anomaly_rate: Share of imported records carrying a detector-relevant anomaly
+    """
+    size = SIZES[size_name]
+    rng = random.Random(seed)
+    columns = max(1, int(math.ceil(math.sqrt(size.recording_areas))))
+
+    dataset = SyntheticDataset(size_name, seed, [], [], [], [], [], [], [], [], [])
+    definitive_ids = [0]
+    import_ids = [0]
+
+    for index in range(size.recording_areas):
+        fid = index + 1
+        area = RecordingArea(
+            fid=fid,
+            name=f"Sondage {fid}",
+            xmin=ORIGIN[0] + (index % columns) * RECORDING_AREA_SIZE * 1.5,
+            ymin=ORIGIN[1] + (index // columns) * RECORDING_AREA_SIZE * 1.5,
+            size=RECORDING_AREA_SIZE,
+        )
+        dataset.recording_areas.append(area)
+        sectors = _sector_centers(rng, area, rng.randint(3, 6))
+
+        objects = _entities_for_area(rng, area, sectors, size.objects_per_area, 0.35)
+        features = _entities_for_area(rng, area, sectors, size.features_per_area, 0.8)
+        small_finds = _entities_for_area(rng, area, sectors, size.small_finds_per_area, 0.05)
+
+        definitive, pending = _split_import(objects, import_fraction)
+        dataset.definitive_objects.extend(definitive)
+        dataset.import_objects.extend(pending)
+        definitive, pending = _split_import(features, import_fraction)
+        dataset.definitive_features.extend(definitive)
+        dataset.import_features.extend(pending)
+        definitive, pending = _split_import(small_finds, import_fraction)
+        dataset.definitive_small_finds.extend(definitive)
+        dataset.import_small_finds.extend(pending)
+
+    for entity in dataset.definitive_objects:
+        dataset.definitive_points.extend(
+            _points_for_object(rng, entity, size.points_per_object, "T", definitive_ids)
+        )
+    for entity in dataset.import_objects:
+        dataset.import_points.extend(
+            _points_for_object(rng, entity, size.points_per_object, "P", import_ids)
+        )
+
+    _assign_field_projects(dataset, size.field_projects)
+    _inject_anomalies(rng, dataset, anomaly_rate)
+    return dataset
+
+
+def _assign_field_projects(dataset: SyntheticDataset, project_count: int) -> None:
+    """Spread imported entities over field projects by recording area."""
+    for entities in (dataset.import_objects, dataset.import_features, dataset.import_small_finds):
+        for entity in entities:
+            entity.field_project = (entity.recording_area_fid - 1) % max(project_count, 1)
+
+
+def _inject_anomalies(rng: random.Random, dataset: SyntheticDataset, anomaly_rate: float) -> None:
+    """Add the problems each detector reports, at roughly ``anomaly_rate`` per category."""
+    def pick(records: list) -> list:
+        if not records:
+            return []
+        count = max(1, int(len(records) * anomaly_rate))
+        return rng.sample(records, min(count, len(records)))
+
+    areas = {area.fid: area for area in dataset.recording_areas}
+
+    # Skipped numbers: shift some imported objects past a gap.
+    for entity in pick(dataset.import_objects):
+        entity.number += 3
+    # Duplicate objects: copy a number onto another import object of the same area.
+    for entity in pick(dataset.import_objects):
+        same_area = [
+            other for other in dataset.import_objects
+            if other.recording_area_fid == entity.recording_area_fid and other is not entity
+        ]
+        if same_area:
+            entity.number = rng.choice(same_area).number
+    # Missing total station: drop every point of some imported objects.
+    missing = {entity.object_id for entity in pick(dataset.import_objects)}
+    dataset.import_points = [point for point in dataset.import_points if point.object_id not in missing]
+    # Distance: move some points away from their object.
+    for point in pick(dataset.import_points):
+        point.x += rng.choice((-1, 1)) * rng.uniform(1.0, 3.0)
+    # Out of bounds: move some points outside their recording area.
+    for point in pick(dataset.import_points):
+        area = areas[point.recording_area_fid]
+        point.x = area.xmin + area.size + rng.uniform(1.0, 4.0)
+    # Height difference: spike the elevation of some points.
+    for point in pick(dataset.import_points):
+        point.z += rng.choice((-1, 1)) * rng.uniform(0.5, 1.5)
+    # Duplicate identifiers: reuse definitive identifiers in the import.
+    if dataset.definitive_points:
+        for point in pick(dataset.import_points):
+            point.identifier = rng.choice(dataset.definitive_points).identifier
+
+
+def write_topo_csv(points: List[TopoPoint], path: str) -> None:
+    """Write total station points in the CSV layout the CSV import expects."""
+    import csv
+
+    with open(path, 'w', newline='', encoding='utf-8') as output:
+        writer = csv.writer(output)
+        writer.writerow(['identifier', 'X', 'Y', 'Z', 'object_id'])
+        for point in points:
+            writer.writerow([
+                point.identifier,
+                f"{point.x:.3f}",
+                f"{point.y:.3f}",
+                f"{point.z:.3f}",
+                point.object_id,
+            ])
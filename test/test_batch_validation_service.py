@@ -0,0 +1,165 @@
+"""
+Tests for BatchValidationService and the headless report writers.
+"""
+
+import csv
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock
+
+try:
+    from core.data_structures import WarningData
+    from services.batch_validation_service import (
+        DETECTOR_STEPS,
+        BatchValidationService,
+        DetectorStep,
+        write_csv_report,
+        write_json_report,
+    )
+    from services.settings_service import InMemorySettingsManager
+except ImportError:
+    from ..core.data_structures import WarningData
+    from ..services.batch_validation_service import (
+        DETECTOR_STEPS,
+        BatchValidationService,
+        DetectorStep,
+        write_csv_report,
+        write_json_report,
+    )
+    from ..services.settings_service import InMemorySettingsManager
+
+
+def _detector_class(result):
+    """Build a detector class whose ``detect`` method returns or raises ``result``."""
+    class FakeDetector:
+        def __init__(self, settings_manager, layer_service):
+            self.settings_manager = settings_manager
+
+        def detect(self, cancellation_token=None):
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    return FakeDetector
+
+
+class TestBatchValidationService(unittest.TestCase):
+    """Test cases for BatchValidationService."""
+
+    def setUp(self):
+        self.settings = InMemorySettingsManager({'objects_layer': 'objects_id'})
+        self.layer_service = Mock()
+        self.layer_service.get_layer_by_name.return_value = None
+        self.service = BatchValidationService(self.settings, self.layer_service)
+
+    def test_suite_covers_every_summary_warning_category(self):
+        self.assertEqual(len({step.result_key for step in DETECTOR_STEPS}), 7)
+
+    def test_run_collects_warnings_in_suite_order(self):
+        warning = WarningData("Skipped 4", "Sondage 1", "New Objects", '"number" = 5', skipped_numbers=[4])
+        steps = [
+            DetectorStep("skipped_numbers_warnings", "Skipped numbers", _detector_class([warning]), "detect"),
+            DetectorStep("distance_warnings", "Distances", _detector_class(["Far point"]), "detect"),
+        ]
+
+        report = self.service.run(steps=steps, project_path="/data/master.qgz")
+
+        self.assertEqual(report.warnings['skipped_numbers_warnings'], [warning])
+        self.assertEqual(report.warnings['distance_warnings'], ["Far point"])
+        self.assertEqual(report.warning_count(), 2)
+        self.assertEqual([step.name for step in report.metrics], ["Skipped numbers", "Distances"])
+        self.assertEqual(report.errors, {})
+
+    def test_failing_detector_does_not_stop_the_others(self):
+        steps = [
+            DetectorStep("distance_warnings", "Distances", _detector_class(RuntimeError("boom")), "detect"),
+            DetectorStep("height_difference_warnings", "Height differences", _detector_class(["Spike"]), "detect"),
+        ]
+
+        report = self.service.run(steps=steps)
+
+        self.assertEqual(report.errors, {'distance_warnings': "boom"})
+        self.assertEqual(report.warnings['distance_warnings'], [])
+        self.assertEqual(report.warnings['height_difference_warnings'], ["Spike"])
+
+    def test_detectors_run_one_after_another_on_the_calling_thread(self):
+        calling_thread = threading.get_ident()
+        detector_threads = []
+
+        class RecordingDetector:
+            def __init__(self, settings_manager, layer_service):
+                pass
+
+            def detect(self, cancellation_token=None):
+                detector_threads.append(threading.get_ident())
+                return []
+
+        steps = [
+            DetectorStep("distance_warnings", "Distances", RecordingDetector, "detect"),
+            DetectorStep("height_difference_warnings", "Height differences", RecordingDetector, "detect"),
+        ]
+
+        self.service.run(steps=steps)
+
+        self.assertEqual(detector_threads, [calling_thread, calling_thread])
+
+    def test_prepare_layers_copies_virtual_fields_to_pending_layers(self):
+        temp_layer = Mock()
+        definitive_layer = Mock()
+        self.layer_service.get_layer_by_name.side_effect = (
+            lambda name: temp_layer if name == "New Objects" else None
+        )
+        self.layer_service.get_layer_by_id.return_value = definitive_layer
+
+        self.service.prepare_layers()
+
+        self.layer_service.copy_virtual_fields.assert_called_once_with(definitive_layer, temp_layer)
+
+    def test_reports_are_written_as_json_and_csv(self):
+        feature = Mock()
+        feature.id.return_value = 12
+        warning = WarningData(
+            "Point far from object", "Sondage 2", "Imported_CSV_Points", '"identifier" = \'P1\'',
+            distance_issues=[{'point_feature': feature, 'distance': 1.5}],
+        )
+        steps = [DetectorStep("distance_warnings", "Distances", _detector_class([warning]), "detect")]
+        report = self.service.run(steps=steps)
+
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "report.json")
+            csv_path = os.path.join(directory, "report.csv")
+            write_json_report(report, json_path)
+            write_csv_report(report, csv_path)
+            with open(json_path, encoding="utf-8") as json_file:
+                data = json.load(json_file)
+            with open(csv_path, newline='', encoding="utf-8") as csv_file:
+                rows = list(csv.DictReader(csv_file))
+
+        issue = data['warnings']['distance_warnings'][0]['distance_issues'][0]
+        self.assertEqual(issue, {'point_feature': 12, 'distance': 1.5})
+        self.assertEqual(data['steps'][0]['name'], "Distances")
+        self.assertEqual(rows[0]['category'], "distance_warnings")
+        self.assertEqual(rows[0]['recording_area'], "Sondage 2")
+
+
+class TestInMemorySettingsManager(unittest.TestCase):
+    """Test cases for InMemorySettingsManager."""
+
+    def test_values_override_fallback(self):
+        fallback = Mock()
+        fallback.get_value.side_effect = lambda key, default=None: f"stored {key}"
+        settings = InMemorySettingsManager({'objects_layer': 'from file'}, fallback=fallback)
+
+        self.assertEqual(settings.get_value('objects_layer'), 'from file')
+        self.assertEqual(settings.get_value('features_layer'), 'stored features_layer')
+
+        settings.remove_value('objects_layer')
+        self.assertEqual(settings.get_value('objects_layer'), 'stored objects_layer')
+        self.assertEqual(InMemorySettingsManager().get_value('missing', 3), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Tests for the QGIS-free parts of the benchmark suite."""
+
+import csv
+import os
+import tempfile
+import unittest
+
+try:
+    from core.data_structures import StepMetrics
+    from test.benchmarks.baselines import (
+        compare_to_baseline,
+        format_comparisons,
+        load_baseline,
+        median_wall_times,
+        save_baseline,
+    )
+    from test.benchmarks.synthetic_data import SIZES, generate_dataset, write_topo_csv
+except ImportError:
+    from ..core.data_structures import StepMetrics
+    from .benchmarks.baselines import (
+        compare_to_baseline,
+        format_comparisons,
+        load_baseline,
+        median_wall_times,
+        save_baseline,
+    )
+    from .benchmarks.synthetic_data import SIZES, generate_dataset, write_topo_csv
+
+
+class TestSyntheticData(unittest.TestCase):
+    """Test cases for synthetic dataset generation."""
+
+    def test_same_seed_yields_same_dataset(self):
+        first = generate_dataset('small', seed=3)
+        second = generate_dataset('small', seed=3)
+
+        self.assertEqual(first.counts(), second.counts())
+        self.assertEqual(first.import_points, second.import_points)
+        self.assertNotEqual(first.import_points, generate_dataset('small', seed=4).import_points)
+
+    def test_counts_follow_size(self):
+        dataset = generate_dataset('small')
+        size = SIZES['small']
+
+        self.assertEqual(len(dataset.recording_areas), size.recording_areas)
+        self.assertEqual(
+            len(dataset.definitive_objects) + len(dataset.import_objects),
+            size.recording_areas * size.objects_per_area,
+        )
+        self.assertEqual(len(dataset.definitive_points), len(dataset.definitive_objects) * size.points_per_object)
+
+    def test_objects_stay_inside_their_recording_area(self):
+        dataset = generate_dataset('small')
+        areas = {area.fid: area for area in dataset.recording_areas}
+
+        for entity in dataset.definitive_objects + dataset.import_objects:
+            area = areas[entity.recording_area_fid]
+            self.assertTrue(area.xmin <= entity.x <= area.xmin + area.size)
+            self.assertTrue(area.ymin <= entity.y <= area.ymin + area.size)
+
+    def test_import_contains_anomalies(self):
+        dataset = generate_dataset('small', anomaly_rate=0.1)
+        areas = {area.fid: area for area in dataset.recording_areas}
+        definitive_identifiers = {point.identifier for point in dataset.definitive_points}
+
+        linked_objects = {point.object_id for point in dataset.import_points}
+        self.assertTrue(any(entity.object_id not in linked_objects for entity in dataset.import_objects))
+        self.assertTrue(any(point.identifier in definitive_identifiers for point in dataset.import_points))
+        self.assertTrue(any(
+            point.x > areas[point.recording_area_fid].xmin + areas[point.recording_area_fid].size
+            for point in dataset.import_points
+        ))
+
+    def test_write_topo_csv(self):
+        dataset = generate_dataset('small')
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "points.csv")
+            write_topo_csv(dataset.import_points, path)
+            with open(path, newline='', encoding='utf-8') as csv_file:
+                rows = list(csv.reader(csv_file))
+
+        self.assertEqual(rows[0], ['identifier', 'X', 'Y', 'Z', 'object_id'])
+        self.assertEqual(len(rows) - 1, len(dataset.import_points))
+
+
+class TestBaselines(unittest.TestCase):
+    """Test cases for baseline comparison."""
+
+    def test_median_wall_times(self):
+        runs = [[StepMetrics(name="Distance", wall_time_ms=value)] for value in (10.0, 30.0, 20.0)]
+        self.assertEqual(median_wall_times(runs), {"Distance": 20.0})
+
+    def test_regression_needs_relative_and_absolute_slowdown(self):
+        baseline = {'small': {'Distance': 100.0, 'Skipped numbers': 2.0}}
+        results = {'small': {'Distance': 140.0, 'Skipped numbers': 6.0, 'New step': 50.0}}
+
+        comparisons = {c.step_name: c for c in compare_to_baseline(results, baseline, 0.25, 20.0)}
+
+        self.assertTrue(comparisons['Distance'].regressed)
+        self.assertFalse(comparisons['Skipped numbers'].regressed)
+        self.assertFalse(comparisons['New step'].regressed)
+        self.assertAlmostEqual(comparisons['Distance'].change, 0.4)
+
+    def test_steps_without_baseline_are_reported_missing(self):
+        comparisons = compare_to_baseline({'small': {'Distance': 10.0}}, {}, 0.25, 20.0)
+
+        self.assertTrue(comparisons[0].missing)
+        self.assertIn("NO BASELINE", format_comparisons(comparisons))
+
+    def test_save_baseline_keeps_other_sizes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            save_baseline(path, {'small': {'Distance': 1.0}}, {'python': '3'})
+            save_baseline(path, {'medium': {'Distance': 5.0}}, {'python': '3'})
+
+            self.assertEqual(load_baseline(path), {'small': {'Distance': 1.0}, 'medium': {'Distance': 5.0}})
+        self.assertEqual(load_baseline(os.path.join(directory, "missing.json")), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
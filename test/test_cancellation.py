@@ -0,0 +1,73 @@
+"""Tests for cooperative cancellation of warning-detection runs."""
+
+import unittest
+from unittest.mock import patch
+
+try:
+    from core.cancellation import (
+        CancellationToken,
+        DetectionCancelled,
+        cancellation_scope,
+        current_cancellation_token,
+    )
+    import core.ui_responsiveness as ui_responsiveness
+except ImportError:
+    from ..core.cancellation import (
+        CancellationToken,
+        DetectionCancelled,
+        cancellation_scope,
+        current_cancellation_token,
+    )
+    from ..core import ui_responsiveness
+
+
+class TestCancellationToken(unittest.TestCase):
+    """Test cases for CancellationToken and cancellation_scope."""
+
+    def test_watched_check_cancels_token(self):
+        task_cancelled = [False]
+        token = CancellationToken()
+        token.watch(lambda: task_cancelled[0])
+
+        self.assertFalse(token.cancelled)
+        task_cancelled[0] = True
+        self.assertTrue(token.cancelled)
+
+    def test_scope_restores_previous_token(self):
+        outer = CancellationToken()
+        inner = CancellationToken()
+
+        with cancellation_scope(outer):
+            with cancellation_scope(inner):
+                self.assertIs(current_cancellation_token(), inner)
+            with cancellation_scope(None):
+                self.assertIs(current_cancellation_token(), outer)
+            self.assertIs(current_cancellation_token(), outer)
+        self.assertIsNone(current_cancellation_token())
+
+    def test_maybe_yield_raises_in_cancelled_scope(self):
+        token = CancellationToken()
+        with patch.object(ui_responsiveness, "_process_events"):
+            with cancellation_scope(token):
+                ui_responsiveness.maybe_yield_to_ui()
+                token.cancel()
+                with self.assertRaises(DetectionCancelled):
+                    ui_responsiveness.maybe_yield_to_ui()
+
+    def test_cancellation_is_not_swallowed_by_exception_handlers(self):
+        token = CancellationToken()
+        token.cancel()
+
+        def detector_loop():
+            try:
+                token.raise_if_cancelled()
+                return ["partial"]
+            except Exception:
+                return ["partial"]
+
+        with self.assertRaises(DetectionCancelled):
+            detector_loop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for the process-based detector kernels.
+"""
+
+import random
+import unittest
+from unittest.mock import patch
+
+try:
+    from core import detector_kernels
+    from core.detector_kernels import (
+        height_difference_kernel,
+        read_point_snapshot,
+        remove_snapshot,
+        run_kernel,
+        write_point_snapshot,
+    )
+except ImportError:
+    from ..core import detector_kernels
+    from ..core.detector_kernels import (
+        height_difference_kernel,
+        read_point_snapshot,
+        remove_snapshot,
+        run_kernel,
+        write_point_snapshot,
+    )
+
+
+def _brute_force(rows, max_distance, max_height_difference):
+    """Reference pairing, one record per pair in row order."""
+    records = []
+    for i, (fid1, x1, y1, z1) in enumerate(rows):
+        for fid2, x2, y2, z2 in rows[i + 1:]:
+            distance = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+            if distance <= max_distance and abs(z1 - z2) > max_height_difference:
+                records.append((fid1, fid2, distance, abs(z1 - z2)))
+    return records
+
+
+class TestDetectorKernels(unittest.TestCase):
+    """Test cases for the detector kernels and their process runner."""
+
+    def setUp(self):
+        generator = random.Random(7)
+        self.rows = [
+            (fid, generator.uniform(-5, 5), generator.uniform(-5, 5), generator.uniform(10, 11))
+            for fid in range(1, 301)
+        ]
+        self.path = write_point_snapshot(self.rows)
+
+    def tearDown(self):
+        remove_snapshot(self.path)
+
+    def test_snapshot_round_trip(self):
+        values = read_point_snapshot(self.path)
+        self.assertEqual(len(values), 4 * len(self.rows))
+        self.assertEqual(tuple(values[4:8]), tuple(float(v) for v in self.rows[1]))
+
+    def test_kernel_matches_brute_force_pairing(self):
+        expected = _brute_force(self.rows, 0.6, 0.3)
+        records = run_kernel(height_difference_kernel, self.path, len(self.rows), workers=1,
+                             max_distance=0.6, max_height_difference=0.3)
+        self.assertTrue(expected)
+        self.assertEqual(sorted(records), sorted(expected))
+
+    def test_chunks_report_each_pair_once(self):
+        whole = height_difference_kernel(self.path, 0, len(self.rows), 0.6, 0.3)
+        chunked = (height_difference_kernel(self.path, 0, 120, 0.6, 0.3)
+                   + height_difference_kernel(self.path, 120, len(self.rows), 0.6, 0.3))
+        self.assertEqual(chunked, whole)
+
+    def test_worker_processes_return_the_same_records(self):
+        expected = height_difference_kernel(self.path, 0, len(self.rows), 0.6, 0.3)
+        with patch.object(detector_kernels, 'MIN_PROCESS_ROWS', 0):
+            records = run_kernel(height_difference_kernel, self.path, len(self.rows), workers=2,
+                                 max_distance=0.6, max_height_difference=0.3)
+        self.assertEqual(records, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
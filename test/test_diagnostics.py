@@ -0,0 +1,97 @@
+"""Tests for the plugin-wide diagnostics facility."""
+
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    import core.diagnostics as diagnostics
+except ImportError:
+    from ..core import diagnostics
+
+
+class _CountingArgument:
+    """Argument that records how often it is formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "value"
+
+
+class TestDiagnostics(unittest.TestCase):
+    """Test cases for get_diagnostics and configure_diagnostics."""
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {}, clear=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop(diagnostics.ENVIRONMENT_VARIABLE, None)
+        self.addCleanup(diagnostics.configure_diagnostics)
+        self.addCleanup(diagnostics.set_category_level, "tests", logging.NOTSET)
+
+    def test_debug_arguments_are_not_formatted_when_level_is_off(self):
+        diagnostics.configure_diagnostics(level="WARNING")
+        argument = _CountingArgument()
+
+        diagnostics.get_diagnostics("tests").debug("Scanned %s", argument)
+
+        self.assertEqual(argument.formatted, 0)
+
+    def test_file_output_receives_enabled_messages(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "diagnostics.log")
+            handler = diagnostics.configure_diagnostics(
+                level="debug", output=diagnostics.OUTPUT_FILE, file_path=log_path
+            )
+
+            diagnostics.get_diagnostics("tests").debug("Scanned %d features", 12)
+            handler.flush()
+            diagnostics.configure_diagnostics()
+
+            with open(log_path, encoding="utf-8") as log_file:
+                content = log_file.read()
+
+        self.assertIn("[DEBUG][archeosync.tests] Scanned 12 features", content)
+
+    def test_category_level_overrides_global_level(self):
+        diagnostics.configure_diagnostics(level="WARNING")
+        diagnostics.set_category_level("tests", "DEBUG")
+
+        self.assertTrue(diagnostics.get_diagnostics("tests.child").isEnabledFor(logging.DEBUG))
+        self.assertFalse(diagnostics.get_diagnostics("other").isEnabledFor(logging.DEBUG))
+
+    def test_environment_variable_overrides_configured_level(self):
+        os.environ[diagnostics.ENVIRONMENT_VARIABLE] = "debug"
+
+        diagnostics.configure_diagnostics(level="OFF")
+
+        self.assertTrue(diagnostics.get_diagnostics("tests").isEnabledFor(logging.DEBUG))
+
+    def test_message_log_level_mapping(self):
+        qgis = Mock(spec=["Info", "Warning", "Critical"])
+
+        self.assertIs(diagnostics.qgis_message_level(qgis, logging.DEBUG), qgis.Info)
+        self.assertIs(diagnostics.qgis_message_level(qgis, logging.WARNING), qgis.Warning)
+        self.assertIs(diagnostics.qgis_message_level(qgis, logging.ERROR), qgis.Critical)
+
+    def test_configure_from_settings_reads_level_and_output(self):
+        settings = Mock()
+        settings.get_value.side_effect = lambda key, default=None: {
+            "diagnostics_level": "INFO",
+            "diagnostics_output": diagnostics.OUTPUT_MESSAGE_LOG,
+        }.get(key, default)
+
+        diagnostics.configure_diagnostics_from_settings(settings)
+
+        logger = logging.getLogger(diagnostics.ROOT_LOGGER_NAME)
+        self.assertEqual(logger.level, logging.INFO)
+        self.assertIsInstance(diagnostics._handler, diagnostics.QgsMessageLogHandler)
+
+
+if __name__ == "__main__":
+    unittest.main()
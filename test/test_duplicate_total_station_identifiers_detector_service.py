@@ -302,7 +302,25 @@ class TestDuplicateTotalStationIdentifiersDetectorService(unittest.TestCase):
         self.assertIsInstance(warnings[0], WarningData)
         self.assertIn("TS001", warnings[0].message)
         self.assertIn("2", warnings[0].message)  # 2 features with same identifier
-    
+
+    def test_find_duplicate_feature_ids_keeps_only_duplicated_identifiers(self):
+        """Test that only identifiers seen more than once keep their feature ids."""
+        layer = Mock()
+        features = []
+        for feature_id, identifier in enumerate(["TS001", "TS002", "TS001", None, "TS003", "TS001"], start=1):
+            feature = Mock()
+            feature.__getitem__ = Mock(return_value=identifier)
+            feature.id.return_value = feature_id
+            features.append(feature)
+        layer.getFeatures.return_value = features
+
+        with patch('services.duplicate_total_station_identifiers_detector_service.iter_features',
+                   return_value=features) as iter_features_mock:
+            result = self.detector._find_duplicate_feature_ids(layer, 0)
+
+        self.assertEqual(result, {"TS001": [1, 3, 6]})
+        self.assertFalse(iter_features_mock.call_args[1]['with_geometry'])
+
     def test_detect_duplicates_between_layers(self):
         """Test detecting duplicates between two layers."""
         # Create mock layers
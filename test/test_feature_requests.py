@@ -0,0 +1,83 @@
+"""Tests for shaped feature requests used by detector scans."""
+
+import unittest
+from unittest.mock import Mock
+
+try:
+    from core.feature_requests import build_feature_request, iter_features, resolve_field_indices
+except ImportError:
+    from ..core.feature_requests import build_feature_request, iter_features, resolve_field_indices
+
+try:
+    from qgis.core import QgsFeatureRequest
+    QGIS_AVAILABLE = True
+except ImportError:
+    QGIS_AVAILABLE = False
+
+
+def _mock_layer(field_names):
+    fields = []
+    for name in field_names:
+        field = Mock()
+        field.name.return_value = name
+        fields.append(field)
+
+    layer_fields = Mock()
+    layer_fields.indexOf.side_effect = lambda name: field_names.index(name) if name in field_names else -1
+    layer_fields.__iter__ = lambda self: iter(fields)
+
+    layer = Mock()
+    layer.fields.return_value = layer_fields
+    return layer
+
+
+class TestResolveFieldIndices(unittest.TestCase):
+    """Test cases for resolve_field_indices."""
+
+    def test_resolves_names_and_indices(self):
+        layer = _mock_layer(["fid", "number", "area"])
+        self.assertEqual(resolve_field_indices(layer, ["area", 1]), [2, 1])
+
+    def test_matches_names_case_insensitively(self):
+        layer = _mock_layer(["fid", "PtID"])
+        self.assertEqual(resolve_field_indices(layer, ["ptid"]), [1])
+
+    def test_ignores_missing_and_duplicate_fields(self):
+        layer = _mock_layer(["fid", "number"])
+        self.assertEqual(
+            resolve_field_indices(layer, ["number", "missing", None, -1, 1, "NUMBER"]),
+            [1],
+        )
+
+
+@unittest.skipUnless(QGIS_AVAILABLE, "QGIS not available")
+class TestBuildFeatureRequest(unittest.TestCase):
+    """Test cases for build_feature_request."""
+
+    def test_subset_and_no_geometry(self):
+        layer = _mock_layer(["fid", "number", "area"])
+        request = build_feature_request(layer, ["number", "area"], with_geometry=False)
+
+        self.assertEqual(sorted(request.subsetOfAttributes()), [1, 2])
+        self.assertTrue(request.flags() & QgsFeatureRequest.NoGeometry)
+
+    def test_all_attributes_with_geometry_by_default(self):
+        layer = _mock_layer(["fid", "number"])
+        request = build_feature_request(layer)
+
+        self.assertFalse(request.flags() & QgsFeatureRequest.SubsetOfAttributes)
+        self.assertFalse(request.flags() & QgsFeatureRequest.NoGeometry)
+
+    def test_iter_features_passes_request_with_limit(self):
+        layer = _mock_layer(["fid"])
+        layer.getFeatures.return_value = iter([])
+
+        iter_features(layer, (), with_geometry=False, limit=1)
+
+        request = layer.getFeatures.call_args[0][0]
+        self.assertEqual(request.limit(), 1)
+        self.assertEqual(list(request.subsetOfAttributes()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
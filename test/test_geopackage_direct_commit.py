@@ -0,0 +1,150 @@
+"""
+Tests for the single-transaction GeoPackage commit used by validation.
+"""
+
+import os
+import sqlite3
+import struct
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock
+
+try:
+    from services.geopackage_direct_commit import (
+        GeoPackageDirectWriter,
+        encode_geopackage_geometry,
+        read_geopackage_table,
+    )
+except ImportError:
+    from ..services.geopackage_direct_commit import (
+        GeoPackageDirectWriter,
+        encode_geopackage_geometry,
+        read_geopackage_table,
+    )
+
+
+def _create_geopackage(path):
+    """Create a minimal GeoPackage point table with a GDAL-style R-tree index."""
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE gpkg_contents (table_name TEXT PRIMARY KEY, data_type TEXT, last_change TEXT,
+                                    min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER);
+        CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT, geometry_type_name TEXT,
+                                            srs_id INTEGER, z TINYINT, m TINYINT);
+        CREATE TABLE objects (fid INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, geom POINT,
+                              numero MEDIUMINT, label TEXT DEFAULT 'new');
+        INSERT INTO gpkg_contents (table_name, data_type, srs_id) VALUES ('objects', 'features', 2154);
+        INSERT INTO gpkg_geometry_columns VALUES ('objects', 'geom', 'POINT', 2154, 0, 0);
+        INSERT INTO objects (fid, numero) VALUES (7, 1);
+        CREATE VIRTUAL TABLE rtree_objects_geom USING rtree(id, minx, maxx, miny, maxy);
+        CREATE TRIGGER rtree_objects_geom_insert AFTER INSERT ON objects
+          WHEN (new.geom NOT NULL AND NOT ST_IsEmpty(NEW.geom))
+        BEGIN
+          INSERT OR REPLACE INTO rtree_objects_geom VALUES (
+            NEW.fid, ST_MinX(NEW.geom), ST_MaxX(NEW.geom), ST_MinY(NEW.geom), ST_MaxY(NEW.geom));
+        END;
+    """)
+    connection.commit()
+    connection.close()
+
+
+def _point_feature(x, y, numero):
+    box = Mock()
+    box.xMinimum.return_value = box.xMaximum.return_value = x
+    box.yMinimum.return_value = box.yMaximum.return_value = y
+    geometry = Mock()
+    geometry.isNull.return_value = False
+    geometry.isEmpty.return_value = False
+    geometry.asWkb.return_value = struct.pack('<bIdd', 1, 1, x, y)
+    geometry.boundingBox.return_value = box
+
+    feature = Mock()
+    feature.geometry.return_value = geometry
+    feature.attributes.return_value = [None, numero, None]
+    return feature
+
+
+class TestGeoPackageDirectWriter(unittest.TestCase):
+    """Test cases for GeoPackageDirectWriter."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "definitive.gpkg")
+        _create_geopackage(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_read_table_describes_columns(self):
+        table = read_geopackage_table(self.path, "OBJECTS")
+
+        self.assertEqual((table.table, table.fid_column, table.geometry_column), ("objects", "fid", "geom"))
+        self.assertEqual(table.srs_id, 2154)
+        self.assertEqual(table.columns, ("numero", "label"))
+        self.assertIsNone(read_geopackage_table(self.path, "missing"))
+
+    def test_commit_inserts_rows_and_updates_the_spatial_index(self):
+        table = read_geopackage_table(self.path, "objects")
+        writer = GeoPackageDirectWriter(table, ["fid", "numero", "label"], batch_size=2)
+        for numero, (x, y) in enumerate([(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)], start=2):
+            writer.add(_point_feature(x, y, numero))
+
+        feature_ids = writer.commit()
+
+        connection = sqlite3.connect(self.path)
+        rows = connection.execute("SELECT fid, numero, label FROM objects WHERE fid > 7").fetchall()
+        index = connection.execute("SELECT id, minx, maxy FROM rtree_objects_geom ORDER BY id").fetchall()
+        extent = connection.execute("SELECT min_x, max_y FROM gpkg_contents").fetchone()
+        connection.close()
+        self.assertEqual(feature_ids, [8, 9, 10])
+        # Unset attributes are left out, so the column default applies
+        self.assertEqual(rows, [(8, 2, 'new'), (9, 3, 'new'), (10, 4, 'new')])
+        self.assertEqual(index, [(8, 1.0, 2.0), (9, 3.0, 4.0), (10, 5.0, 6.0)])
+        self.assertEqual(extent, (1.0, 6.0))
+        self.assertEqual(writer.pending_count, 0)
+
+    def test_failed_commit_writes_nothing(self):
+        table = read_geopackage_table(self.path, "objects")
+        writer = GeoPackageDirectWriter(table, ["fid", "numero", "label"])
+        writer.add(_point_feature(1.0, 2.0, 2))
+        writer.add(_point_feature(3.0, 4.0, 3))
+        connection = sqlite3.connect(self.path)
+        connection.execute("CREATE TRIGGER reject BEFORE INSERT ON objects WHEN NEW.numero = 3 "
+                           "BEGIN SELECT RAISE(ABORT, 'rejected'); END")
+        connection.commit()
+        connection.close()
+
+        with self.assertRaises(sqlite3.Error):
+            writer.commit()
+
+        connection = sqlite3.connect(self.path)
+        self.assertEqual(connection.execute("SELECT count(*) FROM objects").fetchone()[0], 1)
+        connection.close()
+        self.assertEqual(writer.pending_count, 2)
+
+    def test_commit_on_main_thread_does_not_wait_for_a_busy_file(self):
+        table = read_geopackage_table(self.path, "objects")
+        writer = GeoPackageDirectWriter(table, ["fid", "numero", "label"])
+        writer.add(_point_feature(1.0, 2.0, 2))
+        other_writer = sqlite3.connect(self.path, isolation_level=None)
+        other_writer.execute("BEGIN IMMEDIATE")
+        self.addCleanup(other_writer.close)
+
+        started = time.monotonic()
+        with self.assertRaises(sqlite3.OperationalError):
+            writer.commit()
+
+        self.assertLess(time.monotonic() - started, 5.0)
+        self.assertEqual(writer.pending_count, 1)
+
+    def test_empty_geometry_blob_has_no_envelope(self):
+        blob = encode_geopackage_geometry(b'\x01\x01\x00\x00\x00', 4326, None)
+
+        self.assertEqual(blob[:2], b'GP')
+        self.assertTrue(blob[3] & 0x10)
+        self.assertEqual(len(blob), 8 + 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -163,6 +163,47 @@ class TestHeightDifferenceDetectorService(unittest.TestCase):
             self.assertGreater(len(warnings), 0)
             self.assertIsInstance(warnings[0], WarningData)
     
+    def test_failed_worker_processes_fall_back_to_spatial_index(self):
+        """A failing process pool must not hide height-difference warnings."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        layer = Mock()
+        layer.name.return_value = "Total Station Points"
+        fields_collection = Mock()
+        fields_collection.indexOf.return_value = 2
+        layer.fields.return_value = fields_collection
+        features = []
+        for fid, x, z in ((1, 0, 100.0), (2, 0.5, 120.5)):
+            geometry = Mock()
+            geometry.asPoint.return_value = QgsPointXY(x, 0)
+            geometry.isEmpty.return_value = False
+            feature = Mock()
+            feature.id.return_value = fid
+            feature.geometry.return_value = geometry
+            feature.attribute.return_value = z
+            features.append(feature)
+        layer.getFeatures.return_value = features
+
+        self.settings_manager.get_value.side_effect = lambda key, default=None: 'test_layer_id'
+        self.layer_service.get_layer_by_id.return_value = layer
+        self.layer_service.get_layer_by_name.return_value = None
+
+        module = 'services.height_difference_detector_service'
+        with patch('qgis.core.QgsDistanceArea') as mock_distance_area, \
+                patch(f'{module}.MIN_PROCESS_ROWS', 2), \
+                patch(f'{module}.run_kernel', side_effect=BrokenProcessPool("pool died")) as mock_run_kernel, \
+                patch.object(self.service, '_process_worker_count', return_value=2):
+            mock_calculator = Mock()
+            mock_calculator.measureLine.return_value = 0.5
+            mock_calculator.convertLengthMeasurement.return_value = 0.5
+            mock_distance_area.return_value = mock_calculator
+
+            warnings = self.service.detect_height_difference_warnings()
+
+        mock_run_kernel.assert_called_once()
+        self.assertGreater(len(warnings), 0)
+        self.assertIsInstance(warnings[0], WarningData)
+
     def test_detect_height_difference_warnings_no_height_difference(self):
         """Test detection when features have no significant height difference."""
         # Mock layer
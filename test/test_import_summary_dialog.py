@@ -17,7 +17,7 @@ try:
         DOCK_WIDGET_AREAS,
         _qmessagebox_yes_no_dialog_args,
     )
-    from core.data_structures import ImportSummaryData, WarningData
+    from core.data_structures import FeatureTarget, ImportSummaryData, WarningData
 except ImportError:
     from qgis.PyQt import QtWidgets
     from ..ui.import_summary_dialog import (
@@ -26,7 +26,7 @@ except ImportError:
         DOCK_WIDGET_AREAS,
         _qmessagebox_yes_no_dialog_args,
     )
-    from ..core.data_structures import ImportSummaryData, WarningData
+    from ..core.data_structures import FeatureTarget, ImportSummaryData, WarningData
 
 
 class TestImportSummaryDialog(unittest.TestCase):
@@ -41,6 +41,19 @@ class TestImportSummaryDialog(unittest.TestCase):
         mock_feature.fields.return_value = mock_fields
         return mock_feature
     
+    @staticmethod
+    def _warning_panel_texts(dock):
+        """Return the category and warning texts shown in the dock's warnings panel."""
+        model = dock._warnings_model
+        texts = set()
+        for row in range(model.rowCount()):
+            category = model.index(row, 0)
+            while model.canFetchMore(category):
+                model.fetchMore(category)
+            texts.add(model.data(category))
+            texts.update(model.data(model.index(child, 0, category)) for child in range(model.rowCount(category)))
+        return texts
+    
     def setUp(self):
         """Set up test fixtures."""
         if QtWidgets.QApplication.instance() is None:
@@ -141,9 +154,9 @@ class TestImportSummaryDialog(unittest.TestCase):
             layer_service=self.mock_layer_service,
             parent=self.parent,
         )
-        texts = {lbl.text() for lbl in dock.findChildren(QtWidgets.QLabel)}
-        self.assertIn("Duplicate Objects Warnings:", texts)
-        self.assertIn("Skipped Numbers Warnings:", texts)
+        texts = self._warning_panel_texts(dock)
+        self.assertTrue(any(t.startswith("Duplicate Objects Warnings:") for t in texts))
+        self.assertTrue(any(t.startswith("Skipped Numbers Warnings:") for t in texts))
         self.assertTrue(any("Duplicate object warning" in t for t in texts))
         self.assertTrue(any("Skipped numbers warning" in t for t in texts))
 
@@ -204,9 +217,9 @@ class TestImportSummaryDialog(unittest.TestCase):
             self.dialog._summary_data.objects_count = 5
             self._run_warning_refresh_pipeline_immediately(self.dialog)
 
-        texts = {lbl.text() for lbl in self.dialog.findChildren(QtWidgets.QLabel)}
-        self.assertIn("Duplicate Objects Warnings:", texts)
-        self.assertIn("Skipped Numbers Warnings:", texts)
+        texts = self._warning_panel_texts(self.dialog)
+        self.assertTrue(any(t.startswith("Duplicate Objects Warnings:") for t in texts))
+        self.assertTrue(any(t.startswith("Skipped Numbers Warnings:") for t in texts))
         self.assertTrue(any("Refreshed duplicate warning" in t for t in texts))
         self.assertTrue(any("Refreshed skipped warning" in t for t in texts))
 
@@ -232,8 +245,8 @@ class TestImportSummaryDialog(unittest.TestCase):
             layer_service=self.mock_layer_service,
             parent=self.parent,
         )
-        texts = {lbl.text() for lbl in dock.findChildren(QtWidgets.QLabel)}
-        self.assertIn("Out-of-Bounds Warnings:", texts)
+        texts = self._warning_panel_texts(dock)
+        self.assertTrue(any(t.startswith("Out-of-Bounds Warnings:") for t in texts))
         self.assertTrue(any("Features 2 outside boundary" in t for t in texts))
 
     def test_effective_warnings_keep_import_lists_when_detector_returns_empty_mid_refresh(self):
@@ -308,9 +321,9 @@ class TestImportSummaryDialog(unittest.TestCase):
             "duplicate_objects_warnings": [],
             "skipped_numbers_warnings": [],
         }
-        dock._recreate_summary_content()
+        dock._update_warnings_panel()
 
-        texts = {lbl.text() for lbl in dock.findChildren(QtWidgets.QLabel)}
+        texts = self._warning_panel_texts(dock)
         self.assertTrue(any("import dup warning" in t for t in texts))
         self.assertTrue(any("import skipped warning" in t for t in texts))
         self.assertTrue(any("import oob warning" in t for t in texts))
@@ -337,6 +350,56 @@ class TestImportSummaryDialog(unittest.TestCase):
 
         self.assertEqual(len(self.dialog._summary_data.missing_total_station_warnings), 1)
 
+    def test_warning_targets_are_selected_by_id(self):
+        """Warnings with targets select features by id instead of evaluating the filter."""
+        objects_layer = Mock()
+        objects_layer.selectedFeatureCount.return_value = 2
+        warning = WarningData(
+            message="Duplicate object",
+            recording_area_name="Zone A",
+            layer_name="Objects",
+            filter_expression='"numero" = 3',
+            targets=[FeatureTarget("objects", [3, 8])],
+        )
+
+        with patch("qgis.core.QgsProject") as mock_project, \
+             patch("ui.import_summary_dialog.QMessageBox"):
+            mock_project.instance.return_value.mapLayer.side_effect = (
+                lambda layer_id: objects_layer if layer_id == "objects" else None
+            )
+            self.dialog._open_filtered_attribute_table(warning)
+
+        objects_layer.selectByIds.assert_called_once_with([3, 8])
+        objects_layer.selectByExpression.assert_not_called()
+        self.mock_iface.setActiveLayer.assert_called_with(objects_layer)
+        self.mock_iface.mapCanvas.return_value.refresh.assert_called_once()
+
+    def test_warning_with_a_removed_target_layer_uses_the_filter_expression(self):
+        """A target layer that is gone must not leave a partial selection by id."""
+        objects_layer = Mock()
+        objects_layer.name.return_value = "Objects"
+        objects_layer.selectedFeatureCount.return_value = 2
+        self.mock_layer_service.get_layer_by_name.return_value = objects_layer
+        warning = WarningData(
+            message="Duplicate object",
+            recording_area_name="Zone A",
+            layer_name="Objects",
+            filter_expression='"numero" = 3',
+            targets=[FeatureTarget("objects", [3, 8]), FeatureTarget("removed", [1])],
+        )
+
+        with patch("qgis.core.QgsProject") as mock_project, \
+             patch("ui.import_summary_dialog.QMessageBox"):
+            mock_project.instance.return_value.mapLayer.side_effect = (
+                lambda layer_id: objects_layer if layer_id == "objects" else None
+            )
+            mock_project.instance.return_value.mapLayers.return_value = {"objects": objects_layer}
+            self.dialog._open_filtered_attribute_table(warning)
+
+        objects_layer.selectByIds.assert_not_called()
+        objects_layer.selectByExpression.assert_called_once_with('"numero" = 3')
+        self.mock_iface.setActiveLayer.assert_called_with(objects_layer)
+
     def test_refresh_warnings_button_exists(self):
         """Test that the refresh warnings button is created."""
         self.assertIsNotNone(self.dialog._refresh_button)
@@ -374,13 +437,33 @@ class TestImportSummaryDialog(unittest.TestCase):
         ), patch(
             "ui.import_summary_dialog.SkippedNumbersDetectorService",
             return_value=Mock(detect_skipped_numbers=Mock(return_value=[])),
-        ), patch("qgis.PyQt.QtWidgets.QMessageBox"), patch.object(
-            self.dialog, "_recreate_summary_content"
-        ):
+        ), patch("qgis.PyQt.QtWidgets.QMessageBox"):
             self.dialog._summary_data.objects_count = 2
             self._run_warning_refresh_pipeline_immediately(self.dialog)
         mock_sync.assert_called_once()
 
+    def test_refresh_warnings_records_detector_step_metrics(self):
+        """Each refresh step is recorded in the summary's performance metrics."""
+        with patch.object(
+            self.dialog, "_sync_virtual_fields_to_temporary_import_layers"
+        ), patch(
+            "ui.import_summary_dialog.DuplicateObjectsDetectorService",
+            return_value=Mock(detect_duplicate_objects=Mock(return_value=[])),
+        ), patch(
+            "ui.import_summary_dialog.SkippedNumbersDetectorService",
+            return_value=Mock(detect_skipped_numbers=Mock(return_value=[])),
+        ), patch("qgis.PyQt.QtWidgets.QMessageBox"):
+            self.dialog._summary_data.objects_count = 2
+            self._run_warning_refresh_pipeline_immediately(self.dialog)
+            self._run_warning_refresh_pipeline_immediately(self.dialog)
+
+        metrics = self.dialog._summary_data.performance_metrics
+        self.assertEqual(len(metrics), len(self.dialog._warning_refresh_plan))
+        self.assertTrue(all(step.runs == 1 for step in metrics))
+        self.assertEqual(
+            self.dialog._performance_table.rowCount(), len(self.dialog._warning_refresh_plan)
+        )
+
     def test_refresh_warnings_success(self):
         """Test that refresh warnings works correctly."""
         # Mock the detection services
@@ -424,7 +507,7 @@ class TestImportSummaryDialog(unittest.TestCase):
              patch('services.duplicate_total_station_identifiers_detector_service.DuplicateTotalStationIdentifiersDetectorService', return_value=mock_dup_ts), \
              patch('services.height_difference_detector_service.HeightDifferenceDetectorService', return_value=mock_height), \
              patch('qgis.PyQt.QtWidgets.QMessageBox'), \
-             patch.object(self.dialog, '_recreate_summary_content') as mock_recreate:
+             patch.object(self.dialog, '_update_warnings_panel') as mock_update:
             
             # Set up summary data with objects
             self.dialog._summary_data.objects_count = 5
@@ -443,8 +526,8 @@ class TestImportSummaryDialog(unittest.TestCase):
             )
             self.assertEqual(len(self.dialog._summary_data.skipped_numbers_warnings), 1)
             
-            # Verify the UI was recreated after each completed detector step
-            self.assertGreaterEqual(mock_recreate.call_count, 1)
+            # Verify the warnings panel was updated after each completed detector step
+            self.assertGreaterEqual(mock_update.call_count, 1)
 
     def test_refresh_warnings_clears_resolved_duplicate_object_warnings(self):
         """Resolved duplicate warnings must disappear after refresh, not linger from import."""
@@ -485,9 +568,7 @@ class TestImportSummaryDialog(unittest.TestCase):
         ), patch(
             "services.height_difference_detector_service.HeightDifferenceDetectorService",
             return_value=mock_height,
-        ), patch("qgis.PyQt.QtWidgets.QMessageBox"), patch.object(
-            self.dialog, "_recreate_summary_content"
-        ):
+        ), patch("qgis.PyQt.QtWidgets.QMessageBox"):
             self.assertEqual(len(self.dialog._summary_data.duplicate_objects_warnings), 1)
             self._run_warning_refresh_pipeline_immediately(self.dialog)
 
@@ -542,15 +623,15 @@ class TestImportSummaryDialog(unittest.TestCase):
             "services.height_difference_detector_service.HeightDifferenceDetectorService",
             return_value=Mock(detect_height_difference_warnings=Mock(return_value=[])),
         ), patch('qgis.PyQt.QtWidgets.QMessageBox') as mock_qmessagebox, \
-             patch.object(dialog, '_recreate_summary_content') as mock_recreate:
+             patch.object(dialog, '_update_warnings_panel') as mock_update:
             
             # Configure the mock QMessageBox
             mock_qmessagebox.information = Mock()
             
             self._run_warning_refresh_pipeline_immediately(dialog)
             
-            # Verify that UI was recreated as detector steps complete
-            self.assertGreaterEqual(mock_recreate.call_count, 1)
+            # Verify that the warnings panel was updated as detector steps complete
+            self.assertGreaterEqual(mock_update.call_count, 1)
 
     def test_warnings_analysis_indicator_hidden_by_default(self):
         """Busy indicator is hidden until warning analysis starts."""
@@ -638,8 +719,7 @@ class TestImportSummaryDialog(unittest.TestCase):
              patch('services.missing_total_station_detector_service.MissingTotalStationDetectorService', return_value=mock_missing_ts), \
              patch('services.duplicate_total_station_identifiers_detector_service.DuplicateTotalStationIdentifiersDetectorService', return_value=mock_dup_ts), \
              patch('services.height_difference_detector_service.HeightDifferenceDetectorService', return_value=mock_height), \
-             patch('qgis.PyQt.QtWidgets.QMessageBox') as mock_qmessagebox, \
-             patch.object(self.dialog, '_recreate_summary_content'):
+             patch('qgis.PyQt.QtWidgets.QMessageBox') as mock_qmessagebox:
             self._run_warning_refresh_pipeline_immediately(
                 self.dialog,
                 trigger=self.dialog.refresh_warnings_silently,
@@ -648,41 +728,6 @@ class TestImportSummaryDialog(unittest.TestCase):
         mock_qmessagebox.information.assert_not_called()
         self.assertFalse(self.dialog._warnings_analysis_container.isVisible())
     
-    def test_recreate_summary_content(self):
-        """Test that the summary content recreation works correctly."""
-        # Mock the widget and layout structure
-        mock_widget = Mock()
-        mock_layout = Mock()
-        mock_scroll_area = Mock()
-        
-        # Set up the mock structure
-        mock_widget.layout.return_value = mock_layout
-        mock_layout.count.return_value = 1
-        mock_layout.itemAt.return_value.widget.return_value = mock_scroll_area
-        mock_scroll_area.__class__ = type(QtWidgets.QScrollArea())
-        
-        with patch.object(self.dialog, 'widget', return_value=mock_widget), \
-             patch.object(self.dialog, '_create_summary_content') as mock_create:
-            
-            # Call the recreate method
-            self.dialog._recreate_summary_content()
-            
-            # Verify that the scroll area was removed and recreated
-            mock_layout.removeItem.assert_called_once()
-            mock_scroll_area.deleteLater.assert_called_once()
-            mock_create.assert_called_once()
-    
-    def test_recreate_summary_content_error_handling(self):
-        """Test that recreate summary content handles errors gracefully."""
-        # Mock the layout to raise an exception
-        with patch.object(self.dialog, 'layout', side_effect=Exception("Test error")):
-            
-            # Call the recreate method - should not raise an exception
-            try:
-                self.dialog._recreate_summary_content()
-            except Exception:
-                self.fail("_recreate_summary_content should handle exceptions gracefully")
-    
     def test_dock_widget_creation(self):
         """Test that dock widget can be created successfully."""
         # Create a dock widget
@@ -16,12 +16,15 @@ try:
         _feature_id,
         build_layer_copy_jobs,
         build_peer_temp_layer_replacements,
+        commit_job_direct_writes,
+        copy_next_job_batch,
         load_job_source_features_chunk,
         remove_pending_import_layers,
         reset_import_session_tracking,
         TEMPORARY_IMPORT_LAYER_NAMES,
         IMPORT_LAYER_MAPPINGS,
         DEFAULT_COPY_BATCH_SIZE,
+        defaults_require_sequential_copy,
     )
 except ImportError:
     from qgis.PyQt import QtWidgets
@@ -33,12 +36,15 @@ except ImportError:
         _feature_id,
         build_layer_copy_jobs,
         build_peer_temp_layer_replacements,
+        commit_job_direct_writes,
+        copy_next_job_batch,
         load_job_source_features_chunk,
         remove_pending_import_layers,
         reset_import_session_tracking,
         TEMPORARY_IMPORT_LAYER_NAMES,
         IMPORT_LAYER_MAPPINGS,
         DEFAULT_COPY_BATCH_SIZE,
+        defaults_require_sequential_copy,
     )
 
 
@@ -95,6 +101,128 @@ class TestImportFeatureCopier(unittest.TestCase):
 
         mock_yield.assert_called()
 
+    def test_bulk_copy_creates_the_batch_at_once(self):
+        """Bulk mode builds the whole batch in one call and yields once."""
+        copier = ImportFeatureCopier(batch_size=1, bulk_batch_size=3)
+        source_features = [Mock() for _ in range(5)]
+        target_layer = Mock()
+        target_layer.isEditable.return_value = True
+        target_layer.addFeatures.return_value = True
+
+        with patch.object(
+            copier,
+            "create_features_with_target_structure",
+            side_effect=lambda features, *_args, **_kwargs: [Mock() for _ in features],
+        ) as mock_create, patch.object(copier, "create_feature_with_target_structure") as mock_create_one, \
+             patch("services.import_validation_service.maybe_yield_to_ui") as mock_yield:
+            result = copier.copy_features_batch(
+                source_features=source_features,
+                target_layer=target_layer,
+                start_index=0,
+                field_mapping=Mock(attribute_field_pairs=[]),
+                bulk=True,
+            )
+
+        mock_create.assert_called_once()
+        mock_create_one.assert_not_called()
+        self.assertEqual(mock_yield.call_count, 1)
+        target_layer.addFeature.assert_not_called()
+        target_layer.addFeatures.assert_called_once()
+        self.assertEqual(len(target_layer.addFeatures.call_args[0][0]), 3)
+        self.assertEqual(result.copied_count, 3)
+        self.assertEqual(result.next_index, 3)
+
+    def test_bulk_copy_counts_features_added_before_a_failure(self):
+        """Ids and counts of a failed addFeatures come from the edit buffer signal."""
+        class FeatureAddedSignal:
+            def __init__(self):
+                self.slots = []
+
+            def connect(self, slot):
+                self.slots.append(slot)
+
+            def disconnect(self, slot):
+                self.slots.remove(slot)
+
+            def emit(self, fid):
+                for slot in list(self.slots):
+                    slot(fid)
+
+        signal = FeatureAddedSignal()
+        target_layer = Mock()
+        target_layer.isEditable.return_value = True
+        target_layer.editBuffer.return_value = Mock(featureAdded=signal)
+
+        def add_two_then_fail(features):
+            signal.emit(-2)
+            signal.emit(-3)
+            return False
+
+        target_layer.addFeatures.side_effect = add_two_then_fail
+        copier = ImportFeatureCopier(batch_size=1, bulk_batch_size=3)
+
+        with patch.object(
+            copier,
+            "create_features_with_target_structure",
+            side_effect=lambda features, *_args, **_kwargs: [Mock() for _ in features],
+        ):
+            result = copier.copy_features_batch(
+                source_features=[Mock() for _ in range(3)],
+                target_layer=target_layer,
+                start_index=0,
+                field_mapping=Mock(attribute_field_pairs=[]),
+                bulk=True,
+            )
+
+        self.assertEqual((result.copied_count, result.error_count), (2, 1))
+        self.assertEqual(result.added_feature_ids, [-2, -3])
+        self.assertEqual(signal.slots, [])
+
+    def test_copy_batch_hands_features_to_sink(self):
+        """With a sink the edit buffer is left untouched."""
+        copier = ImportFeatureCopier(batch_size=1, bulk_batch_size=2)
+        target_layer = Mock()
+        target_layer.isEditable.return_value = False
+        sink = Mock(side_effect=[True, False])
+
+        with patch.object(
+            copier,
+            "create_features_with_target_structure",
+            side_effect=lambda features, *_args, **_kwargs: [Mock() for _ in features],
+        ):
+            result = copier.copy_features_batch(
+                source_features=[Mock(), Mock()],
+                target_layer=target_layer,
+                start_index=0,
+                field_mapping=Mock(attribute_field_pairs=[]),
+                bulk=True,
+                sink=sink,
+            )
+
+        self.assertEqual(sink.call_count, 2)
+        target_layer.startEditing.assert_not_called()
+        target_layer.addFeature.assert_not_called()
+        self.assertEqual((result.copied_count, result.error_count), (1, 1))
+
+    def test_defaults_require_sequential_copy_detects_aggregates(self):
+        def layer_with_defaults(*expressions):
+            layer = Mock()
+            layer.fields.return_value.count.return_value = len(expressions)
+            layer.defaultValueDefinition.side_effect = (
+                lambda index: Mock(expression=Mock(return_value=expressions[index]))
+            )
+            return layer
+
+        self.assertTrue(defaults_require_sequential_copy(
+            layer_with_defaults("", 'coalesce(Maximum("sequence"), 0) + 1')
+        ))
+        self.assertTrue(defaults_require_sequential_copy(
+            layer_with_defaults("aggregate('objects', 'count', \"fid\")")
+        ))
+        self.assertFalse(defaults_require_sequential_copy(
+            layer_with_defaults("now()", "'topo'", '"maximum_depth" * 2', "")
+        ))
+
     def test_feature_id_accepts_edit_buffer_fids(self):
         """Temporary edit-buffer FIDs are negative and must be kept for selection."""
         buffer_feature = Mock()
@@ -309,6 +437,54 @@ class TestImportFeatureCopierQgis(unittest.TestCase):
         self.assertEqual(sorted(values), [4, 5])
 
 
+    def test_bulk_copy_applies_constant_defaults(self):
+        """Bulk copies evaluate order-independent defaults for every feature."""
+        from qgis.core import (
+            QgsDefaultValue,
+            QgsFeature,
+            QgsFields,
+            QgsField,
+            QgsGeometry,
+            QgsPointXY,
+            QgsVectorLayer,
+        )
+        from qgis.PyQt.QtCore import QVariant
+
+        def_layer = QgsVectorLayer(
+            "Point?crs=EPSG:4326&field=pointid:string&field=operation_id:integer",
+            "Total Station Points",
+            "memory",
+        )
+        self.assertTrue(def_layer.isValid())
+        def_layer.setDefaultValueDefinition(
+            def_layer.fields().indexOf("operation_id"), QgsDefaultValue("6")
+        )
+        self.assertFalse(defaults_require_sequential_copy(def_layer))
+
+        temp_fields = QgsFields()
+        temp_fields.append(QgsField("pointid", QVariant.String))
+        source_features = []
+        for index in range(4):
+            feature = QgsFeature(temp_fields)
+            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(index, index)))
+            feature.setAttribute("pointid", f"TS-{index}")
+            source_features.append(feature)
+
+        mapping = self.copier.build_field_mapping(temp_fields, def_layer)
+        batch_result = self.copier.copy_features_batch(
+            source_features=source_features,
+            target_layer=def_layer,
+            start_index=0,
+            field_mapping=mapping,
+            bulk=True,
+        )
+
+        self.assertEqual(batch_result.copied_count, 4)
+        self.assertEqual(len(batch_result.added_feature_ids), 4)
+        values = sorted((f["pointid"], f["operation_id"]) for f in def_layer.getFeatures())
+        self.assertEqual(values, [(f"TS-{index}", 6) for index in range(4)])
+
+
 class TestLoadJobSourceFeaturesChunk(unittest.TestCase):
     """Tests for incremental temporary-layer loading."""
 
@@ -339,6 +515,61 @@ class TestLoadJobSourceFeaturesChunk(unittest.TestCase):
         self.assertEqual(job.feature_count, 5)
 
 
+    def test_load_chunk_size_adapts_to_the_frame_budget(self):
+        source_layer = Mock()
+        source_layer.getFeatures.return_value = iter([Mock() for _ in range(200)])
+        job = LayerCopyJob(
+            temp_layer_name="Imported_CSV_Points",
+            definitive_layer_key="total_station_points_layer",
+            source_layer=source_layer,
+            target_layer=Mock(),
+            field_mapping=LayerFieldMapping(attribute_field_pairs=[]),
+            feature_count=200,
+        )
+        ticks = iter([0.0, 0.001, 1.0, 1.002])
+        job.load_sizer.clock = lambda: next(ticks)
+
+        self.assertFalse(load_job_source_features_chunk(job))
+        self.assertEqual(len(job.source_features), FEATURE_LOAD_YIELD_EVERY)
+        self.assertEqual(job.load_sizer.size, 2 * FEATURE_LOAD_YIELD_EVERY)
+
+        self.assertFalse(load_job_source_features_chunk(job))
+        self.assertEqual(len(job.source_features), 3 * FEATURE_LOAD_YIELD_EVERY)
+
+
+class TestCopyNextJobBatch(unittest.TestCase):
+    """Tests for streaming validation copies from the temporary layer."""
+
+    def test_copy_streams_source_features_in_batches(self):
+        source_layer = Mock()
+        source_layer.getFeatures.return_value = iter([Mock() for _ in range(5)])
+        target_layer = Mock()
+        target_layer.isEditable.return_value = True
+        target_layer.addFeature.return_value = True
+        job = LayerCopyJob(
+            temp_layer_name="New Objects",
+            definitive_layer_key="objects_layer",
+            source_layer=source_layer,
+            target_layer=target_layer,
+            field_mapping=LayerFieldMapping(attribute_field_pairs=[]),
+            feature_count=7,
+        )
+        copier = ImportFeatureCopier(batch_size=2)
+        copier._sizer.record = Mock()
+
+        batches = 0
+        with patch.object(copier, "create_feature_with_target_structure", return_value=Mock()):
+            while not job.load_complete:
+                copy_next_job_batch(job, copier)
+                batches += 1
+
+        self.assertEqual(batches, 3)
+        self.assertEqual(job.copied_count, 5)
+        self.assertEqual(job.feature_count, 5)
+        self.assertIsNone(job.source_features)
+        source_layer.getFeatures.assert_called_once()
+
+
 class TestBuildLayerCopyJobs(unittest.TestCase):
     """Tests for resolving temporary/definitive layer pairs."""
 
@@ -375,9 +606,48 @@ class TestBuildLayerCopyJobs(unittest.TestCase):
         self.assertIs(jobs[0].source_layer, temp_objects)
         self.assertIs(jobs[0].target_layer, def_objects)
         self.assertEqual(jobs[0].feature_count, 1)
+        self.assertTrue(jobs[0].bulk_copy)
         self.assertIsNone(jobs[0].source_features)
 
 
+class TestCommitJobDirectWrites(unittest.TestCase):
+    """Tests for committing collected features straight to a GeoPackage."""
+
+    def _job(self, writer):
+        return LayerCopyJob(
+            temp_layer_name="New Objects",
+            definitive_layer_key="objects_layer",
+            source_layer=Mock(),
+            target_layer=Mock(),
+            field_mapping=LayerFieldMapping(attribute_field_pairs=[]),
+            feature_count=2,
+            feature_index=2,
+            copied_count=2,
+            direct_writer=writer,
+        )
+
+    def test_commit_reloads_the_layer_and_records_fids(self):
+        writer = Mock()
+        writer.commit.return_value = [8, 9]
+        job = self._job(writer)
+
+        self.assertTrue(commit_job_direct_writes(job))
+
+        self.assertEqual(job.added_feature_ids, [8, 9])
+        job.target_layer.dataProvider().reloadData.assert_called_once()
+
+    def test_failed_commit_falls_back_to_the_edit_buffer(self):
+        writer = Mock()
+        writer.commit.side_effect = RuntimeError("database is locked")
+        job = self._job(writer)
+
+        self.assertFalse(commit_job_direct_writes(job))
+
+        writer.clear.assert_called_once()
+        self.assertIsNone(job.direct_writer)
+        self.assertEqual((job.feature_index, job.copied_count), (0, 0))
+
+
 class TestBuildPeerTempLayerReplacements(unittest.TestCase):
     """Tests for mapping definitive layers to active temporary import layers."""
 
@@ -0,0 +1,146 @@
+"""
+Tests for the slot-based warning issue records.
+"""
+
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    from core.data_structures import (
+        BatchValidationReport,
+        DistanceIssue,
+        FeatureRef,
+        FeatureTarget,
+        HeightDifferenceIssue,
+        OutOfBoundsIssue,
+        WarningData,
+    )
+except ImportError:
+    from ..core.data_structures import (
+        BatchValidationReport,
+        DistanceIssue,
+        FeatureRef,
+        FeatureTarget,
+        HeightDifferenceIssue,
+        OutOfBoundsIssue,
+        WarningData,
+    )
+
+
+def _layer(layer_id):
+    layer = Mock()
+    layer.id.return_value = layer_id
+    return layer
+
+
+def _feature(feature_id):
+    feature = Mock()
+    feature.id.return_value = feature_id
+    return feature
+
+
+class TestIssueRecords(unittest.TestCase):
+    """Test cases for FeatureRef and the issue records."""
+
+    def setUp(self):
+        self.issue = DistanceIssue.from_issue(
+            {
+                'point_feature': _feature(4),
+                'object_feature': _feature(9),
+                'point_identifier': "P4",
+                'object_identifier': "Object 9",
+                'distance': 0.42,
+                'relation_value': "12",
+            },
+            _layer("points"),
+            _layer("objects"),
+        )
+
+    def test_records_keep_references_instead_of_features(self):
+        self.assertFalse(hasattr(self.issue, '__dict__'))
+        self.assertEqual(self.issue.point_ref, FeatureRef("points", 4))
+        self.assertEqual(self.issue.object_ref, FeatureRef("objects", 9))
+        self.assertEqual(self.issue['distance'], 0.42)
+        self.assertIsNone(self.issue.get('missing'))
+        with self.assertRaises(KeyError):
+            self.issue['_FEATURE_KEYS']
+
+    def test_feature_keys_load_the_feature_lazily(self):
+        loaded = Mock()
+        loaded.isValid.return_value = True
+        layer = Mock()
+        layer.getFeature.return_value = loaded
+        qgis_core = Mock()
+        qgis_core.QgsProject.instance.return_value.mapLayer.side_effect = (
+            lambda layer_id: layer if layer_id == "points" else None
+        )
+
+        with patch.dict(sys.modules, {'qgis': Mock(core=qgis_core), 'qgis.core': qgis_core}):
+            self.assertIs(self.issue['point_feature'], loaded)
+            self.assertIsNone(self.issue['object_feature'])
+
+        layer.getFeature.assert_called_once_with(4)
+
+    def test_out_of_bounds_and_height_records(self):
+        out_of_bounds = OutOfBoundsIssue.from_issue(
+            {
+                'feature': _feature(7),
+                'feature_id': 7,
+                'feature_identifier': "Object 7",
+                'recording_area_id': 2,
+                'recording_area_name': "Sondage 2",
+                'distance': 1.5,
+            },
+            _layer("objects"),
+        )
+        height = HeightDifferenceIssue.from_issue(
+            {
+                'feature1': _feature(1),
+                'feature2': _feature(2),
+                'feature1_identifier': "P1",
+                'feature2_identifier': "P2",
+                'distance': 0.5,
+                'height_difference': 0.3,
+                'z1': 10.0,
+                'z2': 10.3,
+            },
+            _layer("points"),
+        )
+
+        self.assertEqual(out_of_bounds['feature_id'], 7)
+        self.assertEqual(out_of_bounds.recording_area_name, "Sondage 2")
+        self.assertEqual(height.feature2_ref, FeatureRef("points", 2))
+        self.assertEqual(height['height_difference'], 0.3)
+
+    def test_warning_targets_are_derived_from_issue_records(self):
+        second = DistanceIssue(FeatureRef("points", 5), FeatureRef("objects", 9), "P5", "Object 9", 0.5, "12")
+        warning = WarningData("Far points", "Relation 12", "Imported_CSV_Points", "", distance_issues=[self.issue, second])
+
+        self.assertEqual(
+            warning.feature_targets(),
+            [FeatureTarget("points", [4, 5]), FeatureTarget("objects", [9])],
+        )
+
+    def test_explicit_warning_targets_take_precedence(self):
+        warning = WarningData(
+            "Duplicate", "Zone A", "Objects", '"numero" = 3',
+            distance_issues=[self.issue],
+            targets=[FeatureTarget.of(_layer("objects"), [3, 8, 3])],
+        )
+
+        self.assertEqual(warning.feature_targets(), [FeatureTarget("objects", [3, 8])])
+        self.assertEqual(WarningData("Plain", "", "Objects", "").feature_targets(), [])
+
+    def test_report_serializes_references(self):
+        warning = WarningData("Far point", "Relation 12", "Imported_CSV_Points", "", distance_issues=[self.issue])
+        report = BatchValidationReport(warnings={'distance_warnings': [warning]})
+
+        issue = report.to_dict()['warnings']['distance_warnings'][0]['distance_issues'][0]
+
+        self.assertEqual(issue['point_ref'], {'layer_id': "points", 'feature_id': 4})
+        self.assertEqual(issue['object_identifier'], "Object 9")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -677,5 +677,55 @@ class TestOutOfBoundsDetectorService(unittest.TestCase):
         recording_areas_layer.getFeatures.assert_not_called()
 
 
+    def test_scans_every_feature_in_chunks_without_safety_cap(self):
+        """Large layers are streamed in chunks and every feature is checked."""
+        layer = Mock()
+        layer.name.return_value = "New Objects"
+        layer.fields.return_value = Mock()
+        layer.fields.return_value.indexOf.return_value = 0
+
+        features = []
+        for fid in range(10005):
+            feature = Mock()
+            feature.id.return_value = fid
+            feature.geometry.return_value.isEmpty.return_value = False
+            feature.attribute.return_value = 'A' if fid % 2 else 'B'
+            features.append(feature)
+        layer.getFeatures.return_value = features
+
+        recording_area_a = Mock()
+        recording_area_a.attribute.return_value = 'A'
+        recording_area_b = Mock()
+        recording_area_b.attribute.return_value = 'B'
+        recording_areas_layer = Mock()
+        recording_areas_layer.fields.return_value.indexOf.return_value = 0
+        recording_areas_layer.getFeatures.return_value = [recording_area_a, recording_area_b]
+
+        self.layer_service.get_layer_by_id.return_value = layer
+
+        prepared_factory = Mock()
+        prepared_factory.return_value.distance_outside.return_value = 1.0
+
+        with patch.object(self.service, '_get_recording_area_field', return_value='recording_area_field'), \
+             patch.object(self.service, '_get_relation_for_layer') as relation_mock, \
+             patch.object(self.service, '_get_recording_area_name', side_effect=lambda _layer, ra: ra.attribute(0)), \
+             patch('services.out_of_bounds_detector_service._FEATURE_SCAN_CHUNK_SIZE', 1000), \
+             patch('services.out_of_bounds_detector_service._PreparedRecordingArea', prepared_factory):
+            relation_mock.return_value.fieldPairs.return_value = {
+                'recording_area_field': 'id',
+            }
+            warnings = self.service._detect_out_of_bounds_in_layer(
+                'layer_id', recording_areas_layer, "Objects"
+            )
+
+        self.assertEqual(len(warnings), 2)
+        self.assertEqual(
+            sum(len(warning.out_of_bounds_features) for warning in warnings), 10005
+        )
+        # One prepared geometry per recording area, reused across chunks.
+        self.assertEqual(prepared_factory.call_count, 2)
+        recording_areas_layer.getFeatures.assert_called_once()
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""Tests for per-step performance instrumentation."""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock
+
+try:
+    from core.data_structures import StepMetrics
+    from core.performance import (
+        CATEGORY_DETECTOR,
+        CATEGORY_VALIDATION,
+        PerformanceRecorder,
+        count_scanned_features,
+        create_performance_recorder,
+        record_cache_access,
+        record_features_scanned,
+    )
+except ImportError:
+    from ..core.data_structures import StepMetrics
+    from ..core.performance import (
+        CATEGORY_DETECTOR,
+        CATEGORY_VALIDATION,
+        PerformanceRecorder,
+        count_scanned_features,
+        create_performance_recorder,
+        record_cache_access,
+        record_features_scanned,
+    )
+
+
+class TestPerformanceRecorder(unittest.TestCase):
+    """Test cases for PerformanceRecorder."""
+
+    def test_measure_records_features_and_cache_accesses(self):
+        recorder = PerformanceRecorder()
+
+        with recorder.measure("Distance", category=CATEGORY_DETECTOR):
+            list(count_scanned_features(range(5)))
+            record_cache_access("relation_paths", False)
+            record_cache_access("relation_paths", True)
+            record_cache_access("relation_paths", True)
+
+        step = recorder.metrics[0]
+        self.assertEqual(step.features_scanned, 5)
+        self.assertEqual(step.runs, 1)
+        self.assertGreaterEqual(step.wall_time_ms, 0.0)
+        self.assertAlmostEqual(step.cache_hit_rate("relation_paths"), 2 / 3)
+        self.assertIsNone(step.peak_memory_bytes)
+
+    def test_reports_outside_a_step_are_ignored(self):
+        recorder = PerformanceRecorder()
+        record_features_scanned(10)
+        record_cache_access("relation_paths", True)
+
+        with recorder.measure("Empty"):
+            pass
+
+        self.assertEqual(recorder.metrics[0].features_scanned, 0)
+        self.assertIsNone(recorder.metrics[0].cache_hit_rate())
+
+    def test_repeated_steps_accumulate_into_shared_list(self):
+        metrics = []
+        recorder = PerformanceRecorder(metrics)
+
+        for _ in range(3):
+            with recorder.measure("Validation: New Objects", category=CATEGORY_VALIDATION) as step:
+                step.features_scanned += 2
+
+        self.assertEqual(len(metrics), 1)
+        self.assertEqual(metrics[0].runs, 3)
+        self.assertEqual(metrics[0].features_scanned, 6)
+
+    def test_steps_on_other_threads_do_not_receive_reports(self):
+        recorder = PerformanceRecorder()
+
+        with recorder.measure("Main"):
+            worker = threading.Thread(target=record_features_scanned, args=(7,))
+            worker.start()
+            worker.join()
+
+        self.assertEqual(recorder.metrics[0].features_scanned, 0)
+
+    def test_trace_memory_records_peak(self):
+        recorder = PerformanceRecorder(trace_memory=True)
+
+        with recorder.measure("Allocate"):
+            data = [bytearray(1024) for _ in range(100)]
+            del data
+
+        self.assertGreater(recorder.metrics[0].peak_memory_bytes, 100 * 1024)
+
+    def test_clear_keeps_other_categories(self):
+        recorder = PerformanceRecorder()
+        recorder.metrics.extend([
+            StepMetrics(name="CSV import", category="import"),
+            StepMetrics(name="Distance", category=CATEGORY_DETECTOR),
+        ])
+
+        recorder.clear(CATEGORY_DETECTOR)
+
+        self.assertEqual([step.name for step in recorder.metrics], ["CSV import"])
+
+    def test_export_json(self):
+        recorder = PerformanceRecorder()
+        with recorder.measure("Distance", category=CATEGORY_DETECTOR):
+            record_cache_access("recording_area_names", True)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "performance.json")
+            recorder.export_json(path, extra={'import_summary': {'objects_count': 3}})
+            with open(path, encoding="utf-8") as exported:
+                data = json.load(exported)
+
+        self.assertEqual(data['steps'][0]['name'], "Distance")
+        self.assertEqual(data['steps'][0]['caches']['recording_area_names']['hit_rate'], 1.0)
+        self.assertEqual(data['import_summary'], {'objects_count': 3})
+
+    def test_create_performance_recorder_parses_setting(self):
+        settings = Mock()
+        settings.get_value.return_value = "true"
+        self.assertTrue(create_performance_recorder(settings).trace_memory)
+
+        settings.get_value.return_value = "false"
+        self.assertFalse(create_performance_recorder(settings).trace_memory)
+        self.assertFalse(create_performance_recorder(Mock()).trace_memory)
+
+
+if __name__ == "__main__":
+    unittest.main()
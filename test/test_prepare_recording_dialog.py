@@ -42,6 +42,15 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         self.mock_layer_service.get_layer_info.return_value = None
         self.mock_layer_service.get_layer_by_id.return_value = None
         self.mock_layer_service.get_related_objects_info.return_value = {'last_number': '', 'last_level': ''}
+        # Grouped lookups answer from the per-feature mock, so tests configure one of them
+        self.mock_layer_service.get_related_objects_info_batch.side_effect = (
+            lambda features, layer_id, number_field, level_field, recording_layer_id, unfiltered=False: {
+                feature.id(): self.mock_layer_service.get_related_objects_info(
+                    feature, layer_id, number_field, level_field, recording_layer_id
+                )
+                for feature in features
+            }
+        )
         self.mock_layer_service.calculate_next_level.return_value = ''
         self.mock_layer_service.get_raster_layers.return_value = []
         self.mock_layer_service.get_raster_layers_overlapping_feature.return_value = []
@@ -305,6 +314,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table(features)
+        self.dialog.get_all_next_values()
         
         # Verify table has correct number of rows
         self.assertEqual(self.dialog._entities_table.rowCount(), 3)
@@ -403,6 +413,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
         
         # Verify table has correct number of columns (Name + Last/Next number + Last/Next level + Background image)
         self.assertEqual(self.dialog._entities_table.columnCount(), 6)
@@ -422,6 +433,52 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         background_widget = self.dialog._entities_table.cellWidget(0, 5)  # Background image column
         self.assertIsInstance(background_widget, QtWidgets.QComboBox)
 
+    def test_populate_entities_table_fills_next_values_after_showing_names(self):
+        """Names appear at once; next values are filled in later timer ticks or on demand."""
+        self.mock_settings_manager.get_value.side_effect = lambda key, default=None: {
+            'recording_areas_layer': 'recording_layer_id',
+            'objects_layer': 'objects_layer_id',
+            'objects_number_field': 'number_field',
+        }.get(key, default)
+        self.dialog._create_entities_table(self.dialog._entities_table.parent().layout())
+        mock_layer = Mock()
+        mock_layer.displayExpression.return_value = ''
+        mock_layer.fields.return_value.indexOf.return_value = 0
+        self.mock_layer_service.get_layer_by_id.return_value = mock_layer
+        self.mock_layer_service.get_related_objects_info.return_value = {'last_number': '4', 'last_level': ''}
+        features = []
+        for feature_id, name in ((1, 'Zone A'), (2, 'Zone B'), (3, 'Zone C')):
+            feature = Mock()
+            feature.id.return_value = feature_id
+            feature.attribute.return_value = name
+            features.append(feature)
+
+        with patch.object(prepare_recording_dialog_module.QTimer, 'singleShot') as single_shot:
+            self.dialog._populate_entities_table(features)
+
+        self.assertEqual(self.dialog._entities_table.item(2, 0).text(), 'Zone C')
+        self.assertEqual(self.dialog._entities_table.item(0, 2).text(), '…')
+        self.mock_layer_service.get_related_objects_info_batch.assert_not_called()
+        single_shot.assert_called_once()
+
+        self.assertEqual(self.dialog.get_next_values_for_feature(1)['first_number'], '5')
+        self.mock_layer_service.get_related_objects_info_batch.assert_called_once()
+        self.assertEqual(self.mock_layer_service.get_related_objects_info_batch.call_args[0][0], features)
+
+        with patch.object(prepare_recording_dialog_module.QTimer, 'singleShot'):
+            single_shot.call_args[0][1]()
+        self.assertEqual(self.dialog._pending_entity_rows, {})
+        self.assertEqual(self.dialog._entities_table.item(0, 2).text(), '5')
+        self.mock_layer_service.get_related_objects_info_batch.assert_called_once()
+        # The run is over, so its unfiltered layer copies are closed
+        self.mock_layer_service.release_unfiltered_layers.assert_called_once()
+
+    def test_closing_dialog_releases_unfiltered_layers(self):
+        """Closing the dialog mid-fill must not keep unfiltered layer copies open."""
+        self.dialog.reject()
+
+        self.mock_layer_service.release_unfiltered_layers.assert_called_once()
+
     def test_populate_entities_table_reads_objects_layer_unfiltered(self):
         """Next number/level must use the full objects layer, not zone-filtered features."""
         def mock_get_value(key, default=None):
@@ -456,10 +513,11 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         self.mock_layer_service.calculate_next_level.return_value = 'Level B'
 
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
 
         objects_calls = [
             call
-            for call in self.mock_layer_service.get_related_objects_info.call_args_list
+            for call in self.mock_layer_service.get_related_objects_info_batch.call_args_list
             if call.args[1] == 'objects_layer_id'
         ]
         self.assertTrue(objects_calls, "Expected at least one objects-layer lookup")
@@ -515,6 +573,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         self.mock_layer_service.calculate_next_level.return_value = 'Level D'
 
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
 
         # Last level column also uses highest level across configured layers.
         last_level_item = self.dialog._entities_table.item(0, 3)  # Last level column
@@ -571,6 +630,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Populate table
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
         
         # Set first number and level values
         self.dialog._entities_table.setItem(0, 2, QtWidgets.QTableWidgetItem('16'))  # First number column
@@ -641,6 +701,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Populate table
         self.dialog._populate_entities_table([mock_feature1, mock_feature2])
+        self.dialog.get_all_next_values()
         
         # Set first number and level values for both rows
         self.dialog._entities_table.setItem(0, 2, QtWidgets.QTableWidgetItem('16'))  # First number column, row 0
@@ -717,6 +778,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
         
         # Verify table has correct number of columns (Name + Last/Next number + Background image)
         self.assertEqual(self.dialog._entities_table.columnCount(), 4)
@@ -775,6 +837,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
         
         # Verify table has correct number of columns (Name + Last/Next level + Background image)
         self.assertEqual(self.dialog._entities_table.columnCount(), 4)
@@ -827,6 +890,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
         
         # Verify table has correct number of columns (Name + Last/Next number + Last/Next level + Background image)
         self.assertEqual(self.dialog._entities_table.columnCount(), 6)
@@ -883,6 +947,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
         
         # Verify table has correct number of columns (Name + Last/Next number + Last/Next level + Background image)
         self.assertEqual(self.dialog._entities_table.columnCount(), 6)
@@ -948,6 +1013,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table([mock_feature])
+        self.dialog.get_all_next_values()
         
         # Verify table has correct number of columns (Name + Last/Next level + Background image)
         self.assertEqual(self.dialog._entities_table.columnCount(), 4)
@@ -1011,6 +1077,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table(features)
+        self.dialog.get_all_next_values()
         
         # Verify table has the correct number of columns (Name + Background image)
         self.assertEqual(self.dialog._entities_table.columnCount(), 2)
@@ -1065,6 +1132,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Call the method
         self.dialog._populate_entities_table(features)
+        self.dialog.get_all_next_values()
         
         # Verify background image dropdown was created with only "No image" option
         background_widget = self.dialog._entities_table.cellWidget(0, 1)
@@ -1114,6 +1182,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Populate table
         self.dialog._populate_entities_table(features)
+        self.dialog.get_all_next_values()
         
         # Set background image selection
         background_widget = self.dialog._entities_table.cellWidget(0, 1)
@@ -1175,6 +1244,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         
         # Populate table
         self.dialog._populate_entities_table(features)
+        self.dialog.get_all_next_values()
         
         # Set different background image selections
         background_widget1 = self.dialog._entities_table.cellWidget(0, 1)
@@ -1229,6 +1299,7 @@ class TestPrepareRecordingDialog(unittest.TestCase):
         mock_feature2.geometry.return_value = mock_geometry2
 
         self.dialog._populate_entities_table([mock_feature1, mock_feature2])
+        self.dialog.get_all_next_values()
 
         self.mock_layer_service.get_raster_layers.assert_called_once()
         self.assertEqual(
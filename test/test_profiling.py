@@ -0,0 +1,116 @@
+"""Tests for on-demand operation profiling."""
+
+import os
+import pstats
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    from core.profiling import ENVIRONMENT_VARIABLE, OperationProfiler, profile_segment, profiled_operation
+except ImportError:
+    from ..core.profiling import ENVIRONMENT_VARIABLE, OperationProfiler, profile_segment, profiled_operation
+
+
+def _busy_function():
+    return sum(index * index for index in range(2000))
+
+
+def _settings(values):
+    settings = Mock()
+    settings.get_value.side_effect = lambda key, default=None: values.get(key, default)
+    return settings
+
+
+class TestOperationProfiler(unittest.TestCase):
+    """Test cases for OperationProfiler and ProfileSession."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        environment = patch.dict(os.environ, {}, clear=False)
+        environment.start()
+        self.addCleanup(environment.stop)
+        os.environ.pop(ENVIRONMENT_VARIABLE, None)
+
+    def _profiler(self, **values):
+        values.setdefault('profiling_output_dir', self.directory.name)
+        return OperationProfiler(_settings(values))
+
+    def test_disabled_by_default(self):
+        profiler = self._profiler()
+
+        self.assertFalse(profiler.enabled)
+        self.assertIsNone(profiler.start_session("import_data"))
+        with profile_segment(None):
+            _busy_function()
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_environment_variable_enables_profiling(self):
+        os.environ[ENVIRONMENT_VARIABLE] = "memory"
+        profiler = self._profiler(profiling_enabled="false")
+
+        self.assertTrue(profiler.enabled)
+        self.assertTrue(profiler.trace_memory)
+
+    @patch('core.profiling._log_summary')
+    def test_profile_writes_prof_file_and_logs_summary(self, log_summary):
+        profiler = self._profiler(profiling_enabled="true", profiling_top_n=5)
+
+        with profiler.profile("import_data") as session:
+            _busy_function()
+
+        self.assertTrue(session.profile_path.endswith(".prof"))
+        self.assertTrue(os.path.basename(session.profile_path).startswith("import_data_"))
+        stats = pstats.Stats(session.profile_path)
+        self.assertTrue(any(function[2] == "_busy_function" for function in stats.stats))
+        self.assertIn("import_data", log_summary.call_args[0][0])
+
+    @patch('core.profiling._log_summary')
+    def test_segments_accumulate_across_threads(self, _log_summary):
+        session = self._profiler(profiling_enabled=True).start_session("warning_refresh")
+
+        def detector_step():
+            with profile_segment(session):
+                _busy_function()
+
+        worker = threading.Thread(target=detector_step)
+        worker.start()
+        worker.join()
+        with profile_segment(session):
+            # Nested segments are ignored instead of failing.
+            with profile_segment(session):
+                _busy_function()
+
+        self.assertIsNotNone(session.finish())
+        self.assertEqual(session._segments, 2)
+
+    @patch('core.profiling._log_summary')
+    def test_trace_memory_writes_snapshot(self, _log_summary):
+        profiler = self._profiler(profiling_enabled=True, profiling_trace_memory="true")
+
+        with profiler.profile("validation") as session:
+            data = [bytearray(512) for _ in range(100)]
+            del data
+
+        self.assertTrue(os.path.exists(session.snapshot_path))
+
+    @patch('core.profiling._log_summary')
+    def test_profiled_operation_uses_owner_profiler(self, _log_summary):
+        class Owner:
+            def __init__(self, profiler):
+                self._profiler = profiler
+
+            @profiled_operation("prepare_recording")
+            def run(self, value):
+                _busy_function()
+                return value
+
+        self.assertEqual(Owner(self._profiler(profiling_enabled=True)).run(3), 3)
+        self.assertEqual(Owner(None).run(4), 4)
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
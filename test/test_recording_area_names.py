@@ -0,0 +1,70 @@
+"""Tests for the per-run recording area name index."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    from core.recording_area_names import RecordingAreaNameIndex
+except ImportError:
+    from ..core.recording_area_names import RecordingAreaNameIndex
+
+
+def _mock_area(feature_id, values):
+    feature = Mock()
+    feature.id.return_value = feature_id
+    feature.__getitem__ = Mock(side_effect=lambda idx: values[idx])
+    feature.attributes.return_value = list(values)
+    return feature
+
+
+def _mock_areas_layer(field_names):
+    layer_fields = Mock()
+    layer_fields.indexOf.side_effect = lambda name: field_names.index(name) if name in field_names else -1
+    layer = Mock()
+    layer.fields.return_value = layer_fields
+    layer.displayExpression.return_value = ""
+    return layer
+
+
+class TestRecordingAreaNameIndex(unittest.TestCase):
+    """Test cases for RecordingAreaNameIndex."""
+
+    def setUp(self):
+        self.layer = _mock_areas_layer(["fid", "code", "name"])
+        self.features = [
+            _mock_area(1, [1, "A-01", "North trench"]),
+            _mock_area(2, [2, "A-02", None]),
+        ]
+        patcher = patch("core.recording_area_names.iter_features", return_value=self.features)
+        self.iter_features = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_resolves_ids_and_key_field_values(self):
+        names = RecordingAreaNameIndex(self.layer, key_fields=["code"])
+
+        self.assertEqual(names.name(1), "North trench")
+        self.assertEqual(names.name("A-01"), "North trench")
+        self.assertEqual(names.name("A-02"), "2")
+
+    def test_ids_only_index_ignores_attribute_values(self):
+        names = RecordingAreaNameIndex(self.layer, key_fields=(), use_display_expression=False)
+
+        self.assertEqual(names.name(1), "North trench")
+        self.assertEqual(names.name("A-01"), "A-01")
+
+    def test_unknown_key_falls_back_to_string(self):
+        names = RecordingAreaNameIndex(self.layer)
+
+        self.assertEqual(names.name(99), "99")
+
+    def test_layer_is_scanned_once(self):
+        names = RecordingAreaNameIndex(self.layer)
+
+        for key in (1, 2, "A-01", "A-02", 99):
+            names.name(key)
+
+        self.assertEqual(self.iter_features.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests for the shared project relation graph."""
+
+import unittest
+from unittest.mock import Mock
+
+try:
+    from core.relation_graph import RelationGraph, get_relation_graph, ordered_layers_along_path
+except ImportError:
+    from ..core.relation_graph import RelationGraph, get_relation_graph, ordered_layers_along_path
+
+
+def _mock_layer(layer_id):
+    layer = Mock()
+    layer.id.return_value = layer_id
+    return layer
+
+
+def _mock_relation(relation_id, referencing_layer, referenced_layer):
+    relation = Mock()
+    relation.id.return_value = relation_id
+    relation.referencingLayer.return_value = referencing_layer
+    relation.referencedLayer.return_value = referenced_layer
+    relation.referencingLayerId.return_value = referencing_layer.id()
+    relation.referencedLayerId.return_value = referenced_layer.id()
+    return relation
+
+
+class TestRelationGraph(unittest.TestCase):
+    """Test cases for RelationGraph."""
+
+    def setUp(self):
+        self.points = _mock_layer('pid')
+        self.link = _mock_layer('lid')
+        self.objects = _mock_layer('oid')
+        self.rel_direct = _mock_relation('direct', self.points, self.objects)
+        self.rel_points_link = _mock_relation('pl', self.points, self.link)
+        self.rel_link_objects = _mock_relation('lo', self.link, self.objects)
+        self.relation_manager = Mock()
+        self.relation_manager.relations.return_value = {
+            'direct': self.rel_direct,
+            'pl': self.rel_points_link,
+            'lo': self.rel_link_objects,
+        }
+        self.graph = RelationGraph(self.relation_manager)
+
+    def test_relations_between_either_direction(self):
+        self.assertEqual(self.graph.relations_between(self.objects, self.points), [self.rel_direct])
+        self.assertIsNone(self.graph.relation_from(self.objects, self.points))
+        self.assertIs(self.graph.relation_from(self.points, self.objects), self.rel_direct)
+
+    def test_shortest_path_skips_forbidden_relation(self):
+        self.assertEqual(self.graph.shortest_path(self.points, self.objects), [self.rel_direct])
+
+        path = self.graph.shortest_path(
+            self.points, self.objects, forbidden_relation_ids=frozenset({'direct'})
+        )
+
+        self.assertEqual(path, [self.rel_points_link, self.rel_link_objects])
+        self.assertEqual(
+            ordered_layers_along_path(self.points, path), [self.points, self.link, self.objects]
+        )
+
+    def test_shortest_path_respects_forbidden_layers(self):
+        path = self.graph.shortest_path(
+            self.points,
+            self.objects,
+            forbidden_relation_ids=frozenset({'direct'}),
+            forbidden_layer_ids=frozenset({'lid'}),
+        )
+
+        self.assertIsNone(path)
+
+    def test_relations_for_layer_id_lists_referencing_then_referenced(self):
+        self.assertEqual(
+            self.graph.relations_for_layer_id('lid'), [self.rel_link_objects, self.rel_points_link]
+        )
+
+    def test_index_is_built_once_and_rebuilt_after_changed_signal(self):
+        self.graph.shortest_path(self.points, self.objects)
+        self.graph.relations_between(self.points, self.link)
+        self.assertEqual(self.relation_manager.relations.call_count, 1)
+
+        on_changed = self.relation_manager.changed.connect.call_args[0][0]
+        self.relation_manager.relations.return_value = {}
+        on_changed()
+
+        self.assertIsNone(self.graph.shortest_path(self.points, self.objects))
+        self.assertEqual(self.relation_manager.relations.call_count, 2)
+
+    def test_shared_graph_follows_relation_manager(self):
+        graph = get_relation_graph(self.relation_manager)
+
+        self.assertIs(get_relation_graph(self.relation_manager), graph)
+        self.assertIsNot(get_relation_graph(Mock()), graph)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for the incremental evaluation of sequence default values.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    from services.sequence_defaults import SequenceDefaultEvaluator, parse_sequence_default
+except ImportError:
+    from ..services.sequence_defaults import SequenceDefaultEvaluator, parse_sequence_default
+
+FIELD_NAMES = ["fid", "numero", "recording_area"]
+
+
+def _mock_layer(defaults):
+    """Build a layer whose fields are FIELD_NAMES and whose defaults map index -> expression."""
+    layer_fields = Mock()
+    layer_fields.count.return_value = len(FIELD_NAMES)
+    layer_fields.indexOf.side_effect = lambda name: FIELD_NAMES.index(name) if name in FIELD_NAMES else -1
+    layer_fields.__iter__ = lambda self: iter([])
+
+    layer = Mock()
+    layer.fields.return_value = layer_fields
+
+    def default_definition(index):
+        definition = Mock()
+        definition.expression.return_value = defaults.get(index, "")
+        return definition
+
+    layer.defaultValueDefinition.side_effect = default_definition
+    return layer
+
+
+def _feature(numero, recording_area):
+    values = {1: numero, 2: recording_area}
+    feature = Mock()
+    feature.attribute.side_effect = values.get
+    return feature
+
+
+class TestParseSequenceDefault(unittest.TestCase):
+    """Test cases for parse_sequence_default."""
+
+    def setUp(self):
+        self.layer = _mock_layer({})
+
+    def test_plain_and_coalesce_forms(self):
+        plain = parse_sequence_default('maximum("numero") + 1', self.layer, 1)
+        coalesce = parse_sequence_default('coalesce(maximum("numero"), 0) + 1', self.layer, 1)
+
+        self.assertEqual((plain.value_index, plain.group_index, plain.start), (1, None, None))
+        self.assertEqual((coalesce.value_index, coalesce.start), (1, 0))
+
+    def test_group_by_and_filter_forms(self):
+        grouped = parse_sequence_default(
+            'coalesce(maximum("numero", group_by:="recording_area"), 0) + 1', self.layer, 1
+        )
+        filtered = parse_sequence_default(
+            'maximum("numero", filter:="recording_area" = @recording_area) + 1', self.layer, 1
+        )
+
+        self.assertEqual((grouped.group_index, grouped.variable), (2, None))
+        self.assertEqual((filtered.group_index, filtered.variable), (2, "recording_area"))
+
+    def test_other_expressions_are_not_sequences(self):
+        self.assertIsNone(parse_sequence_default('maximum("numero") * 2', self.layer, 1))
+        self.assertIsNone(parse_sequence_default('maximum("missing") + 1', self.layer, 1))
+        self.assertIsNone(parse_sequence_default('count("numero") + 1', self.layer, 1))
+
+
+class TestSequenceDefaultEvaluator(unittest.TestCase):
+    """Test cases for SequenceDefaultEvaluator."""
+
+    def test_unrecognised_aggregate_default_disables_the_evaluator(self):
+        layer = _mock_layer({1: 'maximum("numero") * 2'})
+
+        self.assertIsNone(SequenceDefaultEvaluator.for_layer(layer))
+
+    def test_fill_numbers_each_group_from_the_seeded_maxima(self):
+        layer = _mock_layer({1: 'coalesce(maximum("numero", group_by:="recording_area"), 0) + 1'})
+        evaluator = SequenceDefaultEvaluator.for_layer(layer)
+        existing = [_feature(4, "A"), _feature(7, "B")]
+
+        with patch("services.sequence_defaults.iter_features", return_value=existing) as scan:
+            maps = [{2: "A"}, {2: "A"}, {2: "B"}, {1: 20, 2: "C"}, {2: "C"}]
+            for attribute_map in maps:
+                evaluator.fill(attribute_map, Mock())
+
+        scan.assert_called_once()
+        self.assertEqual([attribute_map[1] for attribute_map in maps], [5, 6, 8, 20, 21])
+
+    def test_filter_form_uses_the_variable_group(self):
+        layer = _mock_layer({1: 'maximum("numero", filter:="recording_area" = @recording_area) + 1'})
+        evaluator = SequenceDefaultEvaluator.for_layer(layer)
+        context = Mock()
+        context.variable.return_value = "A"
+
+        with patch("services.sequence_defaults.iter_features", return_value=[_feature(3, "A"), _feature(9, "B")]):
+            first, second = {2: "A"}, {2: "A"}
+            evaluator.fill(first, context)
+            evaluator.fill(second, context)
+
+        self.assertEqual((first[1], second[1]), (4, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
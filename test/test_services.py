@@ -1229,7 +1229,7 @@ class TestQGISLayerService(unittest.TestCase):
         self.assertIn(('objects_layer_id', 42), related_features_cache)
 
     def test_get_related_objects_info_unfiltered_ignores_layer_filters_but_keeps_zone_relation(self):
-        """Unfiltered mode must clear layer filters but still scope to the recording area."""
+        """Unfiltered mode reads an unfiltered copy of the layer but still scopes to the recording area."""
         mock_feature = Mock()
         mock_feature.id.return_value = 1
 
@@ -1237,22 +1237,36 @@ class TestQGISLayerService(unittest.TestCase):
         mock_obj_feature.attribute.return_value = 42
 
         mock_relation = Mock()
-        mock_relation.getRelatedFeatures.return_value = [mock_obj_feature]
+        mock_request = Mock()
+        mock_relation.getRelatedFeaturesRequest.return_value = mock_request
 
         mock_layer = Mock()
+        mock_layer.id.return_value = 'objects_layer_id'
+        mock_layer.providerType.return_value = 'ogr'
+        mock_layer.source.return_value = '/data/objects.gpkg|layername=objects|subset="status" = 1'
+        mock_layer.isEditable.return_value = False
         mock_layer.subsetString.return_value = '"status" = 1'
         mock_layer.filterExpression.return_value = '"visible" = 1'
         mock_fields = Mock()
         mock_fields.indexOf.return_value = 0
         mock_layer.fields.return_value = mock_fields
 
-        with patch.object(self.layer_service, 'get_layer_by_id', return_value=mock_layer):
-            with patch.object(
-                self.layer_service,
-                '_find_relation_to_recording_area',
-                return_value=mock_relation,
-            ) as mock_find_relation:
-                result = self.layer_service.get_related_objects_info(
+        unfiltered_layer = Mock()
+        unfiltered_layer.getFeatures.side_effect = lambda request: iter([mock_obj_feature])
+
+        with patch.object(self.layer_service, 'get_layer_by_id', return_value=mock_layer), \
+                patch.object(
+                    self.layer_service, '_find_relation_to_recording_area', return_value=mock_relation
+                ) as mock_find_relation, \
+                patch('services.layer_service.QgsVectorLayer', return_value=unfiltered_layer) as mock_layer_class, \
+                patch('qgis.core.QgsProviderRegistry') as mock_registry:
+            registry = mock_registry.instance.return_value
+            registry.decodeUri.return_value = {
+                'path': '/data/objects.gpkg', 'layerName': 'objects', 'subset': '"status" = 1'
+            }
+            registry.encodeUri.return_value = '/data/objects.gpkg|layername=objects'
+            results = [
+                self.layer_service.get_related_objects_info(
                     mock_feature,
                     'objects_layer_id',
                     'number_field',
@@ -1260,19 +1274,156 @@ class TestQGISLayerService(unittest.TestCase):
                     recording_areas_layer_id='recording_layer_id',
                     unfiltered=True,
                 )
+                for _ in range(2)
+            ]
+            mock_layer_class.assert_called_once_with('/data/objects.gpkg|layername=objects', mock_layer.name(), 'ogr')
+
+            # Once the run releases its copies, the next lookup reopens the source
+            self.layer_service.release_unfiltered_layers()
+            self.layer_service.get_related_objects_info(
+                mock_feature,
+                'objects_layer_id',
+                'number_field',
+                None,
+                recording_areas_layer_id='recording_layer_id',
+                unfiltered=True,
+            )
+
+        self.assertEqual([result['last_number'] for result in results], ['42', '42'])
+        mock_find_relation.assert_called_with('objects_layer_id', 'recording_layer_id')
+        registry.encodeUri.assert_called_with('ogr', {'path': '/data/objects.gpkg', 'layerName': 'objects'})
+        self.assertEqual(mock_layer_class.call_count, 2)
+        unfiltered_layer.getFeatures.assert_called_with(mock_request)
+        mock_relation.getRelatedFeaturesRequest.assert_called_with(mock_feature)
+        mock_relation.getRelatedFeatures.assert_not_called()
+        mock_layer.setSubsetString.assert_not_called()
+        mock_layer.setFilterExpression.assert_not_called()
+        mock_layer.getFeatures.assert_not_called()
+
+    def test_get_related_objects_info_unfiltered_memory_layer_clears_and_restores_filter(self):
+        """Memory layers cannot be reopened unfiltered, so their filter is cleared for the read."""
+        mock_feature = Mock()
+        mock_feature.id.return_value = 1
+
+        subset_during_read = []
+        mock_obj_feature = Mock()
+        mock_obj_feature.attribute.return_value = 42
+        mock_relation = Mock()
+        mock_relation.getRelatedFeatures.side_effect = lambda feature: (
+            subset_during_read.append(mock_layer.setSubsetString.call_args[0][0]) or [mock_obj_feature]
+        )
+
+        mock_layer = Mock()
+        mock_layer.providerType.return_value = 'memory'
+        mock_layer.isEditable.return_value = False
+        mock_layer.subsetString.return_value = '"numero" < 10'
+        mock_layer.filterExpression.return_value = ''
+        mock_layer.fields.return_value.indexOf.return_value = 0
+
+        with patch.object(self.layer_service, 'get_layer_by_id', return_value=mock_layer), \
+                patch.object(self.layer_service, '_find_relation_to_recording_area', return_value=mock_relation), \
+                patch('services.layer_service.QgsVectorLayer') as mock_layer_class:
+            result = self.layer_service.get_related_objects_info(
+                mock_feature,
+                'objects_layer_id',
+                'number_field',
+                None,
+                recording_areas_layer_id='recording_layer_id',
+                unfiltered=True,
+            )
 
         self.assertEqual(result['last_number'], '42')
-        mock_find_relation.assert_called_once_with('objects_layer_id', 'recording_layer_id')
-        mock_relation.getRelatedFeatures.assert_called_once_with(mock_feature)
-        subset_calls = mock_layer.setSubsetString.call_args_list
-        self.assertEqual(subset_calls[0][0][0], '')
-        self.assertEqual(subset_calls[-1][0][0], '"status" = 1')
-        mock_layer.setFilterExpression.assert_any_call('')
-        self.assertEqual(
-            mock_layer.setFilterExpression.call_args_list[-1][0][0],
-            '"visible" = 1',
+        self.assertEqual(subset_during_read, [''])
+        self.assertEqual(mock_layer.setSubsetString.call_args_list[-1][0][0], '"numero" < 10')
+        mock_layer_class.assert_not_called()
+
+    def _related_batch_fixture(self):
+        """Return (relation, area features) for grouped related-objects lookups."""
+        mock_relation = Mock()
+        mock_relation.fieldPairs.return_value = {'area_id': 'id'}
+        areas = []
+        for feature_id, key in ((1, 10), (2, 20), (3, 30)):
+            area = Mock()
+            area.id.return_value = feature_id
+            area.attribute.return_value = key
+            areas.append(area)
+        return mock_relation, areas
+
+    def test_get_related_objects_info_batch_groups_in_geopackage(self):
+        """GeoPackage layers are aggregated with one GROUP BY query per child layer."""
+        import sqlite3
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'objects.gpkg')
+        connection = sqlite3.connect(path)
+        connection.execute('CREATE TABLE objects (fid INTEGER PRIMARY KEY, area_id INTEGER, numero INTEGER, niveau TEXT)')
+        connection.executemany(
+            'INSERT INTO objects (area_id, numero, niveau) VALUES (?, ?, ?)',
+            [(10, 3, 'b'), (10, 12, 'a'), (20, 5, None), (20, None, 'NULL'), (99, 40, 'z')],
         )
+        connection.commit()
+        connection.close()
+
+        mock_relation, areas = self._related_batch_fixture()
+        mock_layer = Mock()
+        mock_layer.providerType.return_value = 'ogr'
+        mock_layer.isEditable.return_value = False
+        mock_layer.subsetString.return_value = '"numero" < 40'
+        mock_layer.fields.return_value.indexOf.side_effect = ['area_id', 'numero', 'niveau'].index
+        field_info = [
+            {'name': 'area_id', 'is_integer': True, 'type_id': 4},
+            {'name': 'numero', 'is_integer': True, 'type_id': 4},
+            {'name': 'niveau', 'is_integer': False, 'type_id': 10},
+        ]
+
+        with patch.object(self.layer_service, 'get_layer_by_id', return_value=mock_layer), \
+                patch.object(self.layer_service, 'get_layer_fields', return_value=field_info), \
+                patch.object(self.layer_service, '_find_relation_to_recording_area', return_value=mock_relation), \
+                patch('qgis.core.QgsProviderRegistry') as mock_registry:
+            mock_registry.instance.return_value.decodeUri.return_value = {'path': path, 'layerName': 'objects'}
+            result = self.layer_service.get_related_objects_info_batch(
+                areas, 'objects_layer_id', 'numero', 'niveau', 'recording_layer_id'
+            )
+
+        self.assertEqual(result, {
+            1: {'last_number': '12', 'last_level': 'b'},
+            2: {'last_number': '5', 'last_level': ''},
+            3: {'last_number': '', 'last_level': ''},
+        })
         mock_layer.getFeatures.assert_not_called()
+        mock_relation.getRelatedFeatures.assert_not_called()
+
+    def test_get_related_objects_info_batch_scans_other_providers_once(self):
+        """Layers without a SQL data source are scanned once and grouped by relation key."""
+        mock_relation, areas = self._related_batch_fixture()
+        children = []
+        for key, number, level in ((10, 3, 'b'), (20, 7, 'a'), (10, 8, None)):
+            child = Mock()
+            child.attribute.side_effect = {0: key, 1: number, 2: level}.get
+            children.append(child)
+        mock_layer = Mock()
+        mock_layer.providerType.return_value = 'memory'
+        mock_layer.isEditable.return_value = False
+        mock_layer.subsetString.return_value = '"status" = 1'
+        mock_layer.filterExpression.return_value = ''
+        mock_layer.fields.return_value.indexOf.side_effect = ['area_id', 'numero', 'niveau'].index
+        mock_layer.getFeatures.return_value = iter(children)
+
+        with patch.object(self.layer_service, 'get_layer_by_id', return_value=mock_layer), \
+                patch.object(self.layer_service, 'get_layer_fields', return_value=[]), \
+                patch.object(self.layer_service, '_find_relation_to_recording_area', return_value=mock_relation):
+            result = self.layer_service.get_related_objects_info_batch(
+                areas, 'objects_layer_id', 'numero', 'niveau', 'recording_layer_id', unfiltered=True
+            )
+
+        self.assertEqual(result[1]['last_number'], '8')
+        self.assertEqual(result[2]['last_number'], '7')
+        self.assertEqual(result[3], {'last_number': '', 'last_level': ''})
+        mock_layer.getFeatures.assert_called_once()
+        mock_relation.getRelatedFeatures.assert_not_called()
+        self.assertEqual(mock_layer.setSubsetString.call_args_list[0][0][0], '')
+        self.assertEqual(mock_layer.setSubsetString.call_args_list[-1][0][0], '"status" = 1')
 
     def test_calculate_next_level_empty_last_level(self):
         """Test calculating next level when last level is empty."""
@@ -134,12 +134,6 @@ class TestSkippedNumbersDetectorService(unittest.TestCase):
             
             self.assertEqual(warnings, [])
     
-    def test_consecutive_run_length_ending_at(self):
-        """Test consecutive run length ending at a value."""
-        self.assertEqual(self.service._consecutive_run_length_ending_at([1, 2, 3, 10], 3), 3)
-        self.assertEqual(self.service._consecutive_run_length_ending_at([1, 5], 1), 1)
-        self.assertEqual(self.service._consecutive_run_length_ending_at([1, 3], 3), 1)
-
     def test_find_novel_gaps_between_layers(self):
         """Novel gaps include cross-layer holes after consecutive definitive blocks."""
         novel = self.service._find_novel_gaps_between_layers(
@@ -147,7 +141,7 @@ class TestSkippedNumbersDetectorService(unittest.TestCase):
             [5],
             [1, 2, 3, 5, 10],
         )
-        self.assertEqual(novel, [4])
+        self.assertEqual(novel, [(4, 4)])
 
         sandwiched = self.service._find_novel_gaps_between_layers(
             [1, 5],
@@ -161,29 +155,50 @@ class TestSkippedNumbersDetectorService(unittest.TestCase):
             [4, 6],
             [4, 6],
         )
-        self.assertEqual(within_new, [5])
+        self.assertEqual(within_new, [(5, 5)])
+
+    def test_find_novel_gaps_beyond_definitive_span(self):
+        """Gaps above the definitive maximum are reported as one range."""
+        novel = self.service._find_novel_gaps_between_layers(
+            [1, 2, 3],
+            [100000],
+            [1, 2, 3, 100000],
+        )
+        self.assertEqual(novel, [(4, 99999)])
 
-    def test_find_gaps_in_sequence(self):
-        """Test that gaps are correctly identified in a sequence."""
+    def test_find_gap_ranges(self):
+        """Test that gaps are correctly identified as inclusive ranges."""
         # Test with gaps
-        numbers = [1, 2, 4, 6, 8]
-        gaps = self.service._find_gaps_in_sequence(numbers)
-        self.assertEqual(gaps, [3, 5, 7])
+        self.assertEqual(
+            self.service._find_gap_ranges([1, 2, 4, 8, 8]),
+            [(3, 3), (5, 7)],
+        )
         
         # Test with no gaps
-        numbers = [1, 2, 3, 4, 5]
-        gaps = self.service._find_gaps_in_sequence(numbers)
-        self.assertEqual(gaps, [])
+        self.assertEqual(self.service._find_gap_ranges([1, 2, 3, 4, 5]), [])
         
         # Test with single number
-        numbers = [1]
-        gaps = self.service._find_gaps_in_sequence(numbers)
-        self.assertEqual(gaps, [])
+        self.assertEqual(self.service._find_gap_ranges([1]), [])
         
         # Test with empty list
-        numbers = []
-        gaps = self.service._find_gaps_in_sequence(numbers)
-        self.assertEqual(gaps, [])
+        self.assertEqual(self.service._find_gap_ranges([]), [])
+
+    def test_find_gap_ranges_does_not_expand_large_gaps(self):
+        """A single outlier number produces one range instead of every missing number."""
+        gap_ranges = self.service._find_gap_ranges([1, 2, 3, 100000])
+        self.assertEqual(gap_ranges, [(4, 99999)])
+        self.assertEqual(
+            self.service._expand_gap_ranges(gap_ranges, limit=3),
+            [4, 5, 6],
+        )
+
+    def test_get_context_numbers_for_gaps(self):
+        """Context numbers are the existing neighbours of each gap."""
+        context = self.service._get_context_numbers_for_gaps(
+            [1, 2, 5, 9, 100000],
+            [(3, 4), (6, 8), (10, 99999)],
+        )
+        self.assertEqual(context, [2, 5, 9, 100000])
     
     def test_find_layer_by_name_not_found(self):
         """Test that None is returned when layer is not found by name."""
@@ -241,21 +256,21 @@ class TestSkippedNumbersDetectorService(unittest.TestCase):
     def test_create_skipped_numbers_warning_with_translation(self):
         """Test that warning message is created with translation."""
         with patch.object(self.service, "tr", side_effect=lambda msg: msg):
-            warning = self.service._create_skipped_numbers_warning("Test Area", [2, 4], "Test Layer")
+            warning = self.service._create_skipped_numbers_warning("Test Area", [(2, 2), (4, 4)], "Test Layer")
 
         self.assertEqual(warning, "Recording Area 'Test Area' has skipped numbers: [2, 4] in Test Layer")
     
     def test_create_skipped_numbers_warning_single_gap(self):
         """Test that warning message is created for single gap."""
         with patch.object(self.service, "tr", side_effect=lambda msg: msg):
-            warning = self.service._create_skipped_numbers_warning("Test Area", [2], "Test Layer")
+            warning = self.service._create_skipped_numbers_warning("Test Area", [(2, 2)], "Test Layer")
 
         self.assertEqual(warning, "Recording Area 'Test Area' has skipped numbers: [2] in Test Layer")
     
     def test_create_skipped_numbers_warning_fallback_to_english(self):
         """Test that warning message falls back to English when translation fails."""
         with patch.object(self.service, "tr", side_effect=Exception("Translation failed")):
-            warning = self.service._create_skipped_numbers_warning("Test Area", [2, 4], "Test Layer")
+            warning = self.service._create_skipped_numbers_warning("Test Area", [(2, 2), (4, 4)], "Test Layer")
 
         self.assertEqual(warning, "Recording Area 'Test Area' has skipped numbers: [2, 4] in Test Layer")
     
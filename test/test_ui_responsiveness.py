@@ -1,5 +1,6 @@
 """Tests for cooperative UI yielding during long main-thread work."""
 
+import threading
 import unittest
 from unittest.mock import patch
 
@@ -9,13 +10,43 @@ except ImportError:
     from ..core import ui_responsiveness
 
 
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
 class TestUIResponsiveness(unittest.TestCase):
     """Test cases for maybe_yield_to_ui."""
 
     def setUp(self):
+        self.clock = _FakeClock()
+        patcher = patch.object(ui_responsiveness, "_clock", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        ui_responsiveness.set_yield_interval_ms(50)
+        self.addCleanup(
+            ui_responsiveness.set_yield_interval_ms, ui_responsiveness.DEFAULT_YIELD_INTERVAL_MS
+        )
         ui_responsiveness.reset_yield_counter()
 
-    def test_maybe_yield_calls_process_events_every_n_iterations(self):
+    def test_yields_only_after_interval_elapsed(self):
+        with patch.object(ui_responsiveness, "_process_events") as mock_process:
+            for _ in range(1000):
+                ui_responsiveness.maybe_yield_to_ui()
+            mock_process.assert_not_called()
+
+            self.clock.now += 0.06
+            ui_responsiveness.maybe_yield_to_ui()
+            mock_process.assert_called_once()
+
+            ui_responsiveness.maybe_yield_to_ui()
+            mock_process.assert_called_once()
+
+    def test_every_skips_clock_checks_between_calls(self):
+        self.clock.now += 1.0
         with patch.object(ui_responsiveness, "_process_events") as mock_process:
             for _ in range(24):
                 ui_responsiveness.maybe_yield_to_ui(every=25)
@@ -31,17 +62,46 @@ class TestUIResponsiveness(unittest.TestCase):
 
     def test_reset_yield_counter_restarts_interval(self):
         with patch.object(ui_responsiveness, "_process_events") as mock_process:
-            for _ in range(25):
-                ui_responsiveness.maybe_yield_to_ui(every=25)
-            self.assertEqual(mock_process.call_count, 1)
-
+            self.clock.now += 0.04
             ui_responsiveness.reset_yield_counter()
-            for _ in range(24):
-                ui_responsiveness.maybe_yield_to_ui(every=25)
-            self.assertEqual(mock_process.call_count, 1)
+            self.clock.now += 0.04
+            ui_responsiveness.maybe_yield_to_ui()
+            mock_process.assert_not_called()
 
-            ui_responsiveness.maybe_yield_to_ui(every=25)
-            self.assertEqual(mock_process.call_count, 2)
+    def test_no_op_outside_main_thread(self):
+        self.clock.now += 1.0
+        with patch.object(ui_responsiveness, "_process_events") as mock_process:
+            worker = threading.Thread(
+                target=lambda: ui_responsiveness.maybe_yield_to_ui(force=True)
+            )
+            worker.start()
+            worker.join()
+            mock_process.assert_not_called()
+
+
+class TestAdaptiveBatchSizer(unittest.TestCase):
+    """Test cases for AdaptiveBatchSizer."""
+
+    def test_grows_at_most_twice_per_tick_when_fast(self):
+        sizer = ui_responsiveness.AdaptiveBatchSizer(initial=10, budget_ms=14)
+        sizer.record(10, 0.001)
+        self.assertEqual(sizer.size, 20)
+        sizer.record(20, 0.002)
+        self.assertEqual(sizer.size, 40)
+
+    def test_shrinks_to_the_budget_when_slow(self):
+        sizer = ui_responsiveness.AdaptiveBatchSizer(initial=100, budget_ms=14)
+        sizer.record(100, 0.140)
+        self.assertEqual(sizer.size, 10)
+        sizer.record(10, 1.0)
+        self.assertEqual(sizer.size, 1)
+
+    def test_size_stays_within_bounds(self):
+        sizer = ui_responsiveness.AdaptiveBatchSizer(initial=8, maximum=12)
+        sizer.record(8, 0.0)
+        self.assertEqual(sizer.size, 12)
+        sizer.record(0, 5.0)
+        self.assertEqual(sizer.size, 12)
 
 
 if __name__ == "__main__":
@@ -5,8 +5,12 @@ from unittest.mock import Mock, patch, MagicMock
 
 
 try:
+    from core.cancellation import CancellationToken
+    from core.ui_responsiveness import maybe_yield_to_ui
     from core.warning_detection_runner import dispatch_warning_detection_step
 except ImportError:
+    from ..core.cancellation import CancellationToken
+    from ..core.ui_responsiveness import maybe_yield_to_ui
     from ..core.warning_detection_runner import dispatch_warning_detection_step
 
 
@@ -59,6 +63,31 @@ class TestWarningDetectionRunner(unittest.TestCase):
         self.assertEqual(len(errors), 1)
         self.assertIsInstance(errors[0], ValueError)
 
+    def test_cancelled_step_reports_neither_success_nor_error(self):
+        token = CancellationToken()
+        on_success = Mock()
+        on_error = Mock()
+
+        def runner():
+            token.cancel()
+            maybe_yield_to_ui()
+            return ["partial"]
+
+        with patch(
+            "core.warning_detection_runner._get_qgs_task_manager",
+            side_effect=RuntimeError("no qgis"),
+        ), patch("core.ui_responsiveness._process_events"):
+            dispatch_warning_detection_step(
+                "Checking distances",
+                runner,
+                on_success,
+                on_error,
+                cancellation_token=token,
+            )
+
+        on_success.assert_not_called()
+        on_error.assert_not_called()
+
     def test_delegates_to_qgs_task_when_available(self):
         mock_task = MagicMock()
         mock_task_manager = MagicMock()
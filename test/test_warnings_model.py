@@ -0,0 +1,82 @@
+"""
+Tests for the warnings panel item model.
+"""
+
+import unittest
+
+try:
+    from qgis.PyQt.QtCore import QModelIndex
+    from ui.warnings_model import WARNING_FETCH_BATCH, WARNING_ROLE, WarningsModel
+    from core.data_structures import WarningData
+except ImportError:
+    from qgis.PyQt.QtCore import QModelIndex
+    from ..ui.warnings_model import WARNING_FETCH_BATCH, WARNING_ROLE, WarningsModel
+    from ..core.data_structures import WarningData
+
+
+def _warning(message):
+    return WarningData(
+        message=message,
+        recording_area_name="Zone A",
+        layer_name="New Objects",
+        filter_expression='"fid" = 1',
+    )
+
+
+class TestWarningsModel(unittest.TestCase):
+    """Test cases for WarningsModel."""
+
+    def setUp(self):
+        self.model = WarningsModel()
+
+    def _category_titles(self):
+        return [self.model.data(self.model.index(row, 0)) for row in range(self.model.rowCount())]
+
+    def test_only_non_empty_categories_are_shown_in_display_order(self):
+        self.model.set_warnings("distance_warnings", [_warning("too far")])
+        self.model.set_warnings("out_of_bounds_warnings", [_warning("outside"), _warning("outside too")])
+        self.model.set_warnings("skipped_numbers_warnings", [])
+
+        self.assertEqual(
+            self._category_titles(), ["Out-of-Bounds Warnings: (2)", "Distance Warnings: (1)"]
+        )
+        category = self.model.index(1, 0)
+        warning_index = self.model.index(0, 0, category)
+        self.assertEqual(self.model.data(warning_index), "• too far")
+        self.assertEqual(self.model.data(warning_index, WARNING_ROLE).message, "too far")
+        self.assertEqual(self.model.parent(warning_index).row(), 1)
+        self.assertTrue(self.model.category_at(warning_index).opens_both_layers)
+
+    def test_updating_a_category_leaves_the_others_in_place(self):
+        first = _warning("import warning")
+        self.model.set_warnings("duplicate_objects_warnings", [first])
+        self.model.set_warnings("skipped_numbers_warnings", [_warning("skipped")])
+        removed = []
+        self.model.rowsAboutToBeRemoved.connect(lambda parent, start, end: removed.append(parent.isValid()))
+
+        self.model.set_warnings("skipped_numbers_warnings", [_warning("skipped again")])
+        self.model.set_warnings("duplicate_objects_warnings", [first])
+        self.model.set_warnings("duplicate_objects_warnings", [])
+
+        self.assertEqual(removed, [True, False])
+        self.assertEqual(self._category_titles(), ["Skipped Numbers Warnings: (1)"])
+        self.assertEqual(
+            self.model.warning_at(self.model.index(0, 0, self.model.index(0, 0))).message, "skipped again"
+        )
+
+    def test_warning_rows_are_fetched_in_batches(self):
+        self.model.set_warnings(
+            "height_difference_warnings", [_warning(str(number)) for number in range(WARNING_FETCH_BATCH + 5)]
+        )
+        category = self.model.index(0, 0)
+
+        self.assertEqual(self.model.rowCount(category), WARNING_FETCH_BATCH)
+        self.assertTrue(self.model.canFetchMore(category))
+        self.model.fetchMore(category)
+        self.assertEqual(self.model.rowCount(category), WARNING_FETCH_BATCH + 5)
+        self.assertFalse(self.model.canFetchMore(category))
+        self.assertFalse(self.model.canFetchMore(QModelIndex()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,11 +43,12 @@ Usage:
 from typing import Optional, List, Dict, Any, Union, Callable, Tuple
 from qgis.PyQt import QtWidgets
 from qgis.PyQt.QtWidgets import QMessageBox, QDockWidget
-from qgis.PyQt.QtCore import Qt, QTimer
+from qgis.PyQt.QtCore import QT_TRANSLATE_NOOP, Qt, QTimer
 from qgis.PyQt.QtGui import QCloseEvent
 
 try:
     from ..core.interfaces import ISettingsManager, ILayerService
+    from ..core.cancellation import CancellationToken
     from ..core.data_structures import WarningData, ImportSummaryData
     from ..core.ui_responsiveness import flush_ui_updates, maybe_yield_to_ui, reset_yield_counter
     from ..core.warning_detection_runner import dispatch_warning_detection_step
@@ -58,15 +59,25 @@ try:
         block_job_target_signals,
         build_layer_copy_jobs,
         build_peer_temp_layer_replacements,
+        commit_job_direct_writes,
+        copy_next_job_batch,
         ensure_job_expression_context,
-        load_job_source_features,
-        load_job_source_features_chunk,
         remove_pending_import_layers,
         reset_import_session_tracking,
         unblock_job_target_signals,
     )
+    from ..core.diagnostics import DEBUG, get_diagnostics
+    from ..core.performance import (
+        CATEGORY_DETECTOR,
+        CATEGORY_VALIDATION,
+        create_performance_recorder,
+    )
+    from ..core.profiling import OperationProfiler, ProfileSession, profile_segment
+    from ..services.geopackage_direct_commit import DIRECT_COMMIT_SETTING
+    from .warnings_model import WARNING_CATEGORIES, WarningsModel
 except ImportError:
     from core.interfaces import ISettingsManager, ILayerService
+    from core.cancellation import CancellationToken
     from core.data_structures import WarningData, ImportSummaryData
     from core.ui_responsiveness import flush_ui_updates, maybe_yield_to_ui, reset_yield_counter
     from core.warning_detection_runner import dispatch_warning_detection_step
@@ -77,13 +88,24 @@ except ImportError:
         block_job_target_signals,
         build_layer_copy_jobs,
         build_peer_temp_layer_replacements,
+        commit_job_direct_writes,
+        copy_next_job_batch,
         ensure_job_expression_context,
-        load_job_source_features,
-        load_job_source_features_chunk,
         remove_pending_import_layers,
         reset_import_session_tracking,
         unblock_job_target_signals,
     )
+    from core.diagnostics import DEBUG, get_diagnostics
+    from core.performance import (
+        CATEGORY_DETECTOR,
+        CATEGORY_VALIDATION,
+        create_performance_recorder,
+    )
+    from core.profiling import OperationProfiler, ProfileSession, profile_segment
+    from services.geopackage_direct_commit import DIRECT_COMMIT_SETTING
+    from ui.warnings_model import WARNING_CATEGORIES, WarningsModel
+
+_diag = get_diagnostics("ui.import_summary")
 
 
 def _align_center_flag():
@@ -96,6 +118,13 @@ def _align_center_flag():
     raise AttributeError("Qt center alignment flag is not available.")
 
 
+def _qt_enum_value(scope: str, name: str):
+    """Return ``Qt.<name>`` (Qt5) or ``Qt.<scope>.<name>`` (Qt6 scoped enums)."""
+    if hasattr(Qt, name):
+        return getattr(Qt, name)
+    return getattr(getattr(Qt, scope), name)
+
+
 def _qmessagebox_yes_no_dialog_args():
     """
     Return ``QMessageBox.question`` button flags and reply values for Qt5 and Qt6.
@@ -240,7 +269,11 @@ class ImportSummaryDockWidget(QDockWidget):
             archive_projects: Whether field projects from the current import session should be archived on validation
             parent: Parent widget for the dock widget
         """
-        print(f"[DEBUG][UI] ImportSummaryDockWidget created with {len(getattr(summary_data, 'distance_warnings', []))} distance warnings")
+        if _diag.isEnabledFor(DEBUG):
+            _diag.debug(
+                "[UI] ImportSummaryDockWidget created with %s distance warnings",
+                len(getattr(summary_data, 'distance_warnings', [])),
+            )
         super().__init__(parent)
         
         # Store injected dependencies
@@ -259,10 +292,20 @@ class ImportSummaryDockWidget(QDockWidget):
         self._validation_jobs: List[LayerCopyJob] = []
         self._validation_job_index = 0
         self._validation_copied_counts: Dict[str, int] = {}
+        # Layers whose features were committed straight to their GeoPackage
+        self._validation_direct_commits: List[str] = []
         self._validation_missing_configurations: List[str] = []
         self._validation_canvas_rendering_was_enabled: Optional[bool] = None
         self._feature_copier = ImportFeatureCopier()
         self._active_warning_detection_task = None
+        self._warning_detection_cancellation: Optional[CancellationToken] = None
+        metrics = getattr(summary_data, 'performance_metrics', None)
+        self._performance = create_performance_recorder(
+            settings_manager, metrics if isinstance(metrics, list) else None
+        )
+        self._profiler = OperationProfiler(settings_manager)
+        self._warning_refresh_profile: Optional[ProfileSession] = None
+        self._validation_profile: Optional[ProfileSession] = None
 
         # Initialize UI
         self._setup_ui()
@@ -282,6 +325,10 @@ class ImportSummaryDockWidget(QDockWidget):
         self._warnings_analysis_running = False
         self._validation_running = False
 
+        if self._warning_detection_cancellation is not None:
+            self._warning_detection_cancellation.cancel()
+        self._finish_profile_sessions()
+
         task = self._active_warning_detection_task
         if task is not None:
             try:
@@ -310,129 +357,10 @@ class ImportSummaryDockWidget(QDockWidget):
         self.abort_async_operations()
         super().closeEvent(event)
 
-    def _append_out_of_bounds_warnings_section(
-        self, content_layout: QtWidgets.QVBoxLayout
-    ) -> None:
-        """
-        Append out-of-bounds (recording area boundary) warnings to the scrollable summary.
-
-        Reads ``ImportSummaryData.out_of_bounds_warnings`` (filled at import and on refresh).
-        Each structured warning can open the temporary layer attribute table with a filter
-        applied so the user can inspect offending features.
-        """
-        warnings_list = self._effective_warnings("out_of_bounds_warnings")
-        if not warnings_list:
-            return
-        print(f"[DEBUG][UI] Displaying {len(warnings_list)} out-of-bounds warnings")
-        warnings_layout = QtWidgets.QVBoxLayout()
-        warnings_label = QtWidgets.QLabel(self.tr("Out-of-Bounds Warnings:"))
-        warnings_label.setStyleSheet("font-weight: bold; color: #A0522D;")
-        warnings_layout.addWidget(warnings_label)
-        for warning in warnings_list:
-            maybe_yield_to_ui()
-            warning_item_layout = QtWidgets.QHBoxLayout()
-            if hasattr(warning, "message"):
-                warning_text = warning.message
-            else:
-                warning_text = str(warning)
-            warning_item = QtWidgets.QLabel(f"• {warning_text}")
-            warning_item.setStyleSheet("color: #A0522D; margin-left: 10px;")
-            warning_item.setWordWrap(True)
-            warning_item_layout.addWidget(warning_item)
-            if hasattr(warning, "message") and self._iface:
-                if getattr(warning, "second_layer_name", None):
-                    button = QtWidgets.QPushButton(self.tr("Select and Show Both Entities"))
-                    button.setStyleSheet(
-                        "background-color: #FF6B35; color: white; border: none; "
-                        "padding: 5px; border-radius: 3px;"
-                    )
-                    button.clicked.connect(
-                        lambda checked, w=warning: self._open_both_filtered_attribute_tables(w)
-                    )
-                else:
-                    button = QtWidgets.QPushButton(self.tr("Select and Show Entities"))
-                    button.setStyleSheet(
-                        "background-color: #4CAF50; color: white; border: none; "
-                        "padding: 5px; border-radius: 3px;"
-                    )
-                    button.clicked.connect(
-                        lambda checked, w=warning: self._open_filtered_attribute_table(w)
-                    )
-                warning_item_layout.addWidget(button)
-            warning_item_layout.addStretch()
-            warnings_layout.addLayout(warning_item_layout)
-        content_layout.addLayout(warnings_layout)
-        print("[DEBUG][UI] Added out-of-bounds warnings layout to content_layout")
-
-    def _append_warning_entries_section(
-        self,
-        parent_layout: QtWidgets.QVBoxLayout,
-        section_title: str,
-        title_color: str,
-        item_color: str,
-        between_layers_button_color: str,
-        warnings: List[Any],
-    ) -> None:
-        """
-        Append one titled warning list to ``parent_layout``.
-
-        Each call creates its own nested layout so multiple warning groups (for example
-        duplicate objects and skipped numbers) stay visible together.
-        """
-        if not warnings:
-            return
-
-        section_layout = QtWidgets.QVBoxLayout()
-        title_label = QtWidgets.QLabel(self.tr(section_title))
-        title_label.setStyleSheet(f"font-weight: bold; color: {title_color};")
-        section_layout.addWidget(title_label)
-
-        for warning in warnings:
-            maybe_yield_to_ui()
-            warning_item_layout = QtWidgets.QHBoxLayout()
-
-            if hasattr(warning, "message"):
-                warning_text = warning.message
-            else:
-                warning_text = str(warning)
-
-            warning_item = QtWidgets.QLabel(f"• {warning_text}")
-            warning_item.setStyleSheet(f"color: {item_color}; margin-left: 10px;")
-            warning_item.setWordWrap(True)
-            warning_item_layout.addWidget(warning_item)
-
-            if hasattr(warning, "message") and self._iface:
-                if getattr(warning, "second_layer_name", None):
-                    button = QtWidgets.QPushButton(self.tr("Select and Show Both Entities"))
-                    button.setStyleSheet(
-                        f"background-color: {between_layers_button_color}; color: white; "
-                        "border: none; padding: 5px; border-radius: 3px;"
-                    )
-                    button.clicked.connect(
-                        lambda checked, w=warning: self._open_both_filtered_attribute_tables(w)
-                    )
-                else:
-                    button = QtWidgets.QPushButton(self.tr("Select and Show Entities"))
-                    button.setStyleSheet(
-                        "background-color: #4CAF50; color: white; border: none; "
-                        "padding: 5px; border-radius: 3px;"
-                    )
-                    button.clicked.connect(
-                        lambda checked, w=warning: self._open_filtered_attribute_table(w)
-                    )
-                warning_item_layout.addWidget(button)
-
-            warning_item_layout.addStretch()
-            section_layout.addLayout(warning_item_layout)
-
-        parent_layout.addLayout(section_layout)
-
     def _should_show_objects_section(self) -> bool:
         """Return True when the summary should include the objects group box."""
         return (
             self._summary_data.objects_count > 0
-            or self._effective_warnings("duplicate_objects_warnings")
-            or self._effective_warnings("skipped_numbers_warnings")
             or getattr(self._summary_data, "alternative_objects_merged_count", 0) > 0
         )
 
@@ -462,6 +390,10 @@ class ImportSummaryDockWidget(QDockWidget):
         
         # Add summary content
         self._create_summary_content(main_layout)
+
+        self._create_warnings_panel(main_layout)
+
+        self._create_performance_panel(main_layout)
         
         # Add buttons
         self._create_buttons(main_layout)
@@ -534,7 +466,7 @@ class ImportSummaryDockWidget(QDockWidget):
     
     def _create_summary_content(self, parent_layout: QtWidgets.QVBoxLayout) -> None:
         """Create the summary content section."""
-        print("[DEBUG][UI] Creating summary content")
+        _diag.debug("[UI] Creating summary content")
         # Create scroll area for content
         scroll_area = QtWidgets.QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -545,13 +477,6 @@ class ImportSummaryDockWidget(QDockWidget):
         content_widget = QtWidgets.QWidget()
         content_layout = QtWidgets.QVBoxLayout(content_widget)
 
-        # Boundary warnings first so they stay visible without scrolling past long sections
-        print(
-            f"[DEBUG][UI] Summary UI: out_of_bounds_warnings count="
-            f"{len(getattr(self._summary_data, 'out_of_bounds_warnings', None) or [])}"
-        )
-        self._append_out_of_bounds_warnings_section(content_layout)
-
         # CSV Points section
         if self._summary_data.csv_points_count > 0:
             csv_group = self._create_csv_section()
@@ -571,34 +496,6 @@ class ImportSummaryDockWidget(QDockWidget):
         if self._summary_data.small_finds_count > 0:
             small_finds_group = self._create_small_finds_section()
             content_layout.addWidget(small_finds_group)
-
-        # Distance warnings section
-        distance_warnings = self._effective_warnings("distance_warnings")
-        if distance_warnings:
-            print(f"[DEBUG][UI] Displaying {len(distance_warnings)} distance warnings")
-            warnings_layout = QtWidgets.QVBoxLayout()
-            warnings_label = QtWidgets.QLabel(self.tr("Distance Warnings:"))
-            warnings_label.setStyleSheet("font-weight: bold; color: #DC143C;")
-            warnings_layout.addWidget(warnings_label)
-            for i, warning in enumerate(distance_warnings):
-                warning_item_layout = QtWidgets.QHBoxLayout()
-                if hasattr(warning, 'message'):
-                    warning_text = warning.message
-                else:
-                    warning_text = str(warning)
-                warning_item = QtWidgets.QLabel(f"• {warning_text}")
-                warning_item.setStyleSheet("color: #DC143C; margin-left: 10px;")
-                warning_item.setWordWrap(True)
-                warning_item_layout.addWidget(warning_item)
-                if hasattr(warning, 'message') and self._iface:
-                    button = QtWidgets.QPushButton(self.tr("Select and Show Entities"))
-                    button.setStyleSheet("background-color: #DC143C; color: white; border: none; padding: 5px; border-radius: 3px;")
-                    button.clicked.connect(lambda checked, w=warning: self._open_both_filtered_attribute_tables(w))
-                    warning_item_layout.addWidget(button)
-                warning_item_layout.addStretch()
-                warnings_layout.addLayout(warning_item_layout)
-            content_layout.addLayout(warnings_layout)
-            print("[DEBUG][UI] Added distance warnings layout to content_layout")
         
         # Add stretch to push content to top
         content_layout.addStretch()
@@ -607,6 +504,80 @@ class ImportSummaryDockWidget(QDockWidget):
         scroll_area.setWidget(content_widget)
         parent_layout.addWidget(scroll_area)
     
+    def _create_warnings_panel(self, parent_layout: QtWidgets.QVBoxLayout) -> None:
+        """
+        Create the warnings list backed by :class:`WarningsModel`.
+
+        The tree view only paints visible rows, so thousands of warnings do not
+        create thousands of widgets; detector steps update their category in place.
+        """
+        self._warnings_model = WarningsModel(translate=self.tr, parent=self)
+        self._warnings_view = QtWidgets.QTreeView()
+        self._warnings_view.setModel(self._warnings_model)
+        self._warnings_view.setHeaderHidden(True)
+        self._warnings_view.setUniformRowHeights(True)
+        self._warnings_view.setWordWrap(False)
+        self._warnings_view.setToolTip(
+            self.tr("Double-click a warning to select and show the concerned entities.")
+        )
+        self._warnings_model.rowsInserted.connect(self._expand_warning_categories)
+        self._warnings_view.activated.connect(self._handle_warning_activated)
+
+        self._show_warning_button = QtWidgets.QPushButton(self.tr("Select and Show Entities"))
+        self._show_warning_button.setStyleSheet(
+            "background-color: #4CAF50; color: white; border: none; padding: 5px; border-radius: 3px;"
+        )
+        self._show_warning_button.setEnabled(False)
+        self._show_warning_button.setVisible(self._iface is not None)
+        self._show_warning_button.clicked.connect(
+            lambda: self._handle_warning_activated(self._warnings_view.currentIndex())
+        )
+        self._warnings_view.selectionModel().currentChanged.connect(
+            lambda current, _previous: self._show_warning_button.setEnabled(
+                self._warnings_model.warning_at(current) is not None
+            )
+        )
+
+        parent_layout.addWidget(self._warnings_view, 1)
+        parent_layout.addWidget(self._show_warning_button)
+        self._update_warnings_panel()
+
+    def _expand_warning_categories(self, parent, first: int, last: int) -> None:
+        """Expand category rows as soon as they appear in the warnings view."""
+        if parent.isValid():
+            return
+        for row in range(first, last + 1):
+            self._warnings_view.expand(self._warnings_model.index(row, 0))
+
+    def _update_warnings_panel(self, result_key: Optional[str] = None) -> None:
+        """
+        Show the effective warnings of one category, or of every category.
+
+        Only the rows of changed categories are replaced; the rest of the dock
+        (counts, scroll position, selection in other categories) is untouched.
+        """
+        model = getattr(self, "_warnings_model", None)
+        if model is None:
+            return
+        keys = [result_key] if result_key else [category.result_key for category in WARNING_CATEGORIES]
+        for key in keys:
+            model.set_warnings(key, self._effective_warnings(key))
+        self._warnings_view.setVisible(model.rowCount() > 0)
+        self._show_warning_button.setVisible(self._iface is not None and model.rowCount() > 0)
+
+    def _handle_warning_activated(self, index) -> None:
+        """Select and show the entities of the activated warning row."""
+        warning = self._warnings_model.warning_at(index)
+        if warning is None or not hasattr(warning, "message") or not self._iface:
+            return
+        category = self._warnings_model.category_at(index)
+        if (category is not None and category.opens_both_layers) or getattr(
+            warning, "second_layer_name", None
+        ):
+            self._open_both_filtered_attribute_tables(warning)
+        else:
+            self._open_filtered_attribute_table(warning)
+
     def _create_csv_section(self) -> QtWidgets.QGroupBox:
         """Create the CSV points summary section."""
         group = QtWidgets.QGroupBox(self.tr("Total Station CSV Points"))
@@ -633,124 +604,6 @@ class ImportSummaryDockWidget(QDockWidget):
             duplicates_layout.addWidget(duplicates_count)
             layout.addLayout(duplicates_layout)
         
-        # Duplicate total station identifiers warnings
-        duplicate_ts_warnings = self._effective_warnings(
-            "duplicate_total_station_identifiers_warnings"
-        )
-        if duplicate_ts_warnings:
-            warnings_layout = QtWidgets.QVBoxLayout()
-            warnings_label = QtWidgets.QLabel(self.tr("Duplicate Identifiers Warnings:"))
-            warnings_label.setStyleSheet("font-weight: bold; color: #FF4500;")
-            warnings_layout.addWidget(warnings_label)
-            
-            for warning in duplicate_ts_warnings:
-                warning_item_layout = QtWidgets.QHBoxLayout()
-                
-                # Warning text - check if it has the expected attributes
-                if hasattr(warning, 'message'):
-                    warning_text = warning.message
-                else:
-                    warning_text = str(warning)
-                
-                warning_item = QtWidgets.QLabel(f"• {warning_text}")
-                warning_item.setStyleSheet("color: #FF4500; margin-left: 10px;")
-                warning_item.setWordWrap(True)
-                warning_item_layout.addWidget(warning_item)
-                
-                # Add button if we have structured data and QGIS interface
-                if hasattr(warning, 'message') and self._iface:
-                    if getattr(warning, "second_layer_name", None):
-                        # Between-layer warning - open both tables
-                        button = QtWidgets.QPushButton(self.tr("Select and Show Both Entities"))
-                        button.setStyleSheet("background-color: #FF6B35; color: white; border: none; padding: 5px; border-radius: 3px;")
-                        button.clicked.connect(lambda checked, w=warning: self._open_both_filtered_attribute_tables(w))
-                    else:
-                        # Single layer warning
-                        button = QtWidgets.QPushButton(self.tr("Select and Show Entities"))
-                        button.setStyleSheet("background-color: #4CAF50; color: white; border: none; padding: 5px; border-radius: 3px;")
-                        button.clicked.connect(lambda checked, w=warning: self._open_filtered_attribute_table(w))
-                    warning_item_layout.addWidget(button)
-                
-                warning_item_layout.addStretch()
-                warnings_layout.addLayout(warning_item_layout)
-            
-            layout.addLayout(warnings_layout)
-        
-        # Height difference warnings
-        height_difference_warnings = self._effective_warnings("height_difference_warnings")
-        if height_difference_warnings:
-            warnings_layout = QtWidgets.QVBoxLayout()
-            warnings_label = QtWidgets.QLabel(self.tr("Height Difference Warnings:"))
-            warnings_label.setStyleSheet("font-weight: bold; color: #FF4500;")
-            warnings_layout.addWidget(warnings_label)
-            
-            for warning in height_difference_warnings:
-                warning_item_layout = QtWidgets.QHBoxLayout()
-                
-                # Warning text - check if it has the expected attributes
-                if hasattr(warning, 'message'):
-                    warning_text = warning.message
-                else:
-                    warning_text = str(warning)
-                
-                warning_item = QtWidgets.QLabel(f"• {warning_text}")
-                warning_item.setStyleSheet("color: #FF8C00; margin-left: 10px;")
-                warning_item.setWordWrap(True)
-                warning_item_layout.addWidget(warning_item)
-                
-                # Add button if we have structured data and QGIS interface
-                if hasattr(warning, 'message') and self._iface:
-                    if getattr(warning, "second_layer_name", None):
-                        # Between-layer warning - open both tables
-                        button = QtWidgets.QPushButton(self.tr("Select and Show Both Entities"))
-                        button.setStyleSheet("background-color: #FF6B35; color: white; border: none; padding: 5px; border-radius: 3px;")
-                        button.clicked.connect(lambda checked, w=warning: self._open_both_filtered_attribute_tables(w))
-                    else:
-                        # Single layer warning
-                        button = QtWidgets.QPushButton(self.tr("Select and Show Entities"))
-                        button.setStyleSheet("background-color: #4CAF50; color: white; border: none; padding: 5px; border-radius: 3px;")
-                        button.clicked.connect(lambda checked, w=warning: self._open_filtered_attribute_table(w))
-                    warning_item_layout.addWidget(button)
-                
-                warning_item_layout.addStretch()
-                warnings_layout.addLayout(warning_item_layout)
-            
-            layout.addLayout(warnings_layout)
-        
-        # Missing total station warnings
-        missing_total_station_warnings = self._effective_warnings("missing_total_station_warnings")
-        if missing_total_station_warnings:
-            warnings_layout = QtWidgets.QVBoxLayout()
-            warnings_label = QtWidgets.QLabel(self.tr("Missing Total Station Warnings:"))
-            warnings_label.setStyleSheet("font-weight: bold; color: #8B0000;")
-            warnings_layout.addWidget(warnings_label)
-            
-            for i, warning in enumerate(missing_total_station_warnings):
-                warning_item_layout = QtWidgets.QHBoxLayout()
-                
-                # Warning text - check if it has the expected attributes
-                if hasattr(warning, 'message'):
-                    warning_text = warning.message
-                else:
-                    warning_text = str(warning)
-                
-                warning_item = QtWidgets.QLabel(f"• {warning_text}")
-                warning_item.setStyleSheet("color: #8B0000; margin-left: 10px;")
-                warning_item.setWordWrap(True)
-                warning_item_layout.addWidget(warning_item)
-                
-                # Add button if we have structured data and QGIS interface
-                if hasattr(warning, 'message') and self._iface:
-                    button = QtWidgets.QPushButton(self.tr("Select and Show Entities"))
-                    button.setStyleSheet("background-color: #8B0000; color: white; border: none; padding: 5px; border-radius: 3px;")
-                    button.clicked.connect(lambda checked, w=warning: self._open_both_filtered_attribute_tables(w))
-                    warning_item_layout.addWidget(button)
-                
-                warning_item_layout.addStretch()
-                warnings_layout.addLayout(warning_item_layout)
-            
-            layout.addLayout(warnings_layout)
-        
         return group
     
     def _create_features_section(self) -> QtWidgets.QGroupBox:
@@ -817,26 +670,6 @@ class ImportSummaryDockWidget(QDockWidget):
             duplicates_layout.addWidget(duplicates_count)
             layout.addLayout(duplicates_layout)
         
-        # Duplicate objects warnings
-        self._append_warning_entries_section(
-            layout,
-            "Duplicate Objects Warnings:",
-            "#FF4500",
-            "#FF4500",
-            "#FF6B35",
-            self._effective_warnings("duplicate_objects_warnings"),
-        )
-
-        # Skipped numbers warnings
-        self._append_warning_entries_section(
-            layout,
-            "Skipped Numbers Warnings:",
-            "#FF8C00",
-            "#FF8C00",
-            "#FF6B35",
-            self._effective_warnings("skipped_numbers_warnings"),
-        )
-        
         return group
     
     def _create_small_finds_section(self) -> QtWidgets.QGroupBox:
@@ -867,6 +700,132 @@ class ImportSummaryDockWidget(QDockWidget):
         
         return group
     
+    # Header titles are translated with tr(); QT_TRANSLATE_NOOP keeps them in the .ts files.
+    _PERFORMANCE_COLUMNS: Tuple[str, ...] = (
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Step"),
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Wall (ms)"),
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "CPU (ms)"),
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Features"),
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Peak memory (MB)"),
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Cache hits"),
+    )
+
+    def _create_performance_panel(self, parent_layout: QtWidgets.QVBoxLayout) -> None:
+        """Create the collapsible per-step performance panel (collapsed by default)."""
+        header_layout = QtWidgets.QHBoxLayout()
+        self._performance_toggle = QtWidgets.QToolButton()
+        self._performance_toggle.setText(self.tr("Performance"))
+        self._performance_toggle.setCheckable(True)
+        self._performance_toggle.setChecked(False)
+        self._performance_toggle.setStyleSheet("QToolButton { border: none; font-weight: bold; }")
+        self._performance_toggle.setToolButtonStyle(
+            _qt_enum_value("ToolButtonStyle", "ToolButtonTextBesideIcon")
+        )
+        self._performance_toggle.setArrowType(_qt_enum_value("ArrowType", "RightArrow"))
+
+        self._performance_export_button = QtWidgets.QPushButton(self.tr("Export JSON..."))
+        self._performance_export_button.setVisible(False)
+
+        header_layout.addWidget(self._performance_toggle)
+        header_layout.addStretch()
+        header_layout.addWidget(self._performance_export_button)
+        parent_layout.addLayout(header_layout)
+
+        self._performance_table = QtWidgets.QTableWidget(0, len(self._PERFORMANCE_COLUMNS))
+        self._performance_table.setHorizontalHeaderLabels(
+            [self.tr(column) for column in self._PERFORMANCE_COLUMNS]
+        )
+        self._performance_table.verticalHeader().setVisible(False)
+        self._performance_table.setVisible(False)
+        parent_layout.addWidget(self._performance_table)
+
+        self._refresh_performance_panel()
+
+    def _set_performance_panel_expanded(self, expanded: bool) -> None:
+        """Show or hide the performance table and its export button."""
+        self._performance_toggle.setArrowType(
+            _qt_enum_value("ArrowType", "DownArrow" if expanded else "RightArrow")
+        )
+        self._performance_table.setVisible(expanded)
+        self._performance_export_button.setVisible(expanded)
+        if expanded:
+            self._refresh_performance_panel()
+
+    def _refresh_performance_panel(self) -> None:
+        """Fill the performance table from the recorded step metrics."""
+        table = getattr(self, "_performance_table", None)
+        if table is None:
+            return
+        try:
+            steps = list(self._performance.metrics)
+            table.setRowCount(len(steps))
+            for row, step in enumerate(steps):
+                hit_rate = step.cache_hit_rate()
+                values = (
+                    step.name,
+                    f"{step.wall_time_ms:.1f}",
+                    f"{step.cpu_time_ms:.1f}",
+                    str(step.features_scanned),
+                    "" if step.peak_memory_bytes is None else f"{step.peak_memory_bytes / (1024 * 1024):.1f}",
+                    "" if hit_rate is None else f"{hit_rate:.0%}",
+                )
+                for column, value in enumerate(values):
+                    table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
+            table.resizeColumnsToContents()
+        except Exception as e:
+            _diag.warning("Error refreshing performance panel: %s", e)
+
+    def _handle_export_performance(self) -> None:
+        """Export recorded step metrics to a JSON file chosen by the user."""
+        file_path, _selected_filter = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            self.tr("Export Performance Metrics"),
+            "archeosync_performance.json",
+            self.tr("JSON files (*.json)"),
+        )
+        if not file_path:
+            return
+        try:
+            self._performance.export_json(file_path, extra={'import_summary': self._import_counts()})
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                self.tr("Export Error"),
+                self.tr("Could not export performance metrics: {error}").format(error=str(e)),
+            )
+
+    def _import_counts(self) -> Dict[str, Any]:
+        """Return the import counts of the summary, for exported performance reports."""
+        keys = (
+            'csv_points_count',
+            'features_count',
+            'objects_count',
+            'small_finds_count',
+            'is_global_project',
+        )
+        return {key: getattr(self._summary_data, key, None) for key in keys}
+
+    def _measured_warning_step(
+        self, status_label: str, runner: Callable[[], List[Any]]
+    ) -> Callable[[], List[Any]]:
+        """Wrap one warning refresh runner so it is recorded as a detector step."""
+        step_name = status_label.rstrip(". ")
+        profile = self._warning_refresh_profile
+
+        def run() -> List[Any]:
+            with profile_segment(profile), self._performance.measure(step_name, category=CATEGORY_DETECTOR):
+                return runner()
+
+        return run
+
+    def _finish_profile_sessions(self) -> None:
+        """Write the profiles of warning refresh and validation, if any are open."""
+        for attribute in ('_warning_refresh_profile', '_validation_profile'):
+            session = getattr(self, attribute, None)
+            if session is not None:
+                setattr(self, attribute, None)
+                session.finish()
+
     def _create_buttons(self, parent_layout: QtWidgets.QVBoxLayout) -> None:
         """Create the button section."""
         button_layout = QtWidgets.QHBoxLayout()
@@ -895,6 +854,8 @@ class ImportSummaryDockWidget(QDockWidget):
         self._refresh_button.clicked.connect(self._handle_refresh_warnings)
         self._cancel_button.clicked.connect(self._handle_cancel)
         self._validate_button.clicked.connect(self._handle_validate)
+        self._performance_toggle.toggled.connect(self._set_performance_panel_expanded)
+        self._performance_export_button.clicked.connect(self._handle_export_performance)
 
     def refresh_warnings_silently(self) -> None:
         """
@@ -922,23 +883,33 @@ class ImportSummaryDockWidget(QDockWidget):
         """
         Begin incremental validation on the Qt main thread.
 
-        One feature is copied per ``QTimer`` tick so the progress bar can repaint
-        between copies. Default value expressions are still evaluated per feature
-        via ``QgsVectorLayerUtils.createFeature``.
+        Each ``QTimer`` tick runs :meth:`_run_validation_batch_step`, which copies
+        one batch of the current layer job with :func:`copy_next_job_batch`. Source
+        features are streamed from the temporary layer one batch at a time, and
+        batch sizes adapt to fill about one frame budget so the progress bar keeps
+        repainting. Layers whose defaults are order-independent or recognised
+        ``maximum(...) + 1`` sequences are created with ``createFeatures`` and
+        inserted with ``addFeatures`` per batch; other layers are copied feature by
+        feature. With direct commit enabled, GeoPackage targets are written in a
+        single transaction when the job completes.
         """
         from qgis.core import QgsProject
 
+        self._validation_profile = self._profiler.start_session("validation")
         project = QgsProject.instance()
         self._validation_jobs = build_layer_copy_jobs(
             project.mapLayers(),
             self._get_definitive_layer_id,
+            direct_commit=self._direct_commit_enabled(),
         )
         self._validation_job_index = 0
         self._validation_copied_counts = {}
+        self._validation_direct_commits = []
         self._validation_missing_configurations = self._collect_missing_layer_configurations()
 
         total_features = self._validation_total_feature_count()
         if total_features <= 0:
+            self._finish_profile_sessions()
             self._complete_validation_with_no_copied_features()
             return
 
@@ -954,6 +925,15 @@ class ImportSummaryDockWidget(QDockWidget):
         flush_ui_updates(self._warnings_analysis_container)
         QTimer.singleShot(0, self._run_validation_batch_step)
 
+    def _direct_commit_enabled(self) -> bool:
+        """Return True when validation may write directly to GeoPackage tables."""
+        if not self._settings_manager:
+            return False
+        value = self._settings_manager.get_value(DIRECT_COMMIT_SETTING, False)
+        if isinstance(value, str):
+            return value.lower() == 'true'
+        return bool(value)
+
     def _collect_missing_layer_configurations(self) -> List[str]:
         """Return settings keys for import layers present but not configured."""
         from qgis.core import QgsProject
@@ -983,25 +963,12 @@ class ImportSummaryDockWidget(QDockWidget):
                 processed += job.feature_index
         return processed
 
-    def _validation_progress_value(self) -> int:
-        """
-        Progress bar value including partial loading of the active job.
-
-        While features are still being read from disk, advance the bar so the
-        user sees movement before the first copy starts.
-        """
-        processed = self._validation_processed_feature_count()
-        if self._validation_job_index < len(self._validation_jobs):
-            job = self._validation_jobs[self._validation_job_index]
-            if not job.load_complete and job.source_features is not None:
-                processed += len(job.source_features)
-        return processed
-
     def _validation_total_feature_count(self) -> int:
-        return sum(job.feature_count for job in self._validation_jobs)
+        # feature_count is the featureCount() estimate until a job's source is read to the end.
+        return sum(max(job.feature_count, job.feature_index) for job in self._validation_jobs)
 
     def _sync_validation_progress_maximum(self) -> None:
-        """Refresh the progress bar maximum when loaded counts differ from estimates."""
+        """Refresh the progress bar maximum when read counts differ from estimates."""
         if not hasattr(self, "_warnings_analysis_progress"):
             return
         total = self._validation_total_feature_count()
@@ -1027,9 +994,13 @@ class ImportSummaryDockWidget(QDockWidget):
             pass
 
     def _run_validation_batch_step(self) -> None:
-        """Load or copy one small chunk, then yield back to the Qt event loop."""
+        """Copy one small chunk, then yield back to the Qt event loop."""
         if self._async_aborted:
             return
+        with profile_segment(self._validation_profile):
+            self._process_validation_batch_step()
+
+    def _process_validation_batch_step(self) -> None:
         try:
             if self._validation_job_index >= len(self._validation_jobs):
                 self._finalize_validation_success()
@@ -1037,45 +1008,23 @@ class ImportSummaryDockWidget(QDockWidget):
 
             job = self._validation_jobs[self._validation_job_index]
             total = self._validation_total_feature_count()
-
-            if not job.load_complete:
-                load_job_source_features_chunk(job)
-                loaded = len(job.source_features or [])
-                self._sync_validation_progress_maximum()
-                total = self._validation_total_feature_count()
-                self._update_warnings_analysis_progress(
-                    self._validation_progress_value(),
-                    self.tr("Loading {layer}... ({current}/{total})").format(
-                        layer=job.temp_layer_name,
-                        current=loaded,
-                        total=job.feature_count,
-                    ),
-                )
-                QTimer.singleShot(0, self._run_validation_batch_step)
-                return
+            step_name = f"Validation: {job.temp_layer_name}"
 
             ensure_job_expression_context(job)
 
             processed = self._validation_processed_feature_count()
             self._update_warnings_analysis_progress(
-                self._validation_progress_value(),
+                processed,
                 self.tr("Validating import... ({current}/{total})").format(
                     current=processed,
                     total=total,
                 ),
             )
 
-            batch_result = self._feature_copier.copy_features_batch(
-                source_features=job.source_features or [],
-                target_layer=job.target_layer,
-                start_index=job.feature_index,
-                field_mapping=job.field_mapping,
-                expression_context=job.expression_context,
-            )
-
-            job.feature_index = batch_result.next_index
-            job.copied_count += batch_result.copied_count
-            job.added_feature_ids.extend(batch_result.added_feature_ids)
+            start_index = job.feature_index
+            with self._performance.measure(step_name, category=CATEGORY_VALIDATION) as step:
+                batch_result = copy_next_job_batch(job, self._feature_copier)
+                step.features_scanned += max(0, batch_result.next_index - start_index)
 
             if batch_result.error_count > 0:
                 print(
@@ -1083,17 +1032,28 @@ class ImportSummaryDockWidget(QDockWidget):
                     f"{batch_result.error_count} feature error(s) in batch"
                 )
 
+            self._sync_validation_progress_maximum()
+            total = self._validation_total_feature_count()
             processed = self._validation_processed_feature_count()
             self._update_warnings_analysis_progress(
-                self._validation_progress_value(),
+                processed,
                 self.tr("Validating import... ({current}/{total})").format(
                     current=processed,
                     total=total,
                 ),
             )
 
-            if job.feature_index >= job.feature_count:
+            if job.load_complete:
                 unblock_job_target_signals(job)
+                if job.direct_writer is not None:
+                    with self._performance.measure(f"{step_name} (commit)", category=CATEGORY_VALIDATION):
+                        committed = commit_job_direct_writes(job)
+                    if not committed:
+                        # Nothing was written; copy the layer again through the edit buffer.
+                        block_job_target_signals(job)
+                        QTimer.singleShot(0, self._run_validation_batch_step)
+                        return
+                    self._validation_direct_commits.append(job.target_layer.name())
                 self._feature_copier.select_copied_features(
                     job.target_layer,
                     job.added_feature_ids,
@@ -1105,6 +1065,7 @@ class ImportSummaryDockWidget(QDockWidget):
                 )
                 self._validation_job_index += 1
                 self._sync_validation_progress_maximum()
+                self._refresh_performance_panel()
 
             QTimer.singleShot(0, self._run_validation_batch_step)
         except Exception as e:
@@ -1136,6 +1097,7 @@ class ImportSummaryDockWidget(QDockWidget):
 
     def _finalize_validation_success(self) -> None:
         """Show the success summary, then archive data and close the dock."""
+        self._finish_profile_sessions()
         self._unblock_all_validation_layer_signals()
         self._set_map_canvas_rendering(True)
         self._set_warnings_analysis_busy(False)
@@ -1144,13 +1106,22 @@ class ImportSummaryDockWidget(QDockWidget):
             success_message = self.tr("Features copied successfully!\n\n")
             for layer_name, count in self._validation_copied_counts.items():
                 success_message += f"• {layer_name}: {count} features\n"
-            success_message += f"\n{self.tr('The definitive layers are now in edit mode.')}\n"
-            success_message += (
-                f"{self.tr('The newly copied features are selected for easy identification.')}\n"
-            )
-            success_message += f"{self.tr('Please review the copied features and:')}\n"
-            success_message += f"• {self.tr('Save changes if you want to keep them')}\n"
-            success_message += f"• {self.tr('Cancel changes if you want to discard them')}"
+            if self._validation_direct_commits:
+                success_message += "\n" + self.tr(
+                    "Saved directly to the GeoPackage: {layers}"
+                ).format(layers=", ".join(self._validation_direct_commits)) + "\n"
+            if len(self._validation_direct_commits) < len(self._validation_copied_counts):
+                success_message += f"\n{self.tr('The definitive layers are now in edit mode.')}\n"
+                success_message += (
+                    f"{self.tr('The newly copied features are selected for easy identification.')}\n"
+                )
+                success_message += f"{self.tr('Please review the copied features and:')}\n"
+                success_message += f"• {self.tr('Save changes if you want to keep them')}\n"
+                success_message += f"• {self.tr('Cancel changes if you want to discard them')}"
+            else:
+                success_message += (
+                    f"{self.tr('The newly copied features are selected for easy identification.')}"
+                )
 
             QMessageBox.information(
                 self,
@@ -1170,6 +1141,7 @@ class ImportSummaryDockWidget(QDockWidget):
 
     def _handle_validation_failure(self, error: Exception) -> None:
         """Roll back UI state and show a validation error."""
+        self._finish_profile_sessions()
         self._unblock_all_validation_layer_signals()
         self._set_map_canvas_rendering(True)
         self._set_warnings_analysis_busy(False)
@@ -1337,6 +1309,11 @@ class ImportSummaryDockWidget(QDockWidget):
         self._warning_refresh_index = 0
         self._warning_refresh_results: Dict[str, List[Any]] = {}
         self._active_warning_detection_task = None
+        if self._warning_detection_cancellation is not None:
+            self._warning_detection_cancellation.cancel()
+        self._warning_detection_cancellation = CancellationToken()
+        self._performance.clear(CATEGORY_DETECTOR)
+        self._warning_refresh_profile = self._profiler.start_session("warning_refresh")
 
         total_steps = len(self._warning_refresh_plan)
         self._set_warnings_analysis_busy(True, total_steps=total_steps)
@@ -1495,6 +1472,7 @@ class ImportSummaryDockWidget(QDockWidget):
             runner,
             on_success,
             on_error,
+            cancellation_token=self._warning_detection_cancellation,
         )
 
     def _run_next_warning_refresh_step(self) -> None:
@@ -1508,6 +1486,7 @@ class ImportSummaryDockWidget(QDockWidget):
             return
 
         result_key, status_label, runner = self._warning_refresh_plan[self._warning_refresh_index]
+        runner = self._measured_warning_step(status_label, runner)
         step_number = self._warning_refresh_index + 1
         reset_yield_counter()
         self._update_warnings_analysis_progress(
@@ -1524,7 +1503,8 @@ class ImportSummaryDockWidget(QDockWidget):
                 return
             if result_key is not None:
                 self._warning_refresh_results[result_key] = list(warnings or [])
-                self._recreate_summary_content()
+                self._update_warnings_panel(result_key)
+            self._refresh_performance_panel()
             self._warning_refresh_index += 1
             self._update_warnings_analysis_progress(
                 self._warning_refresh_index,
@@ -1549,7 +1529,7 @@ class ImportSummaryDockWidget(QDockWidget):
         self._dispatch_warning_detection_step(status_label, runner, on_success, on_error)
 
     def _finalize_warning_refresh(self) -> None:
-        """Apply collected warnings and rebuild the summary panel on the next event-loop tick."""
+        """Apply collected warnings and update the warnings panel on the next event-loop tick."""
         if self._async_aborted:
             return
         try:
@@ -1564,11 +1544,13 @@ class ImportSummaryDockWidget(QDockWidget):
             self._handle_warning_refresh_error(exc)
 
     def _complete_warning_refresh_ui(self) -> None:
-        """Rebuild summary widgets and clear the busy indicator."""
+        """Show the final warning lists and clear the busy indicator."""
         if self._async_aborted:
             return
         try:
-            self._recreate_summary_content()
+            with profile_segment(self._warning_refresh_profile):
+                self._update_warnings_panel()
+            self._finish_profile_sessions()
 
             if self._warning_refresh_show_feedback:
                 QMessageBox.information(
@@ -1583,6 +1565,7 @@ class ImportSummaryDockWidget(QDockWidget):
 
     def _handle_warning_refresh_error(self, error: Exception) -> None:
         """Abort incremental refresh and surface errors to the user."""
+        self._finish_profile_sessions()
         print(f"Error refreshing warnings: {error}")
         import traceback
         traceback.print_exc()
@@ -1613,14 +1596,14 @@ class ImportSummaryDockWidget(QDockWidget):
             settings_manager=self._settings_manager,
             layer_service=self._layer_service,
         )
-        return detector.detect_duplicate_objects()
+        return detector.detect_duplicate_objects(cancellation_token=self._warning_detection_cancellation)
 
     def _detect_skipped_numbers_warnings(self) -> List[Any]:
         detector = SkippedNumbersDetectorService(
             settings_manager=self._settings_manager,
             layer_service=self._layer_service,
         )
-        return detector.detect_skipped_numbers()
+        return detector.detect_skipped_numbers(cancellation_token=self._warning_detection_cancellation)
 
     def _detect_out_of_bounds_warnings(self) -> List[Any]:
         service_class = self._load_detector_service(
@@ -1631,7 +1614,7 @@ class ImportSummaryDockWidget(QDockWidget):
             settings_manager=self._settings_manager,
             layer_service=self._layer_service,
         )
-        return detector.detect_out_of_bounds_features()
+        return detector.detect_out_of_bounds_features(cancellation_token=self._warning_detection_cancellation)
 
     def _detect_distance_warnings(self) -> List[Any]:
         service_class = self._load_detector_service(
@@ -1646,7 +1629,7 @@ class ImportSummaryDockWidget(QDockWidget):
                 'objects_count': getattr(self._summary_data, 'objects_count', None),
             },
         )
-        return detector.detect_distance_warnings()
+        return detector.detect_distance_warnings(cancellation_token=self._warning_detection_cancellation)
 
     def _detect_missing_total_station_warnings(self) -> List[Any]:
         service_class = self._load_detector_service(
@@ -1657,7 +1640,7 @@ class ImportSummaryDockWidget(QDockWidget):
             settings_manager=self._settings_manager,
             layer_service=self._layer_service,
         )
-        return detector.detect_missing_total_station_warnings()
+        return detector.detect_missing_total_station_warnings(cancellation_token=self._warning_detection_cancellation)
 
     def _detect_duplicate_total_station_identifiers_warnings(self) -> List[Any]:
         service_class = self._load_detector_service(
@@ -1668,7 +1651,7 @@ class ImportSummaryDockWidget(QDockWidget):
             settings_manager=self._settings_manager,
             layer_service=self._layer_service,
         )
-        return detector.detect_duplicate_identifiers_warnings()
+        return detector.detect_duplicate_identifiers_warnings(cancellation_token=self._warning_detection_cancellation)
 
     def _detect_height_difference_warnings(self) -> List[Any]:
         service_class = self._load_detector_service(
@@ -1679,116 +1662,7 @@ class ImportSummaryDockWidget(QDockWidget):
             settings_manager=self._settings_manager,
             layer_service=self._layer_service,
         )
-        return detector.detect_height_difference_warnings()
-    
-    def _recreate_summary_content(self) -> None:
-        """Recreate the summary content to show updated warnings."""
-        try:
-            # Get the main widget and its layout
-            main_widget = self.widget()
-            if not main_widget:
-                print("No main widget found")
-                return
-                
-            main_layout = main_widget.layout()
-            if not main_layout:
-                print("No main layout found")
-                return
-            
-            # Find and remove the existing scroll area (should be after title, before buttons)
-            scroll_area_index = None
-            for i in range(main_layout.count()):
-                item = main_layout.itemAt(i)
-                if item and item.widget() and isinstance(item.widget(), QtWidgets.QScrollArea):
-                    scroll_area = item.widget()
-                    main_layout.removeWidget(scroll_area)
-                    scroll_area.deleteLater()
-                    scroll_area_index = i
-                    break
-            
-            if scroll_area_index is None:
-                print("No scroll area found to recreate")
-                return
-            
-            # Recreate the summary content in the correct position (after title, before buttons)
-            # Insert at the same index where the old scroll area was
-            self._create_summary_content_at_index(main_layout, scroll_area_index)
-            
-            # Force a layout update
-            main_widget.updateGeometry()
-        
-        except Exception as e:
-            print(f"Error recreating summary content: {e}")
-            import traceback
-            traceback.print_exc()
-
-    def _create_summary_content_at_index(self, parent_layout: QtWidgets.QVBoxLayout, insert_index: int) -> None:
-        """Create the summary content section and insert at a specific index."""
-        scroll_area = QtWidgets.QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(_scroll_bar_as_needed_policy())
-        scroll_area.setVerticalScrollBarPolicy(_scroll_bar_as_needed_policy())
-        
-        content_widget = QtWidgets.QWidget()
-        content_layout = QtWidgets.QVBoxLayout(content_widget)
-
-        print(
-            f"[DEBUG][UI] Summary UI: out_of_bounds_warnings count="
-            f"{len(getattr(self._summary_data, 'out_of_bounds_warnings', None) or [])}"
-        )
-        self._append_out_of_bounds_warnings_section(content_layout)
-
-        # CSV Points section
-        if self._summary_data.csv_points_count > 0:
-            csv_group = self._create_csv_section()
-            content_layout.addWidget(csv_group)
-        
-        # Features section
-        if self._summary_data.features_count > 0:
-            features_group = self._create_features_section()
-            content_layout.addWidget(features_group)
-        
-        # Objects section
-        if self._should_show_objects_section():
-            objects_group = self._create_objects_section()
-            content_layout.addWidget(objects_group)
-        
-        # Small Finds section
-        if self._summary_data.small_finds_count > 0:
-            small_finds_group = self._create_small_finds_section()
-            content_layout.addWidget(small_finds_group)
-
-        # Distance warnings section
-        distance_warnings = self._effective_warnings("distance_warnings")
-        if distance_warnings:
-            print(f"[DEBUG][UI] Displaying {len(distance_warnings)} distance warnings")
-            warnings_layout = QtWidgets.QVBoxLayout()
-            warnings_label = QtWidgets.QLabel(self.tr("Distance Warnings:"))
-            warnings_label.setStyleSheet("font-weight: bold; color: #DC143C;")
-            warnings_layout.addWidget(warnings_label)
-            for i, warning in enumerate(distance_warnings):
-                warning_item_layout = QtWidgets.QHBoxLayout()
-                if hasattr(warning, 'message'):
-                    warning_text = warning.message
-                else:
-                    warning_text = str(warning)
-                warning_item = QtWidgets.QLabel(f"• {warning_text}")
-                warning_item.setStyleSheet("color: #DC143C; margin-left: 10px;")
-                warning_item.setWordWrap(True)
-                warning_item_layout.addWidget(warning_item)
-                if hasattr(warning, 'message') and self._iface:
-                    button = QtWidgets.QPushButton(self.tr("Select and Show Entities"))
-                    button.setStyleSheet("background-color: #DC143C; color: white; border: none; padding: 5px; border-radius: 3px;")
-                    button.clicked.connect(lambda checked, w=warning: self._open_both_filtered_attribute_tables(w))
-                    warning_item_layout.addWidget(button)
-                warning_item_layout.addStretch()
-                warnings_layout.addLayout(warning_item_layout)
-            content_layout.addLayout(warnings_layout)
-            print("[DEBUG][UI] Added distance warnings layout to content_layout")
-
-        content_layout.addStretch()
-        scroll_area.setWidget(content_widget)
-        parent_layout.insertWidget(insert_index, scroll_area)
+        return detector.detect_height_difference_warnings(cancellation_token=self._warning_detection_cancellation)
     
     def _copy_temporary_to_definitive_layers(self) -> None:
         """
@@ -1805,17 +1679,8 @@ class ImportSummaryDockWidget(QDockWidget):
         missing_configurations = self._collect_missing_layer_configurations()
 
         for job in jobs:
-            load_job_source_features(job)
-            while job.feature_index < job.feature_count:
-                batch_result = self._feature_copier.copy_features_batch(
-                    source_features=job.source_features,
-                    target_layer=job.target_layer,
-                    start_index=job.feature_index,
-                    field_mapping=job.field_mapping,
-                )
-                job.feature_index = batch_result.next_index
-                job.copied_count += batch_result.copied_count
-                job.added_feature_ids.extend(batch_result.added_feature_ids)
+            while not job.load_complete:
+                copy_next_job_batch(job, self._feature_copier)
 
             self._feature_copier.select_copied_features(
                 job.target_layer,
@@ -2022,15 +1887,105 @@ class ImportSummaryDockWidget(QDockWidget):
         """Return True when a field value should be considered empty for default injection."""
         return ImportFeatureCopier.is_missing_attribute_value(value)
 
+    def _select_warning_targets(self, warning_data: WarningData) -> List[Any]:
+        """
+        Select the exact features of a warning by id and zoom the map to them.
+
+        Returns the layers with selected features, or an empty list when the
+        filter expressions must be used instead: the warning has no targets, a
+        target layer is no longer in the project, or some target ids no longer
+        select anything. Targets are all-or-nothing so the user never gets a
+        partial selection.
+        """
+        if not isinstance(warning_data, WarningData):
+            return []
+        targets = warning_data.feature_targets()
+        if not targets:
+            return []
+
+        from qgis.core import QgsProject
+        project = QgsProject.instance()
+        resolved = []
+        for target in targets:
+            layer = project.mapLayer(target.layer_id) if target.layer_id else None
+            if layer is None or not target.feature_ids:
+                _diag.info("Warning target layer %s is gone, using filter expressions", target.layer_id)
+                return []
+            resolved.append((layer, target.feature_ids))
+
+        layers = []
+        for layer, feature_ids in resolved:
+            layer.selectByIds(list(feature_ids))
+            layers.append(layer)
+        stale = [layer for layer in layers if not layer.selectedFeatureCount()]
+        if stale:
+            _diag.info(
+                "Warning features are gone from %s, using filter expressions",
+                ", ".join(layer.name() for layer in stale),
+            )
+            for layer in layers:
+                layer.removeSelection()
+            return []
+        self._zoom_to_selected_features(layers)
+        return layers
+
+    def _zoom_to_selected_features(self, layers: List[Any]) -> None:
+        """Zoom the map canvas to the combined bounding box of the selection of ``layers``."""
+        try:
+            canvas = self._iface.mapCanvas()
+            map_settings = canvas.mapSettings()
+            extent = None
+            for layer in layers:
+                layer_extent = map_settings.layerExtentToOutputExtent(layer, layer.boundingBoxOfSelected())
+                if extent is None:
+                    extent = layer_extent
+                else:
+                    extent.combineExtentWith(layer_extent)
+            if extent is None:
+                return
+            if extent.isEmpty():
+                # A single point: keep the scale and center on it
+                canvas.setCenter(extent.center())
+            else:
+                extent.scale(1.1)
+                canvas.setExtent(extent)
+            canvas.refresh()
+        except Exception as e:
+            _diag.warning("Error zooming to warning features: %s", e)
+
+    def _open_attribute_tables_for_selection(self, layers: List[Any]) -> None:
+        """Open the attribute table of each layer whose warning features were selected."""
+        for layer in layers:
+            self._iface.setActiveLayer(layer)
+            self._iface.actionOpenTable().trigger()
+        QMessageBox.information(
+            self,
+            self.tr("Attribute Table Opened"),
+            self.tr("Attribute tables opened with the concerned entities selected: {layers}").format(
+                layers=", ".join(
+                    f"{layer.name()} ({layer.selectedFeatureCount()})" for layer in layers
+                )
+            ),
+        )
+
     def _open_filtered_attribute_table(self, warning_data: WarningData) -> None:
         """
         Open the attribute table for the specified layer and select the concerned entities.
+
+        Entities are selected by feature id when the warning carries targets; the
+        filter expression is only evaluated as a fallback.
+
         Args:
             warning_data: Warning data containing layer and filter information
         """
         if not self._iface:
             return
         try:
+            selected_layers = self._select_warning_targets(warning_data)
+            if selected_layers:
+                self._open_attribute_tables_for_selection(selected_layers)
+                return
+
             from qgis.core import QgsProject
             project = QgsProject.instance()
             # Find the layer by name
@@ -2044,28 +1999,30 @@ class ImportSummaryDockWidget(QDockWidget):
                 return
             
             # Apply the filter expression
-            print(f"[DEBUG] Applying filter expression: {warning_data.filter_expression}")
-            print(f"[DEBUG] Layer name: {warning_data.layer_name}")
+            _diag.debug("Applying filter expression: %s", warning_data.filter_expression)
+            _diag.debug("Layer name: %s", warning_data.layer_name)
             
             # Get the layer
             layer = self._layer_service.get_layer_by_name(warning_data.layer_name)
             if not layer:
-                print(f"[DEBUG] ERROR: Layer '{warning_data.layer_name}' not found!")
+                _diag.debug("ERROR: Layer '%s' not found!", warning_data.layer_name)
                 return
             
-            print(f"[DEBUG] Found layer: {layer.name()}, feature count: {layer.featureCount()}")
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug("Found layer: %s, feature count: %s", layer.name(), layer.featureCount())
             
             # Clear any existing selection
             layer.removeSelection()
             
             # Select the concerned entities
-            print(f"[DEBUG] Selecting features with expression: {warning_data.filter_expression}")
+            _diag.debug("Selecting features with expression: %s", warning_data.filter_expression)
             selected_count = layer.selectByExpression(warning_data.filter_expression)
-            print(f"[DEBUG] Selected {selected_count} features")
+            _diag.debug("Selected %s features", selected_count)
             
             # Get the selected features to verify
             selected_features = layer.selectedFeatures()
-            print(f"[DEBUG] Selected feature IDs: {[f.id() for f in selected_features]}")
+            if _diag.isEnabledFor(DEBUG):
+                _diag.debug("Selected feature IDs: %s", [f.id() for f in selected_features])
             
             # Set the layer as active
             self._iface.setActiveLayer(layer)
@@ -2090,10 +2047,18 @@ class ImportSummaryDockWidget(QDockWidget):
     def _open_both_filtered_attribute_tables(self, warning_data: WarningData) -> None:
         """
         Open the attribute tables for both layers and select the concerned entities.
+
+        Like :meth:`_open_filtered_attribute_table`, feature ids are preferred over
+        the filter expressions.
         """
         if not self._iface:
             return
         try:
+            selected_layers = self._select_warning_targets(warning_data)
+            if selected_layers:
+                self._open_attribute_tables_for_selection(selected_layers)
+                return
+
             from qgis.core import QgsProject
             project = QgsProject.instance()
             
@@ -30,16 +30,19 @@ Usage:
         pass
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any
 from qgis.PyQt import QtWidgets
 from qgis.PyQt.QtCore import Qt, QTimer
 
 try:
     from ..core.interfaces import ILayerService, ISettingsManager
-    from ..core.ui_responsiveness import maybe_yield_to_ui
+    from ..core.ui_responsiveness import AdaptiveBatchSizer, maybe_yield_to_ui
 except ImportError:
     from core.interfaces import ILayerService, ISettingsManager
-    from core.ui_responsiveness import maybe_yield_to_ui
+    from core.ui_responsiveness import AdaptiveBatchSizer, maybe_yield_to_ui
+
+# Entity rows filled in the first Qt timer tick; later ticks are sized to the frame budget.
+ENTITY_ROWS_FIRST_BATCH = 4
 
 
 def _align_center_flag():
@@ -159,6 +162,11 @@ class PrepareRecordingDialog(QtWidgets.QDialog):
         self._settings_manager = settings_manager
         self._selected_entity_count = 0
         self._selected_count_update_scheduled = False
+        # Rows whose numbers, levels and background images are not computed yet
+        self._pending_entity_rows: Dict[int, Any] = {}
+        self._entity_row_context: Dict[str, Any] = {}
+        self._entity_rows_generation = 0
+        self._entity_rows_sizer = AdaptiveBatchSizer(initial=ENTITY_ROWS_FIRST_BATCH)
         
         # Initialize UI
         self._setup_ui()
@@ -543,174 +551,265 @@ class PrepareRecordingDialog(QtWidgets.QDialog):
             self._button_box.button(_dialog_button_ok()).setVisible(False)
     
     def _populate_entities_table(self, features) -> None:
-        """Populate the entities table with feature information."""
-        # Clear existing rows
+        """
+        Populate the entities table with one row per feature.
+
+        Names are shown at once. Numbers, levels and background images need
+        related-feature lookups for each recording area, so those cells start as
+        placeholders and are filled by :meth:`_fill_pending_entity_rows` over
+        later event-loop ticks, rows in view first. Reading a row through
+        :meth:`get_next_values_for_feature` fills it on demand.
+        """
+        # Clear existing rows and stop filling rows of a previous selection
         self._entities_table.setRowCount(0)
-        
+        self._entity_rows_generation += 1
+        self._pending_entity_rows = {}
+
         # Get configuration
-        objects_layer_id = self._settings_manager.get_value('objects_layer', '')
-        number_field = self._settings_manager.get_value('objects_number_field', '')
-        level_field = self._settings_manager.get_value('objects_level_field', '')
-        
-        # Get the recording areas layer for display expression
         recording_areas_layer_id = self._settings_manager.get_value('recording_areas_layer', '')
         recording_layer = self._layer_service.get_layer_by_id(recording_areas_layer_id) if recording_areas_layer_id else None
-        related_features_cache: Dict[Tuple[str, int], List[Any]] = {}
-        project_rasters = self._layer_service.get_raster_layers() if recording_areas_layer_id else []
-        
-        # Add features to table
-        for feature in features:
-            maybe_yield_to_ui(every=1)
-            row = self._entities_table.rowCount()
-            self._entities_table.insertRow(row)
-            
-            # Get feature name
-            feature_name = str(feature.id())
-            
-            # Try to get name from display expression
-            if recording_layer:
-                expr_str = recording_layer.displayExpression()
-                if expr_str:
-                    from qgis.core import QgsExpression, QgsExpressionContext, QgsExpressionContextUtils
-                    expr = QgsExpression(expr_str)
-                    context = QgsExpressionContext()
-                    context.appendScope(QgsExpressionContextUtils.layerScope(recording_layer))
-                    context.setFeature(feature)
-                    try:
-                        result = expr.evaluate(context)
-                        if result and str(result) != 'NULL':
-                            feature_name = str(result)
-                    except:
-                        pass
-                
-                # Try to get name from common name fields
-                if feature_name == str(feature.id()):
-                    name_fields = ['name', 'title', 'label', 'description', 'comment']
-                    for field_name in name_fields:
-                        field_idx = recording_layer.fields().indexOf(field_name)
-                        if field_idx >= 0:
-                            value = feature.attribute(field_idx)
-                            if value and str(value) != 'NULL':
-                                feature_name = str(value)
-                                break
-            
+        self._entity_row_context = {
+            'objects_layer_id': self._settings_manager.get_value('objects_layer', ''),
+            'number_field': self._settings_manager.get_value('objects_number_field', ''),
+            'level_field': self._settings_manager.get_value('objects_level_field', ''),
+            'recording_areas_layer_id': recording_areas_layer_id,
+            'features': list(features),
+            # Grouped related-objects lookups, one per layer and field combination
+            'related_info': {},
+            # Raster metadata, read when the first row is filled
+            'project_rasters': None,
+        }
+        name_of = self._entity_name_resolver(recording_layer)
+        background_col = self._entities_table.columnCount() - 1
+
+        self._entities_table.setRowCount(len(features))
+        for row, feature in enumerate(features):
+            maybe_yield_to_ui(every=50)
             # Add name to the table
-            name_item = QtWidgets.QTableWidgetItem(feature_name)
+            name_item = QtWidgets.QTableWidgetItem(name_of(feature))
             name_item.setFlags(name_item.flags() & ~_item_is_editable_flag())  # Make read-only
             self._entities_table.setItem(row, 0, name_item)
-            
-            # Add related objects information if configured
-            col_index = 1
-            
-            if objects_layer_id and number_field:
-                # Get related objects info
-                related_info = self._layer_service.get_related_objects_info(
-                    feature,
-                    objects_layer_id,
-                    number_field,
-                    level_field,
-                    recording_areas_layer_id,
-                    related_features_cache=related_features_cache,
-                    unfiltered=True,
-                )
-                
-                # Add last number
-                number_item = QtWidgets.QTableWidgetItem(related_info['last_number'])
-                number_item.setFlags(number_item.flags() & ~_item_is_editable_flag())  # Make read-only
-                self._entities_table.setItem(row, col_index, number_item)
-                col_index += 1
-                
-                # Add first number (editable)
-                first_number = '1'  # Default value
-                if related_info['last_number']:
-                    try:
-                        last_num = int(related_info['last_number'])
-                        first_number = str(last_num + 1)
-                    except (ValueError, TypeError):
-                        first_number = '1'
-                
-                first_number_item = QtWidgets.QTableWidgetItem(first_number)
-                self._entities_table.setItem(row, col_index, first_number_item)
-                col_index += 1
-            
-            if objects_layer_id and level_field:
-                # Get related objects info (if not already done)
-                if not (objects_layer_id and number_field):
-                    related_info = self._layer_service.get_related_objects_info(
-                        feature,
-                        objects_layer_id,
-                        number_field,
-                        level_field,
-                        recording_areas_layer_id,
-                        related_features_cache=related_features_cache,
-                        unfiltered=True,
-                    )
-                highest_last_level = self._get_highest_last_level_across_configured_layers(
-                    feature=feature,
-                    recording_areas_layer_id=recording_areas_layer_id,
-                    default_last_level=related_info['last_level'],
-                    related_features_cache=related_features_cache,
-                )
-                
-                # Add last level
-                level_item = QtWidgets.QTableWidgetItem(highest_last_level)
-                level_item.setFlags(level_item.flags() & ~_item_is_editable_flag())  # Make read-only
-                self._entities_table.setItem(row, col_index, level_item)
-                col_index += 1
-                
-                # Add level (editable)
-                level = self._layer_service.calculate_next_level(
-                    highest_last_level, level_field, objects_layer_id
-                )
-                level_item = QtWidgets.QTableWidgetItem(level)
-                self._entities_table.setItem(row, col_index, level_item)
-                col_index += 1
-            
-            # Add background image dropdown
-            self._add_background_image_dropdown(
-                row,
-                col_index,
-                feature,
-                recording_areas_layer_id,
-                project_rasters=project_rasters,
-            )
-        
+
+            # Computed columns show a read-only placeholder until the row is filled
+            for col in range(1, background_col):
+                placeholder = QtWidgets.QTableWidgetItem(self.tr("…"))
+                placeholder.setFlags(placeholder.flags() & ~_item_is_editable_flag())
+                self._entities_table.setItem(row, col, placeholder)
+            combo_box = QtWidgets.QComboBox()
+            combo_box.addItem("No image", "")
+            self._entities_table.setCellWidget(row, background_col, combo_box)
+            self._pending_entity_rows[row] = feature
+
         # Resize columns to content
         self._entities_table.resizeColumnsToContents()
+        if self._pending_entity_rows:
+            self._entity_rows_sizer = AdaptiveBatchSizer(initial=ENTITY_ROWS_FIRST_BATCH)
+            generation = self._entity_rows_generation
+            QTimer.singleShot(0, lambda: self._fill_pending_entity_rows(generation))
+
+    def _entity_name_resolver(self, recording_layer):
+        """Return a function giving the display name of a recording area feature."""
+        expression = None
+        context = None
+        name_field_indices: List[int] = []
+        if recording_layer:
+            expr_str = recording_layer.displayExpression()
+            if expr_str:
+                from qgis.core import QgsExpression, QgsExpressionContext, QgsExpressionContextUtils
+                expression = QgsExpression(expr_str)
+                context = QgsExpressionContext()
+                context.appendScope(QgsExpressionContextUtils.layerScope(recording_layer))
+                expression.prepare(context)
+            # Fallback: common name fields
+            name_fields = ['name', 'title', 'label', 'description', 'comment']
+            for field_name in name_fields:
+                field_idx = recording_layer.fields().indexOf(field_name)
+                if field_idx >= 0:
+                    name_field_indices.append(field_idx)
+
+        def name_of(feature) -> str:
+            if expression is not None:
+                context.setFeature(feature)
+                try:
+                    result = expression.evaluate(context)
+                    if result and str(result) != 'NULL':
+                        return str(result)
+                except:
+                    pass
+            for field_idx in name_field_indices:
+                value = feature.attribute(field_idx)
+                if value and str(value) != 'NULL':
+                    return str(value)
+            return str(feature.id())
+
+        return name_of
+
+    def _visible_entity_rows(self) -> range:
+        """Return the rows currently in view in the entities table."""
+        first = self._entities_table.rowAt(0)
+        if first < 0:
+            return range(0)
+        last = self._entities_table.rowAt(self._entities_table.viewport().height() - 1)
+        if last < 0:
+            last = self._entities_table.rowCount() - 1
+        return range(first, last + 1)
+
+    def _fill_pending_entity_rows(self, generation: int) -> None:
+        """Fill one frame budget of pending rows, rows in view first, then reschedule."""
+        if generation != self._entity_rows_generation or not self._pending_entity_rows:
+            return
+        started = self._entity_rows_sizer.clock()
+        batch = [row for row in self._visible_entity_rows() if row in self._pending_entity_rows]
+        batch = batch[:self._entity_rows_sizer.size]
+        for row in sorted(self._pending_entity_rows):
+            if len(batch) >= self._entity_rows_sizer.size:
+                break
+            if row not in batch:
+                batch.append(row)
+        for row in batch:
+            self._fill_entity_row(row)
+        self._entity_rows_sizer.record(len(batch), self._entity_rows_sizer.clock() - started)
+        if self._pending_entity_rows:
+            QTimer.singleShot(0, lambda: self._fill_pending_entity_rows(generation))
+        else:
+            self._entities_table.resizeColumnsToContents()
+            self._layer_service.release_unfiltered_layers()
+
+    def _fill_all_pending_entity_rows(self) -> None:
+        """Fill every row that is still pending (e.g. before reading all values)."""
+        try:
+            for row in sorted(self._pending_entity_rows):
+                self._fill_entity_row(row)
+        finally:
+            self._layer_service.release_unfiltered_layers()
+
+    def _fill_entity_row(self, row: int) -> None:
+        """Compute the numbers, levels and background images of one pending row."""
+        feature = self._pending_entity_rows.pop(row, None)
+        if feature is None:
+            return
+        context = self._entity_row_context
+        objects_layer_id = context['objects_layer_id']
+        number_field = context['number_field']
+        level_field = context['level_field']
+        recording_areas_layer_id = context['recording_areas_layer_id']
+        if context['project_rasters'] is None:
+            context['project_rasters'] = (
+                self._layer_service.get_raster_layers() if recording_areas_layer_id else []
+            )
+
+        # Add related objects information if configured
+        col_index = 1
+
+        if objects_layer_id and number_field:
+            # Get related objects info
+            related_info = self._related_objects_info(feature, objects_layer_id, number_field, level_field)
+
+            # Add last number
+            number_item = QtWidgets.QTableWidgetItem(related_info['last_number'])
+            number_item.setFlags(number_item.flags() & ~_item_is_editable_flag())  # Make read-only
+            self._entities_table.setItem(row, col_index, number_item)
+            col_index += 1
+
+            # Add first number (editable)
+            first_number = '1'  # Default value
+            if related_info['last_number']:
+                try:
+                    last_num = int(related_info['last_number'])
+                    first_number = str(last_num + 1)
+                except (ValueError, TypeError):
+                    first_number = '1'
+
+            first_number_item = QtWidgets.QTableWidgetItem(first_number)
+            self._entities_table.setItem(row, col_index, first_number_item)
+            col_index += 1
+
+        if objects_layer_id and level_field:
+            # Get related objects info (if not already done)
+            if not (objects_layer_id and number_field):
+                related_info = self._related_objects_info(feature, objects_layer_id, number_field, level_field)
+            highest_last_level = self._get_highest_last_level_across_configured_layers(
+                feature=feature,
+                default_last_level=related_info['last_level'],
+            )
+
+            # Add last level
+            level_item = QtWidgets.QTableWidgetItem(highest_last_level)
+            level_item.setFlags(level_item.flags() & ~_item_is_editable_flag())  # Make read-only
+            self._entities_table.setItem(row, col_index, level_item)
+            col_index += 1
+
+            # Add level (editable)
+            level = self._layer_service.calculate_next_level(
+                highest_last_level, level_field, objects_layer_id
+            )
+            level_item = QtWidgets.QTableWidgetItem(level)
+            self._entities_table.setItem(row, col_index, level_item)
+            col_index += 1
+
+        # Add background image dropdown
+        self._add_background_image_dropdown(
+            row,
+            col_index,
+            feature,
+            recording_areas_layer_id,
+            project_rasters=context['project_rasters'],
+        )
+
+    def _related_objects_info(
+        self,
+        feature,
+        layer_id: str,
+        number_field: Optional[str],
+        level_field: Optional[str],
+        unfiltered: bool = True,
+    ) -> Dict[str, str]:
+        """
+        Return the last number and level of one table feature in a child layer.
+
+        The first lookup per layer and field combination aggregates all features
+        of the table with one grouped query; later rows read the cached result.
+        """
+        context = self._entity_row_context
+        cache_key = (layer_id, number_field or None, level_field or None, unfiltered)
+        related_info = context['related_info'].get(cache_key)
+        if related_info is None:
+            related_info = self._layer_service.get_related_objects_info_batch(
+                context['features'],
+                layer_id,
+                number_field,
+                level_field,
+                context['recording_areas_layer_id'],
+                unfiltered=unfiltered,
+            )
+            context['related_info'][cache_key] = related_info
+        return related_info.get(feature.id(), {'last_number': '', 'last_level': ''})
 
     def _get_highest_last_level_across_configured_layers(
         self,
         feature,
-        recording_areas_layer_id: str,
         default_last_level: str,
-        related_features_cache: Optional[Dict[Tuple[str, int], List[Any]]] = None,
     ) -> str:
         """
         Return highest last level among configured objects/features/small_finds layers.
 
         When multiple layers contribute level values, preparation must continue from the
-        highest already-used level across all configured layers.
+        highest already-used level across all configured layers. ``default_last_level``
+        is the last level already read from the objects layer.
         """
         layer_settings = [
-            ("objects_layer", "objects_level_field"),
             ("features_layer", "features_level_field"),
             ("small_finds_layer", "small_finds_level_field"),
         ]
-        level_values: List[str] = []
+        level_values: List[str] = [default_last_level] if default_last_level else []
 
         for layer_setting_key, level_setting_key in layer_settings:
             layer_id = self._settings_manager.get_value(layer_setting_key, '')
             configured_level_field = self._settings_manager.get_value(level_setting_key, '')
             if not layer_id or not configured_level_field:
                 continue
-            layer_info = self._layer_service.get_related_objects_info(
-                feature,
-                layer_id,
-                None,
-                configured_level_field,
-                recording_areas_layer_id,
-                related_features_cache=related_features_cache,
-                unfiltered=(layer_setting_key == 'objects_layer'),
+            layer_info = self._related_objects_info(
+                feature, layer_id, None, configured_level_field, unfiltered=False
             )
             last_level = str(layer_info.get('last_level', '') or '')
             if last_level:
@@ -791,6 +890,7 @@ class PrepareRecordingDialog(QtWidgets.QDialog):
         """
         if feature_index >= self._entities_table.rowCount():
             return {'first_number': '', 'level': '', 'background_image': ''}
+        self._fill_entity_row(feature_index)
         
         # Get configuration
         objects_layer_id = self._settings_manager.get_value('objects_layer', '')
@@ -840,11 +940,17 @@ class PrepareRecordingDialog(QtWidgets.QDialog):
         Returns:
             List of dictionaries with 'first_number', 'level', and 'background_image' values for each feature
         """
+        self._fill_all_pending_entity_rows()
         results = []
         for row in range(self._entities_table.rowCount()):
             results.append(self.get_next_values_for_feature(row))
         return results
     
+    def done(self, result) -> None:
+        """Release the unfiltered layer copies of this run when the dialog closes."""
+        self._layer_service.release_unfiltered_layers()
+        super().done(result)
+    
     def showEvent(self, event) -> None:
         """Override show event to update the display when dialog is shown."""
         super().showEvent(event)
@@ -426,6 +426,15 @@ class SettingsDialog(QtWidgets.QDialog):
         # Extra layers for field projects
         self._extra_layers_widget = self._create_extra_layers_widget()
         form_layout.addRow(self.tr("Extra Field Layers:"), self._extra_layers_widget)
+
+        # Direct GeoPackage commit during validation
+        self._validation_direct_commit = QtWidgets.QCheckBox()
+        self._validation_direct_commit.setChecked(_to_bool(self._settings_manager.get_value('validation_direct_commit', False)))
+        self._validation_direct_commit.setToolTip(self.tr(
+            "Write validated features straight to GeoPackage definitive layers in one transaction "
+            "instead of the edit buffer. Only used for layers without pending edits or filters."
+        ))
+        form_layout.addRow(self.tr("Save Validated Features Directly to GeoPackage:"), self._validation_direct_commit)
         
         layers_layout.addLayout(form_layout)
         layers_layout.addStretch()
@@ -1763,6 +1772,7 @@ class SettingsDialog(QtWidgets.QDialog):
             self._enable_duplicate_total_station_identifiers_warnings.setChecked(_to_bool(self._settings_manager.get_value('enable_duplicate_total_station_identifiers_warnings', True)))
             self._enable_skipped_numbers_warnings.setChecked(_to_bool(self._settings_manager.get_value('enable_skipped_numbers_warnings', True)))
             self._enable_missing_total_station_warnings.setChecked(_to_bool(self._settings_manager.get_value('enable_missing_total_station_warnings', True)))
+            self._validation_direct_commit.setChecked(_to_bool(self._settings_manager.get_value('validation_direct_commit', False)))
 
             # Load map theme settings
             self._refresh_map_theme_combos()
@@ -1821,6 +1831,7 @@ class SettingsDialog(QtWidgets.QDialog):
                 'enable_duplicate_total_station_identifiers_warnings': self._settings_manager.get_value('enable_duplicate_total_station_identifiers_warnings', True),
                 'enable_skipped_numbers_warnings': self._settings_manager.get_value('enable_skipped_numbers_warnings', True),
                 'enable_missing_total_station_warnings': self._settings_manager.get_value('enable_missing_total_station_warnings', True),
+                'validation_direct_commit': self._settings_manager.get_value('validation_direct_commit', False),
                 'import_map_theme': import_map_theme,
                 'global_preparation_map_theme': global_preparation_map_theme,
                 'recording_area_preparation_map_theme': recording_area_preparation_map_theme,
@@ -1876,6 +1887,7 @@ class SettingsDialog(QtWidgets.QDialog):
                 'enable_duplicate_total_station_identifiers_warnings': self._enable_duplicate_total_station_identifiers_warnings.isChecked(),
                 'enable_skipped_numbers_warnings': self._enable_skipped_numbers_warnings.isChecked(),
                 'enable_missing_total_station_warnings': self._enable_missing_total_station_warnings.isChecked(),
+                'validation_direct_commit': self._validation_direct_commit.isChecked(),
                 'import_map_theme': self._import_map_theme_combo.currentData() or '',
                 'global_preparation_map_theme': self._global_preparation_map_theme_combo.currentData() or '',
                 'recording_area_preparation_map_theme': (
@@ -2060,6 +2072,7 @@ class SettingsDialog(QtWidgets.QDialog):
             self._enable_duplicate_total_station_identifiers_warnings.setChecked(_to_bool(self._original_values.get('enable_duplicate_total_station_identifiers_warnings', True)))
             self._enable_skipped_numbers_warnings.setChecked(_to_bool(self._original_values.get('enable_skipped_numbers_warnings', True)))
             self._enable_missing_total_station_warnings.setChecked(_to_bool(self._original_values.get('enable_missing_total_station_warnings', True)))
+            self._validation_direct_commit.setChecked(_to_bool(self._original_values.get('validation_direct_commit', False)))
 
             self._set_map_theme_combo_value(
                 self._import_map_theme_combo,
@@ -0,0 +1,285 @@
+"""
+Item model for the warnings panel of the import summary dock.
+
+The dock used to rebuild a ``QScrollArea`` with one label and button per warning
+after every detector step, which takes seconds and flickers with thousands of
+warnings. :class:`WarningsModel` keeps one top-level row per non-empty warning
+category and the warnings as its children; a ``QTreeView`` with uniform row
+heights only paints the visible rows, and children are exposed in
+:data:`WARNING_FETCH_BATCH` chunks through ``canFetchMore``/``fetchMore``.
+:meth:`WarningsModel.set_warnings` replaces one category in place as detector
+results arrive, leaving the other categories and the scroll position untouched.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from qgis.PyQt.QtCore import QT_TRANSLATE_NOOP, QAbstractItemModel, QModelIndex, Qt
+from qgis.PyQt.QtGui import QBrush, QColor, QFont
+
+# Warning rows exposed per fetchMore call.
+WARNING_FETCH_BATCH = 200
+
+
+def _item_data_role(name: str):
+    """Return ``Qt.<name>`` (Qt5) or ``Qt.ItemDataRole.<name>`` (Qt6)."""
+    if hasattr(Qt, name):
+        return getattr(Qt, name)
+    return getattr(Qt.ItemDataRole, name)
+
+
+DISPLAY_ROLE = _item_data_role("DisplayRole")
+TOOLTIP_ROLE = _item_data_role("ToolTipRole")
+FOREGROUND_ROLE = _item_data_role("ForegroundRole")
+FONT_ROLE = _item_data_role("FontRole")
+# Role returning the warning object of a warning row.
+WARNING_ROLE = int(_item_data_role("UserRole")) + 1
+
+
+@dataclass(frozen=True)
+class WarningCategory:
+    """One titled warning list of the summary panel."""
+    result_key: str
+    title: str
+    color: str
+    # Selecting a warning opens the attribute tables of both involved layers
+    opens_both_layers: bool = False
+
+
+# Titles are translated with the dock's tr(); QT_TRANSLATE_NOOP keeps them in the .ts files.
+# Display order: boundary warnings first, then total station, objects and distance checks.
+WARNING_CATEGORIES: Tuple[WarningCategory, ...] = (
+    WarningCategory(
+        "out_of_bounds_warnings",
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Out-of-Bounds Warnings:"),
+        "#A0522D",
+    ),
+    WarningCategory(
+        "duplicate_total_station_identifiers_warnings",
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Duplicate Identifiers Warnings:"),
+        "#FF4500",
+    ),
+    WarningCategory(
+        "height_difference_warnings",
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Height Difference Warnings:"),
+        "#FF8C00",
+    ),
+    WarningCategory(
+        "missing_total_station_warnings",
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Missing Total Station Warnings:"),
+        "#8B0000",
+        opens_both_layers=True,
+    ),
+    WarningCategory(
+        "duplicate_objects_warnings",
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Duplicate Objects Warnings:"),
+        "#FF4500",
+    ),
+    WarningCategory(
+        "skipped_numbers_warnings",
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Skipped Numbers Warnings:"),
+        "#FF8C00",
+    ),
+    WarningCategory(
+        "distance_warnings",
+        QT_TRANSLATE_NOOP("ImportSummaryDockWidget", "Distance Warnings:"),
+        "#DC143C",
+        opens_both_layers=True,
+    ),
+)
+
+
+@dataclass(eq=False)
+class _CategoryRows:
+    category: WarningCategory
+    warnings: List[Any] = field(default_factory=list)
+    # Warning rows exposed to views so far
+    loaded: int = 0
+
+
+# internalPointer of top-level (category) indices; warning indices point to their category.
+_CATEGORY_ROW = object()
+
+
+def warning_text(warning: Any) -> str:
+    return warning.message if hasattr(warning, "message") else str(warning)
+
+
+class WarningsModel(QAbstractItemModel):
+    """
+    Two-level model: non-empty warning categories and their warnings.
+
+    ``translate`` translates category titles (the dock passes its ``tr``).
+    """
+
+    def __init__(
+        self,
+        categories: Sequence[WarningCategory] = WARNING_CATEGORIES,
+        translate: Optional[Callable[[str], str]] = None,
+        parent: Any = None,
+    ):
+        super().__init__(parent)
+        self._translate = translate or (lambda text: text)
+        self._categories = [_CategoryRows(category) for category in categories]
+        self._by_key: Dict[str, _CategoryRows] = {rows.category.result_key: rows for rows in self._categories}
+        self._visible: List[_CategoryRows] = []
+        self._fonts: Dict[bool, QFont] = {}
+
+    # --- Updates -------------------------------------------------------------
+
+    def set_warnings(self, result_key: str, warnings: Optional[Sequence[Any]]) -> None:
+        """Replace the warnings of one category, updating only its rows."""
+        rows = self._by_key.get(result_key)
+        if rows is None:
+            return
+        new_warnings = list(warnings or [])
+        if len(new_warnings) == len(rows.warnings) and all(
+            new is old for new, old in zip(new_warnings, rows.warnings)
+        ):
+            return
+
+        if rows not in self._visible:
+            if not new_warnings:
+                return
+            position = sum(
+                1 for other in self._categories[:self._categories.index(rows)] if other in self._visible
+            )
+            self.beginInsertRows(QModelIndex(), position, position)
+            rows.warnings = new_warnings
+            rows.loaded = 0
+            self._visible.insert(position, rows)
+            self.endInsertRows()
+            self._load_rows(rows, WARNING_FETCH_BATCH)
+            return
+
+        position = self._visible.index(rows)
+        if not new_warnings:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            self._visible.pop(position)
+            rows.warnings = []
+            rows.loaded = 0
+            self.endRemoveRows()
+            return
+
+        parent = self.index(position, 0)
+        if rows.loaded:
+            self.beginRemoveRows(parent, 0, rows.loaded - 1)
+            rows.loaded = 0
+            self.endRemoveRows()
+        rows.warnings = new_warnings
+        self.dataChanged.emit(parent, parent)
+        self._load_rows(rows, WARNING_FETCH_BATCH)
+
+    def warnings(self, result_key: str) -> List[Any]:
+        rows = self._by_key.get(result_key)
+        return list(rows.warnings) if rows is not None else []
+
+    def warning_count(self) -> int:
+        return sum(len(rows.warnings) for rows in self._categories)
+
+    def category_at(self, index: QModelIndex) -> Optional[WarningCategory]:
+        """Return the category of a category or warning row."""
+        rows = self._rows_of(index)
+        return rows.category if rows is not None else None
+
+    def warning_at(self, index: QModelIndex) -> Any:
+        """Return the warning of a warning row, None for category rows."""
+        if not index.isValid() or index.internalPointer() is _CATEGORY_ROW:
+            return None
+        rows = index.internalPointer()
+        if 0 <= index.row() < rows.loaded:
+            return rows.warnings[index.row()]
+        return None
+
+    # --- Lazy rows -----------------------------------------------------------
+
+    def _rows_of(self, index: QModelIndex) -> Optional[_CategoryRows]:
+        if not index.isValid():
+            return None
+        if index.internalPointer() is _CATEGORY_ROW:
+            return self._visible[index.row()] if index.row() < len(self._visible) else None
+        return index.internalPointer()
+
+    def _load_rows(self, rows: _CategoryRows, count: int) -> None:
+        remaining = len(rows.warnings) - rows.loaded
+        if remaining <= 0:
+            return
+        count = min(count, remaining)
+        parent = self.index(self._visible.index(rows), 0)
+        self.beginInsertRows(parent, rows.loaded, rows.loaded + count - 1)
+        rows.loaded += count
+        self.endInsertRows()
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid() or parent.internalPointer() is not _CATEGORY_ROW:
+            return False
+        rows = self._rows_of(parent)
+        return rows is not None and rows.loaded < len(rows.warnings)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        rows = self._rows_of(parent) if parent.isValid() else None
+        if rows is not None and parent.internalPointer() is _CATEGORY_ROW:
+            self._load_rows(rows, WARNING_FETCH_BATCH)
+
+    # --- QAbstractItemModel --------------------------------------------------
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row >= len(self._visible):
+                return QModelIndex()
+            return self.createIndex(row, column, _CATEGORY_ROW)
+        if parent.internalPointer() is not _CATEGORY_ROW:
+            return QModelIndex()
+        rows = self._rows_of(parent)
+        if rows is None or row >= rows.loaded:
+            return QModelIndex()
+        return self.createIndex(row, column, rows)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid() or index.internalPointer() is _CATEGORY_ROW:
+            return QModelIndex()
+        rows = index.internalPointer()
+        if rows not in self._visible:
+            return QModelIndex()
+        return self.createIndex(self._visible.index(rows), 0, _CATEGORY_ROW)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._visible)
+        if parent.internalPointer() is not _CATEGORY_ROW:
+            return 0
+        rows = self._rows_of(parent)
+        return rows.loaded if rows is not None else 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._visible)
+        return parent.internalPointer() is _CATEGORY_ROW
+
+    def data(self, index: QModelIndex, role: int = DISPLAY_ROLE) -> Any:
+        rows = self._rows_of(index)
+        if rows is None:
+            return None
+        is_category = index.internalPointer() is _CATEGORY_ROW
+        if role == DISPLAY_ROLE:
+            if is_category:
+                return f"{self._translate(rows.category.title)} ({len(rows.warnings)})"
+            return f"• {warning_text(rows.warnings[index.row()])}"
+        if role == TOOLTIP_ROLE and not is_category:
+            return warning_text(rows.warnings[index.row()])
+        if role == FOREGROUND_ROLE:
+            return QBrush(QColor(rows.category.color))
+        if role == FONT_ROLE:
+            if is_category not in self._fonts:
+                font = QFont()
+                font.setBold(is_category)
+                self._fonts[is_category] = font
+            return self._fonts[is_category]
+        if role == WARNING_ROLE and not is_category:
+            return rows.warnings[index.row()]
+        return None